@@ -12,3 +12,47 @@ import numpy as np
 print("NUMPY Version:", np.__version__)
 
 
+
+
+####################################################
+print("Cold import time of vedo")
+import sys
+import subprocess
+times = []
+for _ in range(3):
+    out = subprocess.run(
+        [sys.executable, "-c",
+         "import time; t0 = time.perf_counter(); import vedo; print(time.perf_counter() - t0)"],
+        capture_output=True, text=True, check=True,
+    )
+    times.append(float(out.stdout.split()[-1]))
+print(f"import vedo: best {min(times)*1000:.0f} ms of {len(times)} runs")
+
+# heavy submodules must not be loaded by a plain import vedo
+out = subprocess.run(
+    [sys.executable, "-c",
+     "import sys, vedo; print(' '.join(m for m in ('vedo.addons', 'vedo.plotter',"
+     " 'vedo.applications', 'vtkmodules.vtkFiltersModeling') if m in sys.modules))"],
+    capture_output=True, text=True, check=True,
+)
+print("eagerly loaded:", out.stdout.strip())
+assert out.stdout.strip() == ""
+
+# lazy names must match the __all__ of their submodules
+import vedo
+for modname, names in vedo._lazy_submodules.items():
+    module = getattr(vedo, modname)
+    if not names:  # not star-imported, only accessible as vedo.<modname>
+        continue
+    assert set(names) == set(getattr(module, "__all__", ())), modname
+    for name in names:
+        assert getattr(vedo, name) is getattr(module, name)
+assert "Plotter" in vedo.__all__ and "Bongas" in vedo.fonts
+assert {"addons", "plotter", "applications"} <= set(vedo.__all__)
+
+# every lazily imported vtk class must resolve
+for name in vedo.vtkclasses._module_of:
+    try:
+        getattr(vedo.vtkclasses, name)
+    except AttributeError:
+        print("vtk class not available in this vtk version:", name)
@@ -1,4 +1,5 @@
-from vedo import Cone, Sphere, merge, Volume, dataurl, utils
+from vedo import Box, Cone, Sphere, Points, merge, Volume, dataurl, utils, load, write, CollisionWorld
+from vedo import probe_points, ProbePlan
 import numpy as np
 import vtk
 
@@ -161,10 +162,43 @@ pts3 = s2.points(pts2).points()
 print('points()',sum(pts3-pts2))
 assert np.allclose(pts2, pts3)
 
+###################################### points_view()
+s2 = sphere.clone()
+v = s2.points_view()
+v[:, 2] += 1
+s2.modified()
+print('points_view()', s2.zbounds(), s2.center_of_mass())
+assert np.allclose(s2.zbounds(), [0, 2])
+assert np.allclose(s2.clone().pos(0, 0, 1).points(), s2.points() + [0, 0, 1])
+# a view which overlaps the buffer is copied, not ignored
+rev = s2.points_view()[::-1]
+expected = np.array(rev)
+s2.points(rev)
+assert np.allclose(s2.points(), expected)
+s2.points(s2.points(transformed=False)[::-1])
+assert np.allclose(s2.points(), expected[::-1])
+v = s2.points_view()
+s2.points(v)  # exactly the buffer: no copy
+assert np.shares_memory(v, s2.points_view())
+
+###################################### polydata() cache
+s2 = sphere.clone().pos(1, 0, 0)
+b1 = s2.polydata().GetBounds()
+b2 = s2.polydata().GetBounds()
+print('polydata_cache_info()', s2.polydata_cache_info())
+assert s2.polydata_cache_info() == {"hits": 1, "misses": 1}
+s2.pos(2, 0, 0)
+assert np.isclose(s2.polydata().GetBounds()[0], b1[0] + 1)
+assert s2.polydata_cache_info()["misses"] == 2
+
 
 ###################################### faces
 print('faces()', np.array(sphere.faces()).shape , (2112, 3))
 assert np.array(sphere.faces()).shape == (2112, 3)
+offsets, conn = sphere.faces(fmt="csr")
+print('faces(fmt="csr")', offsets.shape, conn.shape)
+assert len(offsets) == 2113 and len(conn) == 2112 * 3
+assert np.all(sphere.faces(fmt="dense") == np.array(sphere.faces()))
 
 
 ###################################### texture
@@ -235,6 +269,25 @@ assert np.allclose(sphere.closest_point(pt),
                    [0.19883616, 0.48003298, 0.85441941])
 
 
+###################################### find_neighbors
+ids, dists = sphere.find_neighbors(sphere.points()[:10], n=3)
+print('find_neighbors', ids.shape, dists[:, 0])
+assert ids.shape == (10, 3)
+assert np.all(ids[:, 0] == np.arange(10))
+assert np.allclose(dists[:, 0], 0)
+offsets, ids, dists = sphere.find_neighbors([[0, 0, 1], [5, 5, 5]], radius=0.2)
+print('find_neighbors radius', offsets)
+assert offsets[-1] == offsets[1] == len(ids)
+
+
+###################################### compute_local_pca_features
+s2 = sphere.clone().compute_local_pca_features(n=10, features=["planarity", "normals"])
+print('compute_local_pca_features', s2.pointdata.keys())
+assert "Planarity" in s2.pointdata.keys()
+assert np.median(s2.pointdata["Planarity"]) > 0.5
+assert np.allclose(np.linalg.norm(s2.pointdata["Normals"], axis=1), 1)
+
+
 ###################################### findCellsWithin
 ics = sphere.find_cells_in(xbounds=(-0.5, 0.5))
 print('findCellsWithin',len(ics) , 1404)
@@ -346,6 +399,125 @@ q = utils.cyl2cart(*q)
 print("cart2spher spher2cyl cyl2cart", q)
 assert np.allclose(q, [5,2,3])
 
+###################################### native .vedo format
+import os, tempfile
+fvedo = os.path.join(tempfile.gettempdir(), "test_actors_cone.vedo")
+cw = cone.clone().pos(1,2,3)
+write(cw, fvedo)
+cr = load(fvedo)
+print("native format", cr.npoints, cr.pos())
+assert np.allclose(cr.points(), cw.points())
+assert np.array_equal(cr.faces(fmt="csr")[1], cw.faces(fmt="csr")[1])
+assert np.allclose(cr.pointdata["parr"], cw.pointdata["parr"])
+assert np.allclose(cr.celldata["carr"], cw.celldata["carr"])
+
+crs = load([fvedo, fvedo, fvedo], parallel=2)
+print("parallel load", len(crs))
+assert len(crs) == 3 and all(c.npoints == cw.npoints for c in crs)
+
+
+###################################### labels
+labs = cone.labels("id", on="cells")
+print("labels", labs.npoints)
+assert labs.npoints > 0 and np.max(labs.faces(fmt="csr")[1]) < labs.npoints
+
+
+###################################### cmap
+ids = np.arange(cone.npoints, dtype=np.int32)
+cone.cmap("jet", ids, name="ids", alpha=[0, 1])
+lut = cone.mapper().GetLookupTable()
+print("cmap", cone.pointdata["ids"].dtype, lut.GetNumberOfTableValues())
+assert cone.pointdata["ids"].dtype == np.int32
+ids[0] = 99  # the mesh keeps its own copy
+assert cone.pointdata["ids"][0] == 0
+assert lut.GetNumberOfTableValues() == 256
+assert np.allclose(lut.GetTableValue(0)[3], 0) and np.allclose(lut.GetTableValue(255)[3], 1)
+assert np.allclose(lut.GetRange(), [0, cone.npoints - 1])
+cone.cmap(["red", "blue"], ids)
+assert cone.mapper().GetLookupTable().GetNumberOfTableValues() == 2
+
+###################################### contains
+sph = Sphere(res=24)
+qpts = np.random.RandomState(0).uniform(-1.2, 1.2, (2000, 3))
+ins = sph.contains(qpts)
+print("contains", ins.sum())
+assert np.array_equal(np.nonzero(ins)[0], sph.inside_points(qpts, return_ids=True))
+# compare with vtkSelectEnclosedPoints on points which are not on the surface
+box = Box(size=(0, 1, 0, 1, 0, 1)).triangulate()
+bpts = np.random.RandomState(1).uniform(-0.5, 1.5, (5000, 3))
+bpts = bpts[np.all(np.abs(bpts - np.round(bpts)) > 1e-03, axis=1)]  # off the face planes
+sep = vtk.vtkSelectEnclosedPoints()
+sep.SetInputData(Points(bpts).polydata())
+sep.SetSurfaceData(box.polydata())
+sep.SetTolerance(1e-05)
+sep.Update()
+vins = utils.vtk2numpy(sep.GetOutput().GetPointData().GetArray("SelectedPoints")).astype(bool)
+assert vins.any() and np.array_equal(box.contains(bpts), vins)
+assert sph.is_inside([0, 0, 0]) and not sph.is_inside([2, 0, 0])
+r = np.linalg.norm(qpts, axis=1)
+assert np.all(ins[r < 0.95]) and not np.any(ins[r > 1.0])
+sph.pos(2, 0, 0)  # the cached classifier must follow the mesh
+assert sph.is_inside([2, 0, 0]) and not sph.is_inside([0, 0, 0])
+
+###################################### CollisionWorld
+balls = [Sphere(r=0.5, res=12).pos(1.5 * i, 0, 0) for i in range(6)]
+world = CollisionWorld(balls)
+assert world.step() == []
+balls[3].pos(3.8, 0.2, 0)
+contacts = world.step()
+print("collisions", [(i, j, len(ci), len(cj)) for i, j, ci, cj in contacts])
+assert [(i, j) for i, j, _, _ in contacts] == [(2, 3)]
+assert balls[2].collide_with(balls[3], return_bool=True)
+cmsh = balls[2].collide_with(balls[3])
+assert np.array_equal(np.sort(cmsh.metadata["ContactCells1"]), np.sort(contacts[0][2]))
+
+###################################### probe_points
+vol = Volume(np.arange(4 * 5 * 6, dtype=np.uint8).reshape(4, 5, 6), spacing=(1, 2, 1))
+ppts = [[0, 0, 0], [1.5, 3, 2.5], [3, 8, 5], [3.1, 8, 5]]
+pdata = probe_points(vol, ppts).pointdata
+print("probe_points", pdata["input_scalars"], pdata["vtkValidPointMask"])
+# value = x*30 + y/2*6 + z for the uint8 ramp, 56.5 is rounded up as vtk does
+assert pdata["input_scalars"].tolist() == [0, 57, 119, 0]
+assert pdata["vtkValidPointMask"].tolist() == [1, 1, 1, 0]
+plan = ProbePlan(vol, ppts)
+assert np.allclose(plan.apply("input_scalars"), [0, 56.5, 119, 0])
+assert np.allclose(plan.apply(np.ones(vol.inputdata().GetNumberOfPoints())), [1, 1, 1, 0])
+
+###################################### distances
+from vedo.distances import point_set_distance, batch_point_set_distance
+s1 = Sphere(res=24)
+s2 = Sphere(res=24).scale(1.2)
+print("chamfer, hausdorff", s1.chamfer_distance(s2), s1.hausdorff_distance(s2))
+assert np.isclose(s1.chamfer_distance(s2), 0.2)
+assert np.isclose(point_set_distance(s1, s2, "max"), 0.2)
+assert np.isclose(s1.hausdorff_distance(s2), 0.2)
+assert np.isclose(point_set_distance(s1, s2, "percentile", q=50, symmetric=True), 0.2)
+assert point_set_distance(s1, s2.clone().pos(1, 0, 0), "hausdorff", upper_bound=0.5) > 0.5
+dd = batch_point_set_distance([(s1, s2), (s2, s1), (s1, s1)], "chamfer")
+assert np.allclose(dd, [0.2, 0.2, 0])
+# nearly uniform distances, compare with vtkHausdorffDistancePointSetFilter
+s3, s4 = Sphere(res=60), Sphere(res=50).scale([1.05, 1.1, 0.95]).rotate_x(20)
+hp = vtk.vtkHausdorffDistancePointSetFilter()
+hp.SetInputData(0, s3.polydata())
+hp.SetInputData(1, s4.polydata())
+hp.SetTargetDistanceMethodToPointToCell()
+hp.Update()
+assert np.isclose(s3.hausdorff_distance(s4), hp.GetHausdorffDistance())
+
+###################################### registration
+from vedo.registration import batch_icp, icp, procrustes
+regt = Box(size=(1, 0.6, 0.4)).triangulate().subdivide(2)
+regs = [regt.clone().rotate_z(4 * i).shift(0.02 * i, 0, 0) for i in range(4)]
+mats, stats = batch_icp(regs, regt, mode="rigid")
+print("batch_icp", stats)
+assert stats["converged"].all() and stats["rms"].max() < 1e-4
+for s, M in zip(regs, mats):
+    assert np.allclose(s.clone().apply_transform(M, concatenate=True).points(), regt.points(), atol=1e-3)
+M, stats = icp(regt.clone().rotate_x(5).scale(1.1), regt, mode="similarity")
+assert stats["converged"] and np.isclose(np.linalg.det(M[:3, :3]), 1 / 1.1**3, rtol=1e-3)
+mats, mean, stats = procrustes(regs, mode="rigid")
+assert stats["converged"] and stats["rms"].max() < 1e-6
+
 ######################################
 print("OK with test_actors")
 
@@ -0,0 +1,185 @@
+import os
+import tempfile
+import numpy as np
+import vedo
+from vedo import load
+from vedo.file_io import BatchRenderer, Video, _lzf_decompress, _lzf_decode
+
+tmpdir = tempfile.mkdtemp()
+
+
+def write(name, content, mode="w"):
+    filename = os.path.join(tmpdir, name)
+    with open(filename, mode) as f:
+        f.write(content)
+    return filename
+
+
+def lzf_compress(data):
+    # naive LZF compressor, emits literal runs and back references
+    out, lit, i = bytearray(), bytearray(), 0
+
+    def flush():
+        while lit:
+            chunk = lit[:32]
+            out.append(len(chunk) - 1)
+            out.extend(chunk)
+            del lit[:32]
+
+    while i < len(data):
+        best, off = 0, 0
+        for j in range(max(0, i - 8192), i):
+            n = 0
+            while i + n < len(data) and n < 264 and data[j + n] == data[i + n]:
+                n += 1
+            if n > best:
+                best, off = n, i - j - 1
+        if best >= 3:
+            flush()
+            n = best - 2
+            if n < 7:
+                out.append((n << 5) | (off >> 8))
+            else:
+                out.append((7 << 5) | (off >> 8))
+                out.append(n - 7)
+            out.append(off & 255)
+            i += best
+        else:
+            lit.append(data[i])
+            i += 1
+    flush()
+    return bytes(out)
+
+
+verts = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 1]], dtype=float)
+vtext = "".join(f"{x} {y} {z}\n" for x, y, z in verts)
+
+###################################### lzf
+for raw in [b"abcabcabcabcXYZ" * 20, bytes(300), os.urandom(100), b""]:
+    assert _lzf_decode(lzf_compress(raw), len(raw)) == raw
+    assert _lzf_decompress(lzf_compress(raw), len(raw)) == raw
+try:
+    import lzf  # check the decoder on the output of the reference implementation
+    for raw in [b"abcabcabcabcXYZ" * 200, bytes(3000), np.arange(500).tobytes()]:
+        assert _lzf_decode(lzf.compress(raw), len(raw)) == raw
+except ImportError:
+    pass
+
+###################################### OFF with per-face colors
+fn = write("tri.off", "OFF\n# comment\n5 2 0\n" + vtext + "3 0 1 2 255 0 0\n3 0 2 3 0 255 0\n")
+m = load(fn)
+print("OFF", m.faces())
+assert np.allclose(m.points(), verts)
+assert np.array_equal(m.faces(), [[0, 1, 2], [0, 2, 3]])
+
+fn = write("mixed.off", "OFF 5 2 0\n" + vtext + "4 0 1 2 3 10 20 30\n3 0 1 4 0 255 0\n")
+m = load(fn)
+assert np.allclose(m.points(), verts)
+assert [list(f) for f in m.faces()] == [[0, 1, 2, 3], [0, 1, 4]]
+
+###################################### PCD
+header = (
+    "# .PCD v0.7\nVERSION 0.7\nFIELDS x y z intensity\nSIZE 4 4 4 4\n"
+    "TYPE F F F U\nCOUNT 1 1 1 1\nWIDTH 5\nHEIGHT 1\nPOINTS 5\n"
+)
+intensity = np.arange(5, dtype=np.uint32)
+
+fn = write("a.pcd", header + "DATA ascii\n" + "".join(
+    f"{x} {y} {z} {k}\n" for (x, y, z), k in zip(verts, intensity)))
+assert np.allclose(load(fn).points(), verts)
+
+rec = np.zeros(5, dtype=[("x", "<f4"), ("y", "<f4"), ("z", "<f4"), ("i", "<u4")])
+rec["x"], rec["y"], rec["z"], rec["i"] = verts[:, 0], verts[:, 1], verts[:, 2], intensity
+fn = write("b.pcd", (header + "DATA binary\n").encode() + rec.tobytes(), "wb")
+assert np.allclose(load(fn).points(), verts)
+
+# binary_compressed data are stored field by field
+raw = b"".join(rec[name].tobytes() for name in rec.dtype.names)
+comp = lzf_compress(raw)
+sizes = np.array([len(comp), len(raw)], dtype="<u4").tobytes()
+fn = write("c.pcd", (header + "DATA binary_compressed\n").encode() + sizes + comp, "wb")
+print("PCD", load(fn).points())
+assert np.allclose(load(fn).points(), verts)
+
+# a field with COUNT > 1 before the coordinates
+fn = write("n.pcd", "FIELDS normal x y z\nSIZE 4 4 4 4\nTYPE F F F F\nCOUNT 3 1 1 1\n"
+           "WIDTH 2\nHEIGHT 1\nPOINTS 2\nDATA ascii\n9 9 9 1 2 3\n8 8 8 4 5 6\n")
+assert np.allclose(load(fn).points(), [[1, 2, 3], [4, 5, 6]])
+
+fn = write("d.pcd", header + "DATA unknown\n")
+assert load(fn) is None
+
+###################################### Neutral
+fn = write("t.neu", "5\n" + vtext + "2\n1 1 2 3 4\n1 2 3 4 5\n")
+m = load(fn)
+assert np.allclose(m.points(), verts)
+assert np.array_equal(m.faces(), [[0, 1, 2, 3], [1, 2, 3, 4]])
+
+###################################### Gmsh v2
+nodes = "".join(f"{10 * (i + 1)} {x} {y} {z}\n" for i, (x, y, z) in enumerate(verts))
+elements = "3\n1 15 2 0 1 10\n2 2 2 0 1 10 20 30\n3 3 2 0 1 10 20 40 50\n"
+fn = write("m.gmsh", "$MeshFormat\n2.2 0 8\n$EndMeshFormat\n$Nodes\n5\n" + nodes
+           + "$EndNodes\n$Elements\n" + elements + "$EndElements\n")
+m = load(fn)
+print("Gmsh", m.faces())
+assert np.allclose(m.points(), verts)
+assert [list(f) for f in m.faces()] == [[0, 1, 2], [0, 1, 3, 4]]
+
+elements = "2\n1 2 2 0 1 10 20 30\n2 2 2 0 1 10 30 40\n"
+fn = write("t.gmsh", "$Nodes\n5\n" + nodes + "$EndNodes\n$Elements\n" + elements + "$EndElements\n")
+assert np.array_equal(load(fn).faces(), [[0, 1, 2], [0, 2, 3]])
+
+###################################### Video frame queue and spool (no rendering)
+def record(duration):
+    # collect the frames instead of encoding them
+    video = Video(os.path.join(tmpdir, "v.mp4"), duration=duration, fps=10)
+    out = []
+    video._open_writer = lambda shape: (lambda frame: out.append(np.array(frame)), shape)
+    video._close_writer = lambda writer: None
+    return video, out
+
+frames = [np.full((4, 6, 3), i, dtype=np.uint8) for i in range(3)]
+for duration in (None, 1):
+    video, out = record(duration)
+    video._add(frames[0])._add(frames[0])._add(frames[1]).pause(0.2)
+    video._add(frames[2][:3])  # the window was resized
+    video._add(np.full((5, 8, 3), 7, dtype=np.uint8))
+    spool = video.get_filename("frames.raw")
+    assert (video._thread is None) == bool(duration) and os.path.exists(spool) == bool(duration)
+    video.close()
+    print("Video", duration, video.frames)
+    assert video.frames == [0, 0, 1, 1, 1, 2, 3]
+    assert len(out) == 7 and all(f.shape == (4, 6, 3) for f in out)
+    assert np.array_equal(out[1], frames[0]) and np.array_equal(out[4], frames[1])
+    assert np.array_equal(out[5][:3], frames[2][:3]) and not out[5][3].any()
+    assert (out[6] == 7).all()
+    assert not os.path.exists(spool)
+
+def fail(shape):
+    raise RuntimeError("no encoder")
+
+video = Video(os.path.join(tmpdir, "v.mp4"))
+video._open_writer = fail
+for i in range(40):  # more than the queue size, must not block
+    video._add(np.full((4, 6, 3), i, dtype=np.uint8))
+video.close()
+assert isinstance(video._error, RuntimeError)
+
+###################################### BatchRenderer bookkeeping (no rendering)
+br = BatchRenderer(size=(8, 6))
+img = np.zeros((6, 8, 3), dtype=np.uint8)
+img[0] = 255  # top row
+fn = os.path.join(tmpdir, "async.png")
+br._write_async(img, fn)
+assert br.wait()._jobs == []
+assert np.array_equal(load(fn).tonumpy(), img)  # written top row first
+br.close()
+assert br._pool is None and br.renderer.GetActors().GetNumberOfItems() == 0
+
+vedo.base._thumbnail_renderer = BatchRenderer()
+vedo.base._close_thumbnail_renderer()  # registered with atexit
+assert vedo.base._thumbnail_renderer is None
+vedo.base._close_thumbnail_renderer()
+
+######################################
+print("OK with test_file_io")
@@ -2,7 +2,19 @@
 # -*- coding: utf-8 -*-
 from vedo import shapes, show, dataurl, settings
 from vedo import Picture, Mesh, Points, Point
-from vedo.pyplot import Figure, donut
+from vedo.pyplot import Figure, donut, histogram
+import numpy as np
+
+
+###################################### binned 2D histograms
+xy = np.random.RandomState(0).randn(2, 2000)
+hexs = histogram(xy[0], xy[1], mode="hex", bins=8)
+hmesh = hexs.unpack()[0]
+assert len(hexs.unpack()) == 1
+assert hmesh.celldata["Frequency"].max() == hmesh.bounds()[5]
+assert hmesh.inputdata().GetCellData().GetScalars().GetName() == "CellsRGBA"
+h3d = histogram(xy[0], xy[1], mode="3d", bins=8)
+assert h3d.actors[2].ncells == 8 * 8 * 6
 
 
 settings.use_parallel_projection = True
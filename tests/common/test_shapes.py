@@ -1,5 +1,5 @@
 
-from vedo import Arc, vtk_version
+from vedo import Arc, Text3D, preload_fonts, vtk_version, Spheres, InstancedGlyph
 import numpy as np
 
 print('-----------------------------------------------------')
@@ -9,3 +9,28 @@ print('-----------------------------------------------------')
 #####################################
 arc = Arc(center=None, point1=(1, 1, 1), point2=None, normal=(0, 0, 1), angle=np.pi)
 assert isinstance(arc, Arc)
+
+#####################################
+preload_fonts("Normografo")
+txt = Text3D("Ab1", font="Normografo")
+assert txt.npoints > 0 and np.max(txt.faces()) < txt.npoints
+
+#####################################
+pts = np.random.rand(20, 3)
+sph = Spheres(pts, r=np.linspace(0.01, 0.1, 20), c=["red", "blue"] * 10, res=4)
+assert sph.pointdata["Colors"].shape == (sph.npoints, 3)
+
+ig = InstancedGlyph(pts, r=np.ones(20), c=["red", "blue"] * 10, orientation=pts)
+scales = ig.pointdata["InstanceScales"]
+ig.update_instances(pos=pts + 1, r=np.full(20, 2.0))
+assert np.allclose(ig.points(), pts + 1, atol=1e-6)
+assert np.allclose(scales, 2)  # updated in place
+try:  # per-instance arrays must be given again when the #instances changes
+    ig.update_instances(pos=pts[:5])
+    assert False
+except ValueError:
+    assert ig.npoints == 20
+ig.update_instances(pos=pts[:5], r=np.arange(5) + 1, c="green", orientation=pts[:5])
+assert ig.npoints == 5 and not ig.mapper().GetScalarVisibility()
+assert np.allclose(ig.pointdata["InstanceScales"], np.arange(5) + 1)
+assert ig.mapper().GetScaling() and ig.mapper().GetOrient()
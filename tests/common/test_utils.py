@@ -37,3 +37,23 @@ print(make3d([[0,1,2], [6,7,8], [6,7,8], [6,7,4]]))
 
 print(make3d([[0,1], [6,7], [6,7], [6,7]]))
 # assert str() == ''
+
+from vedo.utils import buildPolyData, vtk2numpy
+
+poly = buildPolyData(np.random.rand(6, 3), [[0,1,2], [2,3,4,5]], lines=[[0,1,1,2], [4,5]])
+print(vtk2numpy(poly.GetPolys().GetData()), vtk2numpy(poly.GetLines().GetData()))
+assert vtk2numpy(poly.GetPolys().GetData()).tolist() == [3,0,1,2, 4,2,3,4,5]
+assert vtk2numpy(poly.GetLines().GetData()).tolist() == [2,0,1, 2,1,2, 2,4,5]
+
+from vedo.colors import get_color, get_colors
+
+cols = ["red", "dg", (0, 0, 1), 7, "#ff0000", (255, 0, 0), (0.2, 0.4, 0.6, 0.5)]
+rgba = get_colors(cols)
+print(rgba)
+assert rgba.dtype == np.uint8 and rgba.shape == (7, 4)
+for col, row in zip(cols[:-1], rgba):
+    assert np.allclose(row[:3], np.rint(np.array(get_color(col)) * 255))
+assert rgba[-1].tolist() == [51, 102, 153, 128]
+assert get_colors(["r", "b"]).shape == (2, 3)
+assert get_colors(["r", "b"], alpha=[0, 1])[:, 3].tolist() == [0, 255]
+assert get_colors(np.array([[0.0, 0.5, 1.0], [0, 128, 255]])).tolist() == [[0, 128, 255], [0, 128, 255]]
@@ -13,6 +13,7 @@
 import os
 import sys
 import logging
+import importlib
 import numpy as np
 from numpy import sin, cos, sqrt, exp, log, dot, cross  # just because handy
 
@@ -35,12 +36,43 @@ from vedo.pointcloud import *
 from vedo.mesh import *
 from vedo.picture import *
 from vedo.volume import *
-from vedo.tetmesh import *
-from vedo.addons import *
-from vedo.plotter import *
 
-from vedo import applications
-from vedo import interactor_modes
+# Heavier submodules are imported on first access (PEP 562), see __getattr__.
+# The names listed here must match the __all__ of each submodule.
+_lazy_submodules = {
+    "tetmesh": ("TetMesh", "delaunay3d"),
+    "addons": (
+        "ScalarBar",
+        "ScalarBar3D",
+        "Slider2D",
+        "Slider3D",
+        "Icon",
+        "LegendBox",
+        "Light",
+        "Axes",
+        "RendererFrame",
+        "Ruler",
+        "RulerAxes",
+        "Ruler2D",
+        "DistanceTool",
+        "SplineTool",
+        "Goniometer",
+        "Button",
+        "Flagpost",
+        "ProgressBarWidget",
+        "BoxCutter",
+        "PlaneCutter",
+        "SphereCutter",
+    ),
+    "plotter": ("Plotter", "show", "close"),
+    "distances": ("closest_distances", "point_set_distance", "batch_point_set_distance"),
+    "registration": ("icp", "batch_icp", "procrustes"),
+    "applications": (),
+    "interactor_modes": (),
+}
+_lazy_names = {
+    name: module for module, names in _lazy_submodules.items() for name in names
+}
 
 try:
     import platform
@@ -80,8 +112,8 @@ fonts_path = os.path.join(installdir, "fonts/")
 if not os.path.exists(fonts_path):
     fonts_path = "fonts/"
 
-fonts = [_f.split(".")[0] for _f in os.listdir(fonts_path) if '.npz' not in _f]
-fonts = list(sorted(fonts))
+# the list of available fonts is built on first access of vedo.fonts
+
 
 # pyplot module to remember last figure format
 last_figure = None
@@ -121,6 +153,38 @@ _chsh.setFormatter(_LoggingCustomFormatter())
 logger.addHandler(_chsh)
 logger.setLevel(logging.INFO)
 
+
+######################################################################### LAZY IMPORTS
+def __getattr__(name):
+    """Import heavy submodules and build the fonts list on first access (PEP 562)."""
+    if name in _lazy_submodules:
+        return importlib.import_module("vedo." + name)
+
+    if name in _lazy_names:
+        module = importlib.import_module("vedo." + _lazy_names[name])
+        obj = getattr(module, name)
+        globals()[name] = obj
+        return obj
+
+    if name == "fonts":
+        _fonts = [_f.split(".")[0] for _f in os.listdir(fonts_path) if ".npz" not in _f]
+        globals()["fonts"] = sorted(_fonts)
+        return globals()["fonts"]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_submodules) | set(_lazy_names) | {"fonts"})
+
+
+# star-imports (from vedo import *) also export the lazy names
+__all__ = [_n for _n in globals() if not _n.startswith("_")]
+__all__ += list(_lazy_names) + ["fonts"]
+# and the submodules which were exported when they were imported eagerly
+__all__ += ["tetmesh", "addons", "plotter", "applications", "interactor_modes"]
+
+
 ################################################# silence annoying messages
 # import warnings
 # warnings.simplefilter(action="ignore", category=FutureWarning)
@@ -743,11 +743,15 @@ class Browser(Plotter):
         font="Calco", # slider font
         axes=1,
         resetcam=False, # resetcam while using the slider
+        parallel=False, # read the files concurrently if objects is a string
         **kwargs,
     ):
         """
         Browse a series of vedo objects by using a simple slider.
 
+        If `objects` is a file name or a glob pattern the files are loaded,
+        concurrently if `parallel=True` (see `vedo.file_io.load()`).
+
         Examples:
             ```python
             from vedo import load, dataurl
@@ -764,7 +768,7 @@ class Browser(Plotter):
         Plotter.__init__(self, axes=axes, **kwargs)
 
         if isinstance(objects, str):
-            objects = vedo.file_io.load(objects)
+            objects = vedo.file_io.load(objects, parallel=parallel)
 
         self += objects
 
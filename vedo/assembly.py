@@ -32,6 +32,7 @@ def procrustes_alignment(sources, rigid=False):
 
     The set of average points generated by the algorithm can be accessed with
     ``algoutput.info['mean']`` as a numpy array.
+    See `vedo.registration.procrustes()` for a version which does not create new meshes.
 
     Arguments:
         rigid : bool
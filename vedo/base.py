@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import atexit
 import time
 import numpy as np
 
@@ -21,11 +22,25 @@ __all__ = [
     "BaseActor",
     "BaseActor2D",
     "BaseGrid",
+    "ProbePlan",
     "probe_points",
     "probe_line",
     "probe_plane",
 ]
 
+_thumbnail_renderer = None  # offscreen window shared by all thumbnail() calls
+
+
+def _close_thumbnail_renderer():
+    # release the window used by thumbnail(), also called at exit
+    global _thumbnail_renderer
+    if _thumbnail_renderer is not None:
+        _thumbnail_renderer.close()
+        _thumbnail_renderer = None
+
+
+atexit.register(_close_thumbnail_renderer)
+
 
 ###############################################################################
 class _DataArrayHelper:
@@ -947,38 +962,22 @@ class Base3DProp:
         return vedo.plotter.show(self, **options)
 
     def thumbnail(self, zoom=1.25, size=(200, 200), bg="white", azimuth=0, elevation=0, axes=False):
-        """Build a thumbnail of the object and return it as an array."""
-        # speed is about 20Hz for size=[200,200]
-        ren = vtk.vtkRenderer()
-        ren.AddActor(self)
-        if axes:
-            axes = vedo.addons.Axes(self)
-            ren.AddActor(axes)
-        ren.ResetCamera()
-        cam = ren.GetActiveCamera()
-        cam.Zoom(zoom)
-        cam.Elevation(elevation)
-        cam.Azimuth(azimuth)
-
-        ren_win = vtk.vtkRenderWindow()
-        ren_win.SetOffScreenRendering(True)
-        ren_win.SetSize(size)
-        ren.SetBackground(colors.get_color(bg))
-        ren_win.AddRenderer(ren)
-        ren_win.Render()
-
-        nx, ny = ren_win.GetSize()
-        arr = vtk.vtkUnsignedCharArray()
-        ren_win.GetRGBACharPixelData(0, 0, nx - 1, ny - 1, 0, arr)
-        narr = utils.vtk2numpy(arr).T[:3].T.reshape([ny, nx, 3])
-        narr = np.ascontiguousarray(np.flip(narr, axis=0))
-
-        ren.RemoveActor(self)
-        if axes:
-            ren.RemoveActor(axes)
-        ren_win.Finalize()
-        del ren_win
-        return narr
+        """
+        Build a thumbnail of the object and return it as an array.
+
+        The same offscreen rendering window is reused across calls and released at exit,
+        use `vedo.file_io.BatchRenderer` to render many objects or views at once.
+        """
+        global _thumbnail_renderer
+        if _thumbnail_renderer is None or tuple(_thumbnail_renderer.size) != tuple(size):
+            if _thumbnail_renderer is not None:
+                _thumbnail_renderer.close()
+            _thumbnail_renderer = vedo.file_io.BatchRenderer(size)
+        br = _thumbnail_renderer
+        br.renderer.SetBackground(colors.get_color(bg))
+        br.zoom = zoom
+        br.axes = axes
+        return br.render([self], [(azimuth, elevation)])[0, 0]
 
 
 ########################################################################################
@@ -1117,12 +1116,23 @@ class BaseActor(Base3DProp):
         return self.GetMapper().GetInput()
 
     def modified(self):
-        """Use in conjunction with `tonumpy()`
-        to update any modifications to the volume array"""
-        sc = self.inputdata().GetPointData().GetScalars()
-        if sc:
-            sc.Modified()
-        self.inputdata().GetPointData().Modified()
+        """
+        Notify that the object data have been modified in place, e.g. through
+        the numpy views returned by `tonumpy()`, `points_view()`, `pointdata[name]`
+        or `celldata[name]`.
+        """
+        data = self.inputdata()
+        if hasattr(data, "GetPoints") and data.GetPoints():
+            data.GetPoints().Modified()
+            self.point_locator = None
+            self.cell_locator = None
+        for fdata in (data.GetPointData(), data.GetCellData()):
+            for i in range(fdata.GetNumberOfArrays()):
+                arr = fdata.GetArray(i)
+                if arr:
+                    arr.Modified()
+            fdata.Modified()
+        data.Modified()
         return self
 
     @property
@@ -1146,7 +1156,15 @@ class BaseActor(Base3DProp):
         if pts is None:  ### getter
 
             if isinstance(self, vedo.Points):
-                vpts = self.polydata(transformed).GetPoints()
+                vpts = self.polydata(False).GetPoints()
+                if vpts and transformed:
+                    # apply the current transformation directly on the coordinates
+                    pts = utils.vtk2numpy(vpts.GetData())
+                    M = utils.vtk2numpy(self.GetMatrix())
+                    if np.array_equal(M, np.eye(4)):
+                        return np.array(pts)
+                    tpts = pts @ M[:3, :3].T + M[:3, 3]
+                    return tpts.astype(pts.dtype)
             elif isinstance(self, vedo.BaseVolume):
                 v2p = vtk.vtkImageToPoints()
                 v2p.SetInputData(self.imagedata())
@@ -1168,8 +1186,17 @@ class BaseActor(Base3DProp):
             if pts.shape[1] == 2:
                 pts = np.c_[pts, np.zeros(pts.shape[0], dtype=np.float32)]
             vpts = self.inputdata().GetPoints()
-            arr = utils.numpy2vtk(pts, dtype=np.float32)
-            vpts.SetData(arr)
+            current = utils.vtk2numpy(vpts.GetData()) if vpts and vpts.GetData() else None
+            if current is None or not (
+                current.__array_interface__["data"][0] == pts.__array_interface__["data"][0]
+                and current.shape == pts.shape
+                and current.strides == pts.strides
+            ):
+                # no copy is needed if the input is exactly the array returned by points_view(),
+                # otherwise make new vtkPoints as the old ones may be shared with other objects
+                vpts = vtk.vtkPoints()
+                vpts.SetData(utils.numpy2vtk(pts))
+                self.inputdata().SetPoints(vpts)
             vpts.Modified()
             # reset mesh to identity matrix position/rotation:
             self.PokeMatrix(vtk.vtkMatrix4x4())
@@ -1178,6 +1205,34 @@ class BaseActor(Base3DProp):
             return self
 
 
+    def points_view(self):
+        """
+        Return a writable numpy array which shares memory with the vertex coordinates
+        stored in the underlying `vtkPoints` object, no copy is made.
+        Coordinates are given in the local frame of the object, i.e. the current
+        position, orientation and scaling of the object are not applied.
+
+        After modifying the array in place call `modified()` to update the object.
+        Note that `pointdata[name]` and `celldata[name]` also return numpy views
+        of the data arrays which can be modified in place in the same way.
+
+        Example:
+            ```python
+            from vedo import Sphere
+            s = Sphere()
+            v = s.points_view()
+            v[:, 2] *= 2  # stretch the sphere in place
+            s.modified().show(axes=1).close()
+            ```
+        """
+        if isinstance(self, vedo.Points):
+            vpts = self.polydata(False).GetPoints()
+        else:
+            vpts = self.inputdata().GetPoints()
+        if vpts:
+            return utils.vtk2numpy(vpts.GetData())
+        return np.array([], dtype=np.float32)
+
     def cell_centers(self):
         """
         Get the coordinates of the cell centers.
@@ -1242,10 +1297,12 @@ class BaseActor(Base3DProp):
                 bnds[5] = zbounds[1]
 
         cellIds = vtk.vtkIdList()
-        self.cell_locator = vtk.vtkCellTreeLocator()
-        self.cell_locator.SetDataSet(self.polydata())
-        self.cell_locator.BuildLocator()
-        self.cell_locator.FindCellsWithinBounds(bnds, cellIds)
+        # a local locator: vtkCellTreeLocator cannot replace the shared
+        # cell_locator, which must support FindClosestPoint()
+        locator = vtk.vtkCellTreeLocator()
+        locator.SetDataSet(self.polydata())
+        locator.BuildLocator()
+        locator.FindCellsWithinBounds(bnds, cellIds)
 
         cids = []
         for i in range(cellIds.GetNumberOfIds()):
@@ -1940,29 +1997,16 @@ class BaseGrid(BaseActor):
         )
         return msh
 
-    def cells(self):
+    def cells(self, fmt="list"):
         """
         Get the cells connectivity ids as a numpy array.
 
         The output format is: `[[id0 ... idn], [id0 ... idm],  etc]`.
+
+        Use `fmt="csr"` to get a tuple of numpy arrays `(offsets, connectivity)`,
+        or `fmt="dense"` to get a (N, k) numpy array when all cells have k points.
         """
-        arr1d = utils.vtk2numpy(self._data.GetCells().GetData())
-        if arr1d is None:
-            return []
-
-        # Get cell connettivity ids as a 1D array. vtk format is:
-        # [nids1, id0 ... idn, niids2, id0 ... idm,  etc].
-        i = 0
-        conn = []
-        n = len(arr1d)
-        if n:
-            while True:
-                cell = [arr1d[i + k] for k in range(1, arr1d[i] + 1)]
-                conn.append(cell)
-                i += arr1d[i] + 1
-                if i >= n:
-                    break
-        return conn
+        return utils.cell_connectivity(self._data.GetCells(), fmt)
 
     def color(self, col, alpha=None, vmin=None, vmax=None):
         """
@@ -2474,6 +2518,183 @@ class BaseGrid(BaseActor):
         return ug
 
 
+########################################################################################
+class ProbePlan:
+    """
+    Precomputed interpolation of the point data of a dataset at a set of points.
+    """
+
+    def __init__(self, dataset, pts):
+        """
+        Locate the points `pts` in the cells of `dataset` and store the ids of the
+        points of these cells together with their interpolation weights.
+        Any point data array of the dataset, or any new field defined on its points,
+        can then be sampled at `pts` with `apply()` in a single vectorized gather.
+
+        For a `Volume` (or a `vtkImageData`) the trilinear weights are computed
+        directly with numpy, for other datasets (e.g. a `TetMesh` or a `UGrid`)
+        the cells are located only once by vtk.
+        Points outside the dataset are flagged in `valid` and get a zero value.
+
+        Arguments:
+            dataset : (Volume, TetMesh, UGrid, vtkDataSet)
+                the dataset to be probed
+            pts : (list, Points)
+                the points where to sample the dataset
+
+        Example:
+            ```python
+            import numpy as np
+            from vedo import Volume, ProbePlan
+            vol = Volume(np.random.rand(10, 10, 10))
+            plan = ProbePlan(vol, np.random.rand(1000, 3) * 9)
+            values = plan.apply("input_scalars")
+            values2 = plan.apply(vol.pointdata["input_scalars"] ** 2)
+            ```
+        """
+        if isinstance(pts, vedo.pointcloud.Points):
+            pts = pts.points()
+        pts = np.asarray(pts, dtype=float).reshape(-1, 3)
+
+        self.dataset = _getinput(dataset)
+        self.npoints = len(pts)
+        self.cell_ids = None  # id of the cell containing each point or -1
+        self.point_ids = None  # ids of the points of that cell
+        self.weights = None  # interpolation weights of those points
+        self.valid = None  # mask of the points found inside the dataset
+
+        if isinstance(self.dataset, vtk.vtkImageData):
+            self._image_plan(pts)
+        else:
+            self._cell_plan(pts)
+        self.weights[~self.valid] = 0
+
+    def __len__(self):
+        return self.npoints
+
+    def apply(self, values):
+        """
+        Interpolate a field defined on the points of the dataset.
+
+        Arguments:
+            values : (str, numpy.ndarray)
+                name of a point data array of the dataset,
+                or an array of shape (npoints,) or (npoints, ncomponents)
+        """
+        if isinstance(values, str):
+            arr = self.dataset.GetPointData().GetArray(values)
+            if arr is None:
+                vedo.logger.error(f"in ProbePlan.apply(), no point data array named {values}")
+                raise ValueError(values)
+            values = utils.vtk2numpy(arr)
+        values = np.asarray(values)
+        if len(values) != self.dataset.GetNumberOfPoints():
+            vedo.logger.error(
+                f"in ProbePlan.apply(), expected {self.dataset.GetNumberOfPoints()} values,"
+                f" got {len(values)}"
+            )
+            raise ValueError(values.shape)
+        if values.ndim == 1:
+            return np.einsum("nk,nk->n", values[self.point_ids], self.weights)
+        return np.einsum("nkm,nk->nm", values[self.point_ids], self.weights)
+
+    def _image_plan(self, pts):
+        img = self.dataset
+        dims = np.array(img.GetDimensions())
+        spacing = np.array(img.GetSpacing())
+        loc = pts - img.GetOrigin()
+        if hasattr(img, "GetDirectionMatrix"):
+            dm = img.GetDirectionMatrix()
+            dmat = np.array([[dm.GetElement(i, j) for j in range(3)] for i in range(3)])
+            loc = loc @ dmat
+        loc = loc / spacing - img.GetExtent()[::2]
+        ncells = np.maximum(dims - 1, 0)
+        cloc = np.clip(loc, 0, ncells)
+
+        # accept points just outside the image as vtkProbeFilter does,
+        # within a tolerance of 1/1000 of the cell diagonal
+        tol = 1e-3 * np.linalg.norm(spacing * (dims > 1))
+        self.valid = np.linalg.norm((loc - cloc) * spacing, axis=1) <= tol
+
+        i0 = np.minimum(np.floor(cloc).astype(int), np.maximum(dims - 2, 0))
+        frac = cloc - i0
+        ncs = np.maximum(ncells, 1)
+        self.cell_ids = i0[:, 0] + i0[:, 1] * ncs[0] + i0[:, 2] * (ncs[0] * ncs[1])
+        self.cell_ids[~self.valid] = -1
+
+        # the 8 corners of the voxels in vtk order, x varying fastest
+        strides = np.array([1, dims[0], dims[0] * dims[1]]) * (dims > 1)
+        corners = np.array([[c & 1, (c >> 1) & 1, (c >> 2) & 1] for c in range(8)])
+        base = i0[:, 0] * strides[0] + i0[:, 1] * strides[1] + i0[:, 2] * strides[2]
+        self.point_ids = base[:, None] + corners @ strides
+        wx, wy, wz = (np.c_[1 - frac[:, i], frac[:, i]] for i in range(3))
+        self.weights = (wz[:, :, None, None] * wy[:, None, :, None] * wx[:, None, None, :]).reshape(-1, 8)
+
+    def _cell_plan(self, pts):
+        data = self.dataset
+        # probe an array of cell ids: cell data are passed unchanged by vtkProbeFilter
+        src = data.NewInstance()
+        src.CopyStructure(data)
+        cids = utils.numpy2vtk(np.arange(data.GetNumberOfCells()), dtype="id")
+        cids.SetName("ProbePlanCellIds")
+        src.GetCellData().AddArray(cids)
+        probe_filter = vtk.vtkProbeFilter()
+        probe_filter.SetSourceData(src)
+        probe_filter.SetInputData(_points_polydata(pts, verts=False))
+        probe_filter.Update()
+        out = probe_filter.GetOutput().GetPointData()
+        self.valid = utils.vtk2numpy(out.GetArray("vtkValidPointMask")).astype(bool)
+        self.cell_ids = utils.vtk2numpy(out.GetArray("ProbePlanCellIds")).astype(int)
+        self.cell_ids[~self.valid] = -1
+
+        found = np.nonzero(self.valid)[0]
+        if isinstance(data, vtk.vtkUnstructuredGrid) and data.GetNumberOfCells():
+            offsets = utils.vtk2numpy(data.GetCells().GetOffsetsArray())
+            conn = utils.vtk2numpy(data.GetCells().GetConnectivityArray())
+            types = utils.vtk2numpy(data.GetCellTypesArray())
+        else:
+            offsets = types = None
+
+        size = 1
+        if len(found) and offsets is not None:
+            size = np.max(np.diff(offsets)[self.cell_ids[found]])
+        elif len(found):
+            size = data.GetMaxCellSize()
+        self.point_ids = np.zeros((len(pts), size), dtype=int)
+        self.weights = np.zeros((len(pts), size))
+        if offsets is None:
+            self._evaluate_cells(pts, found)
+            return
+
+        ctypes = types[self.cell_ids[found]]
+        coords = utils.vtk2numpy(data.GetPoints().GetData())
+        # vtk cell types of tetras, triangles, lines and vertices
+        simplices = {10: 4, 5: 3, 3: 2, 1: 1}
+        for ctype, n in simplices.items():
+            sel = found[ctypes == ctype]
+            if len(sel) == 0:
+                continue
+            ids = conn[offsets[self.cell_ids[sel]][:, None] + np.arange(n)]
+            self.point_ids[sel, :n] = ids
+            self.weights[sel, :n] = _simplex_weights(coords[ids], pts[sel])
+        others = np.isin(ctypes, list(simplices))
+        self._evaluate_cells(pts, found[~others])
+
+    def _evaluate_cells(self, pts, sel):
+        # generic (slower) path: ask each cell for its interpolation weights
+        data = self.dataset
+        cell = vtk.vtkGenericCell()
+        closest, pcoords = [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]
+        sub_id, dist2 = vtk.mutable(0), vtk.mutable(0.0)
+        for i in sel:
+            data.GetCell(self.cell_ids[i], cell)
+            n = cell.GetNumberOfPoints()
+            weights = [0.0] * n
+            cell.EvaluatePosition(pts[i], closest, sub_id, pcoords, dist2, weights)
+            self.point_ids[i, :n] = [cell.GetPointId(j) for j in range(n)]
+            self.weights[i, :n] = weights
+
+
 ############################################################################### funcs
 def _getinput(obj):
     if isinstance(obj, (vtk.vtkVolume, vtk.vtkActor)):
@@ -2481,6 +2702,34 @@ def _getinput(obj):
     return obj
 
 
+def _points_polydata(pts, verts=True):
+    # polydata of the points, optionally with a single vertex cell holding them all
+    poly = vtk.vtkPolyData()
+    vpts = vtk.vtkPoints()
+    vpts.SetData(utils.numpy2vtk(pts, dtype=float))
+    poly.SetPoints(vpts)
+    if verts:
+        poly.SetVerts(utils._csr_to_cellarray([0, len(pts)], np.arange(len(pts))))
+    return poly
+
+
+def _simplex_weights(verts, pts):
+    # barycentric coordinates of pts in the simplices verts of shape (n, k, 3),
+    # points lying off a triangle or a line are projected on it as vtk does
+    k = verts.shape[1]
+    if k == 1:
+        return np.ones((len(pts), 1))
+    edges = verts[:, 1:] - verts[:, :1]
+    d = pts - verts[:, 0]
+    if k == 4:
+        rst = np.linalg.solve(edges.transpose(0, 2, 1), d[..., None])[..., 0]
+    else:
+        gram = np.einsum("nid,njd->nij", edges, edges)
+        rhs = np.einsum("nid,nd->ni", edges, d)
+        rst = np.linalg.solve(gram, rhs[..., None])[..., 0]
+    return np.c_[1 - rst.sum(axis=1), rst]
+
+
 def probe_points(dataset, pts):
     """
     Takes a `Volume` (or any other vtk data set)
@@ -2489,6 +2738,9 @@ def probe_points(dataset, pts):
     Note that a mask is also output with valid/invalid points which can be accessed
     with `mesh.pointdata['vtkValidPointMask']`.
 
+    Volumes are sampled by trilinear interpolation directly in numpy.
+    To probe other datasets repeatedly at the same points use a `ProbePlan`.
+
     Examples:
         - [probe_points.py](https://github.com/marcomusy/vedo/tree/master/examples/volumetric/probe_points.py)
 
@@ -2496,30 +2748,53 @@ def probe_points(dataset, pts):
     """
     if isinstance(pts, vedo.pointcloud.Points):
         pts = pts.points()
+    pts = np.asarray(pts, dtype=float).reshape(-1, 3)
 
-    def _readpoints():
-        output = src.GetPolyDataOutput()
-        points = vtk.vtkPoints()
-        for p in pts:
-            x, y, z = p
-            points.InsertNextPoint(x, y, z)
-        output.SetPoints(points)
-
-        cells = vtk.vtkCellArray()
-        cells.InsertNextCell(len(pts))
-        for i in range(len(pts)):
-            cells.InsertCellPoint(i)
-        output.SetVerts(cells)
-
-    src = vtk.vtkProgrammableSource()
-    src.SetExecuteMethod(_readpoints)
-    src.Update()
     img = _getinput(dataset)
-    probeFilter = vtk.vtkProbeFilter()
-    probeFilter.SetSourceData(img)
-    probeFilter.SetInputConnection(src.GetOutputPort())
-    probeFilter.Update()
-    poly = probeFilter.GetOutput()
+    src = _points_polydata(pts)
+    sdata = img.GetPointData()
+    names = [sdata.GetArrayName(i) for i in range(sdata.GetNumberOfArrays())]
+    if (
+        isinstance(img, vtk.vtkImageData)
+        and img.GetCellData().GetNumberOfArrays() == 0
+        and all(names)
+    ):
+        # same output as vtkProbeFilter: arrays sorted by name, then the mask
+        plan = ProbePlan(img, pts)
+        poly = src
+        pdata = poly.GetPointData()
+        for i in sorted(range(len(names)), key=names.__getitem__):
+            arr = sdata.GetArray(i)
+            values = plan.apply(utils.vtk2numpy(arr))
+            out = arr.NewInstance()
+            out.SetName(names[i])
+            out.SetNumberOfComponents(arr.GetNumberOfComponents())
+            out.SetNumberOfTuples(len(pts))
+            if len(pts):
+                vout = utils.vtk2numpy(out)
+                if np.issubdtype(vout.dtype, np.integer):
+                    # round half away from zero and clamp, as vtk does
+                    info = np.iinfo(vout.dtype)
+                    values = np.where(values >= 0, np.floor(values + 0.5), np.ceil(values - 0.5))
+                    values = np.clip(values, info.min, info.max)
+                vout[:] = values
+            pdata.AddArray(out)
+            attr = sdata.IsArrayAnAttribute(i)
+            if attr >= 0:
+                pdata.SetActiveAttribute(names[i], attr)
+        mask = vtk.vtkCharArray()
+        mask.SetName("vtkValidPointMask")
+        mask.SetNumberOfTuples(len(pts))
+        if len(pts):
+            utils.vtk2numpy(mask)[:] = plan.valid
+        pdata.AddArray(mask)
+    else:
+        probeFilter = vtk.vtkProbeFilter()
+        probeFilter.SetSourceData(img)
+        probeFilter.SetInputData(src)
+        probeFilter.Update()
+        poly = probeFilter.GetOutput()
+
     pm = vedo.mesh.Mesh(poly)
     pm.name = "ProbePoints"
     pm.pipeline = utils.OperationNode("probe_points", parents=[dataset])
@@ -1,20384 +1,34 @@
-cmaps = {
-  "Accent": [
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#7fc97f",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#beaed4",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#fdc086",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#386cb0",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#f0027f",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#bf5b16",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666"
-  ],
-  "Blues": [
-    "#f7fbff",
-    "#f6fafe",
-    "#f5f9fe",
-    "#f4f9fe",
-    "#f3f8fd",
-    "#f3f8fd",
-    "#f2f7fd",
-    "#f1f7fd",
-    "#f0f6fc",
-    "#eff6fc",
-    "#eff5fc",
-    "#eef5fc",
-    "#edf4fb",
-    "#ecf4fb",
-    "#ecf3fb",
-    "#ebf3fb",
-    "#eaf2fa",
-    "#e9f2fa",
-    "#e8f1fa",
-    "#e8f1fa",
-    "#e7f0f9",
-    "#e6f0f9",
-    "#e5eff9",
-    "#e4eff9",
-    "#e4eef8",
-    "#e3eef8",
-    "#e2edf8",
-    "#e1edf8",
-    "#e1ecf7",
-    "#e0ecf7",
-    "#dfebf7",
-    "#deebf7",
-    "#ddeaf6",
-    "#ddeaf6",
-    "#dce9f6",
-    "#dbe9f6",
-    "#dae8f5",
-    "#dae8f5",
-    "#d9e7f5",
-    "#d8e7f5",
-    "#d7e6f4",
-    "#d7e6f4",
-    "#d6e5f4",
-    "#d5e5f4",
-    "#d4e4f3",
-    "#d4e4f3",
-    "#d3e3f3",
-    "#d2e3f3",
-    "#d1e2f2",
-    "#d1e2f2",
-    "#d0e1f2",
-    "#cfe1f2",
-    "#cee0f1",
-    "#cee0f1",
-    "#cddff1",
-    "#ccdff1",
-    "#cbdef0",
-    "#cbdef0",
-    "#caddf0",
-    "#c9ddf0",
-    "#c8dcef",
-    "#c8dcef",
-    "#c7dbef",
-    "#c6dbef",
-    "#c5daee",
-    "#c4daee",
-    "#c3d9ee",
-    "#c1d9ed",
-    "#c0d8ed",
-    "#bfd8ec",
-    "#bed7ec",
-    "#bcd7eb",
-    "#bbd6eb",
-    "#bad6ea",
-    "#b9d5ea",
-    "#b7d4ea",
-    "#b6d4e9",
-    "#b5d3e9",
-    "#b4d3e8",
-    "#b2d2e8",
-    "#b1d2e7",
-    "#b0d1e7",
-    "#afd1e6",
-    "#add0e6",
-    "#acd0e6",
-    "#abcfe5",
-    "#aacfe5",
-    "#a8cee4",
-    "#a7cee4",
-    "#a6cde3",
-    "#a5cde3",
-    "#a3cce3",
-    "#a2cbe2",
-    "#a1cbe2",
-    "#a0cae1",
-    "#9ecae1",
-    "#9dc9e0",
-    "#9bc8e0",
-    "#9ac7e0",
-    "#98c7df",
-    "#97c6df",
-    "#95c5df",
-    "#93c4de",
-    "#92c3de",
-    "#90c2de",
-    "#8fc1dd",
-    "#8dc0dd",
-    "#8bc0dd",
-    "#8abfdc",
-    "#88bedc",
-    "#87bddc",
-    "#85bcdb",
-    "#83bbdb",
-    "#82badb",
-    "#80b9da",
-    "#7fb8da",
-    "#7db8d9",
-    "#7bb7d9",
-    "#7ab6d9",
-    "#78b5d8",
-    "#77b4d8",
-    "#75b3d8",
-    "#73b2d7",
-    "#72b1d7",
-    "#70b1d7",
-    "#6fb0d6",
-    "#6dafd6",
-    "#6baed6",
-    "#6aadd5",
-    "#69acd5",
-    "#67abd4",
-    "#66aad4",
-    "#65aad3",
-    "#63a9d3",
-    "#62a8d2",
-    "#61a7d2",
-    "#60a6d1",
-    "#5ea5d1",
-    "#5da4d0",
-    "#5ca3d0",
-    "#5aa3cf",
-    "#59a2cf",
-    "#58a1ce",
-    "#57a0ce",
-    "#559fcd",
-    "#549ecd",
-    "#539dcc",
-    "#519ccc",
-    "#509bcb",
-    "#4f9bcb",
-    "#4e9aca",
-    "#4c99ca",
-    "#4b98c9",
-    "#4a97c9",
-    "#4896c8",
-    "#4795c8",
-    "#4694c7",
-    "#4594c7",
-    "#4393c6",
-    "#4292c6",
-    "#4191c5",
-    "#4090c5",
-    "#3f8fc4",
-    "#3e8ec4",
-    "#3d8dc3",
-    "#3c8cc3",
-    "#3b8bc2",
-    "#3a8ac1",
-    "#3989c1",
-    "#3888c0",
-    "#3787c0",
-    "#3585bf",
-    "#3484bf",
-    "#3383be",
-    "#3282be",
-    "#3181bd",
-    "#3080bd",
-    "#2f7fbc",
-    "#2e7ebc",
-    "#2d7dbb",
-    "#2c7cbb",
-    "#2b7bba",
-    "#2a7ab9",
-    "#2979b9",
-    "#2878b8",
-    "#2777b8",
-    "#2676b7",
-    "#2575b7",
-    "#2474b6",
-    "#2373b6",
-    "#2272b5",
-    "#2171b5",
-    "#2070b4",
-    "#1f6fb3",
-    "#1e6eb2",
-    "#1e6db2",
-    "#1d6cb1",
-    "#1c6bb0",
-    "#1b6aaf",
-    "#1a69ae",
-    "#1a68ae",
-    "#1967ad",
-    "#1866ac",
-    "#1765ab",
-    "#1764ab",
-    "#1663aa",
-    "#1562a9",
-    "#1461a8",
-    "#1360a7",
-    "#135fa7",
-    "#125ea6",
-    "#115da5",
-    "#105ca4",
-    "#0f5ba3",
-    "#0f5aa3",
-    "#0e59a2",
-    "#0d58a1",
-    "#0c57a0",
-    "#0c56a0",
-    "#0b559f",
-    "#0a549e",
-    "#09539d",
-    "#08529c",
-    "#08519c",
-    "#08509a",
-    "#084f99",
-    "#084e97",
-    "#084c96",
-    "#084b94",
-    "#084a92",
-    "#084991",
-    "#08488f",
-    "#08478e",
-    "#08468c",
-    "#08458b",
-    "#084489",
-    "#084388",
-    "#084286",
-    "#084185",
-    "#084083",
-    "#083f82",
-    "#083e80",
-    "#083d7e",
-    "#083c7d",
-    "#083b7b",
-    "#083a7a",
-    "#083978",
-    "#083877",
-    "#083775",
-    "#083674",
-    "#083572",
-    "#083471",
-    "#08336f",
-    "#08326e",
-    "#08316c",
-    "#08306b"
-  ],
-  "BrBG": [
-    "#543005",
-    "#563105",
-    "#583205",
-    "#5a3305",
-    "#5c3505",
-    "#5e3605",
-    "#613706",
-    "#633906",
-    "#653a06",
-    "#673b06",
-    "#693c06",
-    "#6c3e07",
-    "#6e3f07",
-    "#704007",
-    "#724207",
-    "#744307",
-    "#774408",
-    "#794508",
-    "#7b4708",
-    "#7d4808",
-    "#7f4908",
-    "#824b09",
-    "#844c09",
-    "#864d09",
-    "#884f09",
-    "#8a5009",
-    "#8d510a",
-    "#8f530c",
-    "#91550d",
-    "#93570e",
-    "#955910",
-    "#975b11",
-    "#995d12",
-    "#9b5f14",
-    "#9d6115",
-    "#9f6217",
-    "#a16418",
-    "#a36619",
-    "#a5681b",
-    "#a76a1c",
-    "#a96c1d",
-    "#ab6e1f",
-    "#ad7020",
-    "#af7122",
-    "#b17323",
-    "#b37524",
-    "#b57726",
-    "#b77927",
-    "#b97b28",
-    "#bb7d2a",
-    "#bd7f2b",
-    "#bf812d",
-    "#c08330",
-    "#c18633",
-    "#c28836",
-    "#c48b39",
-    "#c58d3c",
-    "#c6903f",
-    "#c79242",
-    "#c99546",
-    "#ca9749",
-    "#cb9a4c",
-    "#cc9d4f",
-    "#ce9f52",
-    "#cfa255",
-    "#d0a458",
-    "#d1a75c",
-    "#d3a95f",
-    "#d4ac62",
-    "#d5ae65",
-    "#d6b168",
-    "#d8b36b",
-    "#d9b66e",
-    "#dab972",
-    "#dbbb75",
-    "#ddbe78",
-    "#dec07b",
-    "#dfc27e",
-    "#e0c481",
-    "#e1c583",
-    "#e2c786",
-    "#e3c889",
-    "#e3ca8c",
-    "#e4cb8e",
-    "#e5cd91",
-    "#e6ce94",
-    "#e7d097",
-    "#e8d199",
-    "#e9d39c",
-    "#ead49f",
-    "#ebd6a2",
-    "#ecd7a4",
-    "#ecd9a7",
-    "#eddaaa",
-    "#eedcad",
-    "#efddaf",
-    "#f0dfb2",
-    "#f1e0b5",
-    "#f2e2b8",
-    "#f3e3ba",
-    "#f4e5bd",
-    "#f5e6c0",
-    "#f6e8c3",
-    "#f5e8c4",
-    "#f5e9c6",
-    "#f5e9c8",
-    "#f5eaca",
-    "#f5eacc",
-    "#f5ebce",
-    "#f5ebd0",
-    "#f5ecd2",
-    "#f5ecd4",
-    "#f5edd6",
-    "#f5edd8",
-    "#f5eeda",
-    "#f5eedc",
-    "#f5efde",
-    "#f5efe0",
-    "#f5f0e2",
-    "#f5f0e4",
-    "#f5f1e6",
-    "#f5f1e8",
-    "#f5f2ea",
-    "#f5f2ec",
-    "#f5f3ee",
-    "#f5f3f0",
-    "#f5f4f2",
-    "#f5f4f4",
-    "#f4f4f4",
-    "#f2f4f4",
-    "#f0f3f3",
-    "#eef3f2",
-    "#ecf3f2",
-    "#ebf2f1",
-    "#e9f2f0",
-    "#e7f1f0",
-    "#e5f1ef",
-    "#e3f0ef",
-    "#e2f0ee",
-    "#e0f0ed",
-    "#deefed",
-    "#dcefec",
-    "#daeeeb",
-    "#d9eeeb",
-    "#d7edea",
-    "#d5edea",
-    "#d3ede9",
-    "#d1ece8",
-    "#d0ece8",
-    "#ceebe7",
-    "#ccebe6",
-    "#caeae6",
-    "#c8eae5",
-    "#c7eae5",
-    "#c4e8e3",
-    "#c1e7e2",
-    "#bee6e0",
-    "#bbe5df",
-    "#b9e4dd",
-    "#b6e3dc",
-    "#b3e2db",
-    "#b0e0d9",
-    "#addfd8",
-    "#abded6",
-    "#a8ddd5",
-    "#a5dcd4",
-    "#a2dbd2",
-    "#a0dad1",
-    "#9dd8cf",
-    "#9ad7ce",
-    "#97d6cd",
-    "#94d5cb",
-    "#92d4ca",
-    "#8fd3c8",
-    "#8cd2c7",
-    "#89d0c5",
-    "#86cfc4",
-    "#84cec3",
-    "#81cdc1",
-    "#7ecbc0",
-    "#7bc9be",
-    "#78c7bc",
-    "#75c5ba",
-    "#72c3b8",
-    "#6fc1b6",
-    "#6cbfb4",
-    "#69bdb2",
-    "#67bbb0",
-    "#64b8ae",
-    "#61b6ac",
-    "#5eb4aa",
-    "#5bb2a8",
-    "#58b0a6",
-    "#55aea4",
-    "#52aca2",
-    "#4faaa0",
-    "#4ca79e",
-    "#49a59c",
-    "#46a39a",
-    "#43a198",
-    "#409f96",
-    "#3d9d94",
-    "#3a9b92",
-    "#379990",
-    "#35978f",
-    "#32958d",
-    "#30938b",
-    "#2e9189",
-    "#2c8f87",
-    "#2a8d85",
-    "#288b83",
-    "#268981",
-    "#24877f",
-    "#22857d",
-    "#20837b",
-    "#1e8179",
-    "#1c7f77",
-    "#1a7e76",
-    "#187c74",
-    "#167a72",
-    "#147870",
-    "#12766e",
-    "#10746c",
-    "#0e726a",
-    "#0c7068",
-    "#0a6e66",
-    "#086c64",
-    "#066a62",
-    "#046860",
-    "#02665e",
-    "#00655d",
-    "#00635b",
-    "#006159",
-    "#006057",
-    "#005e55",
-    "#005c54",
-    "#005b52",
-    "#005950",
-    "#00584e",
-    "#00564c",
-    "#00544b",
-    "#005349",
-    "#005147",
-    "#004f45",
-    "#004e43",
-    "#004c42",
-    "#004a40",
-    "#00493e",
-    "#00473c",
-    "#00453a",
-    "#004439",
-    "#004237",
-    "#004035",
-    "#003f33",
-    "#003d31",
-    "#003c30"
-  ],
-  "BuGn": [
-    "#f7fcfd",
-    "#f6fbfc",
-    "#f5fbfc",
-    "#f5fbfc",
-    "#f4fbfc",
-    "#f4fafc",
-    "#f3fafc",
-    "#f3fafc",
-    "#f2fafb",
-    "#f1fafb",
-    "#f1f9fb",
-    "#f0f9fb",
-    "#f0f9fb",
-    "#eff9fb",
-    "#eff8fb",
-    "#eef8fb",
-    "#edf8fa",
-    "#edf8fa",
-    "#ecf8fa",
-    "#ecf7fa",
-    "#ebf7fa",
-    "#ebf7fa",
-    "#eaf7fa",
-    "#eaf6fa",
-    "#e9f6f9",
-    "#e8f6f9",
-    "#e8f6f9",
-    "#e7f6f9",
-    "#e7f5f9",
-    "#e6f5f9",
-    "#e6f5f9",
-    "#e5f5f9",
-    "#e4f4f8",
-    "#e4f4f8",
-    "#e3f4f7",
-    "#e2f4f7",
-    "#e1f3f6",
-    "#e0f3f5",
-    "#e0f3f5",
-    "#dff2f4",
-    "#def2f4",
-    "#ddf2f3",
-    "#ddf2f2",
-    "#dcf1f2",
-    "#dbf1f1",
-    "#daf1f1",
-    "#d9f1f0",
-    "#d9f0ef",
-    "#d8f0ef",
-    "#d7f0ee",
-    "#d6efee",
-    "#d6efed",
-    "#d5efed",
-    "#d4efec",
-    "#d3eeeb",
-    "#d2eeeb",
-    "#d2eeea",
-    "#d1edea",
-    "#d0ede9",
-    "#cfede8",
-    "#ceede8",
-    "#ceece7",
-    "#cdece7",
-    "#ccece6",
-    "#cbebe5",
-    "#caebe4",
-    "#c8eae3",
-    "#c6e9e3",
-    "#c5e9e2",
-    "#c3e8e1",
-    "#c2e8e0",
-    "#c0e7df",
-    "#bee6de",
-    "#bde6dd",
-    "#bbe5dc",
-    "#bae4db",
-    "#b8e4da",
-    "#b6e3d9",
-    "#b5e3d9",
-    "#b3e2d8",
-    "#b2e1d7",
-    "#b0e1d6",
-    "#aee0d5",
-    "#addfd4",
-    "#abdfd3",
-    "#aaded2",
-    "#a8ded1",
-    "#a6ddd0",
-    "#a5dccf",
-    "#a3dccf",
-    "#a2dbce",
-    "#a0dacd",
-    "#9edacc",
-    "#9dd9cb",
-    "#9bd9ca",
-    "#9ad8c9",
-    "#98d7c8",
-    "#96d7c7",
-    "#95d6c6",
-    "#93d5c5",
-    "#92d4c3",
-    "#90d4c2",
-    "#8ed3c1",
-    "#8dd2c0",
-    "#8bd2bf",
-    "#8ad1be",
-    "#88d0bc",
-    "#86d0bb",
-    "#85cfba",
-    "#83ceb9",
-    "#82ceb8",
-    "#80cdb7",
-    "#7eccb5",
-    "#7dccb4",
-    "#7bcbb3",
-    "#7acab2",
-    "#78c9b1",
-    "#76c9b0",
-    "#75c8af",
-    "#73c7ad",
-    "#72c7ac",
-    "#70c6ab",
-    "#6ec5aa",
-    "#6dc5a9",
-    "#6bc4a8",
-    "#6ac3a6",
-    "#68c3a5",
-    "#66c2a4",
-    "#65c1a3",
-    "#64c1a1",
-    "#63c0a0",
-    "#61bf9e",
-    "#60bf9d",
-    "#5fbe9c",
-    "#5ebd9a",
-    "#5dbd99",
-    "#5cbc97",
-    "#5abc96",
-    "#59bb94",
-    "#58ba93",
-    "#57ba91",
-    "#56b990",
-    "#55b88f",
-    "#54b88d",
-    "#52b78c",
-    "#51b78a",
-    "#50b689",
-    "#4fb587",
-    "#4eb586",
-    "#4db484",
-    "#4bb383",
-    "#4ab382",
-    "#49b280",
-    "#48b27f",
-    "#47b17d",
-    "#46b07c",
-    "#44b07a",
-    "#43af79",
-    "#42ae77",
-    "#41ae76",
-    "#40ad75",
-    "#3fac73",
-    "#3eab71",
-    "#3daa70",
-    "#3ca86e",
-    "#3ba76d",
-    "#3aa66b",
-    "#39a56a",
-    "#38a468",
-    "#37a367",
-    "#37a265",
-    "#36a164",
-    "#35a062",
-    "#349f61",
-    "#339d5f",
-    "#329c5d",
-    "#319b5c",
-    "#309a5a",
-    "#2f9959",
-    "#2e9857",
-    "#2d9756",
-    "#2c9654",
-    "#2b9553",
-    "#2a9451",
-    "#299250",
-    "#28914e",
-    "#27904d",
-    "#278f4b",
-    "#268e49",
-    "#258d48",
-    "#248c46",
-    "#238b45",
-    "#228a44",
-    "#218943",
-    "#1f8842",
-    "#1e8742",
-    "#1d8641",
-    "#1c8540",
-    "#1b843f",
-    "#1a833e",
-    "#19823e",
-    "#18813d",
-    "#17803c",
-    "#167f3b",
-    "#157e3a",
-    "#137e3a",
-    "#127d39",
-    "#117c38",
-    "#107b37",
-    "#0f7a37",
-    "#0e7936",
-    "#0d7835",
-    "#0c7734",
-    "#0b7633",
-    "#0a7533",
-    "#087432",
-    "#077331",
-    "#067230",
-    "#057130",
-    "#04702f",
-    "#036f2e",
-    "#026f2d",
-    "#016e2c",
-    "#006d2c",
-    "#006b2b",
-    "#006a2b",
-    "#00692a",
-    "#006829",
-    "#006629",
-    "#006528",
-    "#006428",
-    "#006227",
-    "#006127",
-    "#006026",
-    "#005f26",
-    "#005d25",
-    "#005c25",
-    "#005b24",
-    "#005924",
-    "#005823",
-    "#005723",
-    "#005622",
-    "#005421",
-    "#005321",
-    "#005220",
-    "#005020",
-    "#004f1f",
-    "#004e1f",
-    "#004d1e",
-    "#004b1e",
-    "#004a1d",
-    "#00491d",
-    "#00471c",
-    "#00461c",
-    "#00451b",
-    "#00441b"
-  ],
-  "BuPu": [
-    "#f7fcfd",
-    "#f6fbfc",
-    "#f5fafc",
-    "#f4fafc",
-    "#f4f9fb",
-    "#f3f9fb",
-    "#f2f8fb",
-    "#f1f8fb",
-    "#f1f7fa",
-    "#f0f7fa",
-    "#eff6fa",
-    "#eff6f9",
-    "#eef5f9",
-    "#edf5f9",
-    "#ecf4f9",
-    "#ecf4f8",
-    "#ebf3f8",
-    "#eaf3f8",
-    "#eaf2f7",
-    "#e9f2f7",
-    "#e8f1f7",
-    "#e7f1f7",
-    "#e7f0f6",
-    "#e6f0f6",
-    "#e5eff6",
-    "#e4eff5",
-    "#e4eef5",
-    "#e3eef5",
-    "#e2edf5",
-    "#e2edf4",
-    "#e1ecf4",
-    "#e0ecf4",
-    "#dfebf3",
-    "#deebf3",
-    "#ddeaf3",
-    "#dce9f2",
-    "#dbe8f2",
-    "#dae7f1",
-    "#d9e7f1",
-    "#d8e6f0",
-    "#d7e5f0",
-    "#d6e4ef",
-    "#d5e4ef",
-    "#d4e3ef",
-    "#d3e2ee",
-    "#d2e1ee",
-    "#d1e0ed",
-    "#d0e0ed",
-    "#cfdfec",
-    "#cedeec",
-    "#cdddec",
-    "#ccddeb",
-    "#cbdceb",
-    "#cadbea",
-    "#c9daea",
-    "#c8d9e9",
-    "#c7d9e9",
-    "#c5d8e8",
-    "#c4d7e8",
-    "#c3d6e8",
-    "#c2d5e7",
-    "#c1d5e7",
-    "#c0d4e6",
-    "#bfd3e6",
-    "#bed2e5",
-    "#bdd2e5",
-    "#bcd1e5",
-    "#bbd0e4",
-    "#bacfe4",
-    "#b9cfe4",
-    "#b8cee3",
-    "#b7cde3",
-    "#b6cde2",
-    "#b5cce2",
-    "#b4cbe2",
-    "#b3cae1",
-    "#b2cae1",
-    "#b1c9e1",
-    "#b0c8e0",
-    "#afc7e0",
-    "#aec7df",
-    "#adc6df",
-    "#acc5df",
-    "#abc5de",
-    "#aac4de",
-    "#a9c3de",
-    "#a7c2dd",
-    "#a6c2dd",
-    "#a5c1dc",
-    "#a4c0dc",
-    "#a3c0dc",
-    "#a2bfdb",
-    "#a1bedb",
-    "#a0bdda",
-    "#9fbdda",
-    "#9ebcda",
-    "#9dbbd9",
-    "#9dbad9",
-    "#9cb9d8",
-    "#9cb7d7",
-    "#9bb6d7",
-    "#9ab5d6",
-    "#9ab4d6",
-    "#99b3d5",
-    "#99b2d4",
-    "#98b0d4",
-    "#98afd3",
-    "#97aed2",
-    "#97add2",
-    "#96acd1",
-    "#95aad0",
-    "#95a9d0",
-    "#94a8cf",
-    "#94a7cf",
-    "#93a6ce",
-    "#93a4cd",
-    "#92a3cd",
-    "#91a2cc",
-    "#91a1cb",
-    "#90a0cb",
-    "#909eca",
-    "#8f9dca",
-    "#8f9cc9",
-    "#8e9bc8",
-    "#8d9ac8",
-    "#8d98c7",
-    "#8c97c6",
-    "#8c96c6",
-    "#8c95c5",
-    "#8c93c5",
-    "#8c92c4",
-    "#8c91c3",
-    "#8c8fc3",
-    "#8c8ec2",
-    "#8c8dc1",
-    "#8c8bc1",
-    "#8c8ac0",
-    "#8c89bf",
-    "#8c87bf",
-    "#8c86be",
-    "#8c85bd",
-    "#8c83bd",
-    "#8c82bc",
-    "#8c81bb",
-    "#8c7fbb",
-    "#8c7eba",
-    "#8c7db9",
-    "#8c7bb9",
-    "#8c7ab8",
-    "#8c78b7",
-    "#8c77b7",
-    "#8c76b6",
-    "#8c74b5",
-    "#8c73b5",
-    "#8c72b4",
-    "#8c70b3",
-    "#8c6fb3",
-    "#8c6eb2",
-    "#8c6cb1",
-    "#8c6bb1",
-    "#8b6ab0",
-    "#8b68af",
-    "#8b67af",
-    "#8b66ae",
-    "#8b64ae",
-    "#8b63ad",
-    "#8b62ac",
-    "#8b60ac",
-    "#8a5fab",
-    "#8a5eaa",
-    "#8a5daa",
-    "#8a5ba9",
-    "#8a5aa9",
-    "#8a59a8",
-    "#8a57a7",
-    "#8a56a7",
-    "#8955a6",
-    "#8953a5",
-    "#8952a5",
-    "#8951a4",
-    "#894fa4",
-    "#894ea3",
-    "#894da2",
-    "#894ba2",
-    "#884aa1",
-    "#8849a0",
-    "#8847a0",
-    "#88469f",
-    "#88459f",
-    "#88439e",
-    "#88429d",
-    "#88419d",
-    "#873f9c",
-    "#873e9b",
-    "#873c9a",
-    "#873b99",
-    "#863998",
-    "#863797",
-    "#863696",
-    "#863494",
-    "#863393",
-    "#853192",
-    "#853091",
-    "#852e90",
-    "#852c8f",
-    "#842b8e",
-    "#84298d",
-    "#84288c",
-    "#84268b",
-    "#84258a",
-    "#832389",
-    "#832288",
-    "#832087",
-    "#831e86",
-    "#831d85",
-    "#821b84",
-    "#821a83",
-    "#821882",
-    "#821781",
-    "#811580",
-    "#81137f",
-    "#81127e",
-    "#81107d",
-    "#810f7c",
-    "#7f0e7a",
-    "#7d0e79",
-    "#7c0d77",
-    "#7a0d76",
-    "#790c74",
-    "#770c72",
-    "#750b71",
-    "#740b6f",
-    "#720a6e",
-    "#700a6c",
-    "#6f096b",
-    "#6d0969",
-    "#6b0868",
-    "#6a0866",
-    "#680865",
-    "#670763",
-    "#650762",
-    "#630660",
-    "#62065e",
-    "#60055d",
-    "#5e055b",
-    "#5d045a",
-    "#5b0458",
-    "#5a0357",
-    "#580355",
-    "#560254",
-    "#550252",
-    "#530151",
-    "#51014f",
-    "#50004e",
-    "#4e004c",
-    "#4d004b"
-  ],
-  "CMRmap": [
-    "#000000",
-    "#010104",
-    "#020208",
-    "#03030c",
-    "#040410",
-    "#060614",
-    "#070718",
-    "#08081c",
-    "#090920",
-    "#0a0a24",
-    "#0c0c28",
-    "#0d0d2c",
-    "#0e0e30",
-    "#0f0f34",
-    "#101038",
-    "#12123c",
-    "#131340",
-    "#141444",
-    "#151548",
-    "#16164c",
-    "#181850",
-    "#191954",
-    "#1a1a58",
-    "#1b1b5c",
-    "#1c1c60",
-    "#1e1e64",
-    "#1f1f68",
-    "#20206c",
-    "#212170",
-    "#222274",
-    "#242478",
-    "#25257c",
-    "#26267f",
-    "#272681",
-    "#282683",
-    "#2a2685",
-    "#2b2687",
-    "#2c2689",
-    "#2d268b",
-    "#2e268d",
-    "#30268f",
-    "#312691",
-    "#322693",
-    "#332695",
-    "#342697",
-    "#352699",
-    "#37269b",
-    "#38269d",
-    "#39269f",
-    "#3a26a1",
-    "#3c26a3",
-    "#3d26a5",
-    "#3e26a7",
-    "#3f26a9",
-    "#4026ab",
-    "#4126ad",
-    "#4326af",
-    "#4426b1",
-    "#4526b3",
-    "#4626b5",
-    "#4826b7",
-    "#4926b9",
-    "#4a26bb",
-    "#4b26bd",
-    "#4d26be",
-    "#4f26bc",
-    "#5127ba",
-    "#5427b8",
-    "#5627b6",
-    "#5928b4",
-    "#5b28b2",
-    "#5d29b0",
-    "#6029ae",
-    "#6229ac",
-    "#652aaa",
-    "#672aa8",
-    "#692ba6",
-    "#6c2ba4",
-    "#6e2ba2",
-    "#712ca0",
-    "#732c9e",
-    "#752d9c",
-    "#782d9a",
-    "#7a2d98",
-    "#7d2e96",
-    "#7f2e94",
-    "#812f92",
-    "#842f90",
-    "#862f8e",
-    "#89308c",
-    "#8b308a",
-    "#8d3188",
-    "#903186",
-    "#923184",
-    "#953282",
-    "#973280",
-    "#9a337e",
-    "#9d337b",
-    "#a03378",
-    "#a33476",
-    "#a73473",
-    "#aa3570",
-    "#ad356d",
-    "#b0356a",
-    "#b33668",
-    "#b73665",
-    "#ba3762",
-    "#bd375f",
-    "#c0375c",
-    "#c3385a",
-    "#c73857",
-    "#ca3954",
-    "#cd3951",
-    "#d0394e",
-    "#d33a4c",
-    "#d73a49",
-    "#da3b46",
-    "#dd3b43",
-    "#e03b40",
-    "#e33c3e",
-    "#e73c3b",
-    "#ea3d38",
-    "#ed3d35",
-    "#f03d32",
-    "#f33e30",
-    "#f73e2d",
-    "#fa3f2a",
-    "#fd3f27",
-    "#fe4025",
-    "#fd4224",
-    "#fd4423",
-    "#fc4622",
-    "#fb4820",
-    "#fa4a1f",
-    "#f94c1e",
-    "#f94e1d",
-    "#f8501c",
-    "#f7521a",
-    "#f65419",
-    "#f55618",
-    "#f55817",
-    "#f45a16",
-    "#f35c14",
-    "#f25e13",
-    "#f16012",
-    "#f16211",
-    "#f06410",
-    "#ef660e",
-    "#ee680d",
-    "#ed6a0c",
-    "#ed6c0b",
-    "#ec6e0a",
-    "#eb7008",
-    "#ea7207",
-    "#e97406",
-    "#e97605",
-    "#e87804",
-    "#e77a02",
-    "#e67c01",
-    "#e57e00",
-    "#e58000",
-    "#e58201",
-    "#e58402",
-    "#e58602",
-    "#e58803",
-    "#e58a04",
-    "#e58c05",
-    "#e58e06",
-    "#e59006",
-    "#e59207",
-    "#e59408",
-    "#e59609",
-    "#e5980a",
-    "#e59a0a",
-    "#e59c0b",
-    "#e59e0c",
-    "#e5a00d",
-    "#e5a20e",
-    "#e5a40e",
-    "#e5a60f",
-    "#e5a810",
-    "#e5aa11",
-    "#e5ac12",
-    "#e5ae12",
-    "#e5b013",
-    "#e5b214",
-    "#e5b415",
-    "#e5b616",
-    "#e5b816",
-    "#e5ba17",
-    "#e5bc18",
-    "#e5be19",
-    "#e5c01b",
-    "#e5c11f",
-    "#e5c222",
-    "#e5c325",
-    "#e5c428",
-    "#e5c62b",
-    "#e5c72f",
-    "#e5c832",
-    "#e5c935",
-    "#e5ca38",
-    "#e5cc3b",
-    "#e5cd3f",
-    "#e5ce42",
-    "#e5cf45",
-    "#e5d048",
-    "#e5d24b",
-    "#e5d34f",
-    "#e5d452",
-    "#e5d555",
-    "#e5d658",
-    "#e5d85b",
-    "#e5d95f",
-    "#e5da62",
-    "#e5db65",
-    "#e5dc68",
-    "#e5de6b",
-    "#e5df6f",
-    "#e5e072",
-    "#e5e175",
-    "#e5e278",
-    "#e5e47b",
-    "#e5e57f",
-    "#e6e683",
-    "#e7e787",
-    "#e7e78b",
-    "#e8e88f",
-    "#e9e992",
-    "#eaea97",
-    "#ebeb9b",
-    "#ebeb9f",
-    "#ececa3",
-    "#ededa7",
-    "#eeeeab",
-    "#efefaf",
-    "#efefb3",
-    "#f0f0b7",
-    "#f1f1bb",
-    "#f2f2bf",
-    "#f3f3c3",
-    "#f3f3c7",
-    "#f4f4cb",
-    "#f5f5cf",
-    "#f6f6d2",
-    "#f7f7d7",
-    "#f7f7db",
-    "#f8f8df",
-    "#f9f9e3",
-    "#fafae7",
-    "#fbfbeb",
-    "#fbfbef",
-    "#fcfcf3",
-    "#fdfdf7",
-    "#fefefb",
-    "#ffffff"
-  ],
-  "Dark2": [
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#1b9e77",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#d95f02",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#7570b3",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#e7298a",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#66a61e",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#e6ab02",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#a6761d",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666",
-    "#666666"
-  ],
-  "GnBu": [
-    "#f7fcf0",
-    "#f6fbef",
-    "#f5fbee",
-    "#f4fbee",
-    "#f4faed",
-    "#f3faec",
-    "#f2faec",
-    "#f1faeb",
-    "#f1f9ea",
-    "#f0f9ea",
-    "#eff9e9",
-    "#eff8e8",
-    "#eef8e8",
-    "#edf8e7",
-    "#ecf8e6",
-    "#ecf7e6",
-    "#ebf7e5",
-    "#eaf7e4",
-    "#eaf6e4",
-    "#e9f6e3",
-    "#e8f6e2",
-    "#e7f6e2",
-    "#e7f5e1",
-    "#e6f5e0",
-    "#e5f5e0",
-    "#e4f4df",
-    "#e4f4de",
-    "#e3f4de",
-    "#e2f4dd",
-    "#e2f3dc",
-    "#e1f3dc",
-    "#e0f3db",
-    "#dff2da",
-    "#dff2da",
-    "#def2d9",
-    "#def2d8",
-    "#ddf1d8",
-    "#dcf1d7",
-    "#dcf1d6",
-    "#dbf1d6",
-    "#daf0d5",
-    "#daf0d4",
-    "#d9f0d4",
-    "#d9f0d3",
-    "#d8efd2",
-    "#d7efd1",
-    "#d7efd1",
-    "#d6efd0",
-    "#d5eecf",
-    "#d5eecf",
-    "#d4eece",
-    "#d4eecd",
-    "#d3edcd",
-    "#d2edcc",
-    "#d2edcb",
-    "#d1edcb",
-    "#d0ecca",
-    "#d0ecc9",
-    "#cfecc8",
-    "#ceecc8",
-    "#ceebc7",
-    "#cdebc6",
-    "#cdebc6",
-    "#ccebc5",
-    "#cbeac4",
-    "#caeac4",
-    "#c9eac3",
-    "#c8e9c3",
-    "#c7e9c2",
-    "#c6e8c2",
-    "#c4e8c1",
-    "#c3e7c1",
-    "#c2e7c0",
-    "#c1e6c0",
-    "#c0e6bf",
-    "#bfe6bf",
-    "#bee5be",
-    "#bde5be",
-    "#bbe4bd",
-    "#bae4bd",
-    "#b9e3bc",
-    "#b8e3bc",
-    "#b7e2bb",
-    "#b6e2bb",
-    "#b5e2ba",
-    "#b4e1ba",
-    "#b2e1b9",
-    "#b1e0b9",
-    "#b0e0b8",
-    "#afdfb8",
-    "#aedfb7",
-    "#addfb7",
-    "#acdeb6",
-    "#aadeb6",
-    "#a9ddb5",
-    "#a8ddb5",
-    "#a7dcb5",
-    "#a6dcb5",
-    "#a4dbb6",
-    "#a3dbb6",
-    "#a1dab7",
-    "#a0dab7",
-    "#9fd9b8",
-    "#9dd9b8",
-    "#9cd8b8",
-    "#9ad8b9",
-    "#99d7b9",
-    "#97d6ba",
-    "#96d6ba",
-    "#95d5bb",
-    "#93d5bb",
-    "#92d4bc",
-    "#90d4bc",
-    "#8fd3bd",
-    "#8ed3bd",
-    "#8cd2be",
-    "#8bd2be",
-    "#89d1bf",
-    "#88d1bf",
-    "#87d0c0",
-    "#85d0c0",
-    "#84cfc0",
-    "#82cec1",
-    "#81cec1",
-    "#7fcdc2",
-    "#7ecdc2",
-    "#7dccc3",
-    "#7bccc3",
-    "#7acbc4",
-    "#78cac4",
-    "#77cac5",
-    "#76c9c5",
-    "#74c8c6",
-    "#73c7c6",
-    "#71c6c7",
-    "#70c6c7",
-    "#6fc5c8",
-    "#6dc4c8",
-    "#6cc3c8",
-    "#6ac2c9",
-    "#69c2c9",
-    "#67c1ca",
-    "#66c0ca",
-    "#65bfcb",
-    "#63bfcb",
-    "#62becc",
-    "#60bdcc",
-    "#5fbccd",
-    "#5ebbcd",
-    "#5cbbce",
-    "#5bbace",
-    "#59b9cf",
-    "#58b8cf",
-    "#57b8d0",
-    "#55b7d0",
-    "#54b6d0",
-    "#52b5d1",
-    "#51b4d1",
-    "#4fb4d2",
-    "#4eb3d2",
-    "#4db2d2",
-    "#4cb1d1",
-    "#4bafd1",
-    "#4aaed0",
-    "#48adcf",
-    "#47accf",
-    "#46aace",
-    "#45a9cd",
-    "#44a8cd",
-    "#43a7cc",
-    "#42a6cb",
-    "#41a4cb",
-    "#40a3ca",
-    "#3fa2ca",
-    "#3da1c9",
-    "#3c9fc8",
-    "#3b9ec8",
-    "#3a9dc7",
-    "#399cc6",
-    "#389ac6",
-    "#3799c5",
-    "#3698c4",
-    "#3597c4",
-    "#3496c3",
-    "#3294c2",
-    "#3193c2",
-    "#3092c1",
-    "#2f91c0",
-    "#2e8fc0",
-    "#2d8ebf",
-    "#2c8dbe",
-    "#2b8cbe",
-    "#2a8bbd",
-    "#298abd",
-    "#2788bc",
-    "#2687bb",
-    "#2586bb",
-    "#2485ba",
-    "#2384ba",
-    "#2283b9",
-    "#2182b9",
-    "#2080b8",
-    "#1f7fb7",
-    "#1e7eb7",
-    "#1d7db6",
-    "#1b7cb6",
-    "#1a7bb5",
-    "#197ab5",
-    "#1879b4",
-    "#1777b3",
-    "#1676b3",
-    "#1575b2",
-    "#1474b2",
-    "#1373b1",
-    "#1272b1",
-    "#1071b0",
-    "#0f70b0",
-    "#0e6eaf",
-    "#0d6dae",
-    "#0c6cae",
-    "#0b6bad",
-    "#0a6aad",
-    "#0969ac",
-    "#0868ac",
-    "#0866aa",
-    "#0865a9",
-    "#0864a8",
-    "#0863a6",
-    "#0861a5",
-    "#0860a4",
-    "#085fa2",
-    "#085ea1",
-    "#085ca0",
-    "#085b9e",
-    "#085a9d",
-    "#08599b",
-    "#08579a",
-    "#085699",
-    "#085597",
-    "#085496",
-    "#085295",
-    "#085193",
-    "#085092",
-    "#084f91",
-    "#084d8f",
-    "#084c8e",
-    "#084b8d",
-    "#084a8b",
-    "#08488a",
-    "#084789",
-    "#084687",
-    "#084586",
-    "#084385",
-    "#084283",
-    "#084182",
-    "#084081"
-  ],
-  "Greens": [
-    "#f7fcf5",
-    "#f6fbf4",
-    "#f5fbf3",
-    "#f5fbf3",
-    "#f4fbf2",
-    "#f4faf1",
-    "#f3faf1",
-    "#f3faf0",
-    "#f2faef",
-    "#f1faef",
-    "#f1f9ee",
-    "#f0f9ed",
-    "#f0f9ed",
-    "#eff9ec",
-    "#eff8eb",
-    "#eef8eb",
-    "#edf8ea",
-    "#edf8e9",
-    "#ecf8e9",
-    "#ecf7e8",
-    "#ebf7e7",
-    "#ebf7e7",
-    "#eaf7e6",
-    "#eaf6e5",
-    "#e9f6e5",
-    "#e8f6e4",
-    "#e8f6e3",
-    "#e7f6e3",
-    "#e7f5e2",
-    "#e6f5e1",
-    "#e6f5e1",
-    "#e5f5e0",
-    "#e4f4df",
-    "#e3f4de",
-    "#e3f4dd",
-    "#e2f3dc",
-    "#e1f3db",
-    "#e0f3da",
-    "#dff2d9",
-    "#def2d8",
-    "#ddf1d7",
-    "#dcf1d6",
-    "#dbf1d5",
-    "#daf0d4",
-    "#d9f0d3",
-    "#d8f0d2",
-    "#d7efd1",
-    "#d6efd0",
-    "#d5eecf",
-    "#d4eece",
-    "#d3eecd",
-    "#d3edcc",
-    "#d2edcb",
-    "#d1edca",
-    "#d0ecc9",
-    "#cfecc8",
-    "#ceebc7",
-    "#cdebc6",
-    "#ccebc5",
-    "#cbeac4",
-    "#caeac3",
-    "#c9eac2",
-    "#c8e9c1",
-    "#c7e9c0",
-    "#c6e8bf",
-    "#c5e8be",
-    "#c4e7bd",
-    "#c3e7bc",
-    "#c1e6bb",
-    "#c0e6b9",
-    "#bfe5b8",
-    "#bee5b7",
-    "#bde4b6",
-    "#bbe4b5",
-    "#bae3b4",
-    "#b9e3b2",
-    "#b8e2b1",
-    "#b7e2b0",
-    "#b6e1af",
-    "#b4e1ae",
-    "#b3e0ad",
-    "#b2e0ab",
-    "#b1dfaa",
-    "#b0dfa9",
-    "#aedea8",
-    "#addea7",
-    "#acdda6",
-    "#abdda5",
-    "#aadca3",
-    "#a8dca2",
-    "#a7dba1",
-    "#a6dba0",
-    "#a5da9f",
-    "#a4da9e",
-    "#a2d99c",
-    "#a1d99b",
-    "#a0d89a",
-    "#9fd899",
-    "#9dd798",
-    "#9cd697",
-    "#9ad695",
-    "#99d594",
-    "#98d493",
-    "#96d492",
-    "#95d391",
-    "#93d290",
-    "#92d28e",
-    "#90d18d",
-    "#8fd08c",
-    "#8ed08b",
-    "#8ccf8a",
-    "#8bce89",
-    "#89ce87",
-    "#88cd86",
-    "#87cc85",
-    "#85cc84",
-    "#84cb83",
-    "#82ca82",
-    "#81ca81",
-    "#80c97f",
-    "#7ec87e",
-    "#7dc87d",
-    "#7bc77c",
-    "#7ac67b",
-    "#78c67a",
-    "#77c578",
-    "#76c477",
-    "#74c476",
-    "#73c375",
-    "#71c274",
-    "#70c274",
-    "#6ec173",
-    "#6cc072",
-    "#6bbf71",
-    "#69be70",
-    "#68be70",
-    "#66bd6f",
-    "#64bc6e",
-    "#63bb6d",
-    "#61ba6c",
-    "#60ba6c",
-    "#5eb96b",
-    "#5cb86a",
-    "#5bb769",
-    "#59b769",
-    "#58b668",
-    "#56b567",
-    "#54b466",
-    "#53b365",
-    "#51b365",
-    "#50b264",
-    "#4eb163",
-    "#4cb062",
-    "#4bb061",
-    "#49af61",
-    "#48ae60",
-    "#46ad5f",
-    "#44ac5e",
-    "#43ac5e",
-    "#41ab5d",
-    "#40aa5c",
-    "#3fa95b",
-    "#3ea85b",
-    "#3da75a",
-    "#3ca659",
-    "#3ba558",
-    "#3aa458",
-    "#39a357",
-    "#38a256",
-    "#37a155",
-    "#37a055",
-    "#369f54",
-    "#359e53",
-    "#349d52",
-    "#339c51",
-    "#329b51",
-    "#319a50",
-    "#30994f",
-    "#2f984e",
-    "#2e974e",
-    "#2d964d",
-    "#2c954c",
-    "#2b944b",
-    "#2a934b",
-    "#29924a",
-    "#289149",
-    "#279048",
-    "#278f48",
-    "#268e47",
-    "#258d46",
-    "#248c45",
-    "#238b45",
-    "#228a44",
-    "#218943",
-    "#1f8842",
-    "#1e8742",
-    "#1d8641",
-    "#1c8540",
-    "#1b843f",
-    "#1a833e",
-    "#19823e",
-    "#18813d",
-    "#17803c",
-    "#167f3b",
-    "#157e3a",
-    "#137e3a",
-    "#127d39",
-    "#117c38",
-    "#107b37",
-    "#0f7a37",
-    "#0e7936",
-    "#0d7835",
-    "#0c7734",
-    "#0b7633",
-    "#0a7533",
-    "#087432",
-    "#077331",
-    "#067230",
-    "#057130",
-    "#04702f",
-    "#036f2e",
-    "#026f2d",
-    "#016e2c",
-    "#006d2c",
-    "#006b2b",
-    "#006a2b",
-    "#00692a",
-    "#006829",
-    "#006629",
-    "#006528",
-    "#006428",
-    "#006227",
-    "#006127",
-    "#006026",
-    "#005f26",
-    "#005d25",
-    "#005c25",
-    "#005b24",
-    "#005924",
-    "#005823",
-    "#005723",
-    "#005622",
-    "#005421",
-    "#005321",
-    "#005220",
-    "#005020",
-    "#004f1f",
-    "#004e1f",
-    "#004d1e",
-    "#004b1e",
-    "#004a1d",
-    "#00491d",
-    "#00471c",
-    "#00461c",
-    "#00451b",
-    "#00441b"
-  ],
-  "Greys": [
-    "#ffffff",
-    "#fefefe",
-    "#fefefe",
-    "#fdfdfd",
-    "#fdfdfd",
-    "#fcfcfc",
-    "#fcfcfc",
-    "#fbfbfb",
-    "#fbfbfb",
-    "#fafafa",
-    "#fafafa",
-    "#f9f9f9",
-    "#f9f9f9",
-    "#f8f8f8",
-    "#f8f8f8",
-    "#f7f7f7",
-    "#f7f7f7",
-    "#f7f7f7",
-    "#f6f6f6",
-    "#f6f6f6",
-    "#f5f5f5",
-    "#f5f5f5",
-    "#f4f4f4",
-    "#f4f4f4",
-    "#f3f3f3",
-    "#f3f3f3",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f1f1f1",
-    "#f1f1f1",
-    "#f0f0f0",
-    "#f0f0f0",
-    "#efefef",
-    "#efefef",
-    "#eeeeee",
-    "#ededed",
-    "#ededed",
-    "#ececec",
-    "#ebebeb",
-    "#eaeaea",
-    "#eaeaea",
-    "#e9e9e9",
-    "#e8e8e8",
-    "#e7e7e7",
-    "#e7e7e7",
-    "#e6e6e6",
-    "#e5e5e5",
-    "#e5e5e5",
-    "#e4e4e4",
-    "#e3e3e3",
-    "#e2e2e2",
-    "#e2e2e2",
-    "#e1e1e1",
-    "#e0e0e0",
-    "#e0e0e0",
-    "#dfdfdf",
-    "#dedede",
-    "#dddddd",
-    "#dddddd",
-    "#dcdcdc",
-    "#dbdbdb",
-    "#dadada",
-    "#dadada",
-    "#d9d9d9",
-    "#d8d8d8",
-    "#d7d7d7",
-    "#d7d7d7",
-    "#d6d6d6",
-    "#d5d5d5",
-    "#d4d4d4",
-    "#d3d3d3",
-    "#d2d2d2",
-    "#d1d1d1",
-    "#d0d0d0",
-    "#cfcfcf",
-    "#cfcfcf",
-    "#cecece",
-    "#cdcdcd",
-    "#cccccc",
-    "#cbcbcb",
-    "#cacaca",
-    "#c9c9c9",
-    "#c8c8c8",
-    "#c8c8c8",
-    "#c7c7c7",
-    "#c6c6c6",
-    "#c5c5c5",
-    "#c4c4c4",
-    "#c3c3c3",
-    "#c2c2c2",
-    "#c1c1c1",
-    "#c1c1c1",
-    "#c0c0c0",
-    "#bfbfbf",
-    "#bebebe",
-    "#bdbdbd",
-    "#bcbcbc",
-    "#bbbbbb",
-    "#bababa",
-    "#b8b8b8",
-    "#b7b7b7",
-    "#b6b6b6",
-    "#b5b5b5",
-    "#b3b3b3",
-    "#b2b2b2",
-    "#b1b1b1",
-    "#b0b0b0",
-    "#afafaf",
-    "#adadad",
-    "#acacac",
-    "#ababab",
-    "#aaaaaa",
-    "#a8a8a8",
-    "#a7a7a7",
-    "#a6a6a6",
-    "#a5a5a5",
-    "#a4a4a4",
-    "#a2a2a2",
-    "#a1a1a1",
-    "#a0a0a0",
-    "#9f9f9f",
-    "#9d9d9d",
-    "#9c9c9c",
-    "#9b9b9b",
-    "#9a9a9a",
-    "#999999",
-    "#979797",
-    "#969696",
-    "#959595",
-    "#949494",
-    "#939393",
-    "#929292",
-    "#919191",
-    "#8f8f8f",
-    "#8e8e8e",
-    "#8d8d8d",
-    "#8c8c8c",
-    "#8b8b8b",
-    "#8a8a8a",
-    "#898989",
-    "#888888",
-    "#878787",
-    "#868686",
-    "#848484",
-    "#838383",
-    "#828282",
-    "#818181",
-    "#808080",
-    "#7f7f7f",
-    "#7e7e7e",
-    "#7d7d7d",
-    "#7c7c7c",
-    "#7b7b7b",
-    "#7a7a7a",
-    "#787878",
-    "#777777",
-    "#767676",
-    "#757575",
-    "#747474",
-    "#737373",
-    "#727272",
-    "#717171",
-    "#707070",
-    "#6f6f6f",
-    "#6e6e6e",
-    "#6d6d6d",
-    "#6c6c6c",
-    "#6b6b6b",
-    "#6a6a6a",
-    "#696969",
-    "#686868",
-    "#666666",
-    "#656565",
-    "#646464",
-    "#636363",
-    "#626262",
-    "#616161",
-    "#606060",
-    "#5f5f5f",
-    "#5e5e5e",
-    "#5d5d5d",
-    "#5c5c5c",
-    "#5b5b5b",
-    "#5a5a5a",
-    "#595959",
-    "#585858",
-    "#575757",
-    "#565656",
-    "#555555",
-    "#545454",
-    "#535353",
-    "#525252",
-    "#505050",
-    "#4f4f4f",
-    "#4e4e4e",
-    "#4c4c4c",
-    "#4b4b4b",
-    "#494949",
-    "#484848",
-    "#474747",
-    "#454545",
-    "#444444",
-    "#424242",
-    "#414141",
-    "#404040",
-    "#3e3e3e",
-    "#3d3d3d",
-    "#3b3b3b",
-    "#3a3a3a",
-    "#383838",
-    "#373737",
-    "#363636",
-    "#343434",
-    "#333333",
-    "#313131",
-    "#303030",
-    "#2f2f2f",
-    "#2d2d2d",
-    "#2c2c2c",
-    "#2a2a2a",
-    "#292929",
-    "#282828",
-    "#262626",
-    "#252525",
-    "#232323",
-    "#222222",
-    "#212121",
-    "#202020",
-    "#1f1f1f",
-    "#1e1e1e",
-    "#1d1d1d",
-    "#1b1b1b",
-    "#1a1a1a",
-    "#191919",
-    "#181818",
-    "#171717",
-    "#161616",
-    "#141414",
-    "#131313",
-    "#121212",
-    "#111111",
-    "#101010",
-    "#0f0f0f",
-    "#0d0d0d",
-    "#0c0c0c",
-    "#0b0b0b",
-    "#0a0a0a",
-    "#090909",
-    "#080808",
-    "#060606",
-    "#050505",
-    "#040404",
-    "#030303",
-    "#020202",
-    "#010101",
-    "#000000"
-  ],
-  "OrRd": [
-    "#fff7ec",
-    "#fef6ea",
-    "#fef6e9",
-    "#fef5e8",
-    "#fef5e7",
-    "#fef4e6",
-    "#fef4e5",
-    "#fef3e4",
-    "#fef3e2",
-    "#fef2e1",
-    "#fef2e0",
-    "#fef1df",
-    "#fef1de",
-    "#fef0dd",
-    "#fef0dc",
-    "#feefdb",
-    "#feefd9",
-    "#feefd8",
-    "#feeed7",
-    "#feeed6",
-    "#feedd5",
-    "#feedd4",
-    "#feecd3",
-    "#feecd2",
-    "#feebd0",
-    "#feebcf",
-    "#feeace",
-    "#feeacd",
-    "#fee9cc",
-    "#fee9cb",
-    "#fee8ca",
-    "#fee8c8",
-    "#fde7c7",
-    "#fde7c6",
-    "#fde6c5",
-    "#fde6c3",
-    "#fde5c2",
-    "#fde4c1",
-    "#fde4bf",
-    "#fde3be",
-    "#fde2bd",
-    "#fde2bb",
-    "#fde1ba",
-    "#fde1b9",
-    "#fde0b8",
-    "#fddfb6",
-    "#fddfb5",
-    "#fddeb4",
-    "#fdddb2",
-    "#fdddb1",
-    "#fddcb0",
-    "#fddcae",
-    "#fddbad",
-    "#fddaac",
-    "#fddaaa",
-    "#fdd9a9",
-    "#fdd8a8",
-    "#fdd8a6",
-    "#fdd7a5",
-    "#fdd6a4",
-    "#fdd6a2",
-    "#fdd5a1",
-    "#fdd5a0",
-    "#fdd49e",
-    "#fdd39d",
-    "#fdd39c",
-    "#fdd29c",
-    "#fdd19b",
-    "#fdd09a",
-    "#fdcf99",
-    "#fdcf98",
-    "#fdce98",
-    "#fdcd97",
-    "#fdcc96",
-    "#fdcb95",
-    "#fdcb94",
-    "#fdca94",
-    "#fdc993",
-    "#fdc892",
-    "#fdc891",
-    "#fdc790",
-    "#fdc68f",
-    "#fdc58f",
-    "#fdc48e",
-    "#fdc48d",
-    "#fdc38c",
-    "#fdc28b",
-    "#fdc18b",
-    "#fdc08a",
-    "#fdc089",
-    "#fdbf88",
-    "#fdbe87",
-    "#fdbd86",
-    "#fdbd86",
-    "#fdbc85",
-    "#fdbb84",
-    "#fcba83",
-    "#fcb982",
-    "#fcb780",
-    "#fcb67f",
-    "#fcb47e",
-    "#fcb37c",
-    "#fcb17b",
-    "#fcb07a",
-    "#fcae78",
-    "#fcad77",
-    "#fcac76",
-    "#fcaa74",
-    "#fca973",
-    "#fca771",
-    "#fca670",
-    "#fca46f",
-    "#fca36d",
-    "#fca16c",
-    "#fca06b",
-    "#fc9f69",
-    "#fc9d68",
-    "#fc9c67",
-    "#fc9a65",
-    "#fc9964",
-    "#fc9763",
-    "#fc9661",
-    "#fc9460",
-    "#fc935f",
-    "#fc925d",
-    "#fc905c",
-    "#fc8f5b",
-    "#fc8d59",
-    "#fb8c58",
-    "#fb8b58",
-    "#fa8957",
-    "#fa8857",
-    "#fa8756",
-    "#f98656",
-    "#f98455",
-    "#f88355",
-    "#f88254",
-    "#f88153",
-    "#f77f53",
-    "#f77e52",
-    "#f67d52",
-    "#f67c51",
-    "#f67a51",
-    "#f57950",
-    "#f57850",
-    "#f4774f",
-    "#f4754f",
-    "#f4744e",
-    "#f3734e",
-    "#f3724d",
-    "#f2704d",
-    "#f26f4c",
-    "#f26e4b",
-    "#f16d4b",
-    "#f16b4a",
-    "#f06a4a",
-    "#f06949",
-    "#ef6749",
-    "#ef6648",
-    "#ef6548",
-    "#ee6347",
-    "#ed6245",
-    "#ed6044",
-    "#ec5e43",
-    "#eb5d42",
-    "#ea5b40",
-    "#ea593f",
-    "#e9583e",
-    "#e8563c",
-    "#e7543b",
-    "#e7533a",
-    "#e65139",
-    "#e55037",
-    "#e44e36",
-    "#e34c35",
-    "#e34b33",
-    "#e24932",
-    "#e14731",
-    "#e04630",
-    "#e0442e",
-    "#df422d",
-    "#de412c",
-    "#dd3f2a",
-    "#dd3d29",
-    "#dc3c28",
-    "#db3a27",
-    "#da3825",
-    "#da3724",
-    "#d93523",
-    "#d83321",
-    "#d73220",
-    "#d7301f",
-    "#d62e1e",
-    "#d52d1d",
-    "#d32b1c",
-    "#d22a1b",
-    "#d1281a",
-    "#d02719",
-    "#cf2518",
-    "#ce2417",
-    "#cd2216",
-    "#cb2115",
-    "#ca1f14",
-    "#c91e13",
-    "#c81c12",
-    "#c71b11",
-    "#c61910",
-    "#c5180f",
-    "#c4160e",
-    "#c2150d",
-    "#c1130c",
-    "#c0120b",
-    "#bf100a",
-    "#be0f09",
-    "#bd0d08",
-    "#bc0c07",
-    "#bb0a06",
-    "#b90905",
-    "#b80704",
-    "#b70604",
-    "#b60403",
-    "#b50302",
-    "#b40101",
-    "#b30000",
-    "#b10000",
-    "#af0000",
-    "#ae0000",
-    "#ac0000",
-    "#ab0000",
-    "#a90000",
-    "#a70000",
-    "#a60000",
-    "#a40000",
-    "#a20000",
-    "#a10000",
-    "#9f0000",
-    "#9d0000",
-    "#9c0000",
-    "#9a0000",
-    "#990000",
-    "#970000",
-    "#950000",
-    "#940000",
-    "#920000",
-    "#900000",
-    "#8f0000",
-    "#8d0000",
-    "#8c0000",
-    "#8a0000",
-    "#880000",
-    "#870000",
-    "#850000",
-    "#830000",
-    "#820000",
-    "#800000",
-    "#7f0000"
-  ],
-  "Oranges": [
-    "#fff5eb",
-    "#fef4ea",
-    "#fef4e9",
-    "#fef3e8",
-    "#fef3e7",
-    "#fef2e6",
-    "#fef2e5",
-    "#fef1e4",
-    "#fef1e3",
-    "#fef0e2",
-    "#fef0e1",
-    "#feefe0",
-    "#feefe0",
-    "#feeedf",
-    "#feeede",
-    "#feeddd",
-    "#feeddc",
-    "#feeddb",
-    "#feecda",
-    "#feecd9",
-    "#feebd8",
-    "#feebd7",
-    "#feead6",
-    "#feead6",
-    "#fee9d5",
-    "#fee9d4",
-    "#fee8d3",
-    "#fee8d2",
-    "#fee7d1",
-    "#fee7d0",
-    "#fee6cf",
-    "#fee6ce",
-    "#fde5cd",
-    "#fde5cc",
-    "#fde4cb",
-    "#fde3c9",
-    "#fde3c8",
-    "#fde2c6",
-    "#fde1c5",
-    "#fde1c4",
-    "#fde0c2",
-    "#fddfc1",
-    "#fddfc0",
-    "#fddebe",
-    "#fdddbd",
-    "#fddcbb",
-    "#fddcba",
-    "#fddbb9",
-    "#fddab7",
-    "#fddab6",
-    "#fdd9b4",
-    "#fdd8b3",
-    "#fdd8b2",
-    "#fdd7b0",
-    "#fdd6af",
-    "#fdd6ae",
-    "#fdd5ac",
-    "#fdd4ab",
-    "#fdd3a9",
-    "#fdd3a8",
-    "#fdd2a7",
-    "#fdd1a5",
-    "#fdd1a4",
-    "#fdd0a3",
-    "#fdcfa1",
-    "#fdce9f",
-    "#fdcd9e",
-    "#fdcc9c",
-    "#fdcb9a",
-    "#fdca98",
-    "#fdc997",
-    "#fdc895",
-    "#fdc793",
-    "#fdc692",
-    "#fdc590",
-    "#fdc48e",
-    "#fdc28c",
-    "#fdc18b",
-    "#fdc089",
-    "#fdbf87",
-    "#fdbe85",
-    "#fdbd84",
-    "#fdbc82",
-    "#fdbb80",
-    "#fdba7f",
-    "#fdb97d",
-    "#fdb87b",
-    "#fdb779",
-    "#fdb678",
-    "#fdb576",
-    "#fdb474",
-    "#fdb272",
-    "#fdb171",
-    "#fdb06f",
-    "#fdaf6d",
-    "#fdae6c",
-    "#fdad6a",
-    "#fdac68",
-    "#fdab67",
-    "#fdaa66",
-    "#fda964",
-    "#fda863",
-    "#fda761",
-    "#fda660",
-    "#fda55e",
-    "#fda45d",
-    "#fda35b",
-    "#fda25a",
-    "#fda158",
-    "#fda057",
-    "#fd9f55",
-    "#fd9e54",
-    "#fd9d52",
-    "#fd9c51",
-    "#fd9a4f",
-    "#fd994e",
-    "#fd984c",
-    "#fd974b",
-    "#fd964a",
-    "#fd9548",
-    "#fd9447",
-    "#fd9345",
-    "#fd9244",
-    "#fd9142",
-    "#fd9041",
-    "#fd8f3f",
-    "#fd8e3e",
-    "#fd8d3c",
-    "#fc8c3b",
-    "#fc8b3a",
-    "#fc8a38",
-    "#fb8937",
-    "#fb8736",
-    "#fa8634",
-    "#fa8533",
-    "#fa8432",
-    "#f98331",
-    "#f9822f",
-    "#f9812e",
-    "#f8802d",
-    "#f87e2b",
-    "#f77d2a",
-    "#f77c29",
-    "#f77b28",
-    "#f67a26",
-    "#f67925",
-    "#f67824",
-    "#f57622",
-    "#f57521",
-    "#f47420",
-    "#f4731f",
-    "#f4721d",
-    "#f3711c",
-    "#f3701b",
-    "#f36f19",
-    "#f26d18",
-    "#f26c17",
-    "#f16b16",
-    "#f16a14",
-    "#f16913",
-    "#f06812",
-    "#ef6712",
-    "#ef6611",
-    "#ee6510",
-    "#ed6410",
-    "#ec630f",
-    "#ec620f",
-    "#eb610e",
-    "#ea600e",
-    "#e95f0d",
-    "#e95d0d",
-    "#e85c0c",
-    "#e75b0b",
-    "#e65a0b",
-    "#e5590a",
-    "#e5580a",
-    "#e45709",
-    "#e35609",
-    "#e25508",
-    "#e25407",
-    "#e15307",
-    "#e05206",
-    "#df5106",
-    "#df5005",
-    "#de4f05",
-    "#dd4e04",
-    "#dc4d03",
-    "#dc4c03",
-    "#db4b02",
-    "#da4a02",
-    "#d94901",
-    "#d94801",
-    "#d74701",
-    "#d64701",
-    "#d44601",
-    "#d34501",
-    "#d14501",
-    "#cf4401",
-    "#ce4401",
-    "#cc4301",
-    "#cb4301",
-    "#c94201",
-    "#c74101",
-    "#c64101",
-    "#c44001",
-    "#c34001",
-    "#c13f01",
-    "#bf3f01",
-    "#be3e02",
-    "#bc3d02",
-    "#bb3d02",
-    "#b93c02",
-    "#b73c02",
-    "#b63b02",
-    "#b43b02",
-    "#b33a02",
-    "#b13a02",
-    "#af3902",
-    "#ae3802",
-    "#ac3802",
-    "#ab3702",
-    "#a93702",
-    "#a73602",
-    "#a63602",
-    "#a43503",
-    "#a33503",
-    "#a23403",
-    "#a13403",
-    "#a03303",
-    "#9e3303",
-    "#9d3203",
-    "#9c3203",
-    "#9b3103",
-    "#993103",
-    "#983003",
-    "#973003",
-    "#962f03",
-    "#952f03",
-    "#932f03",
-    "#922e03",
-    "#912e03",
-    "#902d03",
-    "#8e2d03",
-    "#8d2c03",
-    "#8c2c03",
-    "#8b2b03",
-    "#8a2b03",
-    "#882a03",
-    "#872a03",
-    "#862903",
-    "#852903",
-    "#832803",
-    "#822803",
-    "#812703",
-    "#802703",
-    "#7f2704"
-  ],
-  "PRGn": [
-    "#40004b",
-    "#42014d",
-    "#44034f",
-    "#460451",
-    "#480653",
-    "#4a0855",
-    "#4c0958",
-    "#4e0b5a",
-    "#500d5c",
-    "#530e5e",
-    "#551060",
-    "#571263",
-    "#591365",
-    "#5b1567",
-    "#5d1769",
-    "#5f186b",
-    "#611a6e",
-    "#641c70",
-    "#661d72",
-    "#681f74",
-    "#6a2076",
-    "#6c2279",
-    "#6e247b",
-    "#70257d",
-    "#72277f",
-    "#742981",
-    "#762b83",
-    "#782e85",
-    "#793086",
-    "#7a3388",
-    "#7c368a",
-    "#7d398b",
-    "#7e3b8d",
-    "#803e8e",
-    "#814190",
-    "#834491",
-    "#844693",
-    "#854995",
-    "#874c96",
-    "#884f98",
-    "#895199",
-    "#8b549b",
-    "#8c579c",
-    "#8e5a9e",
-    "#8f5ca0",
-    "#905fa1",
-    "#9262a3",
-    "#9365a4",
-    "#9467a6",
-    "#966aa7",
-    "#976da9",
-    "#9970ab",
-    "#9a72ac",
-    "#9c74ad",
-    "#9d76af",
-    "#9f78b0",
-    "#a17ab2",
-    "#a27cb3",
-    "#a47eb4",
-    "#a580b6",
-    "#a782b7",
-    "#a984b9",
-    "#aa86ba",
-    "#ac88bb",
-    "#ad8bbd",
-    "#af8dbe",
-    "#b18fc0",
-    "#b291c1",
-    "#b493c3",
-    "#b595c4",
-    "#b797c5",
-    "#b999c7",
-    "#ba9bc8",
-    "#bc9dca",
-    "#bd9fcb",
-    "#bfa1cc",
-    "#c1a3ce",
-    "#c2a5cf",
-    "#c4a7d0",
-    "#c5a9d1",
-    "#c7abd2",
-    "#c8add3",
-    "#c9afd4",
-    "#cbb0d5",
-    "#ccb2d6",
-    "#ceb4d7",
-    "#cfb6d8",
-    "#d1b8d9",
-    "#d2bada",
-    "#d4bcdb",
-    "#d5bddc",
-    "#d7bfdd",
-    "#d8c1de",
-    "#d9c3df",
-    "#dbc5e0",
-    "#dcc7e1",
-    "#dec8e2",
-    "#dfcae3",
-    "#e1cce4",
-    "#e2cee5",
-    "#e4d0e6",
-    "#e5d2e7",
-    "#e7d4e8",
-    "#e7d5e8",
-    "#e8d6e9",
-    "#e8d8e9",
-    "#e9d9ea",
-    "#eadaea",
-    "#eadceb",
-    "#ebddec",
-    "#ecdeec",
-    "#ece0ed",
-    "#ede1ed",
-    "#ede3ee",
-    "#eee4ef",
-    "#efe5ef",
-    "#efe7f0",
-    "#f0e8f0",
-    "#f1e9f1",
-    "#f1ebf2",
-    "#f2ecf2",
-    "#f2eef3",
-    "#f3eff3",
-    "#f4f0f4",
-    "#f4f2f4",
-    "#f5f3f5",
-    "#f6f4f6",
-    "#f6f6f6",
-    "#f6f6f6",
-    "#f5f6f4",
-    "#f4f6f3",
-    "#f2f6f2",
-    "#f1f5f0",
-    "#f0f5ef",
-    "#eff5ed",
-    "#eef4ec",
-    "#edf4eb",
-    "#ebf4e9",
-    "#eaf4e8",
-    "#e9f3e6",
-    "#e8f3e5",
-    "#e7f3e3",
-    "#e5f3e2",
-    "#e4f2e1",
-    "#e3f2df",
-    "#e2f2de",
-    "#e1f1dc",
-    "#e0f1db",
-    "#def1da",
-    "#ddf1d8",
-    "#dcf0d7",
-    "#dbf0d5",
-    "#daf0d4",
-    "#d9f0d3",
-    "#d7efd1",
-    "#d5eecf",
-    "#d3edcd",
-    "#d1eccb",
-    "#cfebc9",
-    "#cdebc7",
-    "#cbeac5",
-    "#c9e9c3",
-    "#c7e8c1",
-    "#c5e7bf",
-    "#c3e6bd",
-    "#c1e6bb",
-    "#bfe5b9",
-    "#bde4b7",
-    "#bbe3b5",
-    "#b9e2b3",
-    "#b7e2b1",
-    "#b5e1af",
-    "#b3e0ad",
-    "#b1dfab",
-    "#afdea9",
-    "#addda7",
-    "#abdda5",
-    "#a9dca3",
-    "#a7dba1",
-    "#a4da9e",
-    "#a1d89c",
-    "#9ed699",
-    "#9bd497",
-    "#98d394",
-    "#95d192",
-    "#92cf8f",
-    "#8fcd8d",
-    "#8ccc8b",
-    "#89ca88",
-    "#86c886",
-    "#83c683",
-    "#80c481",
-    "#7dc37e",
-    "#7ac17c",
-    "#77bf79",
-    "#74bd77",
-    "#71bc74",
-    "#6eba72",
-    "#6bb86f",
-    "#68b66d",
-    "#65b56a",
-    "#62b368",
-    "#5fb165",
-    "#5caf63",
-    "#5aae61",
-    "#57ab5f",
-    "#55a95d",
-    "#52a75c",
-    "#50a55a",
-    "#4da358",
-    "#4ba157",
-    "#489f55",
-    "#469d53",
-    "#439a52",
-    "#419850",
-    "#3e964e",
-    "#3c944d",
-    "#39924b",
-    "#379049",
-    "#348e48",
-    "#328c46",
-    "#308a45",
-    "#2d8743",
-    "#2b8541",
-    "#288340",
-    "#26813e",
-    "#237f3c",
-    "#217d3b",
-    "#1e7b39",
-    "#1c7937",
-    "#1a7636",
-    "#197435",
-    "#187234",
-    "#177033",
-    "#166e32",
-    "#156c30",
-    "#146a2f",
-    "#13682e",
-    "#12662d",
-    "#10642c",
-    "#0f622b",
-    "#0e602a",
-    "#0d5e29",
-    "#0c5c28",
-    "#0b5a27",
-    "#0a5825",
-    "#095624",
-    "#085423",
-    "#075222",
-    "#065021",
-    "#054e20",
-    "#044c1f",
-    "#034a1e",
-    "#02481d",
-    "#01461c",
-    "#00441b"
-  ],
-  "Paired": [
-    "#a6cee3",
-    "#a6cee3",
-    "#a6cee3",
-    "#a6cee3",
-    "#a6cee3",
-    "#a6cee3",
-    "#a6cee3",
-    "#a6cee3",
-    "#a6cee3",
-    "#a6cee3",
-    "#a6cee3",
-    "#a6cee3",
-    "#a6cee3",
-    "#a6cee3",
-    "#a6cee3",
-    "#a6cee3",
-    "#a6cee3",
-    "#a6cee3",
-    "#a6cee3",
-    "#a6cee3",
-    "#a6cee3",
-    "#a6cee3",
-    "#1f78b4",
-    "#1f78b4",
-    "#1f78b4",
-    "#1f78b4",
-    "#1f78b4",
-    "#1f78b4",
-    "#1f78b4",
-    "#1f78b4",
-    "#1f78b4",
-    "#1f78b4",
-    "#1f78b4",
-    "#1f78b4",
-    "#1f78b4",
-    "#1f78b4",
-    "#1f78b4",
-    "#1f78b4",
-    "#1f78b4",
-    "#1f78b4",
-    "#1f78b4",
-    "#1f78b4",
-    "#1f78b4",
-    "#b2df8a",
-    "#b2df8a",
-    "#b2df8a",
-    "#b2df8a",
-    "#b2df8a",
-    "#b2df8a",
-    "#b2df8a",
-    "#b2df8a",
-    "#b2df8a",
-    "#b2df8a",
-    "#b2df8a",
-    "#b2df8a",
-    "#b2df8a",
-    "#b2df8a",
-    "#b2df8a",
-    "#b2df8a",
-    "#b2df8a",
-    "#b2df8a",
-    "#b2df8a",
-    "#b2df8a",
-    "#b2df8a",
-    "#33a02c",
-    "#33a02c",
-    "#33a02c",
-    "#33a02c",
-    "#33a02c",
-    "#33a02c",
-    "#33a02c",
-    "#33a02c",
-    "#33a02c",
-    "#33a02c",
-    "#33a02c",
-    "#33a02c",
-    "#33a02c",
-    "#33a02c",
-    "#33a02c",
-    "#33a02c",
-    "#33a02c",
-    "#33a02c",
-    "#33a02c",
-    "#33a02c",
-    "#33a02c",
-    "#fb9a99",
-    "#fb9a99",
-    "#fb9a99",
-    "#fb9a99",
-    "#fb9a99",
-    "#fb9a99",
-    "#fb9a99",
-    "#fb9a99",
-    "#fb9a99",
-    "#fb9a99",
-    "#fb9a99",
-    "#fb9a99",
-    "#fb9a99",
-    "#fb9a99",
-    "#fb9a99",
-    "#fb9a99",
-    "#fb9a99",
-    "#fb9a99",
-    "#fb9a99",
-    "#fb9a99",
-    "#fb9a99",
-    "#fb9a99",
-    "#e31a1c",
-    "#e31a1c",
-    "#e31a1c",
-    "#e31a1c",
-    "#e31a1c",
-    "#e31a1c",
-    "#e31a1c",
-    "#e31a1c",
-    "#e31a1c",
-    "#e31a1c",
-    "#e31a1c",
-    "#e31a1c",
-    "#e31a1c",
-    "#e31a1c",
-    "#e31a1c",
-    "#e31a1c",
-    "#e31a1c",
-    "#e31a1c",
-    "#e31a1c",
-    "#e31a1c",
-    "#e31a1c",
-    "#fdbf6f",
-    "#fdbf6f",
-    "#fdbf6f",
-    "#fdbf6f",
-    "#fdbf6f",
-    "#fdbf6f",
-    "#fdbf6f",
-    "#fdbf6f",
-    "#fdbf6f",
-    "#fdbf6f",
-    "#fdbf6f",
-    "#fdbf6f",
-    "#fdbf6f",
-    "#fdbf6f",
-    "#fdbf6f",
-    "#fdbf6f",
-    "#fdbf6f",
-    "#fdbf6f",
-    "#fdbf6f",
-    "#fdbf6f",
-    "#fdbf6f",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#cab2d6",
-    "#cab2d6",
-    "#cab2d6",
-    "#cab2d6",
-    "#cab2d6",
-    "#cab2d6",
-    "#cab2d6",
-    "#cab2d6",
-    "#cab2d6",
-    "#cab2d6",
-    "#cab2d6",
-    "#cab2d6",
-    "#cab2d6",
-    "#cab2d6",
-    "#cab2d6",
-    "#cab2d6",
-    "#cab2d6",
-    "#cab2d6",
-    "#cab2d6",
-    "#cab2d6",
-    "#cab2d6",
-    "#cab2d6",
-    "#6a3d9a",
-    "#6a3d9a",
-    "#6a3d9a",
-    "#6a3d9a",
-    "#6a3d9a",
-    "#6a3d9a",
-    "#6a3d9a",
-    "#6a3d9a",
-    "#6a3d9a",
-    "#6a3d9a",
-    "#6a3d9a",
-    "#6a3d9a",
-    "#6a3d9a",
-    "#6a3d9a",
-    "#6a3d9a",
-    "#6a3d9a",
-    "#6a3d9a",
-    "#6a3d9a",
-    "#6a3d9a",
-    "#6a3d9a",
-    "#6a3d9a",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#ffff99",
-    "#b15928",
-    "#b15928",
-    "#b15928",
-    "#b15928",
-    "#b15928",
-    "#b15928",
-    "#b15928",
-    "#b15928",
-    "#b15928",
-    "#b15928",
-    "#b15928",
-    "#b15928",
-    "#b15928",
-    "#b15928",
-    "#b15928",
-    "#b15928",
-    "#b15928",
-    "#b15928",
-    "#b15928",
-    "#b15928",
-    "#b15928",
-    "#b15928"
-  ],
-  "Pastel1": [
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#fbb4ae",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#b3cde3",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#decbe4",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#fed9a6",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#ffffcc",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#e5d8bd",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#fddaec",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2",
-    "#f2f2f2"
-  ],
-  "Pastel2": [
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#b3e2cd",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#fdcdac",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#cbd5e8",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#f4cae4",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#e6f5c9",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#fff2ae",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#f1e2cc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc",
-    "#cccccc"
-  ],
-  "PiYG": [
-    "#8e0152",
-    "#900253",
-    "#920355",
-    "#940457",
-    "#960558",
-    "#98065a",
-    "#9a075c",
-    "#9d085d",
-    "#9f095f",
-    "#a10a61",
-    "#a30b62",
-    "#a50c64",
-    "#a70d66",
-    "#aa0e67",
-    "#ac0f69",
-    "#ae106b",
-    "#b0116c",
-    "#b2126e",
-    "#b41370",
-    "#b61472",
-    "#b91573",
-    "#bb1675",
-    "#bd1777",
-    "#bf1878",
-    "#c1197a",
-    "#c31a7c",
-    "#c51c7d",
-    "#c6207f",
-    "#c72481",
-    "#c82783",
-    "#c92b85",
-    "#ca2e87",
-    "#cb3289",
-    "#cc368b",
-    "#cd398d",
-    "#ce3d8f",
-    "#cf4091",
-    "#d04493",
-    "#d14895",
-    "#d24b96",
-    "#d34f98",
-    "#d4529a",
-    "#d5569c",
-    "#d65a9e",
-    "#d75da0",
-    "#d861a2",
-    "#d964a4",
-    "#da68a6",
-    "#db6ca8",
-    "#dc6faa",
-    "#dd73ac",
-    "#de77ae",
-    "#de79af",
-    "#df7bb1",
-    "#e07eb3",
-    "#e080b4",
-    "#e183b6",
-    "#e285b8",
-    "#e388ba",
-    "#e38abb",
-    "#e48dbd",
-    "#e58fbf",
-    "#e692c0",
-    "#e694c2",
-    "#e797c4",
-    "#e899c6",
-    "#e99cc7",
-    "#e99ec9",
-    "#eaa1cb",
-    "#eba3cd",
-    "#eca5ce",
-    "#eca8d0",
-    "#edaad2",
-    "#eeadd3",
-    "#efafd5",
-    "#efb2d7",
-    "#f0b4d9",
-    "#f1b6da",
-    "#f1b8db",
-    "#f2badc",
-    "#f2bbdc",
-    "#f3bddd",
-    "#f3bfde",
-    "#f4c0df",
-    "#f4c2e0",
-    "#f5c3e1",
-    "#f5c5e1",
-    "#f5c7e2",
-    "#f6c8e3",
-    "#f6cae4",
-    "#f7cce5",
-    "#f7cde5",
-    "#f8cfe6",
-    "#f8d1e7",
-    "#f9d2e8",
-    "#f9d4e9",
-    "#fad6ea",
-    "#fad7ea",
-    "#fbd9eb",
-    "#fbdbec",
-    "#fcdced",
-    "#fcdeee",
-    "#fde0ef",
-    "#fce0ef",
-    "#fce1ef",
-    "#fce2ef",
-    "#fce3f0",
-    "#fbe4f0",
-    "#fbe5f0",
-    "#fbe6f1",
-    "#fbe7f1",
-    "#fae8f1",
-    "#fae9f2",
-    "#fae9f2",
-    "#faeaf2",
-    "#f9ebf3",
-    "#f9ecf3",
-    "#f9edf3",
-    "#f9eef4",
-    "#f9eff4",
-    "#f8f0f4",
-    "#f8f1f4",
-    "#f8f2f5",
-    "#f8f2f5",
-    "#f7f3f5",
-    "#f7f4f6",
-    "#f7f5f6",
-    "#f7f6f6",
-    "#f6f6f6",
-    "#f6f6f4",
-    "#f5f6f3",
-    "#f4f6f1",
-    "#f4f6f0",
-    "#f3f6ee",
-    "#f2f6ed",
-    "#f2f6eb",
-    "#f1f6ea",
-    "#f0f6e8",
-    "#f0f6e6",
-    "#eff6e5",
-    "#eef6e3",
-    "#eef5e2",
-    "#edf5e0",
-    "#ecf5df",
-    "#ecf5dd",
-    "#ebf5dc",
-    "#eaf5da",
-    "#eaf5d9",
-    "#e9f5d7",
-    "#e8f5d6",
-    "#e8f5d4",
-    "#e7f5d3",
-    "#e6f5d1",
-    "#e6f5d0",
-    "#e4f4cd",
-    "#e2f3ca",
-    "#e0f2c7",
-    "#def1c4",
-    "#dcf1c1",
-    "#dbf0be",
-    "#d9efbb",
-    "#d7eeb8",
-    "#d5edb5",
-    "#d3edb2",
-    "#d2ecb0",
-    "#d0ebad",
-    "#ceeaaa",
-    "#cceaa7",
-    "#cae9a4",
-    "#c9e8a1",
-    "#c7e79e",
-    "#c5e69b",
-    "#c3e698",
-    "#c1e595",
-    "#c0e493",
-    "#bee390",
-    "#bce28d",
-    "#bae28a",
-    "#b8e187",
-    "#b6e084",
-    "#b4de81",
-    "#b2dd7f",
-    "#b0db7c",
-    "#adda79",
-    "#abd977",
-    "#a9d774",
-    "#a7d671",
-    "#a5d46f",
-    "#a2d36c",
-    "#a0d169",
-    "#9ed066",
-    "#9cce64",
-    "#99cd61",
-    "#97cb5e",
-    "#95ca5c",
-    "#93c959",
-    "#90c756",
-    "#8ec653",
-    "#8cc451",
-    "#8ac34e",
-    "#87c14b",
-    "#85c049",
-    "#83be46",
-    "#81bd43",
-    "#7fbc41",
-    "#7dba3f",
-    "#7bb83e",
-    "#79b73d",
-    "#77b53b",
-    "#75b33a",
-    "#73b239",
-    "#71b038",
-    "#6fae36",
-    "#6dad35",
-    "#6bab34",
-    "#69a933",
-    "#67a831",
-    "#65a630",
-    "#63a42f",
-    "#61a32e",
-    "#5fa12c",
-    "#5da02b",
-    "#5b9e2a",
-    "#599c29",
-    "#579b27",
-    "#559926",
-    "#539725",
-    "#519624",
-    "#4f9422",
-    "#4d9221",
-    "#4c9120",
-    "#4a8f20",
-    "#498d20",
-    "#478b1f",
-    "#46891f",
-    "#44881f",
-    "#43861e",
-    "#41841e",
-    "#40821e",
-    "#3e801e",
-    "#3d7f1d",
-    "#3b7d1d",
-    "#3a7b1d",
-    "#38791c",
-    "#37771c",
-    "#35761c",
-    "#34741b",
-    "#32721b",
-    "#31701b",
-    "#2f6e1a",
-    "#2e6d1a",
-    "#2c6b1a",
-    "#2b6919",
-    "#296719",
-    "#286519",
-    "#276419"
-  ],
-  "PuBu": [
-    "#fff7fb",
-    "#fef6fa",
-    "#fdf5fa",
-    "#fdf5fa",
-    "#fcf4f9",
-    "#fcf4f9",
-    "#fbf3f9",
-    "#faf3f9",
-    "#faf2f8",
-    "#f9f2f8",
-    "#f9f1f8",
-    "#f8f1f7",
-    "#f7f0f7",
-    "#f7f0f7",
-    "#f6eff7",
-    "#f6eff6",
-    "#f5eef6",
-    "#f4eef6",
-    "#f4edf5",
-    "#f3edf5",
-    "#f3ecf5",
-    "#f2ecf5",
-    "#f1ebf4",
-    "#f1ebf4",
-    "#f0eaf4",
-    "#f0eaf3",
-    "#efe9f3",
-    "#eee9f3",
-    "#eee8f3",
-    "#ede8f2",
-    "#ede7f2",
-    "#ece7f2",
-    "#ebe6f1",
-    "#ebe6f1",
-    "#eae5f1",
-    "#e9e4f0",
-    "#e8e4f0",
-    "#e7e3f0",
-    "#e6e2ef",
-    "#e5e2ef",
-    "#e4e1ee",
-    "#e3e0ee",
-    "#e3e0ee",
-    "#e2dfed",
-    "#e1deed",
-    "#e0dded",
-    "#dfddec",
-    "#dedcec",
-    "#dddbeb",
-    "#dcdbeb",
-    "#dcdaeb",
-    "#dbd9ea",
-    "#dad9ea",
-    "#d9d8ea",
-    "#d8d7e9",
-    "#d7d7e9",
-    "#d6d6e8",
-    "#d5d5e8",
-    "#d5d4e8",
-    "#d4d4e7",
-    "#d3d3e7",
-    "#d2d2e7",
-    "#d1d2e6",
-    "#d0d1e6",
-    "#cfd0e5",
-    "#ced0e5",
-    "#cdcfe5",
-    "#cbcee4",
-    "#cacee4",
-    "#c9cde4",
-    "#c7cde3",
-    "#c6cce3",
-    "#c5cbe3",
-    "#c3cbe2",
-    "#c2cae2",
-    "#c1c9e2",
-    "#bfc9e1",
-    "#bec8e1",
-    "#bdc8e1",
-    "#bbc7e0",
-    "#bac6e0",
-    "#b9c6e0",
-    "#b7c5df",
-    "#b6c4df",
-    "#b5c4df",
-    "#b4c3de",
-    "#b2c3de",
-    "#b1c2dd",
-    "#b0c1dd",
-    "#aec1dd",
-    "#adc0dc",
-    "#acbfdc",
-    "#aabfdc",
-    "#a9bedb",
-    "#a8bedb",
-    "#a6bddb",
-    "#a5bcda",
-    "#a3bcda",
-    "#a2bbda",
-    "#a0bad9",
-    "#9fbad9",
-    "#9db9d8",
-    "#9cb9d8",
-    "#9ab8d8",
-    "#98b7d7",
-    "#97b7d7",
-    "#95b6d7",
-    "#94b5d6",
-    "#92b5d6",
-    "#91b4d5",
-    "#8fb3d5",
-    "#8db3d5",
-    "#8cb2d4",
-    "#8ab2d4",
-    "#89b1d4",
-    "#87b0d3",
-    "#86b0d3",
-    "#84afd2",
-    "#82aed2",
-    "#81aed2",
-    "#7fadd1",
-    "#7eadd1",
-    "#7cacd1",
-    "#7babd0",
-    "#79abd0",
-    "#77aacf",
-    "#76a9cf",
-    "#74a9cf",
-    "#73a8ce",
-    "#71a7ce",
-    "#6fa7cd",
-    "#6da6cd",
-    "#6ba5cc",
-    "#69a4cc",
-    "#67a3cb",
-    "#65a3cb",
-    "#63a2cb",
-    "#61a1ca",
-    "#5fa0ca",
-    "#5d9fc9",
-    "#5b9fc9",
-    "#599ec8",
-    "#579dc8",
-    "#559cc7",
-    "#539cc7",
-    "#519bc6",
-    "#509ac6",
-    "#4e99c5",
-    "#4c98c5",
-    "#4a98c4",
-    "#4897c4",
-    "#4696c3",
-    "#4495c3",
-    "#4294c3",
-    "#4094c2",
-    "#3e93c2",
-    "#3c92c1",
-    "#3a91c1",
-    "#3891c0",
-    "#3690c0",
-    "#358fbf",
-    "#338ebf",
-    "#318dbe",
-    "#308cbe",
-    "#2e8bbd",
-    "#2d8abd",
-    "#2b89bc",
-    "#2a88bc",
-    "#2887bb",
-    "#2786bb",
-    "#2585ba",
-    "#2484ba",
-    "#2283b9",
-    "#2182b9",
-    "#1f81b8",
-    "#1d80b8",
-    "#1c7fb7",
-    "#1a7eb7",
-    "#197db6",
-    "#177cb6",
-    "#167bb5",
-    "#147ab5",
-    "#1379b4",
-    "#1178b4",
-    "#1077b3",
-    "#0e76b3",
-    "#0d75b2",
-    "#0b74b2",
-    "#0973b1",
-    "#0872b1",
-    "#0671b0",
-    "#0570b0",
-    "#046faf",
-    "#046eae",
-    "#046eac",
-    "#046dab",
-    "#046caa",
-    "#046ca9",
-    "#046ba8",
-    "#046aa7",
-    "#0469a6",
-    "#0469a5",
-    "#0468a4",
-    "#0467a3",
-    "#0467a2",
-    "#0466a0",
-    "#04659f",
-    "#04659e",
-    "#04649d",
-    "#04639c",
-    "#04639b",
-    "#04629a",
-    "#046199",
-    "#046098",
-    "#046097",
-    "#045f95",
-    "#045e94",
-    "#045e93",
-    "#045d92",
-    "#045c91",
-    "#045c90",
-    "#045b8f",
-    "#045a8e",
-    "#045a8d",
-    "#03598b",
-    "#035889",
-    "#035688",
-    "#035586",
-    "#035484",
-    "#035383",
-    "#035281",
-    "#03517f",
-    "#03507e",
-    "#034f7c",
-    "#034e7a",
-    "#034d79",
-    "#034c77",
-    "#034b75",
-    "#034a74",
-    "#034972",
-    "#024870",
-    "#02466f",
-    "#02456d",
-    "#02446b",
-    "#02436a",
-    "#024268",
-    "#024166",
-    "#024065",
-    "#023f63",
-    "#023e61",
-    "#023d60",
-    "#023c5e",
-    "#023b5c",
-    "#023a5b",
-    "#023959",
-    "#023858"
-  ],
-  "PuBuGn": [
-    "#fff7fb",
-    "#fef6fa",
-    "#fdf5fa",
-    "#fdf5f9",
-    "#fcf4f9",
-    "#fcf3f9",
-    "#fbf3f8",
-    "#faf2f8",
-    "#faf1f8",
-    "#f9f1f7",
-    "#f9f0f7",
-    "#f8eff7",
-    "#f7eff6",
-    "#f7eef6",
-    "#f6edf6",
-    "#f6edf5",
-    "#f5ecf5",
-    "#f4ebf5",
-    "#f4ebf4",
-    "#f3eaf4",
-    "#f3e9f4",
-    "#f2e9f3",
-    "#f1e8f3",
-    "#f1e7f3",
-    "#f0e7f2",
-    "#f0e6f2",
-    "#efe5f2",
-    "#eee5f1",
-    "#eee4f1",
-    "#ede3f0",
-    "#ede3f0",
-    "#ece2f0",
-    "#ebe1ef",
-    "#ebe1ef",
-    "#eae0ef",
-    "#e9e0ef",
-    "#e8dfee",
-    "#e7dfee",
-    "#e6deee",
-    "#e5deed",
-    "#e4dded",
-    "#e3dded",
-    "#e3dcec",
-    "#e2dcec",
-    "#e1dbec",
-    "#e0dbeb",
-    "#dfdaeb",
-    "#ded9eb",
-    "#ddd9ea",
-    "#dcd8ea",
-    "#dcd8ea",
-    "#dbd7ea",
-    "#dad7e9",
-    "#d9d6e9",
-    "#d8d6e9",
-    "#d7d5e8",
-    "#d6d5e8",
-    "#d5d4e8",
-    "#d5d4e7",
-    "#d4d3e7",
-    "#d3d3e7",
-    "#d2d2e6",
-    "#d1d1e6",
-    "#d0d1e6",
-    "#cfd0e5",
-    "#ced0e5",
-    "#cdcfe5",
-    "#cbcee4",
-    "#cacee4",
-    "#c9cde4",
-    "#c7cde3",
-    "#c6cce3",
-    "#c5cbe3",
-    "#c3cbe2",
-    "#c2cae2",
-    "#c1c9e2",
-    "#bfc9e1",
-    "#bec8e1",
-    "#bdc8e1",
-    "#bbc7e0",
-    "#bac6e0",
-    "#b9c6e0",
-    "#b7c5df",
-    "#b6c4df",
-    "#b5c4df",
-    "#b4c3de",
-    "#b2c3de",
-    "#b1c2dd",
-    "#b0c1dd",
-    "#aec1dd",
-    "#adc0dc",
-    "#acbfdc",
-    "#aabfdc",
-    "#a9bedb",
-    "#a8bedb",
-    "#a6bddb",
-    "#a5bcda",
-    "#a3bcda",
-    "#a1bbda",
-    "#9fbad9",
-    "#9dbad9",
-    "#9bb9d8",
-    "#99b9d8",
-    "#97b8d8",
-    "#95b7d7",
-    "#93b7d7",
-    "#91b6d7",
-    "#8fb5d6",
-    "#8db5d6",
-    "#8bb4d5",
-    "#89b3d5",
-    "#87b3d5",
-    "#85b2d4",
-    "#83b2d4",
-    "#81b1d4",
-    "#7fb0d3",
-    "#7db0d3",
-    "#7bafd2",
-    "#79aed2",
-    "#77aed2",
-    "#75add1",
-    "#73add1",
-    "#71acd1",
-    "#6fabd0",
-    "#6dabd0",
-    "#6baacf",
-    "#69a9cf",
-    "#67a9cf",
-    "#66a8ce",
-    "#64a7ce",
-    "#63a7cd",
-    "#61a6cd",
-    "#60a5cc",
-    "#5ea4cc",
-    "#5da3cb",
-    "#5ba3cb",
-    "#59a2cb",
-    "#58a1ca",
-    "#56a0ca",
-    "#559fc9",
-    "#539fc9",
-    "#529ec8",
-    "#509dc8",
-    "#4f9cc7",
-    "#4d9cc7",
-    "#4c9bc6",
-    "#4a9ac6",
-    "#4999c5",
-    "#4798c5",
-    "#4598c4",
-    "#4497c4",
-    "#4296c3",
-    "#4195c3",
-    "#3f94c3",
-    "#3e94c2",
-    "#3c93c2",
-    "#3b92c1",
-    "#3991c1",
-    "#3891c0",
-    "#3690c0",
-    "#348fbe",
-    "#338fbd",
-    "#318ebb",
-    "#308eb9",
-    "#2e8db8",
-    "#2c8db6",
-    "#2b8cb4",
-    "#298cb3",
-    "#278bb1",
-    "#268baf",
-    "#248bae",
-    "#238aac",
-    "#218aaa",
-    "#1f89a8",
-    "#1e89a7",
-    "#1c88a5",
-    "#1a88a3",
-    "#1987a2",
-    "#1787a0",
-    "#15869e",
-    "#14869d",
-    "#12859b",
-    "#118599",
-    "#0f8497",
-    "#0d8496",
-    "#0c8394",
-    "#0a8392",
-    "#088391",
-    "#07828f",
-    "#05828d",
-    "#04818c",
-    "#02818a",
-    "#018088",
-    "#017f87",
-    "#017f85",
-    "#017e84",
-    "#017d82",
-    "#017d81",
-    "#017c7f",
-    "#017b7e",
-    "#017b7c",
-    "#017a7b",
-    "#017979",
-    "#017977",
-    "#017876",
-    "#017774",
-    "#017773",
-    "#017671",
-    "#017570",
-    "#01756e",
-    "#01746d",
-    "#01736b",
-    "#01736a",
-    "#017268",
-    "#017267",
-    "#017165",
-    "#017063",
-    "#017062",
-    "#016f60",
-    "#016e5f",
-    "#016e5d",
-    "#016d5c",
-    "#016c5a",
-    "#016c59",
-    "#016a58",
-    "#016956",
-    "#016855",
-    "#016754",
-    "#016653",
-    "#016452",
-    "#016351",
-    "#016250",
-    "#01614f",
-    "#01604e",
-    "#015f4d",
-    "#015d4b",
-    "#015c4a",
-    "#015b49",
-    "#015a48",
-    "#015947",
-    "#015746",
-    "#015645",
-    "#015544",
-    "#015443",
-    "#015342",
-    "#015140",
-    "#01503f",
-    "#014f3e",
-    "#014e3d",
-    "#014d3c",
-    "#014b3b",
-    "#014a3a",
-    "#014939",
-    "#014838",
-    "#014737",
-    "#014636"
-  ],
-  "PuOr": [
-    "#7f3b08",
-    "#813c07",
-    "#833d07",
-    "#853e07",
-    "#873f07",
-    "#894007",
-    "#8b4107",
-    "#8d4207",
-    "#8f4407",
-    "#914507",
-    "#934607",
-    "#954707",
-    "#974807",
-    "#994906",
-    "#9b4a06",
-    "#9d4c06",
-    "#9f4d06",
-    "#a14e06",
-    "#a34f06",
-    "#a55006",
-    "#a75106",
-    "#a95206",
-    "#ab5406",
-    "#ad5506",
-    "#af5606",
-    "#b15706",
-    "#b35806",
-    "#b55a06",
-    "#b75c07",
-    "#b95d07",
-    "#ba5f08",
-    "#bc6109",
-    "#be6209",
-    "#c0640a",
-    "#c2650a",
-    "#c3670b",
-    "#c5690b",
-    "#c76a0c",
-    "#c96c0c",
-    "#ca6e0d",
-    "#cc6f0d",
-    "#ce710e",
-    "#d0730f",
-    "#d1740f",
-    "#d37610",
-    "#d57810",
-    "#d77911",
-    "#d87b11",
-    "#da7d12",
-    "#dc7e12",
-    "#de8013",
-    "#e08214",
-    "#e18417",
-    "#e2861a",
-    "#e3881d",
-    "#e48a20",
-    "#e58c23",
-    "#e68e26",
-    "#e79029",
-    "#e9922c",
-    "#ea952f",
-    "#eb9732",
-    "#ec9936",
-    "#ed9b39",
-    "#ee9d3c",
-    "#ef9f3f",
-    "#f1a142",
-    "#f2a345",
-    "#f3a548",
-    "#f4a84b",
-    "#f5aa4e",
-    "#f6ac51",
-    "#f7ae55",
-    "#f9b058",
-    "#fab25b",
-    "#fbb45e",
-    "#fcb661",
-    "#fdb864",
-    "#fdba67",
-    "#fdbb6b",
-    "#fdbd6e",
-    "#fdbf71",
-    "#fdc074",
-    "#fdc278",
-    "#fdc37b",
-    "#fdc57e",
-    "#fdc681",
-    "#fdc885",
-    "#fdca88",
-    "#fdcb8b",
-    "#fdcd8e",
-    "#fdce92",
-    "#fdd095",
-    "#fdd198",
-    "#fdd39b",
-    "#fdd59f",
-    "#fdd6a2",
-    "#fdd8a5",
-    "#fdd9a8",
-    "#fddbac",
-    "#fddcaf",
-    "#fddeb2",
-    "#fee0b6",
-    "#fde0b8",
-    "#fde1bb",
-    "#fde2bd",
-    "#fce3c0",
-    "#fce4c2",
-    "#fce5c5",
-    "#fce6c7",
-    "#fbe7ca",
-    "#fbe8cc",
-    "#fbe9cf",
-    "#fae9d2",
-    "#faead4",
-    "#faebd7",
-    "#faecd9",
-    "#f9eddc",
-    "#f9eede",
-    "#f9efe1",
-    "#f9f0e3",
-    "#f8f1e6",
-    "#f8f2e8",
-    "#f8f2eb",
-    "#f7f3ee",
-    "#f7f4f0",
-    "#f7f5f3",
-    "#f7f6f5",
-    "#f6f6f6",
-    "#f5f5f6",
-    "#f3f4f5",
-    "#f2f3f5",
-    "#f1f1f4",
-    "#f0f0f4",
-    "#efeff3",
-    "#edeef3",
-    "#ecedf3",
-    "#ebecf2",
-    "#eaebf2",
-    "#e9e9f1",
-    "#e7e8f1",
-    "#e6e7f0",
-    "#e5e6f0",
-    "#e4e5ef",
-    "#e2e4ef",
-    "#e1e3ee",
-    "#e0e1ee",
-    "#dfe0ed",
-    "#dedfed",
-    "#dcdeec",
-    "#dbddec",
-    "#dadceb",
-    "#d9dbeb",
-    "#d8daeb",
-    "#d6d8ea",
-    "#d5d6e9",
-    "#d3d4e8",
-    "#d2d2e7",
-    "#d0d0e6",
-    "#cfcee5",
-    "#cdcde4",
-    "#cccbe3",
-    "#cac9e2",
-    "#c9c7e1",
-    "#c7c5e0",
-    "#c6c3df",
-    "#c4c2de",
-    "#c3c0dd",
-    "#c1bedc",
-    "#c0bcdb",
-    "#bebada",
-    "#bdb8d9",
-    "#bbb6d8",
-    "#bab5d7",
-    "#b8b3d6",
-    "#b7b1d5",
-    "#b5afd4",
-    "#b4add3",
-    "#b2abd2",
-    "#b1a9d1",
-    "#afa7cf",
-    "#ada5ce",
-    "#aba3cc",
-    "#a9a1cb",
-    "#a79ec9",
-    "#a59cc8",
-    "#a39ac6",
-    "#a198c5",
-    "#9f96c3",
-    "#9d93c2",
-    "#9b91c0",
-    "#998fbf",
-    "#978dbd",
-    "#958bbc",
-    "#9388ba",
-    "#9186b9",
-    "#8f84b7",
-    "#8d82b6",
-    "#8b80b4",
-    "#897db3",
-    "#877bb1",
-    "#8579b0",
-    "#8377ae",
-    "#8175ad",
-    "#8073ac",
-    "#7e70aa",
-    "#7c6da9",
-    "#7a6aa7",
-    "#7967a6",
-    "#7764a4",
-    "#7561a3",
-    "#735ea2",
-    "#725ba0",
-    "#70589f",
-    "#6e559d",
-    "#6d529c",
-    "#6b4f9b",
-    "#694c99",
-    "#674998",
-    "#664696",
-    "#644395",
-    "#624094",
-    "#603d92",
-    "#5f3a91",
-    "#5d378f",
-    "#5b348e",
-    "#5a318c",
-    "#582e8b",
-    "#562b8a",
-    "#542888",
-    "#532686",
-    "#512484",
-    "#502382",
-    "#4e217f",
-    "#4d207d",
-    "#4b1e7a",
-    "#4a1d78",
-    "#481b76",
-    "#471a73",
-    "#451871",
-    "#43166e",
-    "#42156c",
-    "#40136a",
-    "#3f1267",
-    "#3d1065",
-    "#3c0f62",
-    "#3a0d60",
-    "#390c5e",
-    "#370a5b",
-    "#360959",
-    "#340756",
-    "#330654",
-    "#310452",
-    "#30034f",
-    "#2e014d",
-    "#2d004b"
-  ],
-  "PuRd": [
-    "#f7f4f9",
-    "#f6f3f8",
-    "#f5f2f8",
-    "#f5f2f8",
-    "#f4f1f7",
-    "#f4f1f7",
-    "#f3f0f7",
-    "#f3eff6",
-    "#f2eff6",
-    "#f2eef6",
-    "#f1eef5",
-    "#f1edf5",
-    "#f0ecf5",
-    "#f0ecf4",
-    "#efebf4",
-    "#efebf4",
-    "#eeeaf3",
-    "#eee9f3",
-    "#ede9f3",
-    "#ede8f3",
-    "#ece8f2",
-    "#ece7f2",
-    "#ebe6f2",
-    "#ebe6f1",
-    "#eae5f1",
-    "#eae5f1",
-    "#e9e4f0",
-    "#e9e3f0",
-    "#e8e3f0",
-    "#e8e2ef",
-    "#e7e2ef",
-    "#e7e1ef",
-    "#e6e0ee",
-    "#e6dfee",
-    "#e5deed",
-    "#e5ddec",
-    "#e4dbec",
-    "#e3daeb",
-    "#e3d9ea",
-    "#e2d8ea",
-    "#e2d6e9",
-    "#e1d5e8",
-    "#e0d4e8",
-    "#e0d3e7",
-    "#dfd1e7",
-    "#dfd0e6",
-    "#decfe5",
-    "#ddcee5",
-    "#ddcce4",
-    "#dccbe3",
-    "#dccae3",
-    "#dbc9e2",
-    "#dbc7e1",
-    "#dac6e1",
-    "#d9c5e0",
-    "#d9c3df",
-    "#d8c2df",
-    "#d8c1de",
-    "#d7c0dd",
-    "#d6bedd",
-    "#d6bddc",
-    "#d5bcdb",
-    "#d5bbdb",
-    "#d4b9da",
-    "#d3b8d9",
-    "#d3b7d9",
-    "#d3b6d8",
-    "#d2b5d8",
-    "#d2b4d7",
-    "#d2b2d6",
-    "#d1b1d6",
-    "#d1b0d5",
-    "#d1afd5",
-    "#d0aed4",
-    "#d0add3",
-    "#d0abd3",
-    "#cfaad2",
-    "#cfa9d2",
-    "#cfa8d1",
-    "#cea7d0",
-    "#cea6d0",
-    "#cea4cf",
-    "#cda3cf",
-    "#cda2ce",
-    "#cda1cd",
-    "#cca0cd",
-    "#cc9fcc",
-    "#cb9ecc",
-    "#cb9ccb",
-    "#cb9bca",
-    "#ca9aca",
-    "#ca99c9",
-    "#ca98c9",
-    "#c997c8",
-    "#c995c7",
-    "#c994c7",
-    "#c993c6",
-    "#c991c6",
-    "#ca90c5",
-    "#cb8fc4",
-    "#cc8dc3",
-    "#cc8cc3",
-    "#cd8ac2",
-    "#ce89c1",
-    "#ce87c0",
-    "#cf86c0",
-    "#d084bf",
-    "#d083be",
-    "#d181be",
-    "#d280bd",
-    "#d27ebc",
-    "#d37dbb",
-    "#d47bbb",
-    "#d47aba",
-    "#d578b9",
-    "#d677b9",
-    "#d775b8",
-    "#d774b7",
-    "#d873b6",
-    "#d971b6",
-    "#d970b5",
-    "#da6eb4",
-    "#db6db3",
-    "#db6bb3",
-    "#dc6ab2",
-    "#dd68b1",
-    "#dd67b1",
-    "#de65b0",
-    "#df64af",
-    "#df62ae",
-    "#df60ad",
-    "#df5eab",
-    "#e05caa",
-    "#e05aa9",
-    "#e058a8",
-    "#e056a7",
-    "#e155a5",
-    "#e153a4",
-    "#e151a3",
-    "#e14fa2",
-    "#e24da1",
-    "#e24b9f",
-    "#e2499e",
-    "#e2479d",
-    "#e3459c",
-    "#e3449b",
-    "#e34299",
-    "#e34098",
-    "#e43e97",
-    "#e43c96",
-    "#e43a95",
-    "#e43893",
-    "#e53692",
-    "#e53491",
-    "#e53390",
-    "#e5318f",
-    "#e62f8e",
-    "#e62d8c",
-    "#e62b8b",
-    "#e6298a",
-    "#e62888",
-    "#e52787",
-    "#e42785",
-    "#e42684",
-    "#e32582",
-    "#e22480",
-    "#e1247f",
-    "#e1237d",
-    "#e0227b",
-    "#df227a",
-    "#de2178",
-    "#dd2077",
-    "#dd1f75",
-    "#dc1f73",
-    "#db1e72",
-    "#da1d70",
-    "#d91d6e",
-    "#d91c6d",
-    "#d81b6b",
-    "#d71a69",
-    "#d61a68",
-    "#d61966",
-    "#d51865",
-    "#d41763",
-    "#d31761",
-    "#d21660",
-    "#d2155e",
-    "#d1155c",
-    "#d0145b",
-    "#cf1359",
-    "#ce1258",
-    "#ce1256",
-    "#cc1155",
-    "#cb1154",
-    "#c91054",
-    "#c70f53",
-    "#c50f53",
-    "#c40e52",
-    "#c20e51",
-    "#c00d51",
-    "#bf0d50",
-    "#bd0c50",
-    "#bb0b4f",
-    "#ba0b4e",
-    "#b80a4e",
-    "#b60a4d",
-    "#b5094d",
-    "#b3094c",
-    "#b1084c",
-    "#af074b",
-    "#ae074a",
-    "#ac064a",
-    "#aa0649",
-    "#a90549",
-    "#a70548",
-    "#a50447",
-    "#a40447",
-    "#a20346",
-    "#a00246",
-    "#9e0245",
-    "#9d0144",
-    "#9b0144",
-    "#990043",
-    "#980043",
-    "#960042",
-    "#950040",
-    "#93003f",
-    "#92003e",
-    "#90003d",
-    "#8e003c",
-    "#8d003b",
-    "#8b003a",
-    "#8a0038",
-    "#880037",
-    "#870036",
-    "#850035",
-    "#840034",
-    "#820033",
-    "#810032",
-    "#7f0031",
-    "#7e002f",
-    "#7c002e",
-    "#7a002d",
-    "#79002c",
-    "#77002b",
-    "#76002a",
-    "#740029",
-    "#730028",
-    "#710026",
-    "#700025",
-    "#6e0024",
-    "#6d0023",
-    "#6b0022",
-    "#6a0021",
-    "#680020",
-    "#67001f"
-  ],
-  "Purples": [
-    "#fcfbfd",
-    "#fbfafc",
-    "#fbfafc",
-    "#faf9fc",
-    "#faf9fb",
-    "#f9f8fb",
-    "#f9f8fb",
-    "#f9f7fb",
-    "#f8f7fa",
-    "#f8f7fa",
-    "#f7f6fa",
-    "#f7f6fa",
-    "#f7f5f9",
-    "#f6f5f9",
-    "#f6f4f9",
-    "#f5f4f9",
-    "#f5f3f8",
-    "#f5f3f8",
-    "#f4f3f8",
-    "#f4f2f8",
-    "#f3f2f7",
-    "#f3f1f7",
-    "#f3f1f7",
-    "#f2f0f7",
-    "#f2f0f6",
-    "#f1f0f6",
-    "#f1eff6",
-    "#f0eff6",
-    "#f0eef5",
-    "#f0eef5",
-    "#efedf5",
-    "#efedf5",
-    "#eeecf4",
-    "#eeecf4",
-    "#edebf4",
-    "#ecebf4",
-    "#eceaf3",
-    "#ebe9f3",
-    "#eae9f3",
-    "#eae8f2",
-    "#e9e8f2",
-    "#e8e7f2",
-    "#e8e6f1",
-    "#e7e6f1",
-    "#e7e5f1",
-    "#e6e5f0",
-    "#e5e4f0",
-    "#e5e3f0",
-    "#e4e3ef",
-    "#e3e2ef",
-    "#e3e2ef",
-    "#e2e1ef",
-    "#e1e1ee",
-    "#e1e0ee",
-    "#e0dfee",
-    "#dfdfed",
-    "#dfdeed",
-    "#dedeed",
-    "#ddddec",
-    "#dddcec",
-    "#dcdcec",
-    "#dbdbeb",
-    "#dbdbeb",
-    "#dadaeb",
-    "#d9d9ea",
-    "#d8d8ea",
-    "#d7d7e9",
-    "#d6d7e9",
-    "#d6d6e9",
-    "#d5d5e8",
-    "#d4d4e8",
-    "#d3d3e7",
-    "#d2d2e7",
-    "#d1d1e6",
-    "#d0d0e6",
-    "#cfcfe5",
-    "#cecee5",
-    "#cdcde4",
-    "#cccde4",
-    "#cbcce3",
-    "#cacbe3",
-    "#c9cae2",
-    "#c8c9e2",
-    "#c7c8e1",
-    "#c6c7e1",
-    "#c6c6e1",
-    "#c5c5e0",
-    "#c4c4e0",
-    "#c3c3df",
-    "#c2c3df",
-    "#c1c2de",
-    "#c0c1de",
-    "#bfc0dd",
-    "#bebfdd",
-    "#bdbedc",
-    "#bcbddc",
-    "#bbbcdb",
-    "#babbdb",
-    "#b9bada",
-    "#b8b9d9",
-    "#b7b8d9",
-    "#b6b7d8",
-    "#b6b6d8",
-    "#b5b4d7",
-    "#b4b3d6",
-    "#b3b2d6",
-    "#b2b1d5",
-    "#b1b0d4",
-    "#b0afd4",
-    "#afaed3",
-    "#aeadd2",
-    "#adacd2",
-    "#acabd1",
-    "#aba9d1",
-    "#aaa8d0",
-    "#a9a7cf",
-    "#a8a6cf",
-    "#a7a5ce",
-    "#a6a4cd",
-    "#a6a3cd",
-    "#a5a2cc",
-    "#a4a1cc",
-    "#a3a0cb",
-    "#a29eca",
-    "#a19dca",
-    "#a09cc9",
-    "#9f9bc8",
-    "#9e9ac8",
-    "#9d99c7",
-    "#9c98c7",
-    "#9b97c6",
-    "#9a96c6",
-    "#9995c6",
-    "#9894c5",
-    "#9794c5",
-    "#9693c4",
-    "#9692c4",
-    "#9591c3",
-    "#9490c3",
-    "#938fc2",
-    "#928ec2",
-    "#918dc2",
-    "#908cc1",
-    "#8f8bc1",
-    "#8e8ac0",
-    "#8d8ac0",
-    "#8c89bf",
-    "#8b88bf",
-    "#8a87be",
-    "#8986be",
-    "#8885be",
-    "#8784bd",
-    "#8683bd",
-    "#8682bc",
-    "#8581bc",
-    "#8480bb",
-    "#8380bb",
-    "#827fbb",
-    "#817eba",
-    "#807dba",
-    "#7f7cb9",
-    "#7e7ab8",
-    "#7e79b8",
-    "#7d77b7",
-    "#7c76b6",
-    "#7c75b5",
-    "#7b73b5",
-    "#7a72b4",
-    "#7a71b3",
-    "#796fb3",
-    "#786eb2",
-    "#776cb1",
-    "#776bb0",
-    "#766ab0",
-    "#7568af",
-    "#7567ae",
-    "#7466ae",
-    "#7364ad",
-    "#7363ac",
-    "#7261ab",
-    "#7160ab",
-    "#715faa",
-    "#705da9",
-    "#6f5ca8",
-    "#6f5ba8",
-    "#6e59a7",
-    "#6d58a6",
-    "#6c56a6",
-    "#6c55a5",
-    "#6b54a4",
-    "#6a52a3",
-    "#6a51a3",
-    "#6950a2",
-    "#684ea1",
-    "#684da1",
-    "#674ca0",
-    "#664aa0",
-    "#66499f",
-    "#65489e",
-    "#64469e",
-    "#63459d",
-    "#63449c",
-    "#62429c",
-    "#61419b",
-    "#61409b",
-    "#603e9a",
-    "#5f3d99",
-    "#5f3c99",
-    "#5e3a98",
-    "#5d3997",
-    "#5d3897",
-    "#5c3696",
-    "#5b3595",
-    "#5a3495",
-    "#5a3394",
-    "#593194",
-    "#583093",
-    "#582f92",
-    "#572d92",
-    "#562c91",
-    "#562b90",
-    "#552990",
-    "#54288f",
-    "#54278f",
-    "#53258e",
-    "#52248d",
-    "#52238d",
-    "#51228c",
-    "#50218c",
-    "#501f8b",
-    "#4f1e8b",
-    "#4e1d8a",
-    "#4e1c89",
-    "#4d1a89",
-    "#4c1988",
-    "#4c1888",
-    "#4b1787",
-    "#4a1687",
-    "#4a1486",
-    "#491386",
-    "#481285",
-    "#481184",
-    "#470f84",
-    "#460e83",
-    "#460d83",
-    "#450c82",
-    "#440b82",
-    "#440981",
-    "#430880",
-    "#420780",
-    "#42067f",
-    "#41047f",
-    "#40037e",
-    "#40027e",
-    "#3f017d",
-    "#3f007d"
-  ],
-  "RdBu": [
-    "#67001f",
-    "#69001f",
-    "#6c011f",
-    "#6f0220",
-    "#720320",
-    "#750421",
-    "#780521",
-    "#7b0622",
-    "#7e0722",
-    "#810823",
-    "#840923",
-    "#870a24",
-    "#8a0b24",
-    "#8d0c25",
-    "#900d25",
-    "#930e26",
-    "#960f26",
-    "#991027",
-    "#9b1027",
-    "#9e1127",
-    "#a11228",
-    "#a41328",
-    "#a71429",
-    "#aa1529",
-    "#ad162a",
-    "#b0172a",
-    "#b2192b",
-    "#b41c2d",
-    "#b51f2e",
-    "#b6212f",
-    "#b82431",
-    "#b92732",
-    "#bb2a33",
-    "#bc2d34",
-    "#be3036",
-    "#bf3237",
-    "#c03538",
-    "#c2383a",
-    "#c33b3b",
-    "#c53e3c",
-    "#c6403e",
-    "#c7433f",
-    "#c94641",
-    "#ca4942",
-    "#cc4c43",
-    "#cd4f44",
-    "#ce5146",
-    "#d05447",
-    "#d15749",
-    "#d35a4a",
-    "#d45d4b",
-    "#d6604d",
-    "#d7624f",
-    "#d86551",
-    "#d96853",
-    "#da6a55",
-    "#db6d57",
-    "#dd7059",
-    "#de725b",
-    "#df755d",
-    "#e0785f",
-    "#e17b61",
-    "#e27d63",
-    "#e48065",
-    "#e58368",
-    "#e6856a",
-    "#e7886c",
-    "#e88b6e",
-    "#ea8d70",
-    "#eb9072",
-    "#ec9374",
-    "#ed9676",
-    "#ee9878",
-    "#ef9b7a",
-    "#f19e7c",
-    "#f2a07e",
-    "#f3a380",
-    "#f4a683",
-    "#f4a886",
-    "#f4aa88",
-    "#f5ac8b",
-    "#f5ae8e",
-    "#f5b090",
-    "#f6b293",
-    "#f6b496",
-    "#f7b698",
-    "#f7b99b",
-    "#f7bb9e",
-    "#f8bda1",
-    "#f8bfa3",
-    "#f8c1a6",
-    "#f9c3a9",
-    "#f9c5ab",
-    "#f9c7ae",
-    "#facab1",
-    "#faccb4",
-    "#faceb6",
-    "#fbd0b9",
-    "#fbd2bc",
-    "#fbd4be",
-    "#fcd6c1",
-    "#fcd8c4",
-    "#fddbc7",
-    "#fcdcc8",
-    "#fcddca",
-    "#fcdecc",
-    "#fcdfce",
-    "#fbe0d0",
-    "#fbe1d2",
-    "#fbe2d4",
-    "#fbe3d6",
-    "#fae4d7",
-    "#fae5d9",
-    "#fae7db",
-    "#fae8dd",
-    "#f9e9df",
-    "#f9eae1",
-    "#f9ebe3",
-    "#f9ece5",
-    "#f9ede7",
-    "#f8eee8",
-    "#f8efea",
-    "#f8f0ec",
-    "#f8f2ee",
-    "#f7f3f0",
-    "#f7f4f2",
-    "#f7f5f4",
-    "#f7f6f6",
-    "#f6f6f6",
-    "#f4f5f6",
-    "#f3f5f6",
-    "#f1f4f6",
-    "#f0f3f5",
-    "#eef3f5",
-    "#edf2f5",
-    "#ebf1f4",
-    "#eaf1f4",
-    "#e8f0f4",
-    "#e7eff4",
-    "#e5eef3",
-    "#e4eef3",
-    "#e2edf3",
-    "#e1ecf3",
-    "#dfecf2",
-    "#deebf2",
-    "#dceaf2",
-    "#dbe9f1",
-    "#d9e9f1",
-    "#d8e8f1",
-    "#d6e7f1",
-    "#d5e7f0",
-    "#d3e6f0",
-    "#d2e5f0",
-    "#d1e5f0",
-    "#cee3ef",
-    "#cce2ee",
-    "#c9e1ed",
-    "#c7dfed",
-    "#c4deec",
-    "#c2ddeb",
-    "#bfdceb",
-    "#bddaea",
-    "#bad9e9",
-    "#b8d8e8",
-    "#b5d7e8",
-    "#b3d5e7",
-    "#b0d4e6",
-    "#aed3e6",
-    "#abd2e5",
-    "#a9d0e4",
-    "#a7cfe4",
-    "#a4cee3",
-    "#a2cde2",
-    "#9fcbe1",
-    "#9dcae1",
-    "#9ac9e0",
-    "#98c8df",
-    "#95c6df",
-    "#93c5de",
-    "#90c4dd",
-    "#8dc2dc",
-    "#8ac0db",
-    "#87beda",
-    "#84bcd9",
-    "#80bad8",
-    "#7db8d7",
-    "#7ab6d6",
-    "#77b4d5",
-    "#74b2d3",
-    "#71b0d2",
-    "#6eaed1",
-    "#6bacd0",
-    "#68aacf",
-    "#65a8ce",
-    "#61a6cd",
-    "#5ea4cc",
-    "#5ba2cb",
-    "#58a0ca",
-    "#559ec9",
-    "#529cc8",
-    "#4f9ac7",
-    "#4c98c6",
-    "#4996c5",
-    "#4694c4",
-    "#4393c3",
-    "#4191c2",
-    "#408fc1",
-    "#3f8dc0",
-    "#3d8bbf",
-    "#3c8abe",
-    "#3b88bd",
-    "#3986bc",
-    "#3884bb",
-    "#3783ba",
-    "#3581b9",
-    "#347fb9",
-    "#337db8",
-    "#317cb7",
-    "#307ab6",
-    "#2f78b5",
-    "#2d76b4",
-    "#2c75b3",
-    "#2b73b2",
-    "#2971b1",
-    "#286fb0",
-    "#276db0",
-    "#256caf",
-    "#246aae",
-    "#2368ad",
-    "#2166ac",
-    "#2064aa",
-    "#1f62a7",
-    "#1e60a4",
-    "#1d5ea1",
-    "#1c5c9e",
-    "#1a5a9b",
-    "#195898",
-    "#185695",
-    "#175493",
-    "#165190",
-    "#154f8d",
-    "#144d8a",
-    "#134b87",
-    "#124984",
-    "#114781",
-    "#0f457e",
-    "#0e437b",
-    "#0d4078",
-    "#0c3e75",
-    "#0b3c72",
-    "#0a3a6f",
-    "#09386c",
-    "#083669",
-    "#073466",
-    "#063263",
-    "#053061"
-  ],
-  "RdGy": [
-    "#67001f",
-    "#69001f",
-    "#6c011f",
-    "#6f0220",
-    "#720320",
-    "#750421",
-    "#780521",
-    "#7b0622",
-    "#7e0722",
-    "#810823",
-    "#840923",
-    "#870a24",
-    "#8a0b24",
-    "#8d0c25",
-    "#900d25",
-    "#930e26",
-    "#960f26",
-    "#991027",
-    "#9b1027",
-    "#9e1127",
-    "#a11228",
-    "#a41328",
-    "#a71429",
-    "#aa1529",
-    "#ad162a",
-    "#b0172a",
-    "#b2192b",
-    "#b41c2d",
-    "#b51f2e",
-    "#b6212f",
-    "#b82431",
-    "#b92732",
-    "#bb2a33",
-    "#bc2d34",
-    "#be3036",
-    "#bf3237",
-    "#c03538",
-    "#c2383a",
-    "#c33b3b",
-    "#c53e3c",
-    "#c6403e",
-    "#c7433f",
-    "#c94641",
-    "#ca4942",
-    "#cc4c43",
-    "#cd4f44",
-    "#ce5146",
-    "#d05447",
-    "#d15749",
-    "#d35a4a",
-    "#d45d4b",
-    "#d6604d",
-    "#d7624f",
-    "#d86551",
-    "#d96853",
-    "#da6a55",
-    "#db6d57",
-    "#dd7059",
-    "#de725b",
-    "#df755d",
-    "#e0785f",
-    "#e17b61",
-    "#e27d63",
-    "#e48065",
-    "#e58368",
-    "#e6856a",
-    "#e7886c",
-    "#e88b6e",
-    "#ea8d70",
-    "#eb9072",
-    "#ec9374",
-    "#ed9676",
-    "#ee9878",
-    "#ef9b7a",
-    "#f19e7c",
-    "#f2a07e",
-    "#f3a380",
-    "#f4a683",
-    "#f4a886",
-    "#f4aa88",
-    "#f5ac8b",
-    "#f5ae8e",
-    "#f5b090",
-    "#f6b293",
-    "#f6b496",
-    "#f7b698",
-    "#f7b99b",
-    "#f7bb9e",
-    "#f8bda1",
-    "#f8bfa3",
-    "#f8c1a6",
-    "#f9c3a9",
-    "#f9c5ab",
-    "#f9c7ae",
-    "#facab1",
-    "#faccb4",
-    "#faceb6",
-    "#fbd0b9",
-    "#fbd2bc",
-    "#fbd4be",
-    "#fcd6c1",
-    "#fcd8c4",
-    "#fddbc7",
-    "#fddcc9",
-    "#fdddcb",
-    "#fddfcd",
-    "#fde0cf",
-    "#fde2d1",
-    "#fde3d4",
-    "#fde4d6",
-    "#fde6d8",
-    "#fde7da",
-    "#fde9dc",
-    "#fdeadf",
-    "#fdebe1",
-    "#feede3",
-    "#feeee5",
-    "#fef0e7",
-    "#fef1ea",
-    "#fef3ec",
-    "#fef4ee",
-    "#fef5f0",
-    "#fef7f2",
-    "#fef8f5",
-    "#fefaf7",
-    "#fefbf9",
-    "#fefcfb",
-    "#fefefd",
-    "#fefefe",
-    "#fdfdfd",
-    "#fbfbfb",
-    "#fafafa",
-    "#f9f9f9",
-    "#f8f8f8",
-    "#f7f7f7",
-    "#f5f5f5",
-    "#f4f4f4",
-    "#f3f3f3",
-    "#f2f2f2",
-    "#f1f1f1",
-    "#efefef",
-    "#eeeeee",
-    "#ededed",
-    "#ececec",
-    "#eaeaea",
-    "#e9e9e9",
-    "#e8e8e8",
-    "#e7e7e7",
-    "#e6e6e6",
-    "#e4e4e4",
-    "#e3e3e3",
-    "#e2e2e2",
-    "#e1e1e1",
-    "#e0e0e0",
-    "#dedede",
-    "#dddddd",
-    "#dbdbdb",
-    "#dadada",
-    "#d8d8d8",
-    "#d7d7d7",
-    "#d5d5d5",
-    "#d4d4d4",
-    "#d2d2d2",
-    "#d1d1d1",
-    "#cfcfcf",
-    "#cecece",
-    "#cccccc",
-    "#cbcbcb",
-    "#c9c9c9",
-    "#c8c8c8",
-    "#c6c6c6",
-    "#c5c5c5",
-    "#c3c3c3",
-    "#c2c2c2",
-    "#c0c0c0",
-    "#bfbfbf",
-    "#bdbdbd",
-    "#bcbcbc",
-    "#bababa",
-    "#b9b9b9",
-    "#b7b7b7",
-    "#b5b5b5",
-    "#b3b3b3",
-    "#b1b1b1",
-    "#afafaf",
-    "#adadad",
-    "#ababab",
-    "#a9a9a9",
-    "#a7a7a7",
-    "#a5a5a5",
-    "#a3a3a3",
-    "#a1a1a1",
-    "#9f9f9f",
-    "#9d9d9d",
-    "#9b9b9b",
-    "#999999",
-    "#979797",
-    "#959595",
-    "#939393",
-    "#919191",
-    "#8f8f8f",
-    "#8d8d8d",
-    "#8b8b8b",
-    "#898989",
-    "#878787",
-    "#848484",
-    "#828282",
-    "#808080",
-    "#7d7d7d",
-    "#7b7b7b",
-    "#797979",
-    "#777777",
-    "#747474",
-    "#727272",
-    "#707070",
-    "#6d6d6d",
-    "#6b6b6b",
-    "#696969",
-    "#676767",
-    "#646464",
-    "#626262",
-    "#606060",
-    "#5e5e5e",
-    "#5b5b5b",
-    "#595959",
-    "#575757",
-    "#545454",
-    "#525252",
-    "#505050",
-    "#4e4e4e",
-    "#4c4c4c",
-    "#494949",
-    "#484848",
-    "#454545",
-    "#444444",
-    "#414141",
-    "#404040",
-    "#3d3d3d",
-    "#3c3c3c",
-    "#393939",
-    "#383838",
-    "#353535",
-    "#343434",
-    "#313131",
-    "#303030",
-    "#2e2e2e",
-    "#2c2c2c",
-    "#2a2a2a",
-    "#282828",
-    "#262626",
-    "#242424",
-    "#222222",
-    "#202020",
-    "#1e1e1e",
-    "#1c1c1c",
-    "#1a1a1a"
-  ],
-  "RdPu": [
-    "#fff7f3",
-    "#fef6f2",
-    "#fef5f1",
-    "#fef4f0",
-    "#fef4f0",
-    "#fef3ef",
-    "#fef2ee",
-    "#fef1ee",
-    "#fef1ed",
-    "#fef0ec",
-    "#feefec",
-    "#feefeb",
-    "#feeeea",
-    "#feedea",
-    "#feece9",
-    "#feece8",
-    "#fdebe7",
-    "#fdeae7",
-    "#fdeae6",
-    "#fde9e5",
-    "#fde8e5",
-    "#fde7e4",
-    "#fde7e3",
-    "#fde6e3",
-    "#fde5e2",
-    "#fde4e1",
-    "#fde4e1",
-    "#fde3e0",
-    "#fde2df",
-    "#fde2de",
-    "#fde1de",
-    "#fde0dd",
-    "#fcdfdc",
-    "#fcdfdb",
-    "#fcdedb",
-    "#fcddda",
-    "#fcdcd9",
-    "#fcdbd8",
-    "#fcdad7",
-    "#fcd9d6",
-    "#fcd9d5",
-    "#fcd8d4",
-    "#fcd7d3",
-    "#fcd6d2",
-    "#fcd5d1",
-    "#fcd4d1",
-    "#fcd4d0",
-    "#fcd3cf",
-    "#fcd2ce",
-    "#fcd1cd",
-    "#fcd0cc",
-    "#fccfcb",
-    "#fcceca",
-    "#fccec9",
-    "#fccdc8",
-    "#fcccc7",
-    "#fccbc7",
-    "#fccac6",
-    "#fcc9c5",
-    "#fcc9c4",
-    "#fcc8c3",
-    "#fcc7c2",
-    "#fcc6c1",
-    "#fcc5c0",
-    "#fbc4bf",
-    "#fbc3bf",
-    "#fbc2bf",
-    "#fbc1be",
-    "#fbbfbe",
-    "#fbbebe",
-    "#fbbdbd",
-    "#fbbcbd",
-    "#fbbbbd",
-    "#fbb9bc",
-    "#fbb8bc",
-    "#fbb7bc",
-    "#fbb6bb",
-    "#fbb5bb",
-    "#fbb4bb",
-    "#fbb2ba",
-    "#fab1ba",
-    "#fab0ba",
-    "#faafb9",
-    "#faaeb9",
-    "#faacb9",
-    "#faabb8",
-    "#faaab8",
-    "#faa9b7",
-    "#faa8b7",
-    "#faa6b7",
-    "#faa5b6",
-    "#faa4b6",
-    "#faa3b6",
-    "#faa2b5",
-    "#faa0b5",
-    "#fa9fb5",
-    "#f99eb4",
-    "#f99cb4",
-    "#f99ab3",
-    "#f999b2",
-    "#f997b2",
-    "#f995b1",
-    "#f994b1",
-    "#f992b0",
-    "#f990af",
-    "#f98eaf",
-    "#f98dae",
-    "#f88bad",
-    "#f889ad",
-    "#f887ac",
-    "#f886ab",
-    "#f884ab",
-    "#f882aa",
-    "#f881aa",
-    "#f87fa9",
-    "#f87da8",
-    "#f87ba8",
-    "#f77aa7",
-    "#f778a6",
-    "#f776a6",
-    "#f774a5",
-    "#f773a5",
-    "#f771a4",
-    "#f76fa3",
-    "#f76ea3",
-    "#f76ca2",
-    "#f76aa1",
-    "#f768a1",
-    "#f667a0",
-    "#f565a0",
-    "#f463a0",
-    "#f4629f",
-    "#f3609f",
-    "#f25f9f",
-    "#f15d9e",
-    "#f05b9e",
-    "#f05a9e",
-    "#ef589e",
-    "#ee569d",
-    "#ed559d",
-    "#ec539d",
-    "#eb519c",
-    "#eb509c",
-    "#ea4e9c",
-    "#e94d9b",
-    "#e84b9b",
-    "#e7499b",
-    "#e7489a",
-    "#e6469a",
-    "#e5449a",
-    "#e44399",
-    "#e34199",
-    "#e34099",
-    "#e23e99",
-    "#e13c98",
-    "#e03b98",
-    "#df3998",
-    "#de3797",
-    "#de3697",
-    "#dd3497",
-    "#dc3396",
-    "#da3195",
-    "#d92f94",
-    "#d72e94",
-    "#d62c93",
-    "#d42a92",
-    "#d32991",
-    "#d12791",
-    "#d02690",
-    "#ce248f",
-    "#cd238e",
-    "#cb218d",
-    "#ca1f8d",
-    "#c81e8c",
-    "#c71c8b",
-    "#c51b8a",
-    "#c41989",
-    "#c31789",
-    "#c11688",
-    "#c01487",
-    "#be1386",
-    "#bd1186",
-    "#bb0f85",
-    "#ba0e84",
-    "#b80c83",
-    "#b70a82",
-    "#b50982",
-    "#b40781",
-    "#b20680",
-    "#b1047f",
-    "#af027e",
-    "#ae017e",
-    "#ac017d",
-    "#ab017d",
-    "#a9017d",
-    "#a7017d",
-    "#a6017c",
-    "#a4017c",
-    "#a2017c",
-    "#a1017c",
-    "#9f017c",
-    "#9e017b",
-    "#9c017b",
-    "#9a017b",
-    "#99017b",
-    "#97017a",
-    "#95017a",
-    "#94017a",
-    "#92017a",
-    "#91017a",
-    "#8f0179",
-    "#8d0179",
-    "#8c0179",
-    "#8a0179",
-    "#880179",
-    "#870178",
-    "#850178",
-    "#830178",
-    "#820178",
-    "#800177",
-    "#7f0177",
-    "#7d0177",
-    "#7b0177",
-    "#7a0177",
-    "#780076",
-    "#770076",
-    "#750075",
-    "#740075",
-    "#720075",
-    "#700074",
-    "#6f0074",
-    "#6d0073",
-    "#6c0073",
-    "#6a0072",
-    "#690072",
-    "#670072",
-    "#660071",
-    "#640071",
-    "#630070",
-    "#610070",
-    "#600070",
-    "#5e006f",
-    "#5c006f",
-    "#5b006e",
-    "#59006e",
-    "#58006e",
-    "#56006d",
-    "#55006d",
-    "#53006c",
-    "#52006c",
-    "#50006c",
-    "#4f006b",
-    "#4d006b",
-    "#4c006a",
-    "#4a006a",
-    "#49006a"
-  ],
-  "RdYlBu": [
-    "#a50026",
-    "#a60126",
-    "#a80326",
-    "#aa0526",
-    "#ac0726",
-    "#ae0926",
-    "#b00b26",
-    "#b20d26",
-    "#b40f26",
-    "#b61026",
-    "#b81226",
-    "#ba1426",
-    "#bc1626",
-    "#be1826",
-    "#c01a26",
-    "#c21c26",
-    "#c41e26",
-    "#c62026",
-    "#c82126",
-    "#ca2326",
-    "#cc2526",
-    "#ce2726",
-    "#d02926",
-    "#d22b26",
-    "#d42d26",
-    "#d62f26",
-    "#d73127",
-    "#d83328",
-    "#d93529",
-    "#da382a",
-    "#dc3a2b",
-    "#dd3d2d",
-    "#de3f2e",
-    "#df412f",
-    "#e04430",
-    "#e14631",
-    "#e24932",
-    "#e44b33",
-    "#e54d34",
-    "#e65035",
-    "#e75236",
-    "#e85538",
-    "#e95739",
-    "#ea593a",
-    "#ec5c3b",
-    "#ed5e3c",
-    "#ee613d",
-    "#ef633e",
-    "#f0653f",
-    "#f16840",
-    "#f26a41",
-    "#f46d43",
-    "#f46f44",
-    "#f47245",
-    "#f57446",
-    "#f57747",
-    "#f57948",
-    "#f67c4a",
-    "#f67e4b",
-    "#f6814c",
-    "#f7834d",
-    "#f7864e",
-    "#f7894f",
-    "#f88b51",
-    "#f88e52",
-    "#f89053",
-    "#f99354",
-    "#f99555",
-    "#fa9856",
-    "#fa9a58",
-    "#fa9d59",
-    "#fb9f5a",
-    "#fba25b",
-    "#fba55c",
-    "#fca75e",
-    "#fcaa5f",
-    "#fcac60",
-    "#fdae61",
-    "#fdb063",
-    "#fdb265",
-    "#fdb467",
-    "#fdb669",
-    "#fdb86b",
-    "#fdba6c",
-    "#fdbc6e",
-    "#fdbe70",
-    "#fdc072",
-    "#fdc274",
-    "#fdc476",
-    "#fdc678",
-    "#fdc879",
-    "#fdca7b",
-    "#fdcc7d",
-    "#fdce7f",
-    "#fdd081",
-    "#fdd283",
-    "#fdd484",
-    "#fdd686",
-    "#fdd888",
-    "#fdda8a",
-    "#fddc8c",
-    "#fdde8e",
-    "#fee090",
-    "#fee191",
-    "#fee293",
-    "#fee395",
-    "#fee497",
-    "#fee699",
-    "#fee79b",
-    "#fee89c",
-    "#fee99e",
-    "#feeaa0",
-    "#feeca2",
-    "#feeda4",
-    "#feeea6",
-    "#feefa7",
-    "#fef1a9",
-    "#fef2ab",
-    "#fef3ad",
-    "#fef4af",
-    "#fef5b1",
-    "#fef7b3",
-    "#fef8b4",
-    "#fef9b6",
-    "#fefab8",
-    "#fefbba",
-    "#fefdbc",
-    "#fefebe",
-    "#fefec0",
-    "#fdfec2",
-    "#fbfdc4",
-    "#fafdc6",
-    "#f9fcc9",
-    "#f8fccb",
-    "#f7fbcd",
-    "#f5fbcf",
-    "#f4fbd2",
-    "#f3fad4",
-    "#f2fad6",
-    "#f1f9d8",
-    "#eff9da",
-    "#eef8dd",
-    "#edf8df",
-    "#ecf7e1",
-    "#eaf7e3",
-    "#e9f6e6",
-    "#e8f6e8",
-    "#e7f5ea",
-    "#e6f5ec",
-    "#e4f4ef",
-    "#e3f4f1",
-    "#e2f3f3",
-    "#e1f3f5",
-    "#e0f3f7",
-    "#ddf1f7",
-    "#dbf0f6",
-    "#d9eff6",
-    "#d7eef5",
-    "#d5edf5",
-    "#d3ecf4",
-    "#d1ebf3",
-    "#cfeaf3",
-    "#cde9f2",
-    "#cbe8f2",
-    "#c9e7f1",
-    "#c7e6f0",
-    "#c4e5f0",
-    "#c2e4ef",
-    "#c0e3ef",
-    "#bee2ee",
-    "#bce1ee",
-    "#bae0ed",
-    "#b8dfec",
-    "#b6deec",
-    "#b4ddeb",
-    "#b2dceb",
-    "#b0dbea",
-    "#aedae9",
-    "#acd9e9",
-    "#a9d8e8",
-    "#a7d6e7",
-    "#a5d4e6",
-    "#a3d2e5",
-    "#a1d1e4",
-    "#9fcfe3",
-    "#9ccde2",
-    "#9acce1",
-    "#98cae1",
-    "#96c8e0",
-    "#94c6df",
-    "#92c5de",
-    "#90c3dd",
-    "#8dc1dc",
-    "#8bbfdb",
-    "#89beda",
-    "#87bcd9",
-    "#85bad8",
-    "#83b9d7",
-    "#80b7d6",
-    "#7eb5d5",
-    "#7cb3d4",
-    "#7ab2d3",
-    "#78b0d2",
-    "#76aed1",
-    "#74add1",
-    "#72aacf",
-    "#70a8ce",
-    "#6ea6cd",
-    "#6ca4cc",
-    "#6aa2cb",
-    "#689fca",
-    "#679dc9",
-    "#659bc7",
-    "#6399c6",
-    "#6197c5",
-    "#5f94c4",
-    "#5d92c3",
-    "#5c90c2",
-    "#5a8ec1",
-    "#588cbf",
-    "#5689be",
-    "#5487bd",
-    "#5285bc",
-    "#5083bb",
-    "#4f81ba",
-    "#4d7eb9",
-    "#4b7cb7",
-    "#497ab6",
-    "#4778b5",
-    "#4576b4",
-    "#4473b3",
-    "#4371b2",
-    "#436eb0",
-    "#426caf",
-    "#4169ae",
-    "#4067ad",
-    "#3f64ac",
-    "#3f62aa",
-    "#3e60a9",
-    "#3d5da8",
-    "#3c5ba7",
-    "#3b58a6",
-    "#3b56a4",
-    "#3a53a3",
-    "#3951a2",
-    "#384ea1",
-    "#384c9f",
-    "#37499e",
-    "#36479d",
-    "#35449c",
-    "#34429b",
-    "#343f99",
-    "#333d98",
-    "#323a97",
-    "#313896",
-    "#313695"
-  ],
-  "RdYlGn": [
-    "#a50026",
-    "#a60126",
-    "#a80326",
-    "#aa0526",
-    "#ac0726",
-    "#ae0926",
-    "#b00b26",
-    "#b20d26",
-    "#b40f26",
-    "#b61026",
-    "#b81226",
-    "#ba1426",
-    "#bc1626",
-    "#be1826",
-    "#c01a26",
-    "#c21c26",
-    "#c41e26",
-    "#c62026",
-    "#c82126",
-    "#ca2326",
-    "#cc2526",
-    "#ce2726",
-    "#d02926",
-    "#d22b26",
-    "#d42d26",
-    "#d62f26",
-    "#d73127",
-    "#d83328",
-    "#d93529",
-    "#da382a",
-    "#dc3a2b",
-    "#dd3d2d",
-    "#de3f2e",
-    "#df412f",
-    "#e04430",
-    "#e14631",
-    "#e24932",
-    "#e44b33",
-    "#e54d34",
-    "#e65035",
-    "#e75236",
-    "#e85538",
-    "#e95739",
-    "#ea593a",
-    "#ec5c3b",
-    "#ed5e3c",
-    "#ee613d",
-    "#ef633e",
-    "#f0653f",
-    "#f16840",
-    "#f26a41",
-    "#f46d43",
-    "#f46f44",
-    "#f47245",
-    "#f57446",
-    "#f57747",
-    "#f57948",
-    "#f67c4a",
-    "#f67e4b",
-    "#f6814c",
-    "#f7834d",
-    "#f7864e",
-    "#f7894f",
-    "#f88b51",
-    "#f88e52",
-    "#f89053",
-    "#f99354",
-    "#f99555",
-    "#fa9856",
-    "#fa9a58",
-    "#fa9d59",
-    "#fb9f5a",
-    "#fba25b",
-    "#fba55c",
-    "#fca75e",
-    "#fcaa5f",
-    "#fcac60",
-    "#fdae61",
-    "#fdb063",
-    "#fdb265",
-    "#fdb466",
-    "#fdb668",
-    "#fdb86a",
-    "#fdba6b",
-    "#fdbc6d",
-    "#fdbe6e",
-    "#fdc070",
-    "#fdc272",
-    "#fdc473",
-    "#fdc675",
-    "#fdc877",
-    "#fdca78",
-    "#fdcc7a",
-    "#fdce7c",
-    "#fdd07d",
-    "#fdd27f",
-    "#fdd481",
-    "#fdd682",
-    "#fdd884",
-    "#fdda86",
-    "#fddc87",
-    "#fdde89",
-    "#fee08b",
-    "#fee18d",
-    "#fee28f",
-    "#fee391",
-    "#fee493",
-    "#fee695",
-    "#fee797",
-    "#fee899",
-    "#fee99b",
-    "#feea9d",
-    "#feec9f",
-    "#feeda1",
-    "#feeea3",
-    "#feefa5",
-    "#fef1a7",
-    "#fef2a9",
-    "#fef3ab",
-    "#fef4ad",
-    "#fef5af",
-    "#fef7b1",
-    "#fef8b3",
-    "#fef9b5",
-    "#fefab7",
-    "#fefbb9",
-    "#fefdbb",
-    "#fefebd",
-    "#fefebd",
-    "#fcfebb",
-    "#fbfdb9",
-    "#f9fcb7",
-    "#f8fcb5",
-    "#f6fbb3",
-    "#f5fab1",
-    "#f3faaf",
-    "#f2f9ad",
-    "#f0f9ab",
-    "#eff8a9",
-    "#edf7a7",
-    "#ecf7a5",
-    "#eaf6a3",
-    "#e9f5a1",
-    "#e7f59f",
-    "#e6f49d",
-    "#e4f49b",
-    "#e3f399",
-    "#e1f297",
-    "#e0f295",
-    "#def193",
-    "#ddf091",
-    "#dbf08f",
-    "#daef8d",
-    "#d9ef8b",
-    "#d7ee89",
-    "#d5ed88",
-    "#d3ec87",
-    "#d1eb85",
-    "#cfea84",
-    "#cde983",
-    "#cbe881",
-    "#c9e880",
-    "#c7e77f",
-    "#c5e67e",
-    "#c3e57c",
-    "#c1e47b",
-    "#bfe37a",
-    "#bde278",
-    "#bbe277",
-    "#b9e176",
-    "#b7e075",
-    "#b5df73",
-    "#b3de72",
-    "#b1dd71",
-    "#afdc6f",
-    "#addc6e",
-    "#abdb6d",
-    "#a9da6b",
-    "#a7d96a",
-    "#a4d869",
-    "#a2d769",
-    "#9fd669",
-    "#9dd569",
-    "#9ad468",
-    "#98d268",
-    "#95d168",
-    "#93d067",
-    "#90cf67",
-    "#8ece67",
-    "#8bcd67",
-    "#89cc66",
-    "#86cb66",
-    "#84ca66",
-    "#81c966",
-    "#7fc765",
-    "#7cc665",
-    "#7ac565",
-    "#77c464",
-    "#75c364",
-    "#72c264",
-    "#70c164",
-    "#6dc063",
-    "#6bbf63",
-    "#68be63",
-    "#66bd63",
-    "#63bb62",
-    "#60ba61",
-    "#5db860",
-    "#5ab760",
-    "#57b55f",
-    "#54b45e",
-    "#51b25d",
-    "#4eb15d",
-    "#4baf5c",
-    "#48ae5b",
-    "#45ad5a",
-    "#42ab5a",
-    "#3faa59",
-    "#3ca858",
-    "#39a757",
-    "#36a557",
-    "#33a456",
-    "#30a255",
-    "#2da154",
-    "#2a9f54",
-    "#279e53",
-    "#249d52",
-    "#219b51",
-    "#1e9a51",
-    "#1b9850",
-    "#19974f",
-    "#18954e",
-    "#17934d",
-    "#16914c",
-    "#158f4b",
-    "#148d4a",
-    "#138b49",
-    "#128948",
-    "#118847",
-    "#108646",
-    "#0f8445",
-    "#0e8244",
-    "#0d8043",
-    "#0c7e42",
-    "#0b7c41",
-    "#0a7a40",
-    "#09783f",
-    "#08773e",
-    "#07753d",
-    "#06733c",
-    "#05713b",
-    "#046f3a",
-    "#036d39",
-    "#026b38",
-    "#016937",
-    "#006837"
-  ],
-  "Reds": [
-    "#fff5f0",
-    "#fef4ef",
-    "#fef3ee",
-    "#fef3ed",
-    "#fef2ec",
-    "#fef1eb",
-    "#fef1ea",
-    "#fef0e9",
-    "#feefe8",
-    "#feefe7",
-    "#feeee6",
-    "#feede5",
-    "#feede4",
-    "#feece3",
-    "#feebe2",
-    "#feebe1",
-    "#feeae0",
-    "#fee9e0",
-    "#fee9df",
-    "#fee8de",
-    "#fee7dd",
-    "#fee7dc",
-    "#fee6db",
-    "#fee5da",
-    "#fee5d9",
-    "#fee4d8",
-    "#fee3d7",
-    "#fee3d6",
-    "#fee2d5",
-    "#fee1d4",
-    "#fee1d3",
-    "#fee0d2",
-    "#fddfd1",
-    "#fdded0",
-    "#fdddce",
-    "#fddccd",
-    "#fddbcb",
-    "#fddaca",
-    "#fdd8c8",
-    "#fdd7c7",
-    "#fdd6c5",
-    "#fdd5c3",
-    "#fdd4c2",
-    "#fdd3c0",
-    "#fdd1bf",
-    "#fdd0bd",
-    "#fdcfbc",
-    "#fdceba",
-    "#fccdb9",
-    "#fcccb7",
-    "#fccab6",
-    "#fcc9b4",
-    "#fcc8b3",
-    "#fcc7b1",
-    "#fcc6af",
-    "#fcc5ae",
-    "#fcc3ac",
-    "#fcc2ab",
-    "#fcc1a9",
-    "#fcc0a8",
-    "#fcbfa6",
-    "#fcbea5",
-    "#fcbda3",
-    "#fcbba2",
-    "#fcbaa0",
-    "#fcb99f",
-    "#fcb89d",
-    "#fcb69c",
-    "#fcb59a",
-    "#fcb499",
-    "#fcb297",
-    "#fcb196",
-    "#fcb094",
-    "#fcaf93",
-    "#fcad91",
-    "#fcac90",
-    "#fcab8e",
-    "#fca98d",
-    "#fca88b",
-    "#fca78a",
-    "#fca689",
-    "#fca487",
-    "#fca386",
-    "#fca284",
-    "#fca083",
-    "#fc9f81",
-    "#fc9e80",
-    "#fc9d7e",
-    "#fc9b7d",
-    "#fc9a7b",
-    "#fc997a",
-    "#fc9778",
-    "#fc9677",
-    "#fc9575",
-    "#fc9474",
-    "#fc9272",
-    "#fb9171",
-    "#fb9070",
-    "#fb8f6f",
-    "#fb8d6d",
-    "#fb8c6c",
-    "#fb8b6b",
-    "#fb8a6a",
-    "#fb8868",
-    "#fb8767",
-    "#fb8666",
-    "#fb8464",
-    "#fb8363",
-    "#fb8262",
-    "#fb8161",
-    "#fb7f5f",
-    "#fb7e5e",
-    "#fb7d5d",
-    "#fb7c5c",
-    "#fb7a5a",
-    "#fb7959",
-    "#fb7858",
-    "#fb7757",
-    "#fb7555",
-    "#fb7454",
-    "#fb7353",
-    "#fb7252",
-    "#fb7050",
-    "#fb6f4f",
-    "#fb6e4e",
-    "#fb6d4d",
-    "#fb6b4b",
-    "#fb6a4a",
-    "#fa6949",
-    "#fa6748",
-    "#fa6647",
-    "#f96446",
-    "#f96345",
-    "#f86144",
-    "#f86043",
-    "#f85e42",
-    "#f75d42",
-    "#f75b41",
-    "#f75a40",
-    "#f6593f",
-    "#f6573e",
-    "#f5563d",
-    "#f5543c",
-    "#f5533b",
-    "#f4513a",
-    "#f45039",
-    "#f44e38",
-    "#f34d37",
-    "#f34b36",
-    "#f24a35",
-    "#f24834",
-    "#f24733",
-    "#f14532",
-    "#f14432",
-    "#f14231",
-    "#f04130",
-    "#f03f2f",
-    "#ef3e2e",
-    "#ef3d2d",
-    "#ef3b2c",
-    "#ee3a2b",
-    "#ed392b",
-    "#ec382a",
-    "#ea372a",
-    "#e93529",
-    "#e83429",
-    "#e73328",
-    "#e63228",
-    "#e53127",
-    "#e43027",
-    "#e32f27",
-    "#e12e26",
-    "#e02d26",
-    "#df2c25",
-    "#de2a25",
-    "#dd2924",
-    "#dc2824",
-    "#db2723",
-    "#d92623",
-    "#d82522",
-    "#d72422",
-    "#d62321",
-    "#d52221",
-    "#d42120",
-    "#d31f20",
-    "#d21e1f",
-    "#d01d1f",
-    "#cf1c1f",
-    "#ce1b1e",
-    "#cd1a1e",
-    "#cc191d",
-    "#cb181d",
-    "#ca171c",
-    "#c8171c",
-    "#c7171c",
-    "#c6161c",
-    "#c5161b",
-    "#c4161b",
-    "#c2161b",
-    "#c1151b",
-    "#c0151a",
-    "#bf151a",
-    "#be141a",
-    "#bc141a",
-    "#bb1419",
-    "#ba1419",
-    "#b91319",
-    "#b81319",
-    "#b71318",
-    "#b51218",
-    "#b41218",
-    "#b31218",
-    "#b21217",
-    "#b11117",
-    "#af1117",
-    "#ae1117",
-    "#ad1116",
-    "#ac1016",
-    "#ab1016",
-    "#a91016",
-    "#a80f15",
-    "#a70f15",
-    "#a60f15",
-    "#a50f15",
-    "#a30e14",
-    "#a10e14",
-    "#9f0d14",
-    "#9d0d14",
-    "#9b0c13",
-    "#990c13",
-    "#970b13",
-    "#950b13",
-    "#930a12",
-    "#910a12",
-    "#8f0912",
-    "#8d0912",
-    "#8b0811",
-    "#8a0811",
-    "#880811",
-    "#860711",
-    "#840710",
-    "#820610",
-    "#800610",
-    "#7e0510",
-    "#7c050f",
-    "#7a040f",
-    "#78040f",
-    "#76030f",
-    "#74030e",
-    "#72020e",
-    "#70020e",
-    "#6e010e",
-    "#6c010d",
-    "#6a000d",
-    "#68000d",
-    "#67000c"
-  ],
-  "Set1": [
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#e41a1c",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#377eb8",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#4daf4a",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#984ea3",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ff7f00",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#ffff33",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#a65628",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#f781bf",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999",
-    "#999999"
-  ],
-  "Set2": [
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#66c2a5",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#fc8d62",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#8da0cb",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#e78ac3",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#a6d854",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#ffd92f",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#e5c494",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b3b3b3"
-  ],
-  "Set3": [
-    "#8dd3c7",
-    "#8dd3c7",
-    "#8dd3c7",
-    "#8dd3c7",
-    "#8dd3c7",
-    "#8dd3c7",
-    "#8dd3c7",
-    "#8dd3c7",
-    "#8dd3c7",
-    "#8dd3c7",
-    "#8dd3c7",
-    "#8dd3c7",
-    "#8dd3c7",
-    "#8dd3c7",
-    "#8dd3c7",
-    "#8dd3c7",
-    "#8dd3c7",
-    "#8dd3c7",
-    "#8dd3c7",
-    "#8dd3c7",
-    "#8dd3c7",
-    "#8dd3c7",
-    "#ffffb3",
-    "#ffffb3",
-    "#ffffb3",
-    "#ffffb3",
-    "#ffffb3",
-    "#ffffb3",
-    "#ffffb3",
-    "#ffffb3",
-    "#ffffb3",
-    "#ffffb3",
-    "#ffffb3",
-    "#ffffb3",
-    "#ffffb3",
-    "#ffffb3",
-    "#ffffb3",
-    "#ffffb3",
-    "#ffffb3",
-    "#ffffb3",
-    "#ffffb3",
-    "#ffffb3",
-    "#ffffb3",
-    "#bebada",
-    "#bebada",
-    "#bebada",
-    "#bebada",
-    "#bebada",
-    "#bebada",
-    "#bebada",
-    "#bebada",
-    "#bebada",
-    "#bebada",
-    "#bebada",
-    "#bebada",
-    "#bebada",
-    "#bebada",
-    "#bebada",
-    "#bebada",
-    "#bebada",
-    "#bebada",
-    "#bebada",
-    "#bebada",
-    "#bebada",
-    "#fb8072",
-    "#fb8072",
-    "#fb8072",
-    "#fb8072",
-    "#fb8072",
-    "#fb8072",
-    "#fb8072",
-    "#fb8072",
-    "#fb8072",
-    "#fb8072",
-    "#fb8072",
-    "#fb8072",
-    "#fb8072",
-    "#fb8072",
-    "#fb8072",
-    "#fb8072",
-    "#fb8072",
-    "#fb8072",
-    "#fb8072",
-    "#fb8072",
-    "#fb8072",
-    "#80b1d3",
-    "#80b1d3",
-    "#80b1d3",
-    "#80b1d3",
-    "#80b1d3",
-    "#80b1d3",
-    "#80b1d3",
-    "#80b1d3",
-    "#80b1d3",
-    "#80b1d3",
-    "#80b1d3",
-    "#80b1d3",
-    "#80b1d3",
-    "#80b1d3",
-    "#80b1d3",
-    "#80b1d3",
-    "#80b1d3",
-    "#80b1d3",
-    "#80b1d3",
-    "#80b1d3",
-    "#80b1d3",
-    "#80b1d3",
-    "#fdb462",
-    "#fdb462",
-    "#fdb462",
-    "#fdb462",
-    "#fdb462",
-    "#fdb462",
-    "#fdb462",
-    "#fdb462",
-    "#fdb462",
-    "#fdb462",
-    "#fdb462",
-    "#fdb462",
-    "#fdb462",
-    "#fdb462",
-    "#fdb462",
-    "#fdb462",
-    "#fdb462",
-    "#fdb462",
-    "#fdb462",
-    "#fdb462",
-    "#fdb462",
-    "#b3de69",
-    "#b3de69",
-    "#b3de69",
-    "#b3de69",
-    "#b3de69",
-    "#b3de69",
-    "#b3de69",
-    "#b3de69",
-    "#b3de69",
-    "#b3de69",
-    "#b3de69",
-    "#b3de69",
-    "#b3de69",
-    "#b3de69",
-    "#b3de69",
-    "#b3de69",
-    "#b3de69",
-    "#b3de69",
-    "#b3de69",
-    "#b3de69",
-    "#b3de69",
-    "#fccde5",
-    "#fccde5",
-    "#fccde5",
-    "#fccde5",
-    "#fccde5",
-    "#fccde5",
-    "#fccde5",
-    "#fccde5",
-    "#fccde5",
-    "#fccde5",
-    "#fccde5",
-    "#fccde5",
-    "#fccde5",
-    "#fccde5",
-    "#fccde5",
-    "#fccde5",
-    "#fccde5",
-    "#fccde5",
-    "#fccde5",
-    "#fccde5",
-    "#fccde5",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#bc80bd",
-    "#bc80bd",
-    "#bc80bd",
-    "#bc80bd",
-    "#bc80bd",
-    "#bc80bd",
-    "#bc80bd",
-    "#bc80bd",
-    "#bc80bd",
-    "#bc80bd",
-    "#bc80bd",
-    "#bc80bd",
-    "#bc80bd",
-    "#bc80bd",
-    "#bc80bd",
-    "#bc80bd",
-    "#bc80bd",
-    "#bc80bd",
-    "#bc80bd",
-    "#bc80bd",
-    "#bc80bd",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ccebc5",
-    "#ffed6f",
-    "#ffed6f",
-    "#ffed6f",
-    "#ffed6f",
-    "#ffed6f",
-    "#ffed6f",
-    "#ffed6f",
-    "#ffed6f",
-    "#ffed6f",
-    "#ffed6f",
-    "#ffed6f",
-    "#ffed6f",
-    "#ffed6f",
-    "#ffed6f",
-    "#ffed6f",
-    "#ffed6f",
-    "#ffed6f",
-    "#ffed6f",
-    "#ffed6f",
-    "#ffed6f",
-    "#ffed6f",
-    "#ffed6f"
-  ],
-  "Spectral": [
-    "#9e0142",
-    "#a00342",
-    "#a20543",
-    "#a40843",
-    "#a60a44",
-    "#a80c44",
-    "#aa0f45",
-    "#ad1145",
-    "#af1446",
-    "#b11646",
-    "#b31847",
-    "#b51b47",
-    "#b71d48",
-    "#ba2048",
-    "#bc2249",
-    "#be2449",
-    "#c0274a",
-    "#c2294a",
-    "#c42c4b",
-    "#c62e4b",
-    "#c9304c",
-    "#cb334c",
-    "#cd354d",
-    "#cf384d",
-    "#d13a4e",
-    "#d33c4e",
-    "#d53e4e",
-    "#d6404e",
-    "#d8424d",
-    "#d9444d",
-    "#da464c",
-    "#db484c",
-    "#dc494b",
-    "#de4b4b",
-    "#df4d4b",
-    "#e04f4a",
-    "#e1514a",
-    "#e25349",
-    "#e45549",
-    "#e55648",
-    "#e65848",
-    "#e75a47",
-    "#e95c47",
-    "#ea5e46",
-    "#eb6046",
-    "#ec6145",
-    "#ed6345",
-    "#ef6544",
-    "#f06744",
-    "#f16943",
-    "#f26b43",
-    "#f46d43",
-    "#f46f44",
-    "#f47245",
-    "#f57446",
-    "#f57747",
-    "#f57948",
-    "#f67c4a",
-    "#f67e4b",
-    "#f6814c",
-    "#f7834d",
-    "#f7864e",
-    "#f7894f",
-    "#f88b51",
-    "#f88e52",
-    "#f89053",
-    "#f99354",
-    "#f99555",
-    "#fa9856",
-    "#fa9a58",
-    "#fa9d59",
-    "#fb9f5a",
-    "#fba25b",
-    "#fba55c",
-    "#fca75e",
-    "#fcaa5f",
-    "#fcac60",
-    "#fdae61",
-    "#fdb063",
-    "#fdb265",
-    "#fdb466",
-    "#fdb668",
-    "#fdb86a",
-    "#fdba6b",
-    "#fdbc6d",
-    "#fdbe6e",
-    "#fdc070",
-    "#fdc272",
-    "#fdc473",
-    "#fdc675",
-    "#fdc877",
-    "#fdca78",
-    "#fdcc7a",
-    "#fdce7c",
-    "#fdd07d",
-    "#fdd27f",
-    "#fdd481",
-    "#fdd682",
-    "#fdd884",
-    "#fdda86",
-    "#fddc87",
-    "#fdde89",
-    "#fee08b",
-    "#fee18d",
-    "#fee28f",
-    "#fee391",
-    "#fee493",
-    "#fee695",
-    "#fee797",
-    "#fee899",
-    "#fee99b",
-    "#feea9d",
-    "#feec9f",
-    "#feeda1",
-    "#feeea3",
-    "#feefa5",
-    "#fef1a7",
-    "#fef2a9",
-    "#fef3ab",
-    "#fef4ad",
-    "#fef5af",
-    "#fef7b1",
-    "#fef8b3",
-    "#fef9b5",
-    "#fefab7",
-    "#fefbb9",
-    "#fefdbb",
-    "#fefebd",
-    "#fefebe",
-    "#fdfebc",
-    "#fcfebb",
-    "#fbfdb9",
-    "#fafdb8",
-    "#f9fcb6",
-    "#f8fcb5",
-    "#f7fcb3",
-    "#f6fbb2",
-    "#f5fbb0",
-    "#f4faae",
-    "#f3faad",
-    "#f2faab",
-    "#f1f9aa",
-    "#f0f9a8",
-    "#eff8a7",
-    "#eef8a5",
-    "#edf8a4",
-    "#ecf7a2",
-    "#ebf7a1",
-    "#eaf69f",
-    "#e9f69e",
-    "#e8f69c",
-    "#e7f59b",
-    "#e6f599",
-    "#e6f598",
-    "#e3f498",
-    "#e1f398",
-    "#dff299",
-    "#dcf199",
-    "#daf09a",
-    "#d8ef9a",
-    "#d5ee9b",
-    "#d3ed9b",
-    "#d1ec9c",
-    "#ceeb9c",
-    "#ccea9d",
-    "#cae99d",
-    "#c7e89e",
-    "#c5e79e",
-    "#c3e69f",
-    "#c0e59f",
-    "#bee5a0",
-    "#bce4a0",
-    "#bae3a0",
-    "#b7e2a1",
-    "#b5e1a1",
-    "#b3e0a2",
-    "#b0dfa2",
-    "#aedea3",
-    "#acdda3",
-    "#a9dca4",
-    "#a6dba4",
-    "#a4daa4",
-    "#a1d9a4",
-    "#9ed8a4",
-    "#9cd7a4",
-    "#99d6a4",
-    "#96d5a4",
-    "#94d4a4",
-    "#91d2a4",
-    "#8ed1a4",
-    "#8bd0a4",
-    "#89cfa4",
-    "#86cea4",
-    "#83cda4",
-    "#81cca4",
-    "#7ecba4",
-    "#7bcaa4",
-    "#78c9a4",
-    "#76c8a4",
-    "#73c7a4",
-    "#70c6a4",
-    "#6ec5a4",
-    "#6bc4a4",
-    "#68c3a4",
-    "#66c2a5",
-    "#63bfa5",
-    "#61bda6",
-    "#5fbba7",
-    "#5db8a8",
-    "#5bb6a9",
-    "#59b4aa",
-    "#57b2ab",
-    "#55afac",
-    "#53adad",
-    "#51abae",
-    "#4fa8af",
-    "#4da6b0",
-    "#4ba4b1",
-    "#49a2b2",
-    "#479fb3",
-    "#459db4",
-    "#439bb5",
-    "#4199b5",
-    "#3f96b6",
-    "#3d94b7",
-    "#3b92b8",
-    "#398fb9",
-    "#378dba",
-    "#358bbb",
-    "#3389bc",
-    "#3286bc",
-    "#3484bb",
-    "#3682ba",
-    "#3880b9",
-    "#397db8",
-    "#3b7bb7",
-    "#3d79b6",
-    "#3e77b5",
-    "#4075b4",
-    "#4272b2",
-    "#4470b1",
-    "#456eb0",
-    "#476caf",
-    "#4969ae",
-    "#4b67ad",
-    "#4c65ac",
-    "#4e63ab",
-    "#5060aa",
-    "#515ea9",
-    "#535ca8",
-    "#555aa7",
-    "#5757a6",
-    "#5855a5",
-    "#5a53a4",
-    "#5c51a3",
-    "#5e4fa2"
-  ],
-  "Wistia": [
-    "#e4ff7a",
-    "#e4fe78",
-    "#e4fe76",
-    "#e5fd75",
-    "#e5fd73",
-    "#e6fd72",
-    "#e6fc70",
-    "#e6fc6f",
-    "#e7fc6d",
-    "#e7fb6c",
-    "#e8fb6a",
-    "#e8fb69",
-    "#e9fa67",
-    "#e9fa66",
-    "#e9f964",
-    "#eaf963",
-    "#eaf961",
-    "#ebf860",
-    "#ebf85e",
-    "#ecf85d",
-    "#ecf75b",
-    "#ecf75a",
-    "#edf758",
-    "#edf657",
-    "#eef655",
-    "#eef554",
-    "#eff552",
-    "#eff551",
-    "#eff44f",
-    "#f0f44e",
-    "#f0f44c",
-    "#f1f34b",
-    "#f1f349",
-    "#f1f348",
-    "#f2f246",
-    "#f2f245",
-    "#f3f243",
-    "#f3f142",
-    "#f4f140",
-    "#f4f03f",
-    "#f4f03d",
-    "#f5f03c",
-    "#f5ef3a",
-    "#f6ef39",
-    "#f6ef37",
-    "#f7ee36",
-    "#f7ee34",
-    "#f7ee33",
-    "#f8ed31",
-    "#f8ed30",
-    "#f9ec2e",
-    "#f9ec2d",
-    "#faec2b",
-    "#faeb2a",
-    "#faeb28",
-    "#fbeb27",
-    "#fbea25",
-    "#fcea24",
-    "#fcea22",
-    "#fce921",
-    "#fde91f",
-    "#fde81e",
-    "#fee81c",
-    "#fee81b",
-    "#ffe719",
-    "#ffe719",
-    "#ffe619",
-    "#ffe518",
-    "#ffe518",
-    "#ffe417",
-    "#ffe317",
-    "#ffe317",
-    "#ffe216",
-    "#ffe116",
-    "#ffe115",
-    "#ffe015",
-    "#ffdf15",
-    "#ffdf14",
-    "#ffde14",
-    "#ffdd13",
-    "#ffdd13",
-    "#ffdc12",
-    "#ffdb12",
-    "#ffdb12",
-    "#ffda11",
-    "#ffd911",
-    "#ffd810",
-    "#ffd810",
-    "#ffd710",
-    "#ffd60f",
-    "#ffd60f",
-    "#ffd50e",
-    "#ffd40e",
-    "#ffd40e",
-    "#ffd30d",
-    "#ffd20d",
-    "#ffd20c",
-    "#ffd10c",
-    "#ffd00c",
-    "#ffd00b",
-    "#ffcf0b",
-    "#ffce0a",
-    "#ffce0a",
-    "#ffcd09",
-    "#ffcc09",
-    "#ffcc09",
-    "#ffcb08",
-    "#ffca08",
-    "#ffca07",
-    "#ffc907",
-    "#ffc807",
-    "#ffc806",
-    "#ffc706",
-    "#ffc605",
-    "#ffc605",
-    "#ffc505",
-    "#ffc404",
-    "#ffc404",
-    "#ffc303",
-    "#ffc203",
-    "#ffc203",
-    "#ffc102",
-    "#ffc002",
-    "#ffc001",
-    "#ffbf01",
-    "#ffbe01",
-    "#ffbe00",
-    "#ffbd00",
-    "#ffbc00",
-    "#ffbc00",
-    "#ffbb00",
-    "#ffbb00",
-    "#ffba00",
-    "#ffba00",
-    "#ffba00",
-    "#ffb900",
-    "#ffb900",
-    "#ffb800",
-    "#ffb800",
-    "#ffb700",
-    "#ffb700",
-    "#ffb600",
-    "#ffb600",
-    "#ffb500",
-    "#ffb500",
-    "#ffb500",
-    "#ffb400",
-    "#ffb400",
-    "#ffb300",
-    "#ffb300",
-    "#ffb200",
-    "#ffb200",
-    "#ffb100",
-    "#ffb100",
-    "#ffb000",
-    "#ffb000",
-    "#ffb000",
-    "#ffaf00",
-    "#ffaf00",
-    "#ffae00",
-    "#ffae00",
-    "#ffad00",
-    "#ffad00",
-    "#ffac00",
-    "#ffac00",
-    "#ffab00",
-    "#ffab00",
-    "#ffab00",
-    "#ffaa00",
-    "#ffaa00",
-    "#ffa900",
-    "#ffa900",
-    "#ffa800",
-    "#ffa800",
-    "#ffa700",
-    "#ffa700",
-    "#ffa600",
-    "#ffa600",
-    "#ffa600",
-    "#ffa500",
-    "#ffa500",
-    "#ffa400",
-    "#ffa400",
-    "#ffa300",
-    "#ffa300",
-    "#ffa200",
-    "#ffa200",
-    "#ffa100",
-    "#ffa100",
-    "#ffa100",
-    "#ffa000",
-    "#ffa000",
-    "#fe9f00",
-    "#fe9f00",
-    "#fe9e00",
-    "#fe9e00",
-    "#fe9d00",
-    "#fe9d00",
-    "#fe9c00",
-    "#fe9b00",
-    "#fe9b00",
-    "#fe9a00",
-    "#fe9a00",
-    "#fe9900",
-    "#fe9900",
-    "#fe9800",
-    "#fe9800",
-    "#fe9700",
-    "#fe9700",
-    "#fe9600",
-    "#fe9600",
-    "#fe9500",
-    "#fe9500",
-    "#fd9400",
-    "#fd9400",
-    "#fd9300",
-    "#fd9300",
-    "#fd9200",
-    "#fd9200",
-    "#fd9100",
-    "#fd9100",
-    "#fd9000",
-    "#fd9000",
-    "#fd8f00",
-    "#fd8f00",
-    "#fd8e00",
-    "#fd8e00",
-    "#fd8d00",
-    "#fd8c00",
-    "#fd8c00",
-    "#fd8b00",
-    "#fd8b00",
-    "#fd8a00",
-    "#fd8a00",
-    "#fc8900",
-    "#fc8900",
-    "#fc8800",
-    "#fc8800",
-    "#fc8700",
-    "#fc8700",
-    "#fc8600",
-    "#fc8600",
-    "#fc8500",
-    "#fc8500",
-    "#fc8400",
-    "#fc8400",
-    "#fc8300",
-    "#fc8300",
-    "#fc8200",
-    "#fc8200",
-    "#fc8100",
-    "#fc8100",
-    "#fc8000",
-    "#fc8000",
-    "#fc7f00",
-    "#fc7f00"
-  ],
-  "YlGn": [
-    "#ffffe5",
-    "#fefee3",
-    "#fefee2",
-    "#fefee0",
-    "#fdfedf",
-    "#fdfede",
-    "#fdfedc",
-    "#fdfedb",
-    "#fcfed9",
-    "#fcfed8",
-    "#fcfed7",
-    "#fcfdd5",
-    "#fbfdd4",
-    "#fbfdd3",
-    "#fbfdd1",
-    "#fbfdd0",
-    "#fafdce",
-    "#fafdcd",
-    "#fafdcc",
-    "#fafdca",
-    "#f9fdc9",
-    "#f9fdc8",
-    "#f9fcc6",
-    "#f9fcc5",
-    "#f8fcc3",
-    "#f8fcc2",
-    "#f8fcc1",
-    "#f8fcbf",
-    "#f7fcbe",
-    "#f7fcbc",
-    "#f7fcbb",
-    "#f7fcba",
-    "#f6fbb8",
-    "#f5fbb8",
-    "#f5fbb7",
-    "#f4fab6",
-    "#f3fab6",
-    "#f2fab5",
-    "#f1f9b4",
-    "#f0f9b4",
-    "#eff8b3",
-    "#eef8b2",
-    "#edf8b2",
-    "#ecf7b1",
-    "#ebf7b0",
-    "#eaf7af",
-    "#e9f6af",
-    "#e8f6ae",
-    "#e7f5ad",
-    "#e6f5ad",
-    "#e5f5ac",
-    "#e5f4ab",
-    "#e4f4ab",
-    "#e3f4aa",
-    "#e2f3a9",
-    "#e1f3a9",
-    "#e0f2a8",
-    "#dff2a7",
-    "#def2a6",
-    "#ddf1a6",
-    "#dcf1a5",
-    "#dbf1a4",
-    "#daf0a4",
-    "#d9f0a3",
-    "#d8efa2",
-    "#d7efa2",
-    "#d5eea1",
-    "#d4eea0",
-    "#d3eda0",
-    "#d1ec9f",
-    "#d0ec9e",
-    "#ceeb9e",
-    "#cdeb9d",
-    "#ccea9c",
-    "#cae99c",
-    "#c9e99b",
-    "#c8e89a",
-    "#c6e89a",
-    "#c5e799",
-    "#c3e698",
-    "#c2e698",
-    "#c1e597",
-    "#bfe596",
-    "#bee496",
-    "#bde395",
-    "#bbe395",
-    "#bae294",
-    "#b8e293",
-    "#b7e193",
-    "#b6e092",
-    "#b4e091",
-    "#b3df91",
-    "#b2df90",
-    "#b0de8f",
-    "#afdd8f",
-    "#addd8e",
-    "#acdc8d",
-    "#aadc8d",
-    "#a9db8c",
-    "#a7da8b",
-    "#a5d98b",
-    "#a4d98a",
-    "#a2d889",
-    "#a0d789",
-    "#9fd688",
-    "#9dd687",
-    "#9bd587",
-    "#9ad486",
-    "#98d485",
-    "#96d385",
-    "#95d284",
-    "#93d183",
-    "#91d183",
-    "#90d082",
-    "#8ecf81",
-    "#8ccf81",
-    "#8bce80",
-    "#89cd7f",
-    "#87cc7f",
-    "#86cc7e",
-    "#84cb7d",
-    "#82ca7d",
-    "#81c97c",
-    "#7fc97b",
-    "#7dc87b",
-    "#7cc77a",
-    "#7ac779",
-    "#78c679",
-    "#77c578",
-    "#75c477",
-    "#73c376",
-    "#71c375",
-    "#70c275",
-    "#6ec174",
-    "#6cc073",
-    "#6bbf72",
-    "#69be71",
-    "#67bd70",
-    "#65bd6f",
-    "#64bc6e",
-    "#62bb6e",
-    "#60ba6d",
-    "#5eb96c",
-    "#5db86b",
-    "#5bb86a",
-    "#59b769",
-    "#58b668",
-    "#56b567",
-    "#54b466",
-    "#52b366",
-    "#51b265",
-    "#4fb264",
-    "#4db163",
-    "#4bb062",
-    "#4aaf61",
-    "#48ae60",
-    "#46ad5f",
-    "#45ad5f",
-    "#43ac5e",
-    "#41ab5d",
-    "#40aa5c",
-    "#3fa95b",
-    "#3ea75a",
-    "#3da65a",
-    "#3ca559",
-    "#3ba458",
-    "#3aa257",
-    "#39a156",
-    "#38a055",
-    "#379f55",
-    "#379e54",
-    "#369c53",
-    "#359b52",
-    "#349a51",
-    "#339951",
-    "#329750",
-    "#31964f",
-    "#30954e",
-    "#2f944d",
-    "#2e924c",
-    "#2d914c",
-    "#2c904b",
-    "#2b8f4a",
-    "#2a8e49",
-    "#298c48",
-    "#288b48",
-    "#278a47",
-    "#278946",
-    "#268745",
-    "#258644",
-    "#248544",
-    "#238443",
-    "#228342",
-    "#218242",
-    "#1f8141",
-    "#1e8041",
-    "#1d7f41",
-    "#1c7e40",
-    "#1b7e40",
-    "#1a7d40",
-    "#197c3f",
-    "#187b3f",
-    "#177a3e",
-    "#16793e",
-    "#15783e",
-    "#13773d",
-    "#12773d",
-    "#11763d",
-    "#10753c",
-    "#0f743c",
-    "#0e733b",
-    "#0d723b",
-    "#0c713b",
-    "#0b703a",
-    "#0a703a",
-    "#086f3a",
-    "#076e39",
-    "#066d39",
-    "#056c38",
-    "#046b38",
-    "#036a38",
-    "#026937",
-    "#016837",
-    "#006837",
-    "#006736",
-    "#006536",
-    "#006435",
-    "#006335",
-    "#006234",
-    "#006134",
-    "#006033",
-    "#005f33",
-    "#005e33",
-    "#005d32",
-    "#005c32",
-    "#005a31",
-    "#005931",
-    "#005830",
-    "#005730",
-    "#005630",
-    "#00552f",
-    "#00542f",
-    "#00532e",
-    "#00522e",
-    "#00512d",
-    "#004f2d",
-    "#004e2c",
-    "#004d2c",
-    "#004c2c",
-    "#004b2b",
-    "#004a2b",
-    "#00492a",
-    "#00482a",
-    "#004729",
-    "#004629",
-    "#004529"
-  ],
-  "YlGnBu": [
-    "#ffffd9",
-    "#fefed7",
-    "#fdfed6",
-    "#fdfed5",
-    "#fcfed3",
-    "#fcfdd2",
-    "#fbfdd1",
-    "#fbfdd0",
-    "#fafdce",
-    "#f9fdcd",
-    "#f9fccc",
-    "#f8fccb",
-    "#f8fcc9",
-    "#f7fcc8",
-    "#f7fbc7",
-    "#f6fbc6",
-    "#f5fbc4",
-    "#f5fbc3",
-    "#f4fbc2",
-    "#f4fac1",
-    "#f3fabf",
-    "#f3fabe",
-    "#f2fabd",
-    "#f2f9bc",
-    "#f1f9ba",
-    "#f0f9b9",
-    "#f0f9b8",
-    "#eff9b7",
-    "#eff8b5",
-    "#eef8b4",
-    "#eef8b3",
-    "#edf8b2",
-    "#ecf7b1",
-    "#ebf7b1",
-    "#eaf7b1",
-    "#e9f6b1",
-    "#e8f6b1",
-    "#e6f5b1",
-    "#e5f5b1",
-    "#e4f4b1",
-    "#e3f4b1",
-    "#e2f3b1",
-    "#e0f3b1",
-    "#dff2b2",
-    "#def2b2",
-    "#ddf1b2",
-    "#dcf1b2",
-    "#daf0b2",
-    "#d9f0b2",
-    "#d8efb2",
-    "#d7efb2",
-    "#d6efb2",
-    "#d5eeb2",
-    "#d3eeb2",
-    "#d2edb3",
-    "#d1edb3",
-    "#d0ecb3",
-    "#cfecb3",
-    "#cdebb3",
-    "#ccebb3",
-    "#cbeab3",
-    "#caeab3",
-    "#c9e9b3",
-    "#c7e9b3",
-    "#c6e8b4",
-    "#c4e7b4",
-    "#c1e7b4",
-    "#bfe6b4",
-    "#bde5b4",
-    "#bbe4b5",
-    "#b8e3b5",
-    "#b6e2b5",
-    "#b4e1b5",
-    "#b2e0b6",
-    "#afdfb6",
-    "#addfb6",
-    "#abdeb6",
-    "#a9ddb6",
-    "#a6dcb7",
-    "#a4dbb7",
-    "#a2dab7",
-    "#a0d9b7",
-    "#9dd8b8",
-    "#9bd8b8",
-    "#99d7b8",
-    "#97d6b8",
-    "#94d5b8",
-    "#92d4b9",
-    "#90d3b9",
-    "#8dd2b9",
-    "#8bd1b9",
-    "#89d1b9",
-    "#87d0ba",
-    "#84cfba",
-    "#82ceba",
-    "#80cdba",
-    "#7eccbb",
-    "#7cccbb",
-    "#7acbbb",
-    "#78cabb",
-    "#76c9bc",
-    "#74c9bc",
-    "#72c8bc",
-    "#70c7bd",
-    "#6ec6bd",
-    "#6cc6bd",
-    "#6ac5bd",
-    "#68c4be",
-    "#66c4be",
-    "#64c3be",
-    "#63c2bf",
-    "#61c1bf",
-    "#5fc1bf",
-    "#5dc0bf",
-    "#5bbfc0",
-    "#59bfc0",
-    "#57bec0",
-    "#55bdc1",
-    "#53bcc1",
-    "#51bcc1",
-    "#4fbbc1",
-    "#4dbac2",
-    "#4bb9c2",
-    "#49b9c2",
-    "#47b8c3",
-    "#45b7c3",
-    "#43b7c3",
-    "#41b6c3",
-    "#40b5c3",
-    "#3fb4c3",
-    "#3eb3c3",
-    "#3db1c3",
-    "#3bb0c3",
-    "#3aafc3",
-    "#39aec3",
-    "#38adc3",
-    "#37acc2",
-    "#36aac2",
-    "#35a9c2",
-    "#34a8c2",
-    "#32a7c2",
-    "#31a6c2",
-    "#30a5c2",
-    "#2fa4c2",
-    "#2ea2c1",
-    "#2da1c1",
-    "#2ca0c1",
-    "#2a9fc1",
-    "#299ec1",
-    "#289dc1",
-    "#279bc1",
-    "#269ac1",
-    "#2599c0",
-    "#2498c0",
-    "#2397c0",
-    "#2196c0",
-    "#2094c0",
-    "#1f93c0",
-    "#1e92c0",
-    "#1d91c0",
-    "#1d90bf",
-    "#1d8ebe",
-    "#1d8cbe",
-    "#1d8bbd",
-    "#1d89bc",
-    "#1d88bb",
-    "#1e86bb",
-    "#1e84ba",
-    "#1e83b9",
-    "#1e81b8",
-    "#1e80b8",
-    "#1e7eb7",
-    "#1e7cb6",
-    "#1f7bb5",
-    "#1f79b4",
-    "#1f78b4",
-    "#1f76b3",
-    "#1f74b2",
-    "#1f73b1",
-    "#2071b1",
-    "#2070b0",
-    "#206eaf",
-    "#206cae",
-    "#206bae",
-    "#2069ad",
-    "#2168ac",
-    "#2166ab",
-    "#2164ab",
-    "#2163aa",
-    "#2161a9",
-    "#2160a8",
-    "#215ea8",
-    "#225da7",
-    "#225ba6",
-    "#225aa6",
-    "#2259a5",
-    "#2257a5",
-    "#2256a4",
-    "#2255a3",
-    "#2253a3",
-    "#2252a2",
-    "#2251a1",
-    "#234fa1",
-    "#234ea0",
-    "#234da0",
-    "#234b9f",
-    "#234a9e",
-    "#23499e",
-    "#23479d",
-    "#23469c",
-    "#23459c",
-    "#23439b",
-    "#23429a",
-    "#24419a",
-    "#244099",
-    "#243e99",
-    "#243d98",
-    "#243c97",
-    "#243a97",
-    "#243996",
-    "#243895",
-    "#243695",
-    "#243594",
-    "#243494",
-    "#243392",
-    "#233290",
-    "#22318e",
-    "#21318c",
-    "#20308a",
-    "#1f2f88",
-    "#1e2f87",
-    "#1d2e85",
-    "#1c2d83",
-    "#1c2c81",
-    "#1b2c7f",
-    "#1a2b7d",
-    "#192a7b",
-    "#182979",
-    "#172978",
-    "#162876",
-    "#152774",
-    "#142772",
-    "#132670",
-    "#12256e",
-    "#12246c",
-    "#11246a",
-    "#102368",
-    "#0f2267",
-    "#0e2265",
-    "#0d2163",
-    "#0c2061",
-    "#0b1f5f",
-    "#0a1f5d",
-    "#091e5b",
-    "#081d59",
-    "#081d58"
-  ],
-  "YlOrBr": [
-    "#ffffe5",
-    "#fffee3",
-    "#fffee2",
-    "#fffee1",
-    "#fffddf",
-    "#fffdde",
-    "#fffddd",
-    "#fffddb",
-    "#fffcda",
-    "#fffcd9",
-    "#fffcd8",
-    "#fffcd6",
-    "#fffbd5",
-    "#fffbd4",
-    "#fffbd2",
-    "#fffbd1",
-    "#fffad0",
-    "#fffacf",
-    "#fffacd",
-    "#fffacc",
-    "#fff9cb",
-    "#fff9c9",
-    "#fff9c8",
-    "#fff9c7",
-    "#fff8c6",
-    "#fff8c4",
-    "#fff8c3",
-    "#fff8c2",
-    "#fff7c0",
-    "#fff7bf",
-    "#fff7be",
-    "#fff7bd",
-    "#fef6bb",
-    "#fef6ba",
-    "#fef5b9",
-    "#fef5b7",
-    "#fef4b6",
-    "#fef3b5",
-    "#fef3b3",
-    "#fef2b2",
-    "#fef1b1",
-    "#fef1af",
-    "#fef0ae",
-    "#fef0ac",
-    "#feefab",
-    "#feeeaa",
-    "#feeea8",
-    "#feeda7",
-    "#feeca6",
-    "#feeca4",
-    "#feeba3",
-    "#feeba2",
-    "#feeaa0",
-    "#fee99f",
-    "#fee99e",
-    "#fee89c",
-    "#fee79b",
-    "#fee79a",
-    "#fee698",
-    "#fee597",
-    "#fee596",
-    "#fee494",
-    "#fee493",
-    "#fee392",
-    "#fee290",
-    "#fee18e",
-    "#fee08c",
-    "#fedf8a",
-    "#fede88",
-    "#fedd86",
-    "#fedc84",
-    "#fedb81",
-    "#feda7f",
-    "#feda7d",
-    "#fed97b",
-    "#fed879",
-    "#fed777",
-    "#fed675",
-    "#fed573",
-    "#fed471",
-    "#fed36f",
-    "#fed26d",
-    "#fed16b",
-    "#fed069",
-    "#fecf67",
-    "#fece65",
-    "#fecd62",
-    "#fecc60",
-    "#fecb5e",
-    "#feca5c",
-    "#fec95a",
-    "#fec858",
-    "#fec756",
-    "#fec654",
-    "#fec552",
-    "#fec450",
-    "#fec34e",
-    "#fec24d",
-    "#fec04c",
-    "#febf4a",
-    "#febe49",
-    "#febc48",
-    "#febb47",
-    "#feba46",
-    "#feb845",
-    "#feb743",
-    "#feb642",
-    "#feb441",
-    "#feb340",
-    "#feb13f",
-    "#feb03d",
-    "#feaf3c",
-    "#fead3b",
-    "#feac3a",
-    "#feab39",
-    "#fea937",
-    "#fea836",
-    "#fea735",
-    "#fea534",
-    "#fea433",
-    "#fea331",
-    "#fea130",
-    "#fea02f",
-    "#fe9f2e",
-    "#fe9d2d",
-    "#fe9c2b",
-    "#fe9b2a",
-    "#fe9929",
-    "#fd9828",
-    "#fd9728",
-    "#fc9527",
-    "#fc9426",
-    "#fb9326",
-    "#fa9125",
-    "#fa9024",
-    "#f98f24",
-    "#f98e23",
-    "#f88c22",
-    "#f88b22",
-    "#f78a21",
-    "#f68820",
-    "#f68720",
-    "#f5861f",
-    "#f5851e",
-    "#f4831e",
-    "#f4821d",
-    "#f3811c",
-    "#f27f1c",
-    "#f27e1b",
-    "#f17d1a",
-    "#f17c1a",
-    "#f07a19",
-    "#f07918",
-    "#ef7818",
-    "#ef7617",
-    "#ee7516",
-    "#ed7416",
-    "#ed7315",
-    "#ec7114",
-    "#ec7014",
-    "#eb6f13",
-    "#ea6e13",
-    "#e96d12",
-    "#e86b11",
-    "#e76a11",
-    "#e66910",
-    "#e56810",
-    "#e4670f",
-    "#e3660f",
-    "#e2650e",
-    "#e1640e",
-    "#e0620d",
-    "#df610c",
-    "#de600c",
-    "#dd5f0b",
-    "#dc5e0b",
-    "#db5d0a",
-    "#da5c0a",
-    "#d95a09",
-    "#d85908",
-    "#d75808",
-    "#d65707",
-    "#d55607",
-    "#d45506",
-    "#d35406",
-    "#d25305",
-    "#d15104",
-    "#d05004",
-    "#cf4f03",
-    "#ce4e03",
-    "#cd4d02",
-    "#cc4c02",
-    "#ca4b02",
-    "#c94a02",
-    "#c74902",
-    "#c64902",
-    "#c44802",
-    "#c24702",
-    "#c14602",
-    "#bf4602",
-    "#be4502",
-    "#bc4402",
-    "#ba4302",
-    "#b94302",
-    "#b74202",
-    "#b64102",
-    "#b44002",
-    "#b24002",
-    "#b13f03",
-    "#af3e03",
-    "#ae3d03",
-    "#ac3d03",
-    "#aa3c03",
-    "#a93b03",
-    "#a73a03",
-    "#a63a03",
-    "#a43903",
-    "#a23803",
-    "#a13703",
-    "#9f3703",
-    "#9e3603",
-    "#9c3503",
-    "#9a3403",
-    "#993403",
-    "#973304",
-    "#963304",
-    "#943204",
-    "#923204",
-    "#913104",
-    "#8f3104",
-    "#8e3004",
-    "#8c3004",
-    "#8a2f04",
-    "#892f04",
-    "#872e04",
-    "#862e04",
-    "#842d04",
-    "#822d04",
-    "#812d04",
-    "#7f2c04",
-    "#7e2c05",
-    "#7c2b05",
-    "#7a2b05",
-    "#792a05",
-    "#772a05",
-    "#762905",
-    "#742905",
-    "#722805",
-    "#712805",
-    "#6f2705",
-    "#6e2705",
-    "#6c2605",
-    "#6a2605",
-    "#692505",
-    "#672505",
-    "#662505"
-  ],
-  "YlOrRd": [
-    "#ffffcc",
-    "#fffeca",
-    "#fffdc9",
-    "#fffdc7",
-    "#fffcc6",
-    "#fffcc5",
-    "#fffbc3",
-    "#fffbc2",
-    "#fffac0",
-    "#fff9bf",
-    "#fff9be",
-    "#fff8bc",
-    "#fff8bb",
-    "#fff7ba",
-    "#fff7b8",
-    "#fff6b7",
-    "#fff5b5",
-    "#fff5b4",
-    "#fff4b3",
-    "#fff4b1",
-    "#fff3b0",
-    "#fff3af",
-    "#fff2ad",
-    "#fff2ac",
-    "#fff1aa",
-    "#fff0a9",
-    "#fff0a8",
-    "#ffefa6",
-    "#ffefa5",
-    "#ffeea3",
-    "#ffeea2",
-    "#ffeda1",
-    "#feec9f",
-    "#feec9e",
-    "#feeb9d",
-    "#feeb9b",
-    "#feea9a",
-    "#fee999",
-    "#fee997",
-    "#fee896",
-    "#fee795",
-    "#fee793",
-    "#fee692",
-    "#fee691",
-    "#fee590",
-    "#fee48e",
-    "#fee48d",
-    "#fee38c",
-    "#fee28a",
-    "#fee289",
-    "#fee188",
-    "#fee186",
-    "#fee085",
-    "#fedf84",
-    "#fedf82",
-    "#fede81",
-    "#fedd80",
-    "#fedd7e",
-    "#fedc7d",
-    "#fedb7c",
-    "#fedb7a",
-    "#feda79",
-    "#feda78",
-    "#fed976",
-    "#fed875",
-    "#fed774",
-    "#fed673",
-    "#fed571",
-    "#fed370",
-    "#fed26f",
-    "#fed16d",
-    "#fed06c",
-    "#fece6b",
-    "#fecd69",
-    "#fecc68",
-    "#fecb67",
-    "#feca65",
-    "#fec864",
-    "#fec763",
-    "#fec661",
-    "#fec560",
-    "#fec35f",
-    "#fec25d",
-    "#fec15c",
-    "#fec05b",
-    "#febf5a",
-    "#febd58",
-    "#febc57",
-    "#febb56",
-    "#feba54",
-    "#feb853",
-    "#feb752",
-    "#feb650",
-    "#feb54f",
-    "#feb34e",
-    "#feb24c",
-    "#fdb14b",
-    "#fdb04b",
-    "#fdaf4a",
-    "#fdae4a",
-    "#fdac49",
-    "#fdab49",
-    "#fdaa48",
-    "#fda948",
-    "#fda847",
-    "#fda747",
-    "#fda546",
-    "#fda446",
-    "#fda345",
-    "#fda245",
-    "#fda144",
-    "#fda044",
-    "#fd9e43",
-    "#fd9d43",
-    "#fd9c42",
-    "#fd9b42",
-    "#fd9a41",
-    "#fd9941",
-    "#fd9840",
-    "#fd9640",
-    "#fd953f",
-    "#fd943f",
-    "#fd933e",
-    "#fd923e",
-    "#fd913d",
-    "#fd8f3d",
-    "#fd8e3c",
-    "#fd8d3c",
-    "#fc8c3b",
-    "#fc8a3b",
-    "#fc883a",
-    "#fc863a",
-    "#fc8439",
-    "#fc8238",
-    "#fc8038",
-    "#fc7e37",
-    "#fc7c37",
-    "#fc7a36",
-    "#fc7836",
-    "#fc7635",
-    "#fc7434",
-    "#fc7234",
-    "#fc7033",
-    "#fc6e33",
-    "#fc6c32",
-    "#fc6a32",
-    "#fc6831",
-    "#fc6630",
-    "#fc6430",
-    "#fc622f",
-    "#fc602f",
-    "#fc5e2e",
-    "#fc5c2e",
-    "#fc5a2d",
-    "#fc582d",
-    "#fc562c",
-    "#fc542b",
-    "#fc522b",
-    "#fc502a",
-    "#fc4e2a",
-    "#fb4c29",
-    "#fa4b29",
-    "#f94928",
-    "#f94828",
-    "#f84627",
-    "#f74427",
-    "#f64327",
-    "#f64126",
-    "#f53f26",
-    "#f43e25",
-    "#f33c25",
-    "#f23b24",
-    "#f23924",
-    "#f13724",
-    "#f03623",
-    "#ef3423",
-    "#ee3222",
-    "#ee3122",
-    "#ed2f21",
-    "#ec2d21",
-    "#eb2c20",
-    "#eb2a20",
-    "#ea2920",
-    "#e9271f",
-    "#e8251f",
-    "#e7241e",
-    "#e7221e",
-    "#e6201d",
-    "#e51f1d",
-    "#e41d1c",
-    "#e31c1c",
-    "#e31a1c",
-    "#e2191c",
-    "#e0181c",
-    "#df171c",
-    "#de161d",
-    "#dd161d",
-    "#dc151d",
-    "#da141e",
-    "#d9131e",
-    "#d8121e",
-    "#d7121f",
-    "#d6111f",
-    "#d4101f",
-    "#d30f20",
-    "#d20e20",
-    "#d10d20",
-    "#d00d20",
-    "#cf0c21",
-    "#cd0b21",
-    "#cc0a21",
-    "#cb0922",
-    "#ca0922",
-    "#c90822",
-    "#c70723",
-    "#c60623",
-    "#c50523",
-    "#c40424",
-    "#c30424",
-    "#c10324",
-    "#c00225",
-    "#bf0125",
-    "#be0025",
-    "#bd0025",
-    "#bb0026",
-    "#b90026",
-    "#b70026",
-    "#b50026",
-    "#b30026",
-    "#b10026",
-    "#af0026",
-    "#ad0026",
-    "#ac0026",
-    "#aa0026",
-    "#a80026",
-    "#a60026",
-    "#a40026",
-    "#a20026",
-    "#a00026",
-    "#9e0026",
-    "#9c0026",
-    "#9a0026",
-    "#980026",
-    "#960026",
-    "#950026",
-    "#930026",
-    "#910026",
-    "#8f0026",
-    "#8d0026",
-    "#8b0026",
-    "#890026",
-    "#870026",
-    "#850026",
-    "#830026",
-    "#810026",
-    "#800026"
-  ],
-  "afmhot": [
-    "#000000",
-    "#020000",
-    "#040000",
-    "#060000",
-    "#080000",
-    "#0a0000",
-    "#0c0000",
-    "#0e0000",
-    "#100000",
-    "#120000",
-    "#140000",
-    "#160000",
-    "#180000",
-    "#1a0000",
-    "#1c0000",
-    "#1e0000",
-    "#200000",
-    "#220000",
-    "#240000",
-    "#260000",
-    "#280000",
-    "#2a0000",
-    "#2c0000",
-    "#2e0000",
-    "#300000",
-    "#320000",
-    "#340000",
-    "#360000",
-    "#380000",
-    "#3a0000",
-    "#3c0000",
-    "#3e0000",
-    "#400000",
-    "#410000",
-    "#440000",
-    "#460000",
-    "#480000",
-    "#490000",
-    "#4c0000",
-    "#4e0000",
-    "#500000",
-    "#510000",
-    "#540000",
-    "#560000",
-    "#580000",
-    "#590000",
-    "#5c0000",
-    "#5e0000",
-    "#600000",
-    "#610000",
-    "#640000",
-    "#660000",
-    "#680000",
-    "#690000",
-    "#6c0000",
-    "#6e0000",
-    "#700000",
-    "#710000",
-    "#740000",
-    "#760000",
-    "#780000",
-    "#790000",
-    "#7c0000",
-    "#7e0000",
-    "#800000",
-    "#820200",
-    "#830400",
-    "#860600",
-    "#880800",
-    "#8a0a00",
-    "#8c0c00",
-    "#8e0e00",
-    "#901000",
-    "#921200",
-    "#931400",
-    "#961600",
-    "#981800",
-    "#9a1a00",
-    "#9c1c00",
-    "#9e1e00",
-    "#a02000",
-    "#a22200",
-    "#a32400",
-    "#a62600",
-    "#a82800",
-    "#aa2a00",
-    "#ac2c00",
-    "#ae2e00",
-    "#b03000",
-    "#b23200",
-    "#b33400",
-    "#b63600",
-    "#b83800",
-    "#ba3a00",
-    "#bc3c00",
-    "#be3e00",
-    "#c04000",
-    "#c24200",
-    "#c34400",
-    "#c64600",
-    "#c84800",
-    "#ca4a00",
-    "#cc4c00",
-    "#ce4e00",
-    "#d05000",
-    "#d25200",
-    "#d35400",
-    "#d65600",
-    "#d85800",
-    "#da5a00",
-    "#dc5c00",
-    "#de5e00",
-    "#e06000",
-    "#e26200",
-    "#e36400",
-    "#e66600",
-    "#e86800",
-    "#ea6a00",
-    "#ec6c00",
-    "#ee6e00",
-    "#f07000",
-    "#f27200",
-    "#f37400",
-    "#f67600",
-    "#f87800",
-    "#fa7a00",
-    "#fc7c00",
-    "#fe7e00",
-    "#ff8000",
-    "#ff8202",
-    "#ff8404",
-    "#ff8606",
-    "#ff8808",
-    "#ff8a0b",
-    "#ff8c0d",
-    "#ff8e0f",
-    "#ff9010",
-    "#ff9212",
-    "#ff9414",
-    "#ff9616",
-    "#ff9819",
-    "#ff9a1b",
-    "#ff9c1d",
-    "#ff9e1f",
-    "#ffa020",
-    "#ffa222",
-    "#ffa424",
-    "#ffa626",
-    "#ffa828",
-    "#ffaa2b",
-    "#ffac2d",
-    "#ffae2f",
-    "#ffb030",
-    "#ffb232",
-    "#ffb434",
-    "#ffb636",
-    "#ffb839",
-    "#ffba3b",
-    "#ffbc3d",
-    "#ffbe3f",
-    "#ffc041",
-    "#ffc242",
-    "#ffc444",
-    "#ffc646",
-    "#ffc848",
-    "#ffca4b",
-    "#ffcc4d",
-    "#ffce4f",
-    "#ffd051",
-    "#ffd252",
-    "#ffd454",
-    "#ffd656",
-    "#ffd859",
-    "#ffda5b",
-    "#ffdc5d",
-    "#ffde5f",
-    "#ffe061",
-    "#ffe262",
-    "#ffe464",
-    "#ffe666",
-    "#ffe868",
-    "#ffea6b",
-    "#ffec6d",
-    "#ffee6f",
-    "#fff071",
-    "#fff272",
-    "#fff474",
-    "#fff676",
-    "#fff879",
-    "#fffa7b",
-    "#fffc7d",
-    "#fffe7f",
-    "#ffff81",
-    "#ffff83",
-    "#ffff84",
-    "#ffff86",
-    "#ffff88",
-    "#ffff8b",
-    "#ffff8d",
-    "#ffff8f",
-    "#ffff91",
-    "#ffff93",
-    "#ffff94",
-    "#ffff96",
-    "#ffff99",
-    "#ffff9b",
-    "#ffff9d",
-    "#ffff9f",
-    "#ffffa1",
-    "#ffffa3",
-    "#ffffa4",
-    "#ffffa6",
-    "#ffffa8",
-    "#ffffab",
-    "#ffffad",
-    "#ffffaf",
-    "#ffffb1",
-    "#ffffb3",
-    "#ffffb4",
-    "#ffffb6",
-    "#ffffb9",
-    "#ffffbb",
-    "#ffffbd",
-    "#ffffbf",
-    "#ffffc1",
-    "#ffffc3",
-    "#ffffc4",
-    "#ffffc6",
-    "#ffffc8",
-    "#ffffcb",
-    "#ffffcd",
-    "#ffffcf",
-    "#ffffd1",
-    "#ffffd3",
-    "#ffffd4",
-    "#ffffd6",
-    "#ffffd9",
-    "#ffffdb",
-    "#ffffdd",
-    "#ffffdf",
-    "#ffffe1",
-    "#ffffe3",
-    "#ffffe4",
-    "#ffffe6",
-    "#ffffe8",
-    "#ffffeb",
-    "#ffffed",
-    "#ffffef",
-    "#fffff1",
-    "#fffff3",
-    "#fffff4",
-    "#fffff6",
-    "#fffff9",
-    "#fffffb",
-    "#fffffd",
-    "#ffffff"
-  ],
-  "autumn": [
-    "#ff0000",
-    "#ff0100",
-    "#ff0200",
-    "#ff0300",
-    "#ff0400",
-    "#ff0500",
-    "#ff0600",
-    "#ff0700",
-    "#ff0800",
-    "#ff0900",
-    "#ff0a00",
-    "#ff0b00",
-    "#ff0c00",
-    "#ff0d00",
-    "#ff0e00",
-    "#ff0f00",
-    "#ff1000",
-    "#ff1100",
-    "#ff1200",
-    "#ff1300",
-    "#ff1400",
-    "#ff1500",
-    "#ff1600",
-    "#ff1700",
-    "#ff1800",
-    "#ff1900",
-    "#ff1a00",
-    "#ff1b00",
-    "#ff1c00",
-    "#ff1d00",
-    "#ff1e00",
-    "#ff1f00",
-    "#ff2000",
-    "#ff2000",
-    "#ff2200",
-    "#ff2300",
-    "#ff2400",
-    "#ff2400",
-    "#ff2600",
-    "#ff2700",
-    "#ff2800",
-    "#ff2800",
-    "#ff2a00",
-    "#ff2b00",
-    "#ff2c00",
-    "#ff2c00",
-    "#ff2e00",
-    "#ff2f00",
-    "#ff3000",
-    "#ff3000",
-    "#ff3200",
-    "#ff3300",
-    "#ff3400",
-    "#ff3400",
-    "#ff3600",
-    "#ff3700",
-    "#ff3800",
-    "#ff3800",
-    "#ff3a00",
-    "#ff3b00",
-    "#ff3c00",
-    "#ff3c00",
-    "#ff3e00",
-    "#ff3f00",
-    "#ff4000",
-    "#ff4100",
-    "#ff4100",
-    "#ff4300",
-    "#ff4400",
-    "#ff4500",
-    "#ff4600",
-    "#ff4700",
-    "#ff4800",
-    "#ff4900",
-    "#ff4900",
-    "#ff4b00",
-    "#ff4c00",
-    "#ff4d00",
-    "#ff4e00",
-    "#ff4f00",
-    "#ff5000",
-    "#ff5100",
-    "#ff5100",
-    "#ff5300",
-    "#ff5400",
-    "#ff5500",
-    "#ff5600",
-    "#ff5700",
-    "#ff5800",
-    "#ff5900",
-    "#ff5900",
-    "#ff5b00",
-    "#ff5c00",
-    "#ff5d00",
-    "#ff5e00",
-    "#ff5f00",
-    "#ff6000",
-    "#ff6100",
-    "#ff6100",
-    "#ff6300",
-    "#ff6400",
-    "#ff6500",
-    "#ff6600",
-    "#ff6700",
-    "#ff6800",
-    "#ff6900",
-    "#ff6900",
-    "#ff6b00",
-    "#ff6c00",
-    "#ff6d00",
-    "#ff6e00",
-    "#ff6f00",
-    "#ff7000",
-    "#ff7100",
-    "#ff7100",
-    "#ff7300",
-    "#ff7400",
-    "#ff7500",
-    "#ff7600",
-    "#ff7700",
-    "#ff7800",
-    "#ff7900",
-    "#ff7900",
-    "#ff7b00",
-    "#ff7c00",
-    "#ff7d00",
-    "#ff7e00",
-    "#ff7f00",
-    "#ff8000",
-    "#ff8100",
-    "#ff8200",
-    "#ff8300",
-    "#ff8300",
-    "#ff8500",
-    "#ff8600",
-    "#ff8700",
-    "#ff8800",
-    "#ff8900",
-    "#ff8a00",
-    "#ff8b00",
-    "#ff8c00",
-    "#ff8d00",
-    "#ff8e00",
-    "#ff8f00",
-    "#ff9000",
-    "#ff9100",
-    "#ff9200",
-    "#ff9300",
-    "#ff9300",
-    "#ff9500",
-    "#ff9600",
-    "#ff9700",
-    "#ff9800",
-    "#ff9900",
-    "#ff9a00",
-    "#ff9b00",
-    "#ff9c00",
-    "#ff9d00",
-    "#ff9e00",
-    "#ff9f00",
-    "#ffa000",
-    "#ffa100",
-    "#ffa200",
-    "#ffa300",
-    "#ffa300",
-    "#ffa500",
-    "#ffa600",
-    "#ffa700",
-    "#ffa800",
-    "#ffa900",
-    "#ffaa00",
-    "#ffab00",
-    "#ffac00",
-    "#ffad00",
-    "#ffae00",
-    "#ffaf00",
-    "#ffb000",
-    "#ffb100",
-    "#ffb200",
-    "#ffb300",
-    "#ffb300",
-    "#ffb500",
-    "#ffb600",
-    "#ffb700",
-    "#ffb800",
-    "#ffb900",
-    "#ffba00",
-    "#ffbb00",
-    "#ffbc00",
-    "#ffbd00",
-    "#ffbe00",
-    "#ffbf00",
-    "#ffc000",
-    "#ffc100",
-    "#ffc200",
-    "#ffc300",
-    "#ffc300",
-    "#ffc500",
-    "#ffc600",
-    "#ffc700",
-    "#ffc800",
-    "#ffc900",
-    "#ffca00",
-    "#ffcb00",
-    "#ffcc00",
-    "#ffcd00",
-    "#ffce00",
-    "#ffcf00",
-    "#ffd000",
-    "#ffd100",
-    "#ffd200",
-    "#ffd300",
-    "#ffd300",
-    "#ffd500",
-    "#ffd600",
-    "#ffd700",
-    "#ffd800",
-    "#ffd900",
-    "#ffda00",
-    "#ffdb00",
-    "#ffdc00",
-    "#ffdd00",
-    "#ffde00",
-    "#ffdf00",
-    "#ffe000",
-    "#ffe100",
-    "#ffe200",
-    "#ffe300",
-    "#ffe300",
-    "#ffe500",
-    "#ffe600",
-    "#ffe700",
-    "#ffe800",
-    "#ffe900",
-    "#ffea00",
-    "#ffeb00",
-    "#ffec00",
-    "#ffed00",
-    "#ffee00",
-    "#ffef00",
-    "#fff000",
-    "#fff100",
-    "#fff200",
-    "#fff300",
-    "#fff300",
-    "#fff500",
-    "#fff600",
-    "#fff700",
-    "#fff800",
-    "#fff900",
-    "#fffa00",
-    "#fffb00",
-    "#fffc00",
-    "#fffd00",
-    "#fffe00",
-    "#ffff00"
-  ],
-  "binary": [
-    "#ffffff",
-    "#fefefe",
-    "#fdfdfd",
-    "#fcfcfc",
-    "#fbfbfb",
-    "#fafafa",
-    "#f9f9f9",
-    "#f8f8f8",
-    "#f7f7f7",
-    "#f6f6f6",
-    "#f5f5f5",
-    "#f4f4f4",
-    "#f3f3f3",
-    "#f2f2f2",
-    "#f1f1f1",
-    "#f0f0f0",
-    "#efefef",
-    "#eeeeee",
-    "#ededed",
-    "#ececec",
-    "#ebebeb",
-    "#eaeaea",
-    "#e9e9e9",
-    "#e8e8e8",
-    "#e7e7e7",
-    "#e6e6e6",
-    "#e5e5e5",
-    "#e4e4e4",
-    "#e3e3e3",
-    "#e2e2e2",
-    "#e1e1e1",
-    "#e0e0e0",
-    "#dfdfdf",
-    "#dedede",
-    "#dddddd",
-    "#dcdcdc",
-    "#dbdbdb",
-    "#dadada",
-    "#d9d9d9",
-    "#d8d8d8",
-    "#d7d7d7",
-    "#d6d6d6",
-    "#d5d5d5",
-    "#d3d3d3",
-    "#d3d3d3",
-    "#d2d2d2",
-    "#d1d1d1",
-    "#d0d0d0",
-    "#cfcfcf",
-    "#cecece",
-    "#cdcdcd",
-    "#cccccc",
-    "#cbcbcb",
-    "#cacaca",
-    "#c9c9c9",
-    "#c8c8c8",
-    "#c7c7c7",
-    "#c6c6c6",
-    "#c5c5c5",
-    "#c3c3c3",
-    "#c3c3c3",
-    "#c2c2c2",
-    "#c1c1c1",
-    "#c0c0c0",
-    "#bfbfbf",
-    "#bebebe",
-    "#bdbdbd",
-    "#bcbcbc",
-    "#bbbbbb",
-    "#bababa",
-    "#b9b9b9",
-    "#b8b8b8",
-    "#b7b7b7",
-    "#b6b6b6",
-    "#b5b5b5",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b2b2b2",
-    "#b1b1b1",
-    "#b0b0b0",
-    "#afafaf",
-    "#aeaeae",
-    "#adadad",
-    "#acacac",
-    "#ababab",
-    "#aaaaaa",
-    "#a9a9a9",
-    "#a8a8a8",
-    "#a7a7a7",
-    "#a6a6a6",
-    "#a5a5a5",
-    "#a3a3a3",
-    "#a3a3a3",
-    "#a2a2a2",
-    "#a1a1a1",
-    "#a0a0a0",
-    "#9f9f9f",
-    "#9e9e9e",
-    "#9d9d9d",
-    "#9c9c9c",
-    "#9b9b9b",
-    "#9a9a9a",
-    "#999999",
-    "#989898",
-    "#979797",
-    "#969696",
-    "#959595",
-    "#939393",
-    "#939393",
-    "#929292",
-    "#919191",
-    "#909090",
-    "#8f8f8f",
-    "#8e8e8e",
-    "#8d8d8d",
-    "#8c8c8c",
-    "#8b8b8b",
-    "#8a8a8a",
-    "#898989",
-    "#888888",
-    "#878787",
-    "#868686",
-    "#858585",
-    "#838383",
-    "#838383",
-    "#828282",
-    "#818181",
-    "#808080",
-    "#7f7f7f",
-    "#7e7e7e",
-    "#7d7d7d",
-    "#7c7c7c",
-    "#7b7b7b",
-    "#797979",
-    "#797979",
-    "#787878",
-    "#777777",
-    "#767676",
-    "#757575",
-    "#747474",
-    "#727272",
-    "#717171",
-    "#717171",
-    "#707070",
-    "#6f6f6f",
-    "#6e6e6e",
-    "#6d6d6d",
-    "#6c6c6c",
-    "#6b6b6b",
-    "#696969",
-    "#696969",
-    "#686868",
-    "#676767",
-    "#666666",
-    "#656565",
-    "#646464",
-    "#626262",
-    "#616161",
-    "#616161",
-    "#606060",
-    "#5f5f5f",
-    "#5e5e5e",
-    "#5d5d5d",
-    "#5c5c5c",
-    "#5b5b5b",
-    "#595959",
-    "#595959",
-    "#585858",
-    "#575757",
-    "#565656",
-    "#555555",
-    "#545454",
-    "#525252",
-    "#515151",
-    "#515151",
-    "#505050",
-    "#4f4f4f",
-    "#4e4e4e",
-    "#4d4d4d",
-    "#4c4c4c",
-    "#4b4b4b",
-    "#494949",
-    "#494949",
-    "#484848",
-    "#474747",
-    "#464646",
-    "#454545",
-    "#444444",
-    "#424242",
-    "#414141",
-    "#414141",
-    "#404040",
-    "#3f3f3f",
-    "#3e3e3e",
-    "#3d3d3d",
-    "#3c3c3c",
-    "#3b3b3b",
-    "#393939",
-    "#383838",
-    "#383838",
-    "#373737",
-    "#363636",
-    "#353535",
-    "#343434",
-    "#323232",
-    "#313131",
-    "#303030",
-    "#303030",
-    "#2f2f2f",
-    "#2e2e2e",
-    "#2d2d2d",
-    "#2c2c2c",
-    "#2b2b2b",
-    "#292929",
-    "#282828",
-    "#282828",
-    "#272727",
-    "#262626",
-    "#252525",
-    "#242424",
-    "#222222",
-    "#212121",
-    "#202020",
-    "#202020",
-    "#1f1f1f",
-    "#1e1e1e",
-    "#1d1d1d",
-    "#1c1c1c",
-    "#1b1b1b",
-    "#191919",
-    "#181818",
-    "#181818",
-    "#171717",
-    "#161616",
-    "#151515",
-    "#141414",
-    "#121212",
-    "#111111",
-    "#101010",
-    "#101010",
-    "#0f0f0f",
-    "#0e0e0e",
-    "#0d0d0d",
-    "#0c0c0c",
-    "#0b0b0b",
-    "#090909",
-    "#080808",
-    "#080808",
-    "#070707",
-    "#060606",
-    "#050505",
-    "#040404",
-    "#020202",
-    "#010101",
-    "#000000",
-    "#000000"
-  ],
-  "bone": [
-    "#000000",
-    "#000001",
-    "#010102",
-    "#020203",
-    "#030304",
-    "#040406",
-    "#050507",
-    "#060608",
-    "#070609",
-    "#07070a",
-    "#08080c",
-    "#09090d",
-    "#0a0a0e",
-    "#0b0b0f",
-    "#0c0c11",
-    "#0d0d12",
-    "#0e0d13",
-    "#0e0e14",
-    "#0f0f15",
-    "#101017",
-    "#111118",
-    "#121219",
-    "#13131a",
-    "#14141c",
-    "#15141d",
-    "#15151e",
-    "#16161f",
-    "#171720",
-    "#181822",
-    "#191923",
-    "#1a1a24",
-    "#1b1b25",
-    "#1c1b26",
-    "#1c1c28",
-    "#1d1d29",
-    "#1e1e2a",
-    "#1f1f2b",
-    "#20202d",
-    "#21212e",
-    "#22222f",
-    "#232230",
-    "#232331",
-    "#242433",
-    "#252534",
-    "#262635",
-    "#272736",
-    "#282838",
-    "#292939",
-    "#2a293a",
-    "#2a2a3b",
-    "#2b2b3c",
-    "#2c2c3e",
-    "#2d2d3f",
-    "#2e2e40",
-    "#2f2f41",
-    "#303042",
-    "#313044",
-    "#313145",
-    "#323246",
-    "#333347",
-    "#343449",
-    "#35354a",
-    "#36364b",
-    "#37374c",
-    "#38374d",
-    "#38384f",
-    "#393950",
-    "#3a3a51",
-    "#3b3b52",
-    "#3c3c54",
-    "#3d3d55",
-    "#3e3e56",
-    "#3f3e57",
-    "#3f3f58",
-    "#40405a",
-    "#41415b",
-    "#42425c",
-    "#43435d",
-    "#44445e",
-    "#454560",
-    "#464561",
-    "#464662",
-    "#474763",
-    "#484865",
-    "#494966",
-    "#4a4a67",
-    "#4b4b68",
-    "#4c4c69",
-    "#4d4c6b",
-    "#4d4d6c",
-    "#4e4e6d",
-    "#4f4f6e",
-    "#505070",
-    "#515171",
-    "#525272",
-    "#535372",
-    "#545473",
-    "#545674",
-    "#555775",
-    "#565876",
-    "#575977",
-    "#585a78",
-    "#595c79",
-    "#5a5d79",
-    "#5b5e7a",
-    "#5b5f7b",
-    "#5c607c",
-    "#5d627d",
-    "#5e637e",
-    "#5f647f",
-    "#606580",
-    "#616680",
-    "#626881",
-    "#626982",
-    "#636a83",
-    "#646b84",
-    "#656d85",
-    "#666e86",
-    "#676f87",
-    "#687087",
-    "#697188",
-    "#697389",
-    "#6a748a",
-    "#6b758b",
-    "#6c768c",
-    "#6d778d",
-    "#6e798e",
-    "#6f7a8e",
-    "#707b8f",
-    "#707c90",
-    "#717d91",
-    "#727f92",
-    "#738093",
-    "#748194",
-    "#758295",
-    "#768395",
-    "#778596",
-    "#778697",
-    "#788798",
-    "#798899",
-    "#7a899a",
-    "#7b8b9b",
-    "#7c8c9c",
-    "#7d8d9c",
-    "#7e8e9d",
-    "#7e8f9e",
-    "#7f919f",
-    "#8092a0",
-    "#8193a1",
-    "#8294a2",
-    "#8395a3",
-    "#8497a3",
-    "#8598a4",
-    "#8599a5",
-    "#869aa6",
-    "#879ba7",
-    "#889da8",
-    "#899ea9",
-    "#8a9faa",
-    "#8ba0aa",
-    "#8ca1ab",
-    "#8ca3ac",
-    "#8da4ad",
-    "#8ea5ae",
-    "#8fa6af",
-    "#90a7b0",
-    "#91a9b1",
-    "#92aab1",
-    "#93abb2",
-    "#93acb3",
-    "#94adb4",
-    "#95afb5",
-    "#96b0b6",
-    "#97b1b7",
-    "#98b2b8",
-    "#99b3b8",
-    "#9ab5b9",
-    "#9ab6ba",
-    "#9bb7bb",
-    "#9cb8bc",
-    "#9dbabd",
-    "#9ebbbe",
-    "#9fbcbf",
-    "#a0bdbf",
-    "#a1bec0",
-    "#a1c0c1",
-    "#a2c1c2",
-    "#a3c2c3",
-    "#a4c3c4",
-    "#a5c4c5",
-    "#a6c6c6",
-    "#a7c7c6",
-    "#a8c7c7",
-    "#aac8c8",
-    "#abc9c9",
-    "#accaca",
-    "#aecbcb",
-    "#afcccc",
-    "#b1cdcd",
-    "#b2cecd",
-    "#b3cece",
-    "#b5cfcf",
-    "#b6d0d0",
-    "#b7d1d1",
-    "#b9d2d2",
-    "#bad3d3",
-    "#bcd4d4",
-    "#bdd5d4",
-    "#bed5d5",
-    "#c0d6d6",
-    "#c1d7d7",
-    "#c2d8d8",
-    "#c4d9d9",
-    "#c5dada",
-    "#c6dbdb",
-    "#c8dcdb",
-    "#c9dcdc",
-    "#cbdddd",
-    "#ccdede",
-    "#cddfdf",
-    "#cfe0e0",
-    "#d0e1e1",
-    "#d1e2e2",
-    "#d3e3e2",
-    "#d4e3e3",
-    "#d5e4e4",
-    "#d7e5e5",
-    "#d8e6e6",
-    "#dae7e7",
-    "#dbe8e8",
-    "#dce9e9",
-    "#deeae9",
-    "#dfeaea",
-    "#e0ebeb",
-    "#e2ecec",
-    "#e3eded",
-    "#e5eeee",
-    "#e6efef",
-    "#e7f0f0",
-    "#e9f1f0",
-    "#eaf1f1",
-    "#ebf2f2",
-    "#edf3f3",
-    "#eef4f4",
-    "#eff5f5",
-    "#f1f6f6",
-    "#f2f7f7",
-    "#f4f8f7",
-    "#f5f8f8",
-    "#f6f9f9",
-    "#f8fafa",
-    "#f9fbfb",
-    "#fafcfc",
-    "#fcfdfd",
-    "#fdfefe",
-    "#ffffff"
-  ],
-  "brg": [
-    "#0000ff",
-    "#0200fd",
-    "#0400fb",
-    "#0600f9",
-    "#0800f7",
-    "#0a00f5",
-    "#0c00f3",
-    "#0e00f1",
-    "#1000ef",
-    "#1200ed",
-    "#1400eb",
-    "#1600e9",
-    "#1800e7",
-    "#1a00e5",
-    "#1c00e3",
-    "#1e00e1",
-    "#2000df",
-    "#2200dd",
-    "#2400db",
-    "#2600d9",
-    "#2800d7",
-    "#2a00d5",
-    "#2c00d3",
-    "#2e00d1",
-    "#3000cf",
-    "#3200cd",
-    "#3400cb",
-    "#3600c9",
-    "#3800c7",
-    "#3a00c5",
-    "#3c00c3",
-    "#3e00c1",
-    "#4000bf",
-    "#4100bd",
-    "#4400bb",
-    "#4600b9",
-    "#4800b7",
-    "#4900b5",
-    "#4c00b3",
-    "#4e00b1",
-    "#5000af",
-    "#5100ad",
-    "#5400ab",
-    "#5600a9",
-    "#5800a7",
-    "#5900a5",
-    "#5c00a3",
-    "#5e00a1",
-    "#60009f",
-    "#61009d",
-    "#64009b",
-    "#660099",
-    "#680097",
-    "#690095",
-    "#6c0093",
-    "#6e0091",
-    "#70008f",
-    "#71008d",
-    "#74008b",
-    "#760089",
-    "#780087",
-    "#790085",
-    "#7c0083",
-    "#7e0081",
-    "#80007f",
-    "#82007d",
-    "#83007b",
-    "#860079",
-    "#880077",
-    "#8a0075",
-    "#8c0072",
-    "#8e0071",
-    "#90006f",
-    "#92006d",
-    "#93006b",
-    "#960069",
-    "#980067",
-    "#9a0065",
-    "#9c0062",
-    "#9e0061",
-    "#a0005f",
-    "#a2005d",
-    "#a3005b",
-    "#a60059",
-    "#a80057",
-    "#aa0055",
-    "#ac0052",
-    "#ae0051",
-    "#b0004f",
-    "#b2004d",
-    "#b3004b",
-    "#b60049",
-    "#b80047",
-    "#ba0045",
-    "#bc0042",
-    "#be0041",
-    "#c0003f",
-    "#c2003d",
-    "#c3003b",
-    "#c60038",
-    "#c80037",
-    "#ca0035",
-    "#cc0032",
-    "#ce0030",
-    "#d0002f",
-    "#d2002d",
-    "#d3002b",
-    "#d60028",
-    "#d80027",
-    "#da0025",
-    "#dc0022",
-    "#de0020",
-    "#e0001f",
-    "#e2001d",
-    "#e3001b",
-    "#e60018",
-    "#e80017",
-    "#ea0015",
-    "#ec0012",
-    "#ee0010",
-    "#f0000f",
-    "#f2000d",
-    "#f3000b",
-    "#f60008",
-    "#f80007",
-    "#fa0005",
-    "#fc0002",
-    "#fe0000",
-    "#fe0100",
-    "#fc0300",
-    "#fa0500",
-    "#f80700",
-    "#f60800",
-    "#f40b00",
-    "#f20d00",
-    "#f00f00",
-    "#ee1100",
-    "#ec1300",
-    "#ea1500",
-    "#e81700",
-    "#e61900",
-    "#e41b00",
-    "#e21d00",
-    "#e01f00",
-    "#de2100",
-    "#dc2300",
-    "#da2500",
-    "#d82700",
-    "#d62800",
-    "#d32b00",
-    "#d22d00",
-    "#d02f00",
-    "#ce3100",
-    "#cc3300",
-    "#ca3500",
-    "#c83700",
-    "#c63900",
-    "#c33b00",
-    "#c23d00",
-    "#c03f00",
-    "#be4100",
-    "#bc4300",
-    "#ba4500",
-    "#b84700",
-    "#b64800",
-    "#b34b00",
-    "#b24d00",
-    "#b04f00",
-    "#ae5100",
-    "#ac5300",
-    "#aa5500",
-    "#a85700",
-    "#a65900",
-    "#a35b00",
-    "#a25d00",
-    "#a05f00",
-    "#9e6100",
-    "#9c6300",
-    "#9a6500",
-    "#986700",
-    "#966800",
-    "#936b00",
-    "#926d00",
-    "#906f00",
-    "#8e7100",
-    "#8c7300",
-    "#8a7500",
-    "#887700",
-    "#867900",
-    "#837b00",
-    "#827d00",
-    "#807f00",
-    "#7e8100",
-    "#7c8300",
-    "#798500",
-    "#788700",
-    "#768800",
-    "#748b00",
-    "#718d00",
-    "#708f00",
-    "#6e9100",
-    "#6c9300",
-    "#699500",
-    "#689700",
-    "#669900",
-    "#649b00",
-    "#619d00",
-    "#609f00",
-    "#5ea100",
-    "#5ca300",
-    "#59a500",
-    "#58a700",
-    "#56a800",
-    "#54ab00",
-    "#51ad00",
-    "#50af00",
-    "#4eb100",
-    "#4cb300",
-    "#49b500",
-    "#48b700",
-    "#46b900",
-    "#44bb00",
-    "#41bd00",
-    "#40bf00",
-    "#3ec100",
-    "#3cc300",
-    "#39c500",
-    "#38c700",
-    "#36c800",
-    "#34cb00",
-    "#31cd00",
-    "#30cf00",
-    "#2ed100",
-    "#2cd300",
-    "#29d500",
-    "#28d700",
-    "#26d900",
-    "#24db00",
-    "#21dd00",
-    "#20df00",
-    "#1ee100",
-    "#1ce300",
-    "#19e500",
-    "#18e700",
-    "#16e800",
-    "#14eb00",
-    "#11ed00",
-    "#10ef00",
-    "#0ef100",
-    "#0cf300",
-    "#09f500",
-    "#08f700",
-    "#06f900",
-    "#04fb00",
-    "#01fd00",
-    "#00ff00"
-  ],
-  "bwr": [
-    "#0000ff",
-    "#0202ff",
-    "#0404ff",
-    "#0606ff",
-    "#0808ff",
-    "#0a0aff",
-    "#0c0cff",
-    "#0e0eff",
-    "#1010ff",
-    "#1212ff",
-    "#1414ff",
-    "#1616ff",
-    "#1818ff",
-    "#1a1aff",
-    "#1c1cff",
-    "#1e1eff",
-    "#2020ff",
-    "#2222ff",
-    "#2424ff",
-    "#2626ff",
-    "#2828ff",
-    "#2a2aff",
-    "#2c2cff",
-    "#2e2eff",
-    "#3030ff",
-    "#3232ff",
-    "#3434ff",
-    "#3636ff",
-    "#3838ff",
-    "#3a3aff",
-    "#3c3cff",
-    "#3e3eff",
-    "#4040ff",
-    "#4141ff",
-    "#4444ff",
-    "#4646ff",
-    "#4848ff",
-    "#4949ff",
-    "#4c4cff",
-    "#4e4eff",
-    "#5050ff",
-    "#5151ff",
-    "#5454ff",
-    "#5656ff",
-    "#5858ff",
-    "#5959ff",
-    "#5c5cff",
-    "#5e5eff",
-    "#6060ff",
-    "#6161ff",
-    "#6464ff",
-    "#6666ff",
-    "#6868ff",
-    "#6969ff",
-    "#6c6cff",
-    "#6e6eff",
-    "#7070ff",
-    "#7171ff",
-    "#7474ff",
-    "#7676ff",
-    "#7878ff",
-    "#7979ff",
-    "#7c7cff",
-    "#7e7eff",
-    "#8080ff",
-    "#8282ff",
-    "#8383ff",
-    "#8686ff",
-    "#8888ff",
-    "#8a8aff",
-    "#8c8cff",
-    "#8e8eff",
-    "#9090ff",
-    "#9292ff",
-    "#9393ff",
-    "#9696ff",
-    "#9898ff",
-    "#9a9aff",
-    "#9c9cff",
-    "#9e9eff",
-    "#a0a0ff",
-    "#a2a2ff",
-    "#a3a3ff",
-    "#a6a6ff",
-    "#a8a8ff",
-    "#aaaaff",
-    "#acacff",
-    "#aeaeff",
-    "#b0b0ff",
-    "#b2b2ff",
-    "#b3b3ff",
-    "#b6b6ff",
-    "#b8b8ff",
-    "#babaff",
-    "#bcbcff",
-    "#bebeff",
-    "#c0c0ff",
-    "#c2c2ff",
-    "#c3c3ff",
-    "#c6c6ff",
-    "#c8c8ff",
-    "#cacaff",
-    "#ccccff",
-    "#ceceff",
-    "#d0d0ff",
-    "#d2d2ff",
-    "#d3d3ff",
-    "#d6d6ff",
-    "#d8d8ff",
-    "#dadaff",
-    "#dcdcff",
-    "#dedeff",
-    "#e0e0ff",
-    "#e2e2ff",
-    "#e3e3ff",
-    "#e6e6ff",
-    "#e8e8ff",
-    "#eaeaff",
-    "#ececff",
-    "#eeeeff",
-    "#f0f0ff",
-    "#f2f2ff",
-    "#f3f3ff",
-    "#f6f6ff",
-    "#f8f8ff",
-    "#fafaff",
-    "#fcfcff",
-    "#fefeff",
-    "#fffefe",
-    "#fffcfc",
-    "#fffafa",
-    "#fff8f8",
-    "#fff6f6",
-    "#fff4f4",
-    "#fff2f2",
-    "#fff0f0",
-    "#ffeeee",
-    "#ffecec",
-    "#ffeaea",
-    "#ffe8e8",
-    "#ffe6e6",
-    "#ffe4e4",
-    "#ffe2e2",
-    "#ffe0e0",
-    "#ffdede",
-    "#ffdcdc",
-    "#ffdada",
-    "#ffd8d8",
-    "#ffd6d6",
-    "#ffd3d3",
-    "#ffd2d2",
-    "#ffd0d0",
-    "#ffcece",
-    "#ffcccc",
-    "#ffcaca",
-    "#ffc8c8",
-    "#ffc6c6",
-    "#ffc3c3",
-    "#ffc2c2",
-    "#ffc0c0",
-    "#ffbebe",
-    "#ffbcbc",
-    "#ffbaba",
-    "#ffb8b8",
-    "#ffb6b6",
-    "#ffb3b3",
-    "#ffb2b2",
-    "#ffb0b0",
-    "#ffaeae",
-    "#ffacac",
-    "#ffaaaa",
-    "#ffa8a8",
-    "#ffa6a6",
-    "#ffa3a3",
-    "#ffa2a2",
-    "#ffa0a0",
-    "#ff9e9e",
-    "#ff9c9c",
-    "#ff9a9a",
-    "#ff9898",
-    "#ff9696",
-    "#ff9393",
-    "#ff9292",
-    "#ff9090",
-    "#ff8e8e",
-    "#ff8c8c",
-    "#ff8a8a",
-    "#ff8888",
-    "#ff8686",
-    "#ff8383",
-    "#ff8282",
-    "#ff8080",
-    "#ff7e7e",
-    "#ff7c7c",
-    "#ff7979",
-    "#ff7878",
-    "#ff7676",
-    "#ff7474",
-    "#ff7171",
-    "#ff7070",
-    "#ff6e6e",
-    "#ff6c6c",
-    "#ff6969",
-    "#ff6868",
-    "#ff6666",
-    "#ff6464",
-    "#ff6161",
-    "#ff6060",
-    "#ff5e5e",
-    "#ff5c5c",
-    "#ff5959",
-    "#ff5858",
-    "#ff5656",
-    "#ff5454",
-    "#ff5151",
-    "#ff5050",
-    "#ff4e4e",
-    "#ff4c4c",
-    "#ff4949",
-    "#ff4848",
-    "#ff4646",
-    "#ff4444",
-    "#ff4141",
-    "#ff4040",
-    "#ff3e3e",
-    "#ff3c3c",
-    "#ff3939",
-    "#ff3838",
-    "#ff3636",
-    "#ff3434",
-    "#ff3131",
-    "#ff3030",
-    "#ff2e2e",
-    "#ff2c2c",
-    "#ff2929",
-    "#ff2828",
-    "#ff2626",
-    "#ff2424",
-    "#ff2121",
-    "#ff2020",
-    "#ff1e1e",
-    "#ff1c1c",
-    "#ff1919",
-    "#ff1818",
-    "#ff1616",
-    "#ff1414",
-    "#ff1111",
-    "#ff1010",
-    "#ff0e0e",
-    "#ff0c0c",
-    "#ff0909",
-    "#ff0808",
-    "#ff0606",
-    "#ff0404",
-    "#ff0101",
-    "#ff0000"
-  ],
-  "cividis": [
-    "#00224d",
-    "#00234f",
-    "#002350",
-    "#002452",
-    "#002554",
-    "#002655",
-    "#002657",
-    "#002759",
-    "#00285b",
-    "#00285c",
-    "#00295e",
-    "#002a60",
-    "#002a62",
-    "#002b64",
-    "#002c66",
-    "#002c67",
-    "#002d69",
-    "#002e6b",
-    "#002f6d",
-    "#002f6f",
-    "#003070",
-    "#003070",
-    "#003170",
-    "#003170",
-    "#043270",
-    "#083370",
-    "#0b3370",
-    "#0e3470",
-    "#11356f",
-    "#14366f",
-    "#16366f",
-    "#18376f",
-    "#1a386f",
-    "#1c386e",
-    "#1d396e",
-    "#1f3a6e",
-    "#213b6e",
-    "#223b6e",
-    "#243c6e",
-    "#253d6d",
-    "#273d6d",
-    "#283e6d",
-    "#2a3f6d",
-    "#2b3f6d",
-    "#2c406d",
-    "#2e416c",
-    "#2f426c",
-    "#30426c",
-    "#31436c",
-    "#32446c",
-    "#34446c",
-    "#35456c",
-    "#36466c",
-    "#37466c",
-    "#38476c",
-    "#39486c",
-    "#3a486b",
-    "#3b496b",
-    "#3d4a6b",
-    "#3e4b6b",
-    "#3f4b6b",
-    "#404c6b",
-    "#414d6b",
-    "#424d6b",
-    "#434e6b",
-    "#444f6b",
-    "#454f6b",
-    "#46506b",
-    "#47516b",
-    "#48516b",
-    "#49526b",
-    "#4a536b",
-    "#4b546c",
-    "#4c546c",
-    "#4d556c",
-    "#4e566c",
-    "#4e566c",
-    "#4f576c",
-    "#50586c",
-    "#51586c",
-    "#52596c",
-    "#535a6c",
-    "#545a6c",
-    "#555b6d",
-    "#565c6d",
-    "#575d6d",
-    "#585d6d",
-    "#595e6d",
-    "#595f6d",
-    "#5a5f6d",
-    "#5b606e",
-    "#5c616e",
-    "#5d616e",
-    "#5e626e",
-    "#5f636e",
-    "#60646e",
-    "#61646f",
-    "#61656f",
-    "#62666f",
-    "#63666f",
-    "#64676f",
-    "#656870",
-    "#666970",
-    "#676970",
-    "#686a70",
-    "#686b71",
-    "#696b71",
-    "#6a6c71",
-    "#6b6d71",
-    "#6c6d72",
-    "#6d6e72",
-    "#6e6f72",
-    "#6e7073",
-    "#6f7073",
-    "#707173",
-    "#717273",
-    "#727374",
-    "#737374",
-    "#747475",
-    "#747575",
-    "#757575",
-    "#767676",
-    "#777776",
-    "#787876",
-    "#797877",
-    "#797977",
-    "#7a7a77",
-    "#7b7b77",
-    "#7c7b78",
-    "#7d7c78",
-    "#7e7d78",
-    "#7f7d78",
-    "#807e78",
-    "#817f78",
-    "#828078",
-    "#838078",
-    "#848178",
-    "#858278",
-    "#858378",
-    "#868378",
-    "#878478",
-    "#888578",
-    "#898678",
-    "#8a8678",
-    "#8b8778",
-    "#8c8878",
-    "#8d8978",
-    "#8e8978",
-    "#8f8a77",
-    "#908b77",
-    "#918c77",
-    "#928c77",
-    "#938d77",
-    "#948e77",
-    "#958f77",
-    "#968f77",
-    "#979076",
-    "#989176",
-    "#999276",
-    "#9a9376",
-    "#9b9376",
-    "#9c9476",
-    "#9d9575",
-    "#9e9675",
-    "#9f9675",
-    "#a09775",
-    "#a19874",
-    "#a29974",
-    "#a39a74",
-    "#a49a74",
-    "#a59b73",
-    "#a69c73",
-    "#a79d73",
-    "#a89e73",
-    "#a99e72",
-    "#aa9f72",
-    "#aba072",
-    "#aca171",
-    "#ada271",
-    "#aea271",
-    "#afa370",
-    "#b0a470",
-    "#b1a570",
-    "#b2a66f",
-    "#b3a66f",
-    "#b4a76f",
-    "#b5a86e",
-    "#b6a96e",
-    "#b7aa6d",
-    "#b8ab6d",
-    "#b9ab6d",
-    "#baac6c",
-    "#bbad6c",
-    "#bcae6b",
-    "#bdaf6b",
-    "#beb06a",
-    "#bfb06a",
-    "#c1b169",
-    "#c2b269",
-    "#c3b368",
-    "#c4b468",
-    "#c5b567",
-    "#c6b567",
-    "#c7b666",
-    "#c8b765",
-    "#c9b865",
-    "#cab964",
-    "#cbba64",
-    "#ccbb63",
-    "#cdbc62",
-    "#cebc62",
-    "#cfbd61",
-    "#d0be60",
-    "#d2bf60",
-    "#d3c05f",
-    "#d4c15e",
-    "#d5c25e",
-    "#d6c35d",
-    "#d7c35c",
-    "#d8c45b",
-    "#d9c55a",
-    "#dac65a",
-    "#dbc759",
-    "#dcc858",
-    "#dec957",
-    "#dfca56",
-    "#e0cb55",
-    "#e1cc54",
-    "#e2cc53",
-    "#e3cd52",
-    "#e4ce51",
-    "#e5cf50",
-    "#e6d04f",
-    "#e8d14e",
-    "#e9d24d",
-    "#ead34c",
-    "#ebd44b",
-    "#ecd54a",
-    "#edd648",
-    "#eed747",
-    "#efd846",
-    "#f1d944",
-    "#f2da43",
-    "#f3da42",
-    "#f4db40",
-    "#f5dc3f",
-    "#f6dd3d",
-    "#f8de3b",
-    "#f9df3a",
-    "#fae038",
-    "#fbe136",
-    "#fde234",
-    "#fde333",
-    "#fde534",
-    "#fde636",
-    "#fde737"
-  ],
-  "cool": [
-    "#00ffff",
-    "#01feff",
-    "#02fdff",
-    "#03fcff",
-    "#04fbff",
-    "#05faff",
-    "#06f9ff",
-    "#07f8ff",
-    "#08f7ff",
-    "#09f6ff",
-    "#0af5ff",
-    "#0bf4ff",
-    "#0cf3ff",
-    "#0df2ff",
-    "#0ef1ff",
-    "#0ff0ff",
-    "#10efff",
-    "#11eeff",
-    "#12edff",
-    "#13ecff",
-    "#14ebff",
-    "#15eaff",
-    "#16e9ff",
-    "#17e8ff",
-    "#18e7ff",
-    "#19e6ff",
-    "#1ae5ff",
-    "#1be4ff",
-    "#1ce3ff",
-    "#1de2ff",
-    "#1ee1ff",
-    "#1fe0ff",
-    "#20dfff",
-    "#20deff",
-    "#22ddff",
-    "#23dcff",
-    "#24dbff",
-    "#24daff",
-    "#26d9ff",
-    "#27d8ff",
-    "#28d7ff",
-    "#28d6ff",
-    "#2ad5ff",
-    "#2bd3ff",
-    "#2cd3ff",
-    "#2cd2ff",
-    "#2ed1ff",
-    "#2fd0ff",
-    "#30cfff",
-    "#30ceff",
-    "#32cdff",
-    "#33ccff",
-    "#34cbff",
-    "#34caff",
-    "#36c9ff",
-    "#37c8ff",
-    "#38c7ff",
-    "#38c6ff",
-    "#3ac5ff",
-    "#3bc3ff",
-    "#3cc3ff",
-    "#3cc2ff",
-    "#3ec1ff",
-    "#3fc0ff",
-    "#40bfff",
-    "#41beff",
-    "#41bdff",
-    "#43bcff",
-    "#44bbff",
-    "#45baff",
-    "#46b9ff",
-    "#47b8ff",
-    "#48b7ff",
-    "#49b6ff",
-    "#49b5ff",
-    "#4bb3ff",
-    "#4cb3ff",
-    "#4db2ff",
-    "#4eb1ff",
-    "#4fb0ff",
-    "#50afff",
-    "#51aeff",
-    "#51adff",
-    "#53acff",
-    "#54abff",
-    "#55aaff",
-    "#56a9ff",
-    "#57a8ff",
-    "#58a7ff",
-    "#59a6ff",
-    "#59a5ff",
-    "#5ba3ff",
-    "#5ca3ff",
-    "#5da2ff",
-    "#5ea1ff",
-    "#5fa0ff",
-    "#609fff",
-    "#619eff",
-    "#619dff",
-    "#639cff",
-    "#649bff",
-    "#659aff",
-    "#6699ff",
-    "#6798ff",
-    "#6897ff",
-    "#6996ff",
-    "#6995ff",
-    "#6b93ff",
-    "#6c93ff",
-    "#6d92ff",
-    "#6e91ff",
-    "#6f90ff",
-    "#708fff",
-    "#718eff",
-    "#718dff",
-    "#738cff",
-    "#748bff",
-    "#758aff",
-    "#7689ff",
-    "#7788ff",
-    "#7887ff",
-    "#7986ff",
-    "#7985ff",
-    "#7b83ff",
-    "#7c83ff",
-    "#7d82ff",
-    "#7e81ff",
-    "#7f80ff",
-    "#807fff",
-    "#817eff",
-    "#827dff",
-    "#837cff",
-    "#837bff",
-    "#8579ff",
-    "#8679ff",
-    "#8778ff",
-    "#8877ff",
-    "#8976ff",
-    "#8a75ff",
-    "#8b74ff",
-    "#8c72ff",
-    "#8d71ff",
-    "#8e71ff",
-    "#8f70ff",
-    "#906fff",
-    "#916eff",
-    "#926dff",
-    "#936cff",
-    "#936bff",
-    "#9569ff",
-    "#9669ff",
-    "#9768ff",
-    "#9867ff",
-    "#9966ff",
-    "#9a65ff",
-    "#9b64ff",
-    "#9c62ff",
-    "#9d61ff",
-    "#9e61ff",
-    "#9f60ff",
-    "#a05fff",
-    "#a15eff",
-    "#a25dff",
-    "#a35cff",
-    "#a35bff",
-    "#a559ff",
-    "#a659ff",
-    "#a758ff",
-    "#a857ff",
-    "#a956ff",
-    "#aa55ff",
-    "#ab54ff",
-    "#ac52ff",
-    "#ad51ff",
-    "#ae51ff",
-    "#af50ff",
-    "#b04fff",
-    "#b14eff",
-    "#b24dff",
-    "#b34cff",
-    "#b34bff",
-    "#b549ff",
-    "#b649ff",
-    "#b748ff",
-    "#b847ff",
-    "#b946ff",
-    "#ba45ff",
-    "#bb44ff",
-    "#bc42ff",
-    "#bd41ff",
-    "#be41ff",
-    "#bf40ff",
-    "#c03fff",
-    "#c13eff",
-    "#c23dff",
-    "#c33cff",
-    "#c33bff",
-    "#c539ff",
-    "#c638ff",
-    "#c738ff",
-    "#c837ff",
-    "#c936ff",
-    "#ca35ff",
-    "#cb34ff",
-    "#cc32ff",
-    "#cd31ff",
-    "#ce30ff",
-    "#cf30ff",
-    "#d02fff",
-    "#d12eff",
-    "#d22dff",
-    "#d32cff",
-    "#d32bff",
-    "#d529ff",
-    "#d628ff",
-    "#d728ff",
-    "#d827ff",
-    "#d926ff",
-    "#da25ff",
-    "#db24ff",
-    "#dc22ff",
-    "#dd21ff",
-    "#de20ff",
-    "#df20ff",
-    "#e01fff",
-    "#e11eff",
-    "#e21dff",
-    "#e31cff",
-    "#e31bff",
-    "#e519ff",
-    "#e618ff",
-    "#e718ff",
-    "#e817ff",
-    "#e916ff",
-    "#ea15ff",
-    "#eb14ff",
-    "#ec12ff",
-    "#ed11ff",
-    "#ee10ff",
-    "#ef10ff",
-    "#f00fff",
-    "#f10eff",
-    "#f20dff",
-    "#f30cff",
-    "#f30bff",
-    "#f509ff",
-    "#f608ff",
-    "#f708ff",
-    "#f807ff",
-    "#f906ff",
-    "#fa05ff",
-    "#fb04ff",
-    "#fc02ff",
-    "#fd01ff",
-    "#fe00ff",
-    "#ff00ff"
-  ],
-  "coolwarm": [
-    "#3a4cc0",
-    "#3b4dc1",
-    "#3c4fc3",
-    "#3e51c4",
-    "#3f53c6",
-    "#4054c7",
-    "#4156c9",
-    "#4258ca",
-    "#435acc",
-    "#455bcd",
-    "#465dcf",
-    "#475fd0",
-    "#4860d1",
-    "#4962d3",
-    "#4b64d4",
-    "#4c66d6",
-    "#4d67d7",
-    "#4e69d8",
-    "#506bda",
-    "#516cdb",
-    "#526edc",
-    "#5370dd",
-    "#5571de",
-    "#5673e0",
-    "#5775e1",
-    "#5876e2",
-    "#5a78e3",
-    "#5b79e4",
-    "#5c7be5",
-    "#5d7de6",
-    "#5f7ee7",
-    "#6080e8",
-    "#6182ea",
-    "#6383ea",
-    "#6485eb",
-    "#6586ec",
-    "#6788ed",
-    "#6889ee",
-    "#698bef",
-    "#6b8df0",
-    "#6c8ef1",
-    "#6d90f1",
-    "#6f91f2",
-    "#7093f3",
-    "#7194f4",
-    "#7395f4",
-    "#7497f5",
-    "#7598f6",
-    "#779af6",
-    "#789bf7",
-    "#7a9df8",
-    "#7b9ef8",
-    "#7ca0f9",
-    "#7ea1f9",
-    "#7fa2fa",
-    "#80a4fa",
-    "#82a5fb",
-    "#83a6fb",
-    "#85a8fb",
-    "#86a9fc",
-    "#87aafc",
-    "#89acfc",
-    "#8aadfd",
-    "#8baefd",
-    "#8daffd",
-    "#8eb1fd",
-    "#90b2fe",
-    "#91b3fe",
-    "#92b4fe",
-    "#94b5fe",
-    "#95b7fe",
-    "#97b8fe",
-    "#98b9fe",
-    "#99bafe",
-    "#9bbbfe",
-    "#9cbcfe",
-    "#9dbdfe",
-    "#9fbefe",
-    "#a0bffe",
-    "#a2c0fe",
-    "#a3c1fe",
-    "#a4c2fe",
-    "#a6c3fd",
-    "#a7c4fd",
-    "#a8c5fd",
-    "#aac6fd",
-    "#abc7fc",
-    "#acc8fc",
-    "#aec9fc",
-    "#afcafb",
-    "#b0cbfb",
-    "#b2cbfb",
-    "#b3ccfa",
-    "#b4cdfa",
-    "#b6cef9",
-    "#b7cff9",
-    "#b8cff8",
-    "#b9d0f8",
-    "#bbd1f7",
-    "#bcd1f6",
-    "#bdd2f6",
-    "#bed3f5",
-    "#c0d3f5",
-    "#c1d4f4",
-    "#c2d4f3",
-    "#c3d5f2",
-    "#c5d5f2",
-    "#c6d6f1",
-    "#c7d6f0",
-    "#c8d7ef",
-    "#c9d7ee",
-    "#cad8ee",
-    "#ccd8ed",
-    "#cdd9ec",
-    "#ced9eb",
-    "#cfd9ea",
-    "#d0dae9",
-    "#d1dae8",
-    "#d2dae7",
-    "#d3dbe6",
-    "#d5dbe5",
-    "#d6dbe4",
-    "#d7dbe2",
-    "#d8dbe1",
-    "#d9dce0",
-    "#dadcdf",
-    "#dbdcde",
-    "#dcdcdd",
-    "#dddcdb",
-    "#dedbda",
-    "#dfdbd9",
-    "#e0dad7",
-    "#e1dad6",
-    "#e2d9d4",
-    "#e3d9d3",
-    "#e4d8d1",
-    "#e5d8d0",
-    "#e6d7cf",
-    "#e7d6cd",
-    "#e7d6cc",
-    "#e8d5ca",
-    "#e9d4c9",
-    "#ead3c7",
-    "#ebd3c6",
-    "#ecd2c4",
-    "#ecd1c3",
-    "#edd0c1",
-    "#edcfc0",
-    "#eecfbe",
-    "#efcebc",
-    "#efcdbb",
-    "#f0ccb9",
-    "#f1cbb8",
-    "#f1cab6",
-    "#f2c9b5",
-    "#f2c8b3",
-    "#f2c7b2",
-    "#f3c6b0",
-    "#f3c5af",
-    "#f4c4ad",
-    "#f4c3ab",
-    "#f4c2aa",
-    "#f5c1a8",
-    "#f5c0a7",
-    "#f5bfa5",
-    "#f6bda4",
-    "#f6bca2",
-    "#f6bba0",
-    "#f6ba9f",
-    "#f6b99d",
-    "#f6b79c",
-    "#f6b69a",
-    "#f7b598",
-    "#f7b397",
-    "#f7b295",
-    "#f7b194",
-    "#f7b092",
-    "#f7ae91",
-    "#f7ad8f",
-    "#f6ab8d",
-    "#f6aa8c",
-    "#f6a98a",
-    "#f6a789",
-    "#f6a687",
-    "#f6a486",
-    "#f6a384",
-    "#f5a182",
-    "#f5a081",
-    "#f59e7f",
-    "#f49d7e",
-    "#f49b7c",
-    "#f49a7b",
-    "#f39879",
-    "#f39678",
-    "#f39576",
-    "#f29375",
-    "#f29173",
-    "#f19072",
-    "#f18e70",
-    "#f08d6f",
-    "#f08b6d",
-    "#ef896c",
-    "#ee876a",
-    "#ee8669",
-    "#ed8467",
-    "#ec8266",
-    "#ec8064",
-    "#eb7f63",
-    "#ea7d61",
-    "#ea7b60",
-    "#e9795e",
-    "#e8775d",
-    "#e7755c",
-    "#e6745a",
-    "#e67259",
-    "#e57057",
-    "#e46e56",
-    "#e36c54",
-    "#e26a53",
-    "#e16852",
-    "#e06650",
-    "#df644f",
-    "#de624e",
-    "#dd604c",
-    "#dc5e4b",
-    "#db5c4a",
-    "#da5a48",
-    "#d95847",
-    "#d85646",
-    "#d75444",
-    "#d65243",
-    "#d44f42",
-    "#d34d40",
-    "#d24b3f",
-    "#d1493e",
-    "#cf463d",
-    "#ce443c",
-    "#cd423a",
-    "#cc3f39",
-    "#ca3d38",
-    "#c93b37",
-    "#c83835",
-    "#c63534",
-    "#c53233",
-    "#c43032",
-    "#c22d31",
-    "#c12a30",
-    "#bf282e",
-    "#be232d",
-    "#bc1f2c",
-    "#bb1a2b",
-    "#b9162a",
-    "#b81129",
-    "#b60d28",
-    "#b50827",
-    "#b30326"
-  ],
-  "copper": [
-    "#000000",
-    "#010000",
-    "#020100",
-    "#030201",
-    "#040301",
-    "#060302",
-    "#070402",
-    "#080503",
-    "#090603",
-    "#0b0704",
-    "#0c0704",
-    "#0d0805",
-    "#0e0905",
-    "#100a06",
-    "#110a06",
-    "#120b07",
-    "#130c07",
-    "#140d08",
-    "#160e08",
-    "#170e09",
-    "#180f09",
-    "#19100a",
-    "#1b110a",
-    "#1c110b",
-    "#1d120b",
-    "#1e130c",
-    "#20140c",
-    "#21150d",
-    "#22150d",
-    "#23160e",
-    "#25170e",
-    "#26180f",
-    "#27180f",
-    "#281910",
-    "#291a10",
-    "#2b1b11",
-    "#2c1c11",
-    "#2d1c12",
-    "#2e1d12",
-    "#301e13",
-    "#311f13",
-    "#322014",
-    "#332014",
-    "#352115",
-    "#362215",
-    "#372316",
-    "#382316",
-    "#3a2417",
-    "#3b2517",
-    "#3c2618",
-    "#3d2718",
-    "#3e2719",
-    "#402819",
-    "#41291a",
-    "#422a1a",
-    "#432a1b",
-    "#452b1b",
-    "#462c1c",
-    "#472d1c",
-    "#482e1d",
-    "#4a2e1d",
-    "#4b2f1e",
-    "#4c301e",
-    "#4d311f",
-    "#4f311f",
-    "#503220",
-    "#513320",
-    "#523421",
-    "#533521",
-    "#553522",
-    "#563622",
-    "#573723",
-    "#583823",
-    "#5a3924",
-    "#5b3924",
-    "#5c3a25",
-    "#5d3b25",
-    "#5f3c26",
-    "#603c26",
-    "#613d27",
-    "#623e27",
-    "#643f28",
-    "#654028",
-    "#664029",
-    "#674129",
-    "#68422a",
-    "#6a432a",
-    "#6b432b",
-    "#6c442b",
-    "#6d452c",
-    "#6f462c",
-    "#70472d",
-    "#71472d",
-    "#72482e",
-    "#74492e",
-    "#754a2f",
-    "#764a2f",
-    "#774b30",
-    "#794c30",
-    "#7a4d31",
-    "#7b4e31",
-    "#7c4e32",
-    "#7d4f32",
-    "#7f5033",
-    "#805133",
-    "#815234",
-    "#825234",
-    "#845335",
-    "#855435",
-    "#865536",
-    "#875536",
-    "#895637",
-    "#8a5737",
-    "#8b5838",
-    "#8c5938",
-    "#8e5939",
-    "#8f5a39",
-    "#905b3a",
-    "#915c3a",
-    "#925c3b",
-    "#945d3b",
-    "#955e3c",
-    "#965f3c",
-    "#97603d",
-    "#99603d",
-    "#9a613e",
-    "#9b623e",
-    "#9c633f",
-    "#9e633f",
-    "#9f6440",
-    "#a06540",
-    "#a16641",
-    "#a36741",
-    "#a46742",
-    "#a56842",
-    "#a66943",
-    "#a76a43",
-    "#a96b44",
-    "#aa6b44",
-    "#ab6c45",
-    "#ac6d45",
-    "#ae6e46",
-    "#af6e46",
-    "#b06f47",
-    "#b17047",
-    "#b37148",
-    "#b47248",
-    "#b57249",
-    "#b67349",
-    "#b8744a",
-    "#b9754a",
-    "#ba754b",
-    "#bb764b",
-    "#bc774c",
-    "#be784c",
-    "#bf794d",
-    "#c0794d",
-    "#c17a4e",
-    "#c37b4e",
-    "#c47c4f",
-    "#c57c4f",
-    "#c67d50",
-    "#c87e50",
-    "#c97f51",
-    "#ca8051",
-    "#cb8052",
-    "#cd8152",
-    "#ce8253",
-    "#cf8353",
-    "#d08454",
-    "#d18454",
-    "#d38555",
-    "#d48655",
-    "#d58756",
-    "#d68756",
-    "#d88857",
-    "#d98957",
-    "#da8a58",
-    "#db8b58",
-    "#dd8b59",
-    "#de8c59",
-    "#df8d5a",
-    "#e08e5a",
-    "#e28e5b",
-    "#e38f5b",
-    "#e4905c",
-    "#e5915c",
-    "#e6925d",
-    "#e8925d",
-    "#e9935e",
-    "#ea945e",
-    "#eb955f",
-    "#ed955f",
-    "#ee9660",
-    "#ef9760",
-    "#f09861",
-    "#f29961",
-    "#f39962",
-    "#f49a62",
-    "#f59b63",
-    "#f79c63",
-    "#f89d63",
-    "#f99d64",
-    "#fa9e64",
-    "#fb9f65",
-    "#fda065",
-    "#fea066",
-    "#ffa166",
-    "#ffa267",
-    "#ffa367",
-    "#ffa468",
-    "#ffa468",
-    "#ffa569",
-    "#ffa669",
-    "#ffa76a",
-    "#ffa76a",
-    "#ffa86b",
-    "#ffa96b",
-    "#ffaa6c",
-    "#ffab6c",
-    "#ffab6d",
-    "#ffac6d",
-    "#ffad6e",
-    "#ffae6e",
-    "#ffae6f",
-    "#ffaf6f",
-    "#ffb070",
-    "#ffb170",
-    "#ffb271",
-    "#ffb271",
-    "#ffb372",
-    "#ffb472",
-    "#ffb573",
-    "#ffb673",
-    "#ffb674",
-    "#ffb774",
-    "#ffb875",
-    "#ffb975",
-    "#ffb976",
-    "#ffba76",
-    "#ffbb77",
-    "#ffbc77",
-    "#ffbd78",
-    "#ffbd78",
-    "#ffbe79",
-    "#ffbf79",
-    "#ffc07a",
-    "#ffc07a",
-    "#ffc17b",
-    "#ffc27b",
-    "#ffc37c",
-    "#ffc47c",
-    "#ffc47d",
-    "#ffc57d",
-    "#ffc67e",
-    "#ffc77e"
-  ],
-  "cubehelix": [
-    "#000000",
-    "#010001",
-    "#030103",
-    "#040104",
-    "#060206",
-    "#080208",
-    "#090309",
-    "#0a040b",
-    "#0c040d",
-    "#0d050f",
-    "#0e0611",
-    "#0f0613",
-    "#110715",
-    "#120817",
-    "#130919",
-    "#140a1b",
-    "#140b1d",
-    "#150b1f",
-    "#160c21",
-    "#170d23",
-    "#170e25",
-    "#180f27",
-    "#181129",
-    "#19122b",
-    "#19132d",
-    "#19142f",
-    "#1a1530",
-    "#1a1632",
-    "#1a1834",
-    "#1a1936",
-    "#1a1a38",
-    "#1a1c39",
-    "#1a1d3b",
-    "#1a1f3c",
-    "#1a203e",
-    "#1a223f",
-    "#1a2341",
-    "#192542",
-    "#192643",
-    "#192845",
-    "#192946",
-    "#182b47",
-    "#182d48",
-    "#182e49",
-    "#17304a",
-    "#17324a",
-    "#17344b",
-    "#17354c",
-    "#16374c",
-    "#16394d",
-    "#163a4d",
-    "#153c4d",
-    "#153e4e",
-    "#15404e",
-    "#15424e",
-    "#15434e",
-    "#15454e",
-    "#14474e",
-    "#14494e",
-    "#144a4d",
-    "#154c4d",
-    "#154e4d",
-    "#154f4c",
-    "#15514c",
-    "#15534b",
-    "#16544b",
-    "#16564a",
-    "#165849",
-    "#175949",
-    "#175b48",
-    "#185c47",
-    "#195e46",
-    "#1a5f45",
-    "#1b6144",
-    "#1b6243",
-    "#1c6342",
-    "#1e6542",
-    "#1f6641",
-    "#206740",
-    "#21683f",
-    "#236a3d",
-    "#246b3c",
-    "#266c3b",
-    "#276d3a",
-    "#296e3a",
-    "#2b6f39",
-    "#2d7038",
-    "#2f7137",
-    "#317236",
-    "#337235",
-    "#357334",
-    "#377433",
-    "#397433",
-    "#3c7532",
-    "#3e7631",
-    "#417631",
-    "#437730",
-    "#467730",
-    "#48782f",
-    "#4b782f",
-    "#4e782f",
-    "#51792e",
-    "#53792e",
-    "#56792e",
-    "#59792e",
-    "#5c7a2e",
-    "#5f7a2f",
-    "#627a2f",
-    "#657a2f",
-    "#687a30",
-    "#6b7a30",
-    "#6e7a31",
-    "#717a32",
-    "#747a32",
-    "#787a33",
-    "#7b7a34",
-    "#7e7a35",
-    "#817a37",
-    "#847a38",
-    "#877a39",
-    "#8a793b",
-    "#8d793c",
-    "#90793e",
-    "#937940",
-    "#967941",
-    "#997943",
-    "#9b7945",
-    "#9e7947",
-    "#a1794a",
-    "#a4784c",
-    "#a6784e",
-    "#a97851",
-    "#ab7853",
-    "#ae7856",
-    "#b07858",
-    "#b2785b",
-    "#b5785e",
-    "#b77860",
-    "#b97863",
-    "#bb7966",
-    "#bd7969",
-    "#bf796c",
-    "#c1796f",
-    "#c27972",
-    "#c47a75",
-    "#c67a78",
-    "#c77a7c",
-    "#c97b7f",
-    "#ca7b82",
-    "#cb7c85",
-    "#cc7c88",
-    "#cd7d8c",
-    "#ce7d8f",
-    "#cf7e92",
-    "#d07f95",
-    "#d17f99",
-    "#d1809c",
-    "#d2819f",
-    "#d382a2",
-    "#d383a5",
-    "#d383a9",
-    "#d484ac",
-    "#d485af",
-    "#d487b2",
-    "#d488b5",
-    "#d489b8",
-    "#d48aba",
-    "#d48bbd",
-    "#d48cc0",
-    "#d38ec3",
-    "#d38fc5",
-    "#d390c8",
-    "#d292cb",
-    "#d293cd",
-    "#d295cf",
-    "#d196d2",
-    "#d098d4",
-    "#d09ad6",
-    "#cf9bd8",
-    "#cf9dda",
-    "#ce9edc",
-    "#cda0de",
-    "#cda2e0",
-    "#cca4e2",
-    "#cba5e3",
-    "#cba7e5",
-    "#caa9e6",
-    "#c9abe7",
-    "#c9ace9",
-    "#c8aeea",
-    "#c7b0eb",
-    "#c7b2ec",
-    "#c6b4ed",
-    "#c5b6ee",
-    "#c5b7ef",
-    "#c4b9ef",
-    "#c4bbf0",
-    "#c3bdf1",
-    "#c3bff1",
-    "#c2c1f2",
-    "#c2c2f2",
-    "#c2c4f2",
-    "#c1c6f3",
-    "#c1c8f3",
-    "#c1caf3",
-    "#c1cbf3",
-    "#c1cdf3",
-    "#c1cff3",
-    "#c1d0f3",
-    "#c1d2f3",
-    "#c1d4f3",
-    "#c1d5f3",
-    "#c2d7f2",
-    "#c2d8f2",
-    "#c3daf2",
-    "#c3dbf2",
-    "#c4ddf1",
-    "#c4def1",
-    "#c5e0f1",
-    "#c6e1f1",
-    "#c7e2f0",
-    "#c8e4f0",
-    "#c8e5f0",
-    "#cae6ef",
-    "#cbe7ef",
-    "#cce8ef",
-    "#cde9ef",
-    "#ceebef",
-    "#d0ecee",
-    "#d1edee",
-    "#d2eeee",
-    "#d4efee",
-    "#d5f0ee",
-    "#d7f0ee",
-    "#d9f1ee",
-    "#daf2ee",
-    "#dcf3ef",
-    "#def4ef",
-    "#dff4ef",
-    "#e1f5f0",
-    "#e3f6f0",
-    "#e5f7f0",
-    "#e7f7f1",
-    "#e8f8f2",
-    "#eaf8f2",
-    "#ecf9f3",
-    "#eefaf4",
-    "#f0faf5",
-    "#f2fbf6",
-    "#f4fbf7",
-    "#f5fcf8",
-    "#f7fcf9",
-    "#f9fdfa",
-    "#fbfdfc",
-    "#fdfefd",
-    "#ffffff"
-  ],
-  "flag": [
-    "#ff0000",
-    "#ff6035",
-    "#ffb27d",
-    "#ffeac6",
-    "#fffeff",
-    "#ccedff",
-    "#84b9ff",
-    "#3c69ff",
-    "#0009ff",
-    "#0000cf",
-    "#000088",
-    "#00003f",
-    "#000000",
-    "#2b0000",
-    "#730000",
-    "#bc0000",
-    "#fc0000",
-    "#ff4e28",
-    "#ffa46f",
-    "#ffe2b8",
-    "#fffdf9",
-    "#d9f3ff",
-    "#92c5ff",
-    "#497aff",
-    "#081cff",
-    "#0000dc",
-    "#000096",
-    "#00004c",
-    "#00000a",
-    "#1f0000",
-    "#650000",
-    "#ae0000",
-    "#f10000",
-    "#ff3c1c",
-    "#ff9561",
-    "#ffd8ab",
-    "#fffbee",
-    "#e5f8ff",
-    "#a0d1ff",
-    "#578aff",
-    "#132eff",
-    "#0000e8",
-    "#0000a4",
-    "#00005a",
-    "#000016",
-    "#130000",
-    "#570000",
-    "#a00000",
-    "#e50000",
-    "#ff2a10",
-    "#ff8653",
-    "#ffce9d",
-    "#fff7e2",
-    "#f1fcff",
-    "#aedbff",
-    "#6599ff",
-    "#1f41ff",
-    "#0000f4",
-    "#0000b2",
-    "#000068",
-    "#000022",
-    "#080000",
-    "#490000",
-    "#920000",
-    "#d90000",
-    "#ff1705",
-    "#ff7546",
-    "#ffc28f",
-    "#fff2d6",
-    "#fcfeff",
-    "#bce4ff",
-    "#73a8ff",
-    "#2b53ff",
-    "#0000ff",
-    "#0000bf",
-    "#000076",
-    "#00002f",
-    "#000000",
-    "#3c0000",
-    "#840000",
-    "#cc0000",
-    "#ff0400",
-    "#ff6438",
-    "#ffb581",
-    "#ffecc9",
-    "#ffffff",
-    "#c9ecff",
-    "#81b5ff",
-    "#3864ff",
-    "#0004ff",
-    "#0000cc",
-    "#000084",
-    "#00003c",
-    "#000000",
-    "#2f0000",
-    "#760000",
-    "#bf0000",
-    "#ff0000",
-    "#ff532b",
-    "#ffa873",
-    "#ffe4bc",
-    "#fffefc",
-    "#d6f2ff",
-    "#8fc2ff",
-    "#4675ff",
-    "#0517ff",
-    "#0000d9",
-    "#000092",
-    "#000049",
-    "#000008",
-    "#220000",
-    "#680000",
-    "#b20000",
-    "#f40000",
-    "#ff411f",
-    "#ff9965",
-    "#ffdbae",
-    "#fffcf1",
-    "#e2f7ff",
-    "#9dceff",
-    "#5386ff",
-    "#102aff",
-    "#0000e5",
-    "#0000a0",
-    "#000057",
-    "#000013",
-    "#160000",
-    "#5a0000",
-    "#a40000",
-    "#e80000",
-    "#ff2e13",
-    "#ff8a57",
-    "#ffd1a0",
-    "#fff8e5",
-    "#eefbff",
-    "#abd8ff",
-    "#6195ff",
-    "#1c3cff",
-    "#0000f1",
-    "#0000ae",
-    "#000065",
-    "#00001f",
-    "#0a0000",
-    "#4c0000",
-    "#960000",
-    "#dc0000",
-    "#ff1c08",
-    "#ff7a49",
-    "#ffc592",
-    "#fff3d9",
-    "#f9fdff",
-    "#b8e2ff",
-    "#6fa4ff",
-    "#284eff",
-    "#0000fc",
-    "#0000bc",
-    "#000073",
-    "#00002b",
-    "#000000",
-    "#3f0000",
-    "#880000",
-    "#cf0000",
-    "#ff0900",
-    "#ff693c",
-    "#ffb984",
-    "#ffedcc",
-    "#fffeff",
-    "#c6eaff",
-    "#7db2ff",
-    "#3560ff",
-    "#0000ff",
-    "#0000c9",
-    "#000081",
-    "#000038",
-    "#000000",
-    "#320000",
-    "#7a0000",
-    "#c20000",
-    "#ff0000",
-    "#ff572f",
-    "#ffab76",
-    "#ffe6bf",
-    "#fffeff",
-    "#d3f1ff",
-    "#8bbfff",
-    "#4271ff",
-    "#0212ff",
-    "#0000d6",
-    "#00008f",
-    "#000046",
-    "#000005",
-    "#250000",
-    "#6c0000",
-    "#b50000",
-    "#f60000",
-    "#ff4522",
-    "#ff9d68",
-    "#ffddb2",
-    "#fffcf4",
-    "#dff6ff",
-    "#99cbff",
-    "#5082ff",
-    "#0d25ff",
-    "#0000e2",
-    "#00009d",
-    "#000053",
-    "#000010",
-    "#190000",
-    "#5e0000",
-    "#a70000",
-    "#eb0000",
-    "#ff3316",
-    "#ff8e5a",
-    "#ffd3a4",
-    "#fff9e8",
-    "#ebfaff",
-    "#a7d6ff",
-    "#5e92ff",
-    "#1938ff",
-    "#0000ee",
-    "#0000ab",
-    "#000061",
-    "#00001c",
-    "#0d0000",
-    "#500000",
-    "#990000",
-    "#df0000",
-    "#ff200a",
-    "#ff7e4c",
-    "#ffc896",
-    "#fff5dc",
-    "#f6fdff",
-    "#b5dfff",
-    "#6ca1ff",
-    "#254aff",
-    "#0000f9",
-    "#0000b8",
-    "#00006f",
-    "#000028",
-    "#020000",
-    "#420000",
-    "#8b0000",
-    "#d30000",
-    "#ff0e00",
-    "#ff6d3f",
-    "#ffbc88",
-    "#ffefcf",
-    "#fffeff",
-    "#c2e8ff",
-    "#7aafff",
-    "#325cff",
-    "#0000ff",
-    "#0000c6",
-    "#00007d",
-    "#000035",
-    "#000000"
-  ],
-  "gist_earth": [
-    "#000000",
-    "#00002b",
-    "#010038",
-    "#010043",
-    "#02004e",
-    "#030058",
-    "#030063",
-    "#04006e",
-    "#050273",
-    "#050474",
-    "#060674",
-    "#070974",
-    "#070b74",
-    "#080d74",
-    "#091075",
-    "#091275",
-    "#0a1475",
-    "#0b1675",
-    "#0b1975",
-    "#0c1b75",
-    "#0d1d76",
-    "#0d2076",
-    "#0e2276",
-    "#0f2476",
-    "#0f2776",
-    "#102977",
-    "#112b77",
-    "#112d77",
-    "#123077",
-    "#133277",
-    "#133477",
-    "#143678",
-    "#153878",
-    "#153a78",
-    "#163c78",
-    "#173e78",
-    "#174079",
-    "#184279",
-    "#194579",
-    "#194779",
-    "#1a4979",
-    "#1b4b79",
-    "#1b4d7a",
-    "#1c4f7a",
-    "#1d517a",
-    "#1d537a",
-    "#1e547a",
-    "#1f567b",
-    "#1f587b",
-    "#205a7b",
-    "#215c7b",
-    "#215e7b",
-    "#22607b",
-    "#23617c",
-    "#23637c",
-    "#24657c",
-    "#25667c",
-    "#25687c",
-    "#26697d",
-    "#276b7d",
-    "#276d7d",
-    "#286e7d",
-    "#29707d",
-    "#29717d",
-    "#2a737e",
-    "#2b747e",
-    "#2b767e",
-    "#2c787e",
-    "#2d797e",
-    "#2d7b7f",
-    "#2e7c7f",
-    "#2f7e7f",
-    "#2f7f7f",
-    "#30807e",
-    "#30817d",
-    "#31817b",
-    "#31827a",
-    "#328279",
-    "#328378",
-    "#338477",
-    "#338475",
-    "#348574",
-    "#348573",
-    "#358672",
-    "#358670",
-    "#36876f",
-    "#36886e",
-    "#37886d",
-    "#37896c",
-    "#38896a",
-    "#388a69",
-    "#388a68",
-    "#398b67",
-    "#398c65",
-    "#3a8c64",
-    "#3a8d63",
-    "#3b8d62",
-    "#3b8e61",
-    "#3c8e5f",
-    "#3c8f5e",
-    "#3d905d",
-    "#3d905c",
-    "#3e915a",
-    "#3e9159",
-    "#3f9258",
-    "#3f9357",
-    "#409355",
-    "#409454",
-    "#409453",
-    "#419552",
-    "#419551",
-    "#42964f",
-    "#42974e",
-    "#43974d",
-    "#43984c",
-    "#44984a",
-    "#449949",
-    "#459948",
-    "#479a47",
-    "#499b46",
-    "#4b9b46",
-    "#4e9c47",
-    "#509c47",
-    "#529d48",
-    "#549d48",
-    "#579e49",
-    "#599f4a",
-    "#5b9f4a",
-    "#5da04b",
-    "#5fa04b",
-    "#62a14c",
-    "#64a14d",
-    "#66a24d",
-    "#68a34e",
-    "#6ba34e",
-    "#6da34f",
-    "#6fa44f",
-    "#71a450",
-    "#73a551",
-    "#76a551",
-    "#78a652",
-    "#79a652",
-    "#7ba752",
-    "#7da752",
-    "#7ea753",
-    "#80a853",
-    "#82a853",
-    "#83a954",
-    "#85a954",
-    "#87aa54",
-    "#88aa55",
-    "#8aab55",
-    "#8cab55",
-    "#8dab56",
-    "#8fac56",
-    "#91ac56",
-    "#92ad57",
-    "#94ad57",
-    "#96ae57",
-    "#97ae58",
-    "#99ae58",
-    "#9aaf58",
-    "#9caf58",
-    "#9eb059",
-    "#9fb059",
-    "#a1b159",
-    "#a3b15a",
-    "#a4b25a",
-    "#a6b25a",
-    "#a8b25b",
-    "#a9b35b",
-    "#abb35b",
-    "#adb45c",
-    "#aeb45c",
-    "#b0b55c",
-    "#b2b55d",
-    "#b3b55d",
-    "#b5b65d",
-    "#b6b65e",
-    "#b7b55e",
-    "#b7b55e",
-    "#b8b45f",
-    "#b8b35f",
-    "#b9b25f",
-    "#b9b15f",
-    "#b9b060",
-    "#baaf60",
-    "#baaf60",
-    "#bbae61",
-    "#bbad61",
-    "#bcac61",
-    "#bcab62",
-    "#bcaa62",
-    "#bda962",
-    "#bda963",
-    "#bea863",
-    "#bea763",
-    "#bea664",
-    "#bfa564",
-    "#bfa464",
-    "#c0a365",
-    "#c0a367",
-    "#c1a369",
-    "#c2a36c",
-    "#c3a46e",
-    "#c5a471",
-    "#c6a573",
-    "#c7a676",
-    "#c8a678",
-    "#c9a77b",
-    "#caa87d",
-    "#cba97f",
-    "#ccaa82",
-    "#ceab84",
-    "#cfac87",
-    "#d0ad89",
-    "#d1ad8c",
-    "#d2ae8e",
-    "#d3af91",
-    "#d4b093",
-    "#d5b196",
-    "#d6b298",
-    "#d8b39a",
-    "#d9b59d",
-    "#dab69f",
-    "#dbb7a2",
-    "#dcb9a4",
-    "#ddbaa7",
-    "#debca9",
-    "#dfbdac",
-    "#e1bfaf",
-    "#e2c1b2",
-    "#e3c3b5",
-    "#e4c5b8",
-    "#e5c7bb",
-    "#e6c9be",
-    "#e7cbc1",
-    "#e8cdc4",
-    "#e9cfc7",
-    "#ebd1ca",
-    "#ecd3cd",
-    "#edd5d0",
-    "#eed7d3",
-    "#efd9d6",
-    "#f0dcd9",
-    "#f1dedc",
-    "#f2e0df",
-    "#f4e3e2",
-    "#f5e6e5",
-    "#f6e9e8",
-    "#f7eceb",
-    "#f8efee",
-    "#f9f2f1",
-    "#faf5f4",
-    "#fbf8f7",
-    "#fdfafa"
-  ],
-  "gist_gray": [
-    "#000000",
-    "#010101",
-    "#020202",
-    "#030303",
-    "#040404",
-    "#050505",
-    "#060606",
-    "#070707",
-    "#080808",
-    "#090909",
-    "#0a0a0a",
-    "#0b0b0b",
-    "#0c0c0c",
-    "#0d0d0d",
-    "#0e0e0e",
-    "#0f0f0f",
-    "#101010",
-    "#111111",
-    "#121212",
-    "#131313",
-    "#141414",
-    "#151515",
-    "#161616",
-    "#171717",
-    "#181818",
-    "#191919",
-    "#1a1a1a",
-    "#1b1b1b",
-    "#1c1c1c",
-    "#1d1d1d",
-    "#1e1e1e",
-    "#1f1f1f",
-    "#202020",
-    "#202020",
-    "#222222",
-    "#232323",
-    "#242424",
-    "#242424",
-    "#262626",
-    "#272727",
-    "#282828",
-    "#282828",
-    "#2a2a2a",
-    "#2b2b2b",
-    "#2c2c2c",
-    "#2c2c2c",
-    "#2e2e2e",
-    "#2f2f2f",
-    "#303030",
-    "#303030",
-    "#323232",
-    "#333333",
-    "#343434",
-    "#343434",
-    "#363636",
-    "#373737",
-    "#383838",
-    "#383838",
-    "#3a3a3a",
-    "#3b3b3b",
-    "#3c3c3c",
-    "#3c3c3c",
-    "#3e3e3e",
-    "#3f3f3f",
-    "#404040",
-    "#414141",
-    "#414141",
-    "#434343",
-    "#444444",
-    "#454545",
-    "#464646",
-    "#474747",
-    "#484848",
-    "#494949",
-    "#494949",
-    "#4b4b4b",
-    "#4c4c4c",
-    "#4d4d4d",
-    "#4e4e4e",
-    "#4f4f4f",
-    "#505050",
-    "#515151",
-    "#515151",
-    "#535353",
-    "#545454",
-    "#555555",
-    "#565656",
-    "#575757",
-    "#585858",
-    "#595959",
-    "#595959",
-    "#5b5b5b",
-    "#5c5c5c",
-    "#5d5d5d",
-    "#5e5e5e",
-    "#5f5f5f",
-    "#606060",
-    "#616161",
-    "#616161",
-    "#636363",
-    "#646464",
-    "#656565",
-    "#666666",
-    "#676767",
-    "#686868",
-    "#696969",
-    "#696969",
-    "#6b6b6b",
-    "#6c6c6c",
-    "#6d6d6d",
-    "#6e6e6e",
-    "#6f6f6f",
-    "#707070",
-    "#717171",
-    "#717171",
-    "#737373",
-    "#747474",
-    "#757575",
-    "#767676",
-    "#777777",
-    "#787878",
-    "#797979",
-    "#797979",
-    "#7b7b7b",
-    "#7c7c7c",
-    "#7d7d7d",
-    "#7e7e7e",
-    "#7f7f7f",
-    "#808080",
-    "#818181",
-    "#828282",
-    "#838383",
-    "#838383",
-    "#858585",
-    "#868686",
-    "#878787",
-    "#888888",
-    "#898989",
-    "#8a8a8a",
-    "#8b8b8b",
-    "#8c8c8c",
-    "#8d8d8d",
-    "#8e8e8e",
-    "#8f8f8f",
-    "#909090",
-    "#919191",
-    "#929292",
-    "#939393",
-    "#939393",
-    "#959595",
-    "#969696",
-    "#979797",
-    "#989898",
-    "#999999",
-    "#9a9a9a",
-    "#9b9b9b",
-    "#9c9c9c",
-    "#9d9d9d",
-    "#9e9e9e",
-    "#9f9f9f",
-    "#a0a0a0",
-    "#a1a1a1",
-    "#a2a2a2",
-    "#a3a3a3",
-    "#a3a3a3",
-    "#a5a5a5",
-    "#a6a6a6",
-    "#a7a7a7",
-    "#a8a8a8",
-    "#a9a9a9",
-    "#aaaaaa",
-    "#ababab",
-    "#acacac",
-    "#adadad",
-    "#aeaeae",
-    "#afafaf",
-    "#b0b0b0",
-    "#b1b1b1",
-    "#b2b2b2",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b5b5b5",
-    "#b6b6b6",
-    "#b7b7b7",
-    "#b8b8b8",
-    "#b9b9b9",
-    "#bababa",
-    "#bbbbbb",
-    "#bcbcbc",
-    "#bdbdbd",
-    "#bebebe",
-    "#bfbfbf",
-    "#c0c0c0",
-    "#c1c1c1",
-    "#c2c2c2",
-    "#c3c3c3",
-    "#c3c3c3",
-    "#c5c5c5",
-    "#c6c6c6",
-    "#c7c7c7",
-    "#c8c8c8",
-    "#c9c9c9",
-    "#cacaca",
-    "#cbcbcb",
-    "#cccccc",
-    "#cdcdcd",
-    "#cecece",
-    "#cfcfcf",
-    "#d0d0d0",
-    "#d1d1d1",
-    "#d2d2d2",
-    "#d3d3d3",
-    "#d3d3d3",
-    "#d5d5d5",
-    "#d6d6d6",
-    "#d7d7d7",
-    "#d8d8d8",
-    "#d9d9d9",
-    "#dadada",
-    "#dbdbdb",
-    "#dcdcdc",
-    "#dddddd",
-    "#dedede",
-    "#dfdfdf",
-    "#e0e0e0",
-    "#e1e1e1",
-    "#e2e2e2",
-    "#e3e3e3",
-    "#e3e3e3",
-    "#e5e5e5",
-    "#e6e6e6",
-    "#e7e7e7",
-    "#e8e8e8",
-    "#e9e9e9",
-    "#eaeaea",
-    "#ebebeb",
-    "#ececec",
-    "#ededed",
-    "#eeeeee",
-    "#efefef",
-    "#f0f0f0",
-    "#f1f1f1",
-    "#f2f2f2",
-    "#f3f3f3",
-    "#f3f3f3",
-    "#f5f5f5",
-    "#f6f6f6",
-    "#f7f7f7",
-    "#f8f8f8",
-    "#f9f9f9",
-    "#fafafa",
-    "#fbfbfb",
-    "#fcfcfc",
-    "#fdfdfd",
-    "#fefefe",
-    "#ffffff"
-  ],
-  "gist_heat": [
-    "#000000",
-    "#010000",
-    "#030000",
-    "#040000",
-    "#060000",
-    "#070000",
-    "#090000",
-    "#0a0000",
-    "#0c0000",
-    "#0d0000",
-    "#0f0000",
-    "#100000",
-    "#120000",
-    "#130000",
-    "#150000",
-    "#160000",
-    "#180000",
-    "#190000",
-    "#1b0000",
-    "#1c0000",
-    "#1e0000",
-    "#1f0000",
-    "#200000",
-    "#220000",
-    "#240000",
-    "#250000",
-    "#270000",
-    "#280000",
-    "#2a0000",
-    "#2b0000",
-    "#2c0000",
-    "#2e0000",
-    "#300000",
-    "#310000",
-    "#330000",
-    "#340000",
-    "#360000",
-    "#370000",
-    "#380000",
-    "#3a0000",
-    "#3c0000",
-    "#3d0000",
-    "#3f0000",
-    "#400000",
-    "#410000",
-    "#430000",
-    "#450000",
-    "#460000",
-    "#480000",
-    "#490000",
-    "#4b0000",
-    "#4c0000",
-    "#4e0000",
-    "#4f0000",
-    "#510000",
-    "#520000",
-    "#540000",
-    "#550000",
-    "#570000",
-    "#580000",
-    "#590000",
-    "#5b0000",
-    "#5d0000",
-    "#5e0000",
-    "#600000",
-    "#610000",
-    "#620000",
-    "#640000",
-    "#660000",
-    "#670000",
-    "#690000",
-    "#6a0000",
-    "#6c0000",
-    "#6d0000",
-    "#6e0000",
-    "#700000",
-    "#710000",
-    "#730000",
-    "#750000",
-    "#760000",
-    "#780000",
-    "#790000",
-    "#7a0000",
-    "#7c0000",
-    "#7e0000",
-    "#7f0000",
-    "#810000",
-    "#820000",
-    "#830000",
-    "#850000",
-    "#860000",
-    "#880000",
-    "#8a0000",
-    "#8b0000",
-    "#8d0000",
-    "#8e0000",
-    "#900000",
-    "#910000",
-    "#930000",
-    "#940000",
-    "#960000",
-    "#970000",
-    "#990000",
-    "#9a0000",
-    "#9c0000",
-    "#9d0000",
-    "#9f0000",
-    "#a00000",
-    "#a20000",
-    "#a30000",
-    "#a50000",
-    "#a60000",
-    "#a80000",
-    "#a90000",
-    "#ab0000",
-    "#ac0000",
-    "#ae0000",
-    "#af0000",
-    "#b10000",
-    "#b20000",
-    "#b30000",
-    "#b50000",
-    "#b60000",
-    "#b80000",
-    "#ba0000",
-    "#bb0000",
-    "#bd0000",
-    "#be0000",
-    "#c00000",
-    "#c10200",
-    "#c30400",
-    "#c40600",
-    "#c50800",
-    "#c70b00",
-    "#c90d00",
-    "#ca0f00",
-    "#cc1000",
-    "#cd1200",
-    "#cf1400",
-    "#d01600",
-    "#d21900",
-    "#d31b00",
-    "#d51d00",
-    "#d61f00",
-    "#d82000",
-    "#d92200",
-    "#db2400",
-    "#dc2600",
-    "#dd2800",
-    "#df2b00",
-    "#e12d00",
-    "#e22f00",
-    "#e33000",
-    "#e53200",
-    "#e63400",
-    "#e83600",
-    "#ea3900",
-    "#eb3b00",
-    "#ed3d00",
-    "#ee3f00",
-    "#f04100",
-    "#f14200",
-    "#f34400",
-    "#f44600",
-    "#f54800",
-    "#f74b00",
-    "#f94d00",
-    "#fa4f00",
-    "#fc5100",
-    "#fd5200",
-    "#ff5400",
-    "#ff5600",
-    "#ff5900",
-    "#ff5b00",
-    "#ff5d00",
-    "#ff5f00",
-    "#ff6100",
-    "#ff6200",
-    "#ff6400",
-    "#ff6600",
-    "#ff6800",
-    "#ff6b00",
-    "#ff6d00",
-    "#ff6f00",
-    "#ff7100",
-    "#ff7200",
-    "#ff7400",
-    "#ff7600",
-    "#ff7900",
-    "#ff7b00",
-    "#ff7d00",
-    "#ff7f00",
-    "#ff8102",
-    "#ff8306",
-    "#ff840a",
-    "#ff860e",
-    "#ff8812",
-    "#ff8b17",
-    "#ff8d1b",
-    "#ff8f1f",
-    "#ff9122",
-    "#ff9326",
-    "#ff942a",
-    "#ff962e",
-    "#ff9933",
-    "#ff9b37",
-    "#ff9d3b",
-    "#ff9f3f",
-    "#ffa142",
-    "#ffa346",
-    "#ffa44a",
-    "#ffa64e",
-    "#ffa852",
-    "#ffab57",
-    "#ffad5b",
-    "#ffaf5f",
-    "#ffb162",
-    "#ffb366",
-    "#ffb46a",
-    "#ffb66e",
-    "#ffb973",
-    "#ffbb77",
-    "#ffbd7b",
-    "#ffbf7f",
-    "#ffc183",
-    "#ffc386",
-    "#ffc48a",
-    "#ffc68e",
-    "#ffc892",
-    "#ffcb97",
-    "#ffcd9b",
-    "#ffcf9f",
-    "#ffd1a3",
-    "#ffd3a6",
-    "#ffd4aa",
-    "#ffd6ae",
-    "#ffd9b3",
-    "#ffdbb7",
-    "#ffddbb",
-    "#ffdfbf",
-    "#ffe1c3",
-    "#ffe3c6",
-    "#ffe4ca",
-    "#ffe6ce",
-    "#ffe8d2",
-    "#ffebd7",
-    "#ffeddb",
-    "#ffefdf",
-    "#fff1e3",
-    "#fff3e6",
-    "#fff4ea",
-    "#fff6ee",
-    "#fff9f3",
-    "#fffbf7",
-    "#fffdfb",
-    "#ffffff"
-  ],
-  "gist_ncar": [
-    "#000080",
-    "#000776",
-    "#000e6d",
-    "#001563",
-    "#001d5a",
-    "#002450",
-    "#002b47",
-    "#00333e",
-    "#003a34",
-    "#00412b",
-    "#004821",
-    "#005018",
-    "#00570f",
-    "#005e05",
-    "#005816",
-    "#005126",
-    "#004a37",
-    "#004348",
-    "#003d58",
-    "#003669",
-    "#002f79",
-    "#00288a",
-    "#00219b",
-    "#001bab",
-    "#0014bc",
-    "#000dcd",
-    "#0006dd",
-    "#0000ee",
-    "#000eff",
-    "#001cff",
-    "#002aff",
-    "#0038ff",
-    "#0046ff",
-    "#0054ff",
-    "#0062ff",
-    "#0070ff",
-    "#007fff",
-    "#008dff",
-    "#009bff",
-    "#00a9ff",
-    "#00b7ff",
-    "#00c0ff",
-    "#00c5ff",
-    "#00caff",
-    "#00ceff",
-    "#00d2ff",
-    "#00d7ff",
-    "#00dbff",
-    "#00e0ff",
-    "#00e4ff",
-    "#00e8ff",
-    "#00edff",
-    "#00f1fe",
-    "#00f6f8",
-    "#00faf1",
-    "#00feeb",
-    "#00fee4",
-    "#00fede",
-    "#00fdd7",
-    "#00fdd1",
-    "#00fcca",
-    "#00fcc3",
-    "#00fbbd",
-    "#00fbb6",
-    "#00fab0",
-    "#00faa9",
-    "#00faa3",
-    "#00fa9c",
-    "#00fa92",
-    "#00fa87",
-    "#00fa7d",
-    "#00fa72",
-    "#00fb68",
-    "#00fb5d",
-    "#00fc53",
-    "#00fc49",
-    "#00fc3e",
-    "#00fd34",
-    "#00fd29",
-    "#00fe1f",
-    "#06fe14",
-    "#0cfe0a",
-    "#13fb00",
-    "#19f700",
-    "#1ff300",
-    "#26ef00",
-    "#2cec00",
-    "#32e800",
-    "#39e400",
-    "#3fe000",
-    "#46dd00",
-    "#4cd900",
-    "#52d500",
-    "#59d100",
-    "#5fce00",
-    "#65d100",
-    "#67d400",
-    "#69d700",
-    "#6bdb00",
-    "#6dde00",
-    "#6fe100",
-    "#71e400",
-    "#73e800",
-    "#75eb00",
-    "#77ee00",
-    "#79f100",
-    "#7bf500",
-    "#7df803",
-    "#7ffb07",
-    "#84fe0b",
-    "#88ff0f",
-    "#8dff13",
-    "#91ff17",
-    "#96ff1b",
-    "#9aff1f",
-    "#9fff23",
-    "#a4ff27",
-    "#a8ff2b",
-    "#adff2f",
-    "#b1ff33",
-    "#b6ff37",
-    "#baff3b",
-    "#bfff37",
-    "#c3ff33",
-    "#c8ff2f",
-    "#ccff2b",
-    "#d1ff27",
-    "#d6ff23",
-    "#daff1f",
-    "#dfff1b",
-    "#e3ff17",
-    "#e8ff13",
-    "#ecff0f",
-    "#f1ff0b",
-    "#f5fc07",
-    "#fafa03",
-    "#fff700",
-    "#fff500",
-    "#fff200",
-    "#fff000",
-    "#ffed00",
-    "#ffeb00",
-    "#ffe800",
-    "#ffe600",
-    "#ffe300",
-    "#ffe100",
-    "#ffde00",
-    "#ffdc00",
-    "#ffda00",
-    "#ffd701",
-    "#ffd502",
-    "#ffd203",
-    "#ffd004",
-    "#ffcd05",
-    "#ffcb06",
-    "#ffc807",
-    "#ffc608",
-    "#ffc309",
-    "#ffc10a",
-    "#ffbe0b",
-    "#ffbc0c",
-    "#ffb90d",
-    "#ffb10d",
-    "#ffa90c",
-    "#ffa10b",
-    "#ff990a",
-    "#ff9109",
-    "#ff8808",
-    "#ff8007",
-    "#ff7806",
-    "#ff7005",
-    "#ff6804",
-    "#ff5f03",
-    "#ff5702",
-    "#ff4f01",
-    "#ff4700",
-    "#ff4200",
-    "#ff3d00",
-    "#ff3900",
-    "#ff3400",
-    "#ff2f00",
-    "#ff2a00",
-    "#ff2600",
-    "#ff2100",
-    "#ff1c00",
-    "#ff1700",
-    "#ff1300",
-    "#ff0e00",
-    "#ff0900",
-    "#ff0411",
-    "#ff0023",
-    "#ff0035",
-    "#ff0046",
-    "#ff0058",
-    "#ff006a",
-    "#ff007b",
-    "#ff008d",
-    "#ff009f",
-    "#ff00b1",
-    "#ff00c2",
-    "#ff00d4",
-    "#ff00e6",
-    "#ff00f8",
-    "#f803fb",
-    "#f106ff",
-    "#ea0aff",
-    "#e30dff",
-    "#dc11ff",
-    "#d514ff",
-    "#ce18ff",
-    "#c71bff",
-    "#c11eff",
-    "#ba22ff",
-    "#b325ff",
-    "#ac29ff",
-    "#a52cfe",
-    "#9e32fd",
-    "#a438fc",
-    "#aa3efb",
-    "#b044fa",
-    "#b64af8",
-    "#bc50f7",
-    "#c256f6",
-    "#c75cf5",
-    "#cd61f4",
-    "#d367f2",
-    "#d96df1",
-    "#df73f0",
-    "#e579ef",
-    "#eb7fee",
-    "#ec84ee",
-    "#ec88ef",
-    "#ed8df0",
-    "#ee92f0",
-    "#ef96f1",
-    "#ef9bf1",
-    "#f09ff2",
-    "#f1a4f3",
-    "#f1a9f3",
-    "#f2adf4",
-    "#f3b2f4",
-    "#f4b7f5",
-    "#f4bbf6",
-    "#f5c0f6",
-    "#f6c5f7",
-    "#f6c9f7",
-    "#f7cef8",
-    "#f8d2f9",
-    "#f9d7f9",
-    "#f9dcfa",
-    "#fae0fa",
-    "#fbe5fb",
-    "#fbeafc",
-    "#fceefc",
-    "#fdf3fd",
-    "#fef7fe"
-  ],
-  "gist_stern": [
-    "#000000",
-    "#120102",
-    "#240204",
-    "#360306",
-    "#490408",
-    "#5b050a",
-    "#6d060c",
-    "#7f070e",
-    "#920810",
-    "#a40912",
-    "#b60a14",
-    "#c90b16",
-    "#db0c18",
-    "#ed0d1a",
-    "#fe0e1c",
-    "#f90f1e",
-    "#f41020",
-    "#ef1122",
-    "#ea1224",
-    "#e51326",
-    "#e01428",
-    "#db152a",
-    "#d6162c",
-    "#d1172e",
-    "#cc1830",
-    "#c71932",
-    "#c21a34",
-    "#bd1b36",
-    "#b81c38",
-    "#b41d3a",
-    "#af1e3c",
-    "#aa1f3e",
-    "#a52040",
-    "#a02041",
-    "#9b2244",
-    "#962346",
-    "#912448",
-    "#8c2449",
-    "#87264c",
-    "#82274e",
-    "#7d2850",
-    "#782851",
-    "#732a54",
-    "#6e2b56",
-    "#692c58",
-    "#642c59",
-    "#5f2e5c",
-    "#5a2f5e",
-    "#553060",
-    "#503061",
-    "#4b3264",
-    "#463366",
-    "#413468",
-    "#3c3469",
-    "#37366c",
-    "#32376e",
-    "#2d3870",
-    "#283871",
-    "#233a74",
-    "#1e3b76",
-    "#193c78",
-    "#143c79",
-    "#0f3e7c",
-    "#0a3f7e",
-    "#404080",
-    "#414182",
-    "#414183",
-    "#434386",
-    "#444488",
-    "#45458a",
-    "#46468c",
-    "#47478e",
-    "#484890",
-    "#494992",
-    "#494993",
-    "#4b4b96",
-    "#4c4c98",
-    "#4d4d9a",
-    "#4e4e9c",
-    "#4f4f9e",
-    "#5050a0",
-    "#5151a2",
-    "#5151a3",
-    "#5353a6",
-    "#5454a8",
-    "#5555aa",
-    "#5656ac",
-    "#5757ae",
-    "#5858b0",
-    "#5959b2",
-    "#5959b3",
-    "#5b5bb6",
-    "#5c5cb8",
-    "#5d5dba",
-    "#5e5ebc",
-    "#5f5fbe",
-    "#6060c0",
-    "#6161c2",
-    "#6161c3",
-    "#6363c6",
-    "#6464c8",
-    "#6565ca",
-    "#6666cc",
-    "#6767ce",
-    "#6868d0",
-    "#6969d2",
-    "#6969d3",
-    "#6b6bd6",
-    "#6c6cd8",
-    "#6d6dda",
-    "#6e6edc",
-    "#6f6fde",
-    "#7070e0",
-    "#7171e2",
-    "#7171e3",
-    "#7373e6",
-    "#7474e8",
-    "#7575ea",
-    "#7676ec",
-    "#7777ee",
-    "#7878f0",
-    "#7979f2",
-    "#7979f3",
-    "#7b7bf6",
-    "#7c7cf8",
-    "#7d7dfa",
-    "#7e7efc",
-    "#7f7ffe",
-    "#8080fc",
-    "#8181f8",
-    "#8282f4",
-    "#8383f0",
-    "#8383eb",
-    "#8485e7",
-    "#8686e3",
-    "#8787df",
-    "#8888da",
-    "#8989d6",
-    "#8a8ad2",
-    "#8b8bce",
-    "#8c8cc9",
-    "#8d8dc5",
-    "#8e8ec1",
-    "#8f8fbd",
-    "#9090b8",
-    "#9191b4",
-    "#9292b0",
-    "#9393ac",
-    "#9393a7",
-    "#9595a3",
-    "#96969f",
-    "#97979a",
-    "#989896",
-    "#999992",
-    "#9a9a8e",
-    "#9b9b89",
-    "#9c9c85",
-    "#9d9d81",
-    "#9e9e7d",
-    "#9f9f78",
-    "#a0a074",
-    "#a1a170",
-    "#a2a26c",
-    "#a3a367",
-    "#a3a363",
-    "#a5a55f",
-    "#a6a65b",
-    "#a7a756",
-    "#a8a852",
-    "#a9a94e",
-    "#aaaa4a",
-    "#abab45",
-    "#acac41",
-    "#adad3d",
-    "#aeae39",
-    "#afaf34",
-    "#b0b030",
-    "#b1b12c",
-    "#b2b228",
-    "#b3b323",
-    "#b3b31f",
-    "#b5b51b",
-    "#b6b617",
-    "#b7b712",
-    "#b8b80e",
-    "#b9b90a",
-    "#baba06",
-    "#bbbb01",
-    "#bcbc02",
-    "#bdbd05",
-    "#bebe09",
-    "#bfbf0d",
-    "#c0c011",
-    "#c1c115",
-    "#c2c218",
-    "#c3c31c",
-    "#c3c320",
-    "#c4c524",
-    "#c5c627",
-    "#c7c72b",
-    "#c8c82f",
-    "#c9c933",
-    "#caca37",
-    "#cbcb3a",
-    "#cbcc3e",
-    "#cdcd42",
-    "#cece46",
-    "#cfcf49",
-    "#d0d04d",
-    "#d1d151",
-    "#d2d255",
-    "#d3d358",
-    "#d3d35c",
-    "#d5d560",
-    "#d6d664",
-    "#d7d768",
-    "#d8d86b",
-    "#d9d96f",
-    "#dada73",
-    "#dbdb77",
-    "#dcdc7a",
-    "#dddd7e",
-    "#dede82",
-    "#dfdf86",
-    "#e0e08a",
-    "#e1e18d",
-    "#e2e291",
-    "#e3e395",
-    "#e3e399",
-    "#e5e59c",
-    "#e6e6a0",
-    "#e7e7a4",
-    "#e8e8a8",
-    "#e9e9ab",
-    "#eaeaaf",
-    "#ebebb3",
-    "#ececb7",
-    "#ededbb",
-    "#eeeebe",
-    "#efefc2",
-    "#f0f0c6",
-    "#f1f1ca",
-    "#f2f2cd",
-    "#f3f3d1",
-    "#f3f3d5",
-    "#f4f5d9",
-    "#f5f6dd",
-    "#f7f7e0",
-    "#f8f8e4",
-    "#f9f9e8",
-    "#fafaec",
-    "#fbfbef",
-    "#fbfcf3",
-    "#fdfdf7",
-    "#fefefb",
-    "#ffffff"
-  ],
-  "gist_yarg": [
-    "#ffffff",
-    "#fefefe",
-    "#fdfdfd",
-    "#fcfcfc",
-    "#fbfbfb",
-    "#fafafa",
-    "#f9f9f9",
-    "#f8f8f8",
-    "#f7f7f7",
-    "#f6f6f6",
-    "#f5f5f5",
-    "#f4f4f4",
-    "#f3f3f3",
-    "#f2f2f2",
-    "#f1f1f1",
-    "#f0f0f0",
-    "#efefef",
-    "#eeeeee",
-    "#ededed",
-    "#ececec",
-    "#ebebeb",
-    "#eaeaea",
-    "#e9e9e9",
-    "#e8e8e8",
-    "#e7e7e7",
-    "#e6e6e6",
-    "#e5e5e5",
-    "#e4e4e4",
-    "#e3e3e3",
-    "#e2e2e2",
-    "#e1e1e1",
-    "#e0e0e0",
-    "#dfdfdf",
-    "#dedede",
-    "#dddddd",
-    "#dcdcdc",
-    "#dbdbdb",
-    "#dadada",
-    "#d9d9d9",
-    "#d8d8d8",
-    "#d7d7d7",
-    "#d6d6d6",
-    "#d5d5d5",
-    "#d3d3d3",
-    "#d3d3d3",
-    "#d2d2d2",
-    "#d1d1d1",
-    "#d0d0d0",
-    "#cfcfcf",
-    "#cecece",
-    "#cdcdcd",
-    "#cccccc",
-    "#cbcbcb",
-    "#cacaca",
-    "#c9c9c9",
-    "#c8c8c8",
-    "#c7c7c7",
-    "#c6c6c6",
-    "#c5c5c5",
-    "#c3c3c3",
-    "#c3c3c3",
-    "#c2c2c2",
-    "#c1c1c1",
-    "#c0c0c0",
-    "#bfbfbf",
-    "#bebebe",
-    "#bdbdbd",
-    "#bcbcbc",
-    "#bbbbbb",
-    "#bababa",
-    "#b9b9b9",
-    "#b8b8b8",
-    "#b7b7b7",
-    "#b6b6b6",
-    "#b5b5b5",
-    "#b3b3b3",
-    "#b3b3b3",
-    "#b2b2b2",
-    "#b1b1b1",
-    "#b0b0b0",
-    "#afafaf",
-    "#aeaeae",
-    "#adadad",
-    "#acacac",
-    "#ababab",
-    "#aaaaaa",
-    "#a9a9a9",
-    "#a8a8a8",
-    "#a7a7a7",
-    "#a6a6a6",
-    "#a5a5a5",
-    "#a3a3a3",
-    "#a3a3a3",
-    "#a2a2a2",
-    "#a1a1a1",
-    "#a0a0a0",
-    "#9f9f9f",
-    "#9e9e9e",
-    "#9d9d9d",
-    "#9c9c9c",
-    "#9b9b9b",
-    "#9a9a9a",
-    "#999999",
-    "#989898",
-    "#979797",
-    "#969696",
-    "#959595",
-    "#939393",
-    "#939393",
-    "#929292",
-    "#919191",
-    "#909090",
-    "#8f8f8f",
-    "#8e8e8e",
-    "#8d8d8d",
-    "#8c8c8c",
-    "#8b8b8b",
-    "#8a8a8a",
-    "#898989",
-    "#888888",
-    "#878787",
-    "#868686",
-    "#858585",
-    "#838383",
-    "#838383",
-    "#828282",
-    "#818181",
-    "#808080",
-    "#7f7f7f",
-    "#7e7e7e",
-    "#7d7d7d",
-    "#7c7c7c",
-    "#7b7b7b",
-    "#797979",
-    "#797979",
-    "#787878",
-    "#777777",
-    "#767676",
-    "#757575",
-    "#747474",
-    "#727272",
-    "#717171",
-    "#717171",
-    "#707070",
-    "#6f6f6f",
-    "#6e6e6e",
-    "#6d6d6d",
-    "#6c6c6c",
-    "#6b6b6b",
-    "#696969",
-    "#696969",
-    "#686868",
-    "#676767",
-    "#666666",
-    "#656565",
-    "#646464",
-    "#626262",
-    "#616161",
-    "#616161",
-    "#606060",
-    "#5f5f5f",
-    "#5e5e5e",
-    "#5d5d5d",
-    "#5c5c5c",
-    "#5b5b5b",
-    "#595959",
-    "#595959",
-    "#585858",
-    "#575757",
-    "#565656",
-    "#555555",
-    "#545454",
-    "#525252",
-    "#515151",
-    "#515151",
-    "#505050",
-    "#4f4f4f",
-    "#4e4e4e",
-    "#4d4d4d",
-    "#4c4c4c",
-    "#4b4b4b",
-    "#494949",
-    "#494949",
-    "#484848",
-    "#474747",
-    "#464646",
-    "#454545",
-    "#444444",
-    "#424242",
-    "#414141",
-    "#414141",
-    "#404040",
-    "#3f3f3f",
-    "#3e3e3e",
-    "#3d3d3d",
-    "#3c3c3c",
-    "#3b3b3b",
-    "#393939",
-    "#383838",
-    "#383838",
-    "#373737",
-    "#363636",
-    "#353535",
-    "#343434",
-    "#323232",
-    "#313131",
-    "#303030",
-    "#303030",
-    "#2f2f2f",
-    "#2e2e2e",
-    "#2d2d2d",
-    "#2c2c2c",
-    "#2b2b2b",
-    "#292929",
-    "#282828",
-    "#282828",
-    "#272727",
-    "#262626",
-    "#252525",
-    "#242424",
-    "#222222",
-    "#212121",
-    "#202020",
-    "#202020",
-    "#1f1f1f",
-    "#1e1e1e",
-    "#1d1d1d",
-    "#1c1c1c",
-    "#1b1b1b",
-    "#191919",
-    "#181818",
-    "#181818",
-    "#171717",
-    "#161616",
-    "#151515",
-    "#141414",
-    "#121212",
-    "#111111",
-    "#101010",
-    "#101010",
-    "#0f0f0f",
-    "#0e0e0e",
-    "#0d0d0d",
-    "#0c0c0c",
-    "#0b0b0b",
-    "#090909",
-    "#080808",
-    "#080808",
-    "#070707",
-    "#060606",
-    "#050505",
-    "#040404",
-    "#020202",
-    "#010101",
-    "#000000",
-    "#000000"
-  ],
-  "gnuplot": [
-    "#000000",
-    "#0f0006",
-    "#16000c",
-    "#1b0012",
-    "#1f0019",
-    "#23001f",
-    "#270025",
-    "#2a002b",
-    "#2d0031",
-    "#2f0038",
-    "#32003e",
-    "#340044",
-    "#37004a",
-    "#390050",
-    "#3b0056",
-    "#3d005c",
-    "#3f0061",
-    "#410067",
-    "#43006d",
-    "#450073",
-    "#470078",
-    "#49007e",
-    "#4a0083",
-    "#4c0088",
-    "#4e008e",
-    "#4f0093",
-    "#510098",
-    "#52009d",
-    "#5400a2",
-    "#5500a7",
-    "#5700ab",
-    "#5800b0",
-    "#5a00b4",
-    "#5b00b9",
-    "#5d00bd",
-    "#5e00c1",
-    "#5f00c5",
-    "#6100c9",
-    "#6200cd",
-    "#6300d1",
-    "#6400d4",
-    "#6601d7",
-    "#6701db",
-    "#6801de",
-    "#6901e1",
-    "#6b01e4",
-    "#6c01e6",
-    "#6d01e9",
-    "#6e01ec",
-    "#6f01ee",
-    "#7001f0",
-    "#7202f2",
-    "#7302f4",
-    "#7402f6",
-    "#7502f7",
-    "#7602f9",
-    "#7702fa",
-    "#7802fb",
-    "#7903fc",
-    "#7a03fd",
-    "#7b03fd",
-    "#7c03fe",
-    "#7d03fe",
-    "#7e03fe",
-    "#7f04fe",
-    "#8004fe",
-    "#8104fe",
-    "#8204fe",
-    "#8304fd",
-    "#8405fc",
-    "#8505fb",
-    "#8605fa",
-    "#8705f9",
-    "#8805f8",
-    "#8906f6",
-    "#8a06f5",
-    "#8b06f3",
-    "#8c07f1",
-    "#8d07ef",
-    "#8d07ed",
-    "#8e07ea",
-    "#8f08e8",
-    "#9008e5",
-    "#9108e2",
-    "#9209df",
-    "#9309dc",
-    "#9409d9",
-    "#940ad6",
-    "#950ad2",
-    "#960acf",
-    "#970bcb",
-    "#980bc7",
-    "#990bc3",
-    "#990cbf",
-    "#9a0cbb",
-    "#9b0db7",
-    "#9c0db2",
-    "#9d0eae",
-    "#9e0ea9",
-    "#9e0ea4",
-    "#9f0f9f",
-    "#a00f9a",
-    "#a11095",
-    "#a21090",
-    "#a2118b",
-    "#a31186",
-    "#a41280",
-    "#a5127b",
-    "#a51375",
-    "#a61370",
-    "#a7146a",
-    "#a81564",
-    "#a8155f",
-    "#a91659",
-    "#aa1653",
-    "#ab174d",
-    "#ab1847",
-    "#ac1841",
-    "#ad193b",
-    "#ae1935",
-    "#ae1a2e",
-    "#af1b28",
-    "#b01b22",
-    "#b11c1c",
-    "#b11d15",
-    "#b21e0f",
-    "#b31e09",
-    "#b31f03",
-    "#b42000",
-    "#b52100",
-    "#b62100",
-    "#b62200",
-    "#b72300",
-    "#b82400",
-    "#b82500",
-    "#b92500",
-    "#ba2600",
-    "#ba2700",
-    "#bb2800",
-    "#bc2900",
-    "#bc2a00",
-    "#bd2b00",
-    "#be2c00",
-    "#be2c00",
-    "#bf2d00",
-    "#c02e00",
-    "#c02f00",
-    "#c13000",
-    "#c23100",
-    "#c23200",
-    "#c33300",
-    "#c43400",
-    "#c43600",
-    "#c53700",
-    "#c63800",
-    "#c63900",
-    "#c73a00",
-    "#c83b00",
-    "#c83c00",
-    "#c93d00",
-    "#c93e00",
-    "#ca4000",
-    "#cb4100",
-    "#cb4200",
-    "#cc4300",
-    "#cd4500",
-    "#cd4600",
-    "#ce4700",
-    "#ce4800",
-    "#cf4a00",
-    "#d04b00",
-    "#d04c00",
-    "#d14e00",
-    "#d24f00",
-    "#d25100",
-    "#d35200",
-    "#d35300",
-    "#d45500",
-    "#d55600",
-    "#d55800",
-    "#d65900",
-    "#d65b00",
-    "#d75c00",
-    "#d85e00",
-    "#d85f00",
-    "#d96100",
-    "#d96200",
-    "#da6400",
-    "#da6600",
-    "#db6700",
-    "#dc6900",
-    "#dc6b00",
-    "#dd6c00",
-    "#dd6e00",
-    "#de7000",
-    "#de7200",
-    "#df7300",
-    "#e07500",
-    "#e07700",
-    "#e17900",
-    "#e17b00",
-    "#e27c00",
-    "#e27e00",
-    "#e38000",
-    "#e48200",
-    "#e48400",
-    "#e58600",
-    "#e58800",
-    "#e68a00",
-    "#e68c00",
-    "#e78e00",
-    "#e79000",
-    "#e89200",
-    "#e99400",
-    "#e99600",
-    "#ea9800",
-    "#ea9a00",
-    "#eb9d00",
-    "#eb9f00",
-    "#eca100",
-    "#eca300",
-    "#eda500",
-    "#eda800",
-    "#eeaa00",
-    "#eeac00",
-    "#efaf00",
-    "#f0b100",
-    "#f0b300",
-    "#f1b600",
-    "#f1b800",
-    "#f2bb00",
-    "#f2bd00",
-    "#f3c000",
-    "#f3c200",
-    "#f4c500",
-    "#f4c700",
-    "#f5ca00",
-    "#f5cc00",
-    "#f6cf00",
-    "#f6d100",
-    "#f7d400",
-    "#f7d700",
-    "#f8d900",
-    "#f8dc00",
-    "#f9df00",
-    "#f9e200",
-    "#fae400",
-    "#fae700",
-    "#fbea00",
-    "#fbed00",
-    "#fcf000",
-    "#fcf300",
-    "#fdf600",
-    "#fdf900",
-    "#fefc00",
-    "#ffff00"
-  ],
-  "gnuplot2": [
-    "#000000",
-    "#000004",
-    "#000008",
-    "#00000c",
-    "#000010",
-    "#000014",
-    "#000018",
-    "#00001c",
-    "#000020",
-    "#000024",
-    "#000028",
-    "#00002c",
-    "#000030",
-    "#000034",
-    "#000038",
-    "#00003c",
-    "#000040",
-    "#000044",
-    "#000048",
-    "#00004c",
-    "#000050",
-    "#000054",
-    "#000058",
-    "#00005c",
-    "#000060",
-    "#000064",
-    "#000068",
-    "#00006c",
-    "#000070",
-    "#000074",
-    "#000078",
-    "#00007c",
-    "#000080",
-    "#000083",
-    "#000088",
-    "#00008c",
-    "#000090",
-    "#000093",
-    "#000098",
-    "#00009c",
-    "#0000a0",
-    "#0000a3",
-    "#0000a8",
-    "#0000ac",
-    "#0000b0",
-    "#0000b3",
-    "#0000b8",
-    "#0000bc",
-    "#0000c0",
-    "#0000c3",
-    "#0000c8",
-    "#0000cc",
-    "#0000d0",
-    "#0000d3",
-    "#0000d8",
-    "#0000dc",
-    "#0000e0",
-    "#0000e3",
-    "#0000e8",
-    "#0000ec",
-    "#0000f0",
-    "#0000f3",
-    "#0000f8",
-    "#0000fc",
-    "#0000ff",
-    "#0300ff",
-    "#0700ff",
-    "#0a00ff",
-    "#0d00ff",
-    "#1000ff",
-    "#1300ff",
-    "#1600ff",
-    "#1900ff",
-    "#1c00ff",
-    "#2000ff",
-    "#2300ff",
-    "#2600ff",
-    "#2900ff",
-    "#2c00ff",
-    "#2f00ff",
-    "#3200ff",
-    "#3500ff",
-    "#3900ff",
-    "#3c00ff",
-    "#3f00ff",
-    "#4200ff",
-    "#4500ff",
-    "#4800ff",
-    "#4b00ff",
-    "#4e00ff",
-    "#5200ff",
-    "#5500ff",
-    "#5800ff",
-    "#5b00ff",
-    "#5e00ff",
-    "#6100ff",
-    "#6400ff",
-    "#6700ff",
-    "#6b00ff",
-    "#6e00ff",
-    "#7100ff",
-    "#7400ff",
-    "#7700ff",
-    "#7a00ff",
-    "#7d00ff",
-    "#8000ff",
-    "#8400ff",
-    "#8700ff",
-    "#8a01fd",
-    "#8d03fb",
-    "#9005f9",
-    "#9307f7",
-    "#9609f5",
-    "#990bf3",
-    "#9d0df1",
-    "#a00fef",
-    "#a311ed",
-    "#a613eb",
-    "#a915e9",
-    "#ac17e7",
-    "#af19e5",
-    "#b21be3",
-    "#b61de1",
-    "#b91fdf",
-    "#bc21dd",
-    "#bf23db",
-    "#c225d9",
-    "#c527d7",
-    "#c829d5",
-    "#cb2bd3",
-    "#cf2dd1",
-    "#d22fcf",
-    "#d531cd",
-    "#d833cb",
-    "#db35c9",
-    "#de37c7",
-    "#e139c5",
-    "#e43bc3",
-    "#e83dc1",
-    "#eb3fbf",
-    "#ee41bd",
-    "#f143bb",
-    "#f445b9",
-    "#f747b7",
-    "#fa49b5",
-    "#fd4bb3",
-    "#ff4db1",
-    "#ff4faf",
-    "#ff51ad",
-    "#ff53ab",
-    "#ff55a9",
-    "#ff57a7",
-    "#ff59a5",
-    "#ff5ba3",
-    "#ff5da1",
-    "#ff5f9f",
-    "#ff619d",
-    "#ff639b",
-    "#ff6599",
-    "#ff6797",
-    "#ff6995",
-    "#ff6b93",
-    "#ff6d91",
-    "#ff6f8f",
-    "#ff718d",
-    "#ff738b",
-    "#ff7589",
-    "#ff7787",
-    "#ff7985",
-    "#ff7b83",
-    "#ff7d81",
-    "#ff7f7f",
-    "#ff817d",
-    "#ff837b",
-    "#ff8579",
-    "#ff8777",
-    "#ff8975",
-    "#ff8b73",
-    "#ff8d71",
-    "#ff8f6f",
-    "#ff916d",
-    "#ff936b",
-    "#ff9569",
-    "#ff9767",
-    "#ff9965",
-    "#ff9b63",
-    "#ff9d61",
-    "#ff9f5f",
-    "#ffa15d",
-    "#ffa35b",
-    "#ffa559",
-    "#ffa757",
-    "#ffa955",
-    "#ffab53",
-    "#ffad51",
-    "#ffaf4f",
-    "#ffb14d",
-    "#ffb34b",
-    "#ffb549",
-    "#ffb747",
-    "#ffb945",
-    "#ffbb43",
-    "#ffbd41",
-    "#ffbf3f",
-    "#ffc13d",
-    "#ffc33b",
-    "#ffc539",
-    "#ffc737",
-    "#ffc935",
-    "#ffcb33",
-    "#ffcd31",
-    "#ffcf2f",
-    "#ffd12d",
-    "#ffd32b",
-    "#ffd529",
-    "#ffd727",
-    "#ffd925",
-    "#ffdb23",
-    "#ffdd21",
-    "#ffdf1f",
-    "#ffe11d",
-    "#ffe31b",
-    "#ffe519",
-    "#ffe717",
-    "#ffe915",
-    "#ffeb13",
-    "#ffed11",
-    "#ffef0f",
-    "#fff10d",
-    "#fff30b",
-    "#fff509",
-    "#fff707",
-    "#fff905",
-    "#fffb03",
-    "#fffd01",
-    "#ffff04",
-    "#ffff11",
-    "#ffff1d",
-    "#ffff2a",
-    "#ffff36",
-    "#ffff43",
-    "#ffff4f",
-    "#ffff5c",
-    "#ffff68",
-    "#ffff75",
-    "#ffff82",
-    "#ffff8e",
-    "#ffff9a",
-    "#ffffa7",
-    "#ffffb3",
-    "#ffffc0",
-    "#ffffcc",
-    "#ffffd9",
-    "#ffffe6",
-    "#fffff2",
-    "#ffffff"
-  ],
-  "hot": [
-    "#0a0000",
-    "#0d0000",
-    "#0f0000",
-    "#120000",
-    "#150000",
-    "#170000",
-    "#1a0000",
-    "#1c0000",
-    "#1f0000",
-    "#220000",
-    "#240000",
-    "#270000",
-    "#2a0000",
-    "#2c0000",
-    "#2f0000",
-    "#310000",
-    "#340000",
-    "#370000",
-    "#390000",
-    "#3c0000",
-    "#3f0000",
-    "#410000",
-    "#440000",
-    "#460000",
-    "#490000",
-    "#4c0000",
-    "#4e0000",
-    "#510000",
-    "#540000",
-    "#560000",
-    "#590000",
-    "#5b0000",
-    "#5e0000",
-    "#610000",
-    "#630000",
-    "#660000",
-    "#690000",
-    "#6b0000",
-    "#6e0000",
-    "#700000",
-    "#730000",
-    "#760000",
-    "#780000",
-    "#7b0000",
-    "#7e0000",
-    "#800000",
-    "#830000",
-    "#850000",
-    "#880000",
-    "#8b0000",
-    "#8d0000",
-    "#900000",
-    "#930000",
-    "#950000",
-    "#980000",
-    "#9a0000",
-    "#9d0000",
-    "#a00000",
-    "#a20000",
-    "#a50000",
-    "#a80000",
-    "#aa0000",
-    "#ad0000",
-    "#af0000",
-    "#b20000",
-    "#b50000",
-    "#b70000",
-    "#ba0000",
-    "#bd0000",
-    "#bf0000",
-    "#c20000",
-    "#c40000",
-    "#c70000",
-    "#ca0000",
-    "#cc0000",
-    "#cf0000",
-    "#d20000",
-    "#d40000",
-    "#d70000",
-    "#d90000",
-    "#dc0000",
-    "#df0000",
-    "#e10000",
-    "#e40000",
-    "#e70000",
-    "#e90000",
-    "#ec0000",
-    "#ee0000",
-    "#f10000",
-    "#f40000",
-    "#f60000",
-    "#f90000",
-    "#fc0000",
-    "#fe0000",
-    "#ff0200",
-    "#ff0500",
-    "#ff0700",
-    "#ff0a00",
-    "#ff0c00",
-    "#ff0f00",
-    "#ff1200",
-    "#ff1400",
-    "#ff1700",
-    "#ff1a00",
-    "#ff1c00",
-    "#ff1f00",
-    "#ff2100",
-    "#ff2400",
-    "#ff2700",
-    "#ff2900",
-    "#ff2c00",
-    "#ff2f00",
-    "#ff3100",
-    "#ff3400",
-    "#ff3600",
-    "#ff3900",
-    "#ff3c00",
-    "#ff3e00",
-    "#ff4100",
-    "#ff4400",
-    "#ff4600",
-    "#ff4900",
-    "#ff4b00",
-    "#ff4e00",
-    "#ff5100",
-    "#ff5300",
-    "#ff5600",
-    "#ff5900",
-    "#ff5b00",
-    "#ff5e00",
-    "#ff6000",
-    "#ff6300",
-    "#ff6600",
-    "#ff6800",
-    "#ff6b00",
-    "#ff6e00",
-    "#ff7000",
-    "#ff7300",
-    "#ff7500",
-    "#ff7800",
-    "#ff7b00",
-    "#ff7d00",
-    "#ff8000",
-    "#ff8300",
-    "#ff8500",
-    "#ff8800",
-    "#ff8a00",
-    "#ff8d00",
-    "#ff9000",
-    "#ff9200",
-    "#ff9500",
-    "#ff9700",
-    "#ff9a00",
-    "#ff9d00",
-    "#ff9f00",
-    "#ffa200",
-    "#ffa500",
-    "#ffa700",
-    "#ffaa00",
-    "#ffac00",
-    "#ffaf00",
-    "#ffb200",
-    "#ffb400",
-    "#ffb700",
-    "#ffba00",
-    "#ffbc00",
-    "#ffbf00",
-    "#ffc100",
-    "#ffc400",
-    "#ffc700",
-    "#ffc900",
-    "#ffcc00",
-    "#ffcf00",
-    "#ffd100",
-    "#ffd400",
-    "#ffd600",
-    "#ffd900",
-    "#ffdc00",
-    "#ffde00",
-    "#ffe100",
-    "#ffe400",
-    "#ffe600",
-    "#ffe900",
-    "#ffeb00",
-    "#ffee00",
-    "#fff100",
-    "#fff300",
-    "#fff600",
-    "#fff900",
-    "#fffb00",
-    "#fffe00",
-    "#ffff02",
-    "#ffff06",
-    "#ffff0a",
-    "#ffff0e",
-    "#ffff12",
-    "#ffff16",
-    "#ffff1a",
-    "#ffff1e",
-    "#ffff22",
-    "#ffff26",
-    "#ffff2a",
-    "#ffff2e",
-    "#ffff32",
-    "#ffff36",
-    "#ffff3a",
-    "#ffff3e",
-    "#ffff41",
-    "#ffff45",
-    "#ffff49",
-    "#ffff4d",
-    "#ffff51",
-    "#ffff55",
-    "#ffff59",
-    "#ffff5d",
-    "#ffff61",
-    "#ffff65",
-    "#ffff69",
-    "#ffff6d",
-    "#ffff71",
-    "#ffff75",
-    "#ffff79",
-    "#ffff7d",
-    "#ffff80",
-    "#ffff84",
-    "#ffff88",
-    "#ffff8c",
-    "#ffff90",
-    "#ffff94",
-    "#ffff98",
-    "#ffff9c",
-    "#ffffa0",
-    "#ffffa4",
-    "#ffffa8",
-    "#ffffac",
-    "#ffffb0",
-    "#ffffb4",
-    "#ffffb8",
-    "#ffffbc",
-    "#ffffbf",
-    "#ffffc3",
-    "#ffffc7",
-    "#ffffcb",
-    "#ffffcf",
-    "#ffffd3",
-    "#ffffd7",
-    "#ffffdb",
-    "#ffffdf",
-    "#ffffe3",
-    "#ffffe7",
-    "#ffffeb",
-    "#ffffef",
-    "#fffff3",
-    "#fffff7",
-    "#fffffb",
-    "#ffffff"
-  ],
-  "hsv": [
-    "#ff0000",
-    "#ff0500",
-    "#ff0b00",
-    "#ff1100",
-    "#ff1700",
-    "#ff1d00",
-    "#ff2300",
-    "#ff2900",
-    "#ff2f00",
-    "#ff3500",
-    "#ff3b00",
-    "#ff4000",
-    "#ff4600",
-    "#ff4c00",
-    "#ff5200",
-    "#ff5800",
-    "#ff5e00",
-    "#ff6400",
-    "#ff6a00",
-    "#ff7000",
-    "#ff7600",
-    "#ff7c00",
-    "#ff8100",
-    "#ff8700",
-    "#ff8d00",
-    "#ff9300",
-    "#ff9900",
-    "#ff9f00",
-    "#ffa500",
-    "#ffab00",
-    "#ffb100",
-    "#ffb700",
-    "#ffbd00",
-    "#ffc200",
-    "#ffc800",
-    "#ffce00",
-    "#ffd400",
-    "#ffda00",
-    "#ffe000",
-    "#ffe600",
-    "#ffec00",
-    "#fdf100",
-    "#fbf500",
-    "#faf900",
-    "#f8fc00",
-    "#f4ff00",
-    "#eeff00",
-    "#e8ff00",
-    "#e2ff00",
-    "#dcff00",
-    "#d6ff00",
-    "#d0ff00",
-    "#caff00",
-    "#c4ff00",
-    "#bfff00",
-    "#b9ff00",
-    "#b3ff00",
-    "#adff00",
-    "#a7ff00",
-    "#a1ff00",
-    "#9bff00",
-    "#95ff00",
-    "#8fff00",
-    "#89ff00",
-    "#83ff00",
-    "#7eff00",
-    "#78ff00",
-    "#72ff00",
-    "#6cff00",
-    "#66ff00",
-    "#60ff00",
-    "#5aff00",
-    "#54ff00",
-    "#4eff00",
-    "#48ff00",
-    "#43ff00",
-    "#3dff00",
-    "#37ff00",
-    "#31ff00",
-    "#2bff00",
-    "#25ff00",
-    "#1fff00",
-    "#19ff00",
-    "#13ff00",
-    "#0dff00",
-    "#07ff00",
-    "#05ff03",
-    "#04ff07",
-    "#02ff0b",
-    "#00ff0f",
-    "#00ff15",
-    "#00ff1b",
-    "#00ff21",
-    "#00ff27",
-    "#00ff2d",
-    "#00ff33",
-    "#00ff39",
-    "#00ff3e",
-    "#00ff44",
-    "#00ff4a",
-    "#00ff50",
-    "#00ff56",
-    "#00ff5c",
-    "#00ff62",
-    "#00ff68",
-    "#00ff6e",
-    "#00ff74",
-    "#00ff79",
-    "#00ff7f",
-    "#00ff85",
-    "#00ff8b",
-    "#00ff91",
-    "#00ff97",
-    "#00ff9d",
-    "#00ffa3",
-    "#00ffa9",
-    "#00ffaf",
-    "#00ffb5",
-    "#00ffba",
-    "#00ffc0",
-    "#00ffc6",
-    "#00ffcc",
-    "#00ffd2",
-    "#00ffd8",
-    "#00ffde",
-    "#00ffe4",
-    "#00ffea",
-    "#00fff0",
-    "#00fff5",
-    "#00fffb",
-    "#00fcff",
-    "#00f6ff",
-    "#00f0ff",
-    "#00eaff",
-    "#00e4ff",
-    "#00deff",
-    "#00d8ff",
-    "#00d2ff",
-    "#00ccff",
-    "#00c7ff",
-    "#00c1ff",
-    "#00bbff",
-    "#00b5ff",
-    "#00afff",
-    "#00a9ff",
-    "#00a3ff",
-    "#009dff",
-    "#0097ff",
-    "#0091ff",
-    "#008bff",
-    "#0086ff",
-    "#0080ff",
-    "#007aff",
-    "#0074ff",
-    "#006eff",
-    "#0068ff",
-    "#0062ff",
-    "#005cff",
-    "#0056ff",
-    "#0050ff",
-    "#004bff",
-    "#0045ff",
-    "#003fff",
-    "#0039ff",
-    "#0033ff",
-    "#002dff",
-    "#0027ff",
-    "#0021ff",
-    "#001bff",
-    "#0015ff",
-    "#000fff",
-    "#010cff",
-    "#0308ff",
-    "#0504ff",
-    "#0700ff",
-    "#0d00ff",
-    "#1300ff",
-    "#1900ff",
-    "#1f00ff",
-    "#2500ff",
-    "#2b00ff",
-    "#3100ff",
-    "#3600ff",
-    "#3c00ff",
-    "#4200ff",
-    "#4800ff",
-    "#4e00ff",
-    "#5400ff",
-    "#5a00ff",
-    "#6000ff",
-    "#6600ff",
-    "#6c00ff",
-    "#7100ff",
-    "#7700ff",
-    "#7d00ff",
-    "#8300ff",
-    "#8900ff",
-    "#8f00ff",
-    "#9500ff",
-    "#9b00ff",
-    "#a100ff",
-    "#a700ff",
-    "#ad00ff",
-    "#b200ff",
-    "#b800ff",
-    "#be00ff",
-    "#c400ff",
-    "#ca00ff",
-    "#d000ff",
-    "#d600ff",
-    "#dc00ff",
-    "#e200ff",
-    "#e800ff",
-    "#ee00ff",
-    "#f300ff",
-    "#f700fd",
-    "#f900f9",
-    "#fb00f5",
-    "#fd00f1",
-    "#ff00ec",
-    "#ff00e6",
-    "#ff00e0",
-    "#ff00da",
-    "#ff00d4",
-    "#ff00cf",
-    "#ff00c9",
-    "#ff00c3",
-    "#ff00bd",
-    "#ff00b7",
-    "#ff00b1",
-    "#ff00ab",
-    "#ff00a5",
-    "#ff009f",
-    "#ff0099",
-    "#ff0093",
-    "#ff008e",
-    "#ff0088",
-    "#ff0082",
-    "#ff007c",
-    "#ff0076",
-    "#ff0070",
-    "#ff006a",
-    "#ff0064",
-    "#ff005e",
-    "#ff0058",
-    "#ff0052",
-    "#ff004d",
-    "#ff0047",
-    "#ff0041",
-    "#ff003b",
-    "#ff0035",
-    "#ff002f",
-    "#ff0029",
-    "#ff0023",
-    "#ff001d",
-    "#ff0017"
-  ],
-  "inferno": [
-    "#000003",
-    "#000004",
-    "#000006",
-    "#010007",
-    "#010109",
-    "#01010b",
-    "#02010e",
-    "#020210",
-    "#030212",
-    "#040314",
-    "#040316",
-    "#050418",
-    "#06041b",
-    "#07051d",
-    "#08061f",
-    "#090621",
-    "#0a0723",
-    "#0b0726",
-    "#0d0828",
-    "#0e082a",
-    "#0f092d",
-    "#10092f",
-    "#120a32",
-    "#130a34",
-    "#140b36",
-    "#160b39",
-    "#170b3b",
-    "#190b3e",
-    "#1a0b40",
-    "#1c0c43",
-    "#1d0c45",
-    "#1f0c47",
-    "#200c4a",
-    "#220b4c",
-    "#240b4e",
-    "#260b50",
-    "#270b52",
-    "#290b54",
-    "#2b0a56",
-    "#2d0a58",
-    "#2e0a5a",
-    "#300a5c",
-    "#32095d",
-    "#34095f",
-    "#350960",
-    "#370961",
-    "#390962",
-    "#3b0964",
-    "#3c0965",
-    "#3e0966",
-    "#400966",
-    "#410967",
-    "#430a68",
-    "#450a69",
-    "#460a69",
-    "#480b6a",
-    "#4a0b6a",
-    "#4b0c6b",
-    "#4d0c6b",
-    "#4f0d6c",
-    "#500d6c",
-    "#520e6c",
-    "#530e6d",
-    "#550f6d",
-    "#570f6d",
-    "#58106d",
-    "#5a116d",
-    "#5b116e",
-    "#5d126e",
-    "#5f126e",
-    "#60136e",
-    "#62146e",
-    "#63146e",
-    "#65156e",
-    "#66156e",
-    "#68166e",
-    "#6a176e",
-    "#6b176e",
-    "#6d186e",
-    "#6e186e",
-    "#70196e",
-    "#72196d",
-    "#731a6d",
-    "#751b6d",
-    "#761b6d",
-    "#781c6d",
-    "#7a1c6d",
-    "#7b1d6c",
-    "#7d1d6c",
-    "#7e1e6c",
-    "#801f6b",
-    "#811f6b",
-    "#83206b",
-    "#85206a",
-    "#86216a",
-    "#88216a",
-    "#892269",
-    "#8b2269",
-    "#8d2369",
-    "#8e2468",
-    "#902468",
-    "#912567",
-    "#932567",
-    "#952666",
-    "#962666",
-    "#982765",
-    "#992864",
-    "#9b2864",
-    "#9c2963",
-    "#9e2963",
-    "#a02a62",
-    "#a12b61",
-    "#a32b61",
-    "#a42c60",
-    "#a62c5f",
-    "#a72d5f",
-    "#a92e5e",
-    "#ab2e5d",
-    "#ac2f5c",
-    "#ae305b",
-    "#af315b",
-    "#b1315a",
-    "#b23259",
-    "#b43358",
-    "#b53357",
-    "#b73456",
-    "#b83556",
-    "#ba3655",
-    "#bb3754",
-    "#bd3753",
-    "#be3852",
-    "#bf3951",
-    "#c13a50",
-    "#c23b4f",
-    "#c43c4e",
-    "#c53d4d",
-    "#c73e4c",
-    "#c83e4b",
-    "#c93f4a",
-    "#cb4049",
-    "#cc4148",
-    "#cd4247",
-    "#cf4446",
-    "#d04544",
-    "#d14643",
-    "#d24742",
-    "#d44841",
-    "#d54940",
-    "#d64a3f",
-    "#d74b3e",
-    "#d94d3d",
-    "#da4e3b",
-    "#db4f3a",
-    "#dc5039",
-    "#dd5238",
-    "#de5337",
-    "#df5436",
-    "#e05634",
-    "#e25733",
-    "#e35832",
-    "#e45a31",
-    "#e55b30",
-    "#e65c2e",
-    "#e65e2d",
-    "#e75f2c",
-    "#e8612b",
-    "#e9622a",
-    "#ea6428",
-    "#eb6527",
-    "#ec6726",
-    "#ed6825",
-    "#ed6a23",
-    "#ee6c22",
-    "#ef6d21",
-    "#f06f1f",
-    "#f0701e",
-    "#f1721d",
-    "#f2741c",
-    "#f2751a",
-    "#f37719",
-    "#f37918",
-    "#f47a16",
-    "#f57c15",
-    "#f57e14",
-    "#f68012",
-    "#f68111",
-    "#f78310",
-    "#f7850e",
-    "#f8870d",
-    "#f8880c",
-    "#f88a0b",
-    "#f98c09",
-    "#f98e08",
-    "#f99008",
-    "#fa9107",
-    "#fa9306",
-    "#fa9506",
-    "#fa9706",
-    "#fb9906",
-    "#fb9b06",
-    "#fb9d06",
-    "#fb9e07",
-    "#fba007",
-    "#fba208",
-    "#fba40a",
-    "#fba60b",
-    "#fba80d",
-    "#fbaa0e",
-    "#fbac10",
-    "#fbae12",
-    "#fbb014",
-    "#fbb116",
-    "#fbb318",
-    "#fbb51a",
-    "#fbb71c",
-    "#fbb91e",
-    "#fabb21",
-    "#fabd23",
-    "#fabf25",
-    "#fac128",
-    "#f9c32a",
-    "#f9c52c",
-    "#f9c72f",
-    "#f8c931",
-    "#f8cb34",
-    "#f8cd37",
-    "#f7cf3a",
-    "#f7d13c",
-    "#f6d33f",
-    "#f6d542",
-    "#f5d745",
-    "#f5d948",
-    "#f4db4b",
-    "#f4dc4f",
-    "#f3de52",
-    "#f3e056",
-    "#f3e259",
-    "#f2e45d",
-    "#f2e660",
-    "#f1e864",
-    "#f1e968",
-    "#f1eb6c",
-    "#f1ed70",
-    "#f1ee74",
-    "#f1f079",
-    "#f1f27d",
-    "#f2f381",
-    "#f2f485",
-    "#f3f689",
-    "#f4f78d",
-    "#f5f891",
-    "#f6fa95",
-    "#f7fb99",
-    "#f9fc9d",
-    "#fafda0",
-    "#fcfea4"
-  ],
-  "jet": [
-    "#00007f",
-    "#000084",
-    "#000088",
-    "#00008d",
-    "#000091",
-    "#000096",
-    "#00009a",
-    "#00009f",
-    "#0000a3",
-    "#0000a8",
-    "#0000ac",
-    "#0000b1",
-    "#0000b6",
-    "#0000ba",
-    "#0000bf",
-    "#0000c3",
-    "#0000c8",
-    "#0000cc",
-    "#0000d1",
-    "#0000d5",
-    "#0000da",
-    "#0000de",
-    "#0000e3",
-    "#0000e8",
-    "#0000ec",
-    "#0000f1",
-    "#0000f5",
-    "#0000fa",
-    "#0000fe",
-    "#0000ff",
-    "#0000ff",
-    "#0000ff",
-    "#0000ff",
-    "#0004ff",
-    "#0008ff",
-    "#000cff",
-    "#0010ff",
-    "#0014ff",
-    "#0018ff",
-    "#001cff",
-    "#0020ff",
-    "#0024ff",
-    "#0028ff",
-    "#002cff",
-    "#0030ff",
-    "#0034ff",
-    "#0038ff",
-    "#003cff",
-    "#0040ff",
-    "#0044ff",
-    "#0048ff",
-    "#004cff",
-    "#0050ff",
-    "#0054ff",
-    "#0058ff",
-    "#005cff",
-    "#0060ff",
-    "#0064ff",
-    "#0068ff",
-    "#006cff",
-    "#0070ff",
-    "#0074ff",
-    "#0078ff",
-    "#007cff",
-    "#0080ff",
-    "#0084ff",
-    "#0088ff",
-    "#008cff",
-    "#0090ff",
-    "#0094ff",
-    "#0098ff",
-    "#009cff",
-    "#00a0ff",
-    "#00a4ff",
-    "#00a8ff",
-    "#00acff",
-    "#00b0ff",
-    "#00b4ff",
-    "#00b8ff",
-    "#00bcff",
-    "#00c0ff",
-    "#00c4ff",
-    "#00c8ff",
-    "#00ccff",
-    "#00d0ff",
-    "#00d4ff",
-    "#00d8ff",
-    "#00dcfe",
-    "#00e0fa",
-    "#00e4f7",
-    "#02e8f4",
-    "#05ecf1",
-    "#08f0ed",
-    "#0cf4ea",
-    "#0ff8e7",
-    "#12fce4",
-    "#15ffe1",
-    "#18ffdd",
-    "#1cffda",
-    "#1fffd7",
-    "#22ffd4",
-    "#25ffd0",
-    "#29ffcd",
-    "#2cffca",
-    "#2fffc7",
-    "#32ffc3",
-    "#36ffc0",
-    "#39ffbd",
-    "#3cffba",
-    "#3fffb7",
-    "#42ffb3",
-    "#46ffb0",
-    "#49ffad",
-    "#4cffaa",
-    "#4fffa6",
-    "#53ffa3",
-    "#56ffa0",
-    "#59ff9d",
-    "#5cff9a",
-    "#5fff96",
-    "#63ff93",
-    "#66ff90",
-    "#69ff8d",
-    "#6cff89",
-    "#70ff86",
-    "#73ff83",
-    "#76ff80",
-    "#79ff7d",
-    "#7cff79",
-    "#80ff76",
-    "#83ff73",
-    "#86ff70",
-    "#89ff6c",
-    "#8dff69",
-    "#90ff66",
-    "#93ff63",
-    "#96ff5f",
-    "#9aff5c",
-    "#9dff59",
-    "#a0ff56",
-    "#a3ff53",
-    "#a6ff4f",
-    "#aaff4c",
-    "#adff49",
-    "#b0ff46",
-    "#b3ff42",
-    "#b7ff3f",
-    "#baff3c",
-    "#bdff39",
-    "#c0ff36",
-    "#c3ff32",
-    "#c7ff2f",
-    "#caff2c",
-    "#cdff29",
-    "#d0ff25",
-    "#d4ff22",
-    "#d7ff1f",
-    "#daff1c",
-    "#ddff18",
-    "#e0ff15",
-    "#e4ff12",
-    "#e7ff0f",
-    "#eaff0c",
-    "#edff08",
-    "#f1fc05",
-    "#f4f802",
-    "#f7f400",
-    "#faf000",
-    "#feed00",
-    "#ffe900",
-    "#ffe500",
-    "#ffe200",
-    "#ffde00",
-    "#ffda00",
-    "#ffd700",
-    "#ffd300",
-    "#ffcf00",
-    "#ffcb00",
-    "#ffc800",
-    "#ffc400",
-    "#ffc000",
-    "#ffbd00",
-    "#ffb900",
-    "#ffb500",
-    "#ffb100",
-    "#ffae00",
-    "#ffaa00",
-    "#ffa600",
-    "#ffa300",
-    "#ff9f00",
-    "#ff9b00",
-    "#ff9800",
-    "#ff9400",
-    "#ff9000",
-    "#ff8c00",
-    "#ff8900",
-    "#ff8500",
-    "#ff8100",
-    "#ff7e00",
-    "#ff7a00",
-    "#ff7600",
-    "#ff7300",
-    "#ff6f00",
-    "#ff6b00",
-    "#ff6700",
-    "#ff6400",
-    "#ff6000",
-    "#ff5c00",
-    "#ff5900",
-    "#ff5500",
-    "#ff5100",
-    "#ff4d00",
-    "#ff4a00",
-    "#ff4600",
-    "#ff4200",
-    "#ff3f00",
-    "#ff3b00",
-    "#ff3700",
-    "#ff3400",
-    "#ff3000",
-    "#ff2c00",
-    "#ff2800",
-    "#ff2500",
-    "#ff2100",
-    "#ff1d00",
-    "#ff1a00",
-    "#ff1600",
-    "#fe1200",
-    "#fa0f00",
-    "#f50b00",
-    "#f10700",
-    "#ec0300",
-    "#e80000",
-    "#e30000",
-    "#de0000",
-    "#da0000",
-    "#d50000",
-    "#d10000",
-    "#cc0000",
-    "#c80000",
-    "#c30000",
-    "#bf0000",
-    "#ba0000",
-    "#b60000",
-    "#b10000",
-    "#ac0000",
-    "#a80000",
-    "#a30000",
-    "#9f0000",
-    "#9a0000",
-    "#960000",
-    "#910000",
-    "#8d0000",
-    "#880000",
-    "#840000",
-    "#7f0000"
-  ],
-  "magma": [
-    "#000003",
-    "#000004",
-    "#000006",
-    "#010007",
-    "#010109",
-    "#01010b",
-    "#02020d",
-    "#02020f",
-    "#030311",
-    "#040313",
-    "#040415",
-    "#050417",
-    "#060519",
-    "#07051b",
-    "#08061d",
-    "#09071f",
-    "#0a0722",
-    "#0b0824",
-    "#0c0926",
-    "#0d0a28",
-    "#0e0a2a",
-    "#0f0b2c",
-    "#100c2f",
-    "#110c31",
-    "#120d33",
-    "#140d35",
-    "#150e38",
-    "#160e3a",
-    "#170f3c",
-    "#180f3f",
-    "#1a1041",
-    "#1b1044",
-    "#1c1046",
-    "#1e1049",
-    "#1f114b",
-    "#20114d",
-    "#221150",
-    "#231152",
-    "#251155",
-    "#261157",
-    "#281159",
-    "#2a115c",
-    "#2b115e",
-    "#2d1060",
-    "#2f1062",
-    "#301065",
-    "#321067",
-    "#341068",
-    "#350f6a",
-    "#370f6c",
-    "#390f6e",
-    "#3b0f6f",
-    "#3c0f71",
-    "#3e0f72",
-    "#400f73",
-    "#420f74",
-    "#430f75",
-    "#450f76",
-    "#470f77",
-    "#481078",
-    "#4a1079",
-    "#4b1079",
-    "#4d117a",
-    "#4f117b",
-    "#50127b",
-    "#52127c",
-    "#53137c",
-    "#55137d",
-    "#57147d",
-    "#58157e",
-    "#5a157e",
-    "#5b167e",
-    "#5d177e",
-    "#5e177f",
-    "#60187f",
-    "#61187f",
-    "#63197f",
-    "#651a80",
-    "#661a80",
-    "#681b80",
-    "#691c80",
-    "#6b1c80",
-    "#6c1d80",
-    "#6e1e81",
-    "#6f1e81",
-    "#711f81",
-    "#731f81",
-    "#742081",
-    "#762181",
-    "#772181",
-    "#792281",
-    "#7a2281",
-    "#7c2381",
-    "#7e2481",
-    "#7f2481",
-    "#812581",
-    "#822581",
-    "#842681",
-    "#852681",
-    "#872781",
-    "#892881",
-    "#8a2881",
-    "#8c2980",
-    "#8d2980",
-    "#8f2a80",
-    "#912a80",
-    "#922b80",
-    "#942b80",
-    "#952c80",
-    "#972c7f",
-    "#992d7f",
-    "#9a2d7f",
-    "#9c2e7f",
-    "#9e2e7e",
-    "#9f2f7e",
-    "#a12f7e",
-    "#a3307e",
-    "#a4307d",
-    "#a6317d",
-    "#a7317d",
-    "#a9327c",
-    "#ab337c",
-    "#ac337b",
-    "#ae347b",
-    "#b0347b",
-    "#b1357a",
-    "#b3357a",
-    "#b53679",
-    "#b63679",
-    "#b83778",
-    "#b93778",
-    "#bb3877",
-    "#bd3977",
-    "#be3976",
-    "#c03a75",
-    "#c23a75",
-    "#c33b74",
-    "#c53c74",
-    "#c63c73",
-    "#c83d72",
-    "#ca3e72",
-    "#cb3e71",
-    "#cd3f70",
-    "#ce4070",
-    "#d0416f",
-    "#d1426e",
-    "#d3426d",
-    "#d4436d",
-    "#d6446c",
-    "#d7456b",
-    "#d9466a",
-    "#da4769",
-    "#dc4869",
-    "#dd4968",
-    "#de4a67",
-    "#e04b66",
-    "#e14c66",
-    "#e24d65",
-    "#e44e64",
-    "#e55063",
-    "#e65162",
-    "#e75262",
-    "#e85461",
-    "#ea5560",
-    "#eb5660",
-    "#ec585f",
-    "#ed595f",
-    "#ee5b5e",
-    "#ee5d5d",
-    "#ef5e5d",
-    "#f0605d",
-    "#f1615c",
-    "#f2635c",
-    "#f3655c",
-    "#f3675b",
-    "#f4685b",
-    "#f56a5b",
-    "#f56c5b",
-    "#f66e5b",
-    "#f6705b",
-    "#f7715b",
-    "#f7735c",
-    "#f8755c",
-    "#f8775c",
-    "#f9795c",
-    "#f97b5d",
-    "#f97d5d",
-    "#fa7f5e",
-    "#fa805e",
-    "#fa825f",
-    "#fb8460",
-    "#fb8660",
-    "#fb8861",
-    "#fb8a62",
-    "#fc8c63",
-    "#fc8e63",
-    "#fc9064",
-    "#fc9265",
-    "#fc9366",
-    "#fd9567",
-    "#fd9768",
-    "#fd9969",
-    "#fd9b6a",
-    "#fd9d6b",
-    "#fd9f6c",
-    "#fda16e",
-    "#fda26f",
-    "#fda470",
-    "#fea671",
-    "#fea873",
-    "#feaa74",
-    "#feac75",
-    "#feae76",
-    "#feaf78",
-    "#feb179",
-    "#feb37b",
-    "#feb57c",
-    "#feb77d",
-    "#feb97f",
-    "#febb80",
-    "#febc82",
-    "#febe83",
-    "#fec085",
-    "#fec286",
-    "#fec488",
-    "#fec689",
-    "#fec78b",
-    "#fec98d",
-    "#fecb8e",
-    "#fdcd90",
-    "#fdcf92",
-    "#fdd193",
-    "#fdd295",
-    "#fdd497",
-    "#fdd698",
-    "#fdd89a",
-    "#fdda9c",
-    "#fddc9d",
-    "#fddd9f",
-    "#fddfa1",
-    "#fde1a3",
-    "#fce3a5",
-    "#fce5a6",
-    "#fce6a8",
-    "#fce8aa",
-    "#fceaac",
-    "#fcecae",
-    "#fceeb0",
-    "#fcf0b1",
-    "#fcf1b3",
-    "#fcf3b5",
-    "#fcf5b7",
-    "#fbf7b9",
-    "#fbf9bb",
-    "#fbfabd",
-    "#fbfcbf"
-  ],
-  "nipy_spectral": [
-    "#000000",
-    "#09000a",
-    "#120015",
-    "#1c001f",
-    "#25002a",
-    "#2e0035",
-    "#38003f",
-    "#41004a",
-    "#4a0055",
-    "#54005f",
-    "#5d006a",
-    "#660075",
-    "#70007f",
-    "#770088",
-    "#780089",
-    "#7a008a",
-    "#7b008c",
-    "#7c008d",
-    "#7e008e",
-    "#7f0090",
-    "#800091",
-    "#810092",
-    "#830094",
-    "#840095",
-    "#850096",
-    "#870098",
-    "#820099",
-    "#77009b",
-    "#6d009c",
-    "#62009d",
-    "#57009f",
-    "#4d00a0",
-    "#4200a1",
-    "#3700a3",
-    "#2d00a4",
-    "#2200a5",
-    "#1700a7",
-    "#0d00a8",
-    "#0200a9",
-    "#0000ad",
-    "#0000b1",
-    "#0000b5",
-    "#0000b9",
-    "#0000bd",
-    "#0000c1",
-    "#0000c5",
-    "#0000c9",
-    "#0000cd",
-    "#0000d1",
-    "#0000d5",
-    "#0000d9",
-    "#0000dd",
-    "#0009dd",
-    "#0012dd",
-    "#001cdd",
-    "#0025dd",
-    "#002edd",
-    "#0038dd",
-    "#0041dd",
-    "#004add",
-    "#0054dd",
-    "#005ddd",
-    "#0066dd",
-    "#0070dd",
-    "#0077dd",
-    "#007add",
-    "#007ddd",
-    "#007fdd",
-    "#0082dd",
-    "#0085dd",
-    "#0087dd",
-    "#008add",
-    "#008ddd",
-    "#008fdd",
-    "#0092dd",
-    "#0095dd",
-    "#0097dd",
-    "#0099db",
-    "#009bd7",
-    "#009cd3",
-    "#009dcf",
-    "#009fcb",
-    "#00a0c7",
-    "#00a1c3",
-    "#00a3bf",
-    "#00a4bb",
-    "#00a5b7",
-    "#00a7b3",
-    "#00a8af",
-    "#00a9ab",
-    "#00aaa8",
-    "#00aaa5",
-    "#00aaa2",
-    "#00aaa0",
-    "#00aa9d",
-    "#00aa9a",
-    "#00aa97",
-    "#00aa95",
-    "#00aa92",
-    "#00aa8f",
-    "#00aa8d",
-    "#00aa8a",
-    "#00aa87",
-    "#00a87d",
-    "#00a772",
-    "#00a667",
-    "#00a45d",
-    "#00a352",
-    "#00a247",
-    "#00a03d",
-    "#009f32",
-    "#009e27",
-    "#009c1d",
-    "#009b12",
-    "#009a07",
-    "#009900",
-    "#009c00",
-    "#009e00",
-    "#00a100",
-    "#00a400",
-    "#00a600",
-    "#00a900",
-    "#00ac00",
-    "#00ae00",
-    "#00b100",
-    "#00b400",
-    "#00b600",
-    "#00b900",
-    "#00bc00",
-    "#00be00",
-    "#00c100",
-    "#00c400",
-    "#00c600",
-    "#00c900",
-    "#00cc00",
-    "#00cf00",
-    "#00d100",
-    "#00d400",
-    "#00d700",
-    "#00d900",
-    "#00dc00",
-    "#00df00",
-    "#00e100",
-    "#00e400",
-    "#00e700",
-    "#00e900",
-    "#00ec00",
-    "#00ef00",
-    "#00f100",
-    "#00f400",
-    "#00f700",
-    "#00f900",
-    "#00fc00",
-    "#00ff00",
-    "#0eff00",
-    "#1dff00",
-    "#2bff00",
-    "#3aff00",
-    "#49ff00",
-    "#57ff00",
-    "#66ff00",
-    "#75ff00",
-    "#83ff00",
-    "#92ff00",
-    "#a1ff00",
-    "#afff00",
-    "#bbfe00",
-    "#bffd00",
-    "#c3fb00",
-    "#c7fa00",
-    "#cbf900",
-    "#cff700",
-    "#d3f600",
-    "#d7f500",
-    "#dbf300",
-    "#dff200",
-    "#e3f100",
-    "#e7ef00",
-    "#ebee00",
-    "#eeec00",
-    "#efe900",
-    "#f1e700",
-    "#f2e400",
-    "#f3e100",
-    "#f5df00",
-    "#f6dc00",
-    "#f7d900",
-    "#f9d700",
-    "#fad400",
-    "#fbd100",
-    "#fdcf00",
-    "#fecc00",
-    "#ffc900",
-    "#ffc500",
-    "#ffc100",
-    "#ffbd00",
-    "#ffb900",
-    "#ffb500",
-    "#ffb100",
-    "#ffad00",
-    "#ffa900",
-    "#ffa500",
-    "#ffa100",
-    "#ff9d00",
-    "#ff9900",
-    "#ff8d00",
-    "#ff8100",
-    "#ff7500",
-    "#ff6900",
-    "#ff5d00",
-    "#ff5100",
-    "#ff4500",
-    "#ff3900",
-    "#ff2c00",
-    "#ff2000",
-    "#ff1400",
-    "#ff0800",
-    "#fe0000",
-    "#fb0000",
-    "#f90000",
-    "#f60000",
-    "#f30000",
-    "#f10000",
-    "#ee0000",
-    "#eb0000",
-    "#e90000",
-    "#e60000",
-    "#e30000",
-    "#e10000",
-    "#de0000",
-    "#dc0000",
-    "#db0000",
-    "#d90000",
-    "#d80000",
-    "#d70000",
-    "#d50000",
-    "#d40000",
-    "#d30000",
-    "#d10000",
-    "#d00000",
-    "#cf0000",
-    "#cd0000",
-    "#cc0000",
-    "#cc0c0c",
-    "#cc1b1b",
-    "#cc2c2c",
-    "#cc3c3c",
-    "#cc4c4c",
-    "#cc5c5c",
-    "#cc6c6c",
-    "#cc7c7c",
-    "#cc8c8c",
-    "#cc9c9c",
-    "#ccacac",
-    "#ccbcbc",
-    "#cccccc"
-  ],
-  "ocean": [
-    "#007f00",
-    "#007e01",
-    "#007c02",
-    "#007b03",
-    "#007904",
-    "#007805",
-    "#007606",
-    "#007507",
-    "#007308",
-    "#007209",
-    "#00700a",
-    "#006f0b",
-    "#006d0c",
-    "#006c0d",
-    "#006a0e",
-    "#00690f",
-    "#006710",
-    "#006611",
-    "#006412",
-    "#006313",
-    "#006114",
-    "#006015",
-    "#005e16",
-    "#005d17",
-    "#005b18",
-    "#005919",
-    "#00581a",
-    "#00571b",
-    "#00551c",
-    "#00541d",
-    "#00521e",
-    "#00511f",
-    "#004f20",
-    "#004e20",
-    "#004c22",
-    "#004a23",
-    "#004924",
-    "#004824",
-    "#004626",
-    "#004527",
-    "#004328",
-    "#004228",
-    "#00402a",
-    "#003f2b",
-    "#003d2c",
-    "#003c2c",
-    "#003a2e",
-    "#00382f",
-    "#003730",
-    "#003630",
-    "#003432",
-    "#003233",
-    "#003134",
-    "#003034",
-    "#002e36",
-    "#002c37",
-    "#002b38",
-    "#002a38",
-    "#00283a",
-    "#00273b",
-    "#00253c",
-    "#00243c",
-    "#00223e",
-    "#00203f",
-    "#001f40",
-    "#001e41",
-    "#001c41",
-    "#001a43",
-    "#001944",
-    "#001845",
-    "#001646",
-    "#001447",
-    "#001348",
-    "#001249",
-    "#001049",
-    "#000f4b",
-    "#000d4c",
-    "#000c4d",
-    "#000a4e",
-    "#00084f",
-    "#000750",
-    "#000651",
-    "#000451",
-    "#000253",
-    "#000154",
-    "#000055",
-    "#000156",
-    "#000257",
-    "#000458",
-    "#000559",
-    "#000759",
-    "#00085b",
-    "#000a5c",
-    "#000b5d",
-    "#000d5e",
-    "#000f5f",
-    "#001060",
-    "#001161",
-    "#001361",
-    "#001563",
-    "#001664",
-    "#001865",
-    "#001966",
-    "#001b67",
-    "#001c68",
-    "#001e69",
-    "#001f69",
-    "#00206b",
-    "#00226c",
-    "#00236d",
-    "#00256e",
-    "#00276f",
-    "#002870",
-    "#002971",
-    "#002b71",
-    "#002d73",
-    "#002e74",
-    "#003075",
-    "#003176",
-    "#003277",
-    "#003478",
-    "#003579",
-    "#003779",
-    "#00387b",
-    "#003a7c",
-    "#003b7d",
-    "#003d7e",
-    "#003f7f",
-    "#004080",
-    "#004181",
-    "#004382",
-    "#004483",
-    "#004683",
-    "#004885",
-    "#004986",
-    "#004b87",
-    "#004c88",
-    "#004e89",
-    "#004f8a",
-    "#00518b",
-    "#00528c",
-    "#00548d",
-    "#00558e",
-    "#00578f",
-    "#005890",
-    "#005991",
-    "#005b92",
-    "#005c93",
-    "#005e93",
-    "#006095",
-    "#006196",
-    "#006297",
-    "#006498",
-    "#006599",
-    "#00679a",
-    "#00689b",
-    "#006a9c",
-    "#006c9d",
-    "#006d9e",
-    "#006f9f",
-    "#0070a0",
-    "#0071a1",
-    "#0073a2",
-    "#0074a3",
-    "#0076a3",
-    "#0078a5",
-    "#0079a6",
-    "#007ba7",
-    "#007ca8",
-    "#007ea9",
-    "#007faa",
-    "#0281ab",
-    "#0582ac",
-    "#0883ad",
-    "#0b85ae",
-    "#0e86af",
-    "#1188b0",
-    "#1489b1",
-    "#178bb2",
-    "#1a8cb3",
-    "#1d8eb3",
-    "#2090b5",
-    "#2391b6",
-    "#2693b7",
-    "#2994b8",
-    "#2c95b9",
-    "#2f97ba",
-    "#3298bb",
-    "#369abc",
-    "#399cbd",
-    "#3c9dbe",
-    "#3f9fbf",
-    "#41a0c0",
-    "#44a2c1",
-    "#47a3c2",
-    "#4aa4c3",
-    "#4da6c3",
-    "#51a8c5",
-    "#54a9c6",
-    "#57abc7",
-    "#5aacc8",
-    "#5daec9",
-    "#60afca",
-    "#62b1cb",
-    "#66b2cc",
-    "#69b4cd",
-    "#6cb5ce",
-    "#6fb7cf",
-    "#72b8d0",
-    "#75bad1",
-    "#78bbd2",
-    "#7bbdd3",
-    "#7ebed3",
-    "#81c0d5",
-    "#83c1d6",
-    "#86c3d7",
-    "#89c4d8",
-    "#8cc5d9",
-    "#8fc7da",
-    "#92c8db",
-    "#96cadc",
-    "#99ccdd",
-    "#9ccdde",
-    "#9fcfdf",
-    "#a2d0e0",
-    "#a4d2e1",
-    "#a7d3e2",
-    "#aad4e3",
-    "#add6e3",
-    "#b1d8e5",
-    "#b4d9e6",
-    "#b7dbe7",
-    "#badce8",
-    "#bddee9",
-    "#c0dfea",
-    "#c3e1eb",
-    "#c5e2ec",
-    "#c8e3ed",
-    "#cbe5ee",
-    "#cee6ef",
-    "#d1e8f0",
-    "#d4e9f1",
-    "#d7ebf2",
-    "#daecf3",
-    "#ddeef3",
-    "#e1f0f5",
-    "#e3f1f6",
-    "#e6f3f7",
-    "#e9f4f8",
-    "#ecf5f9",
-    "#eff7fa",
-    "#f2f8fb",
-    "#f6fafc",
-    "#f9fcfd",
-    "#fcfdfe",
-    "#ffffff"
-  ],
-  "plasma": [
-    "#0c0786",
-    "#100787",
-    "#130689",
-    "#15068a",
-    "#18068b",
-    "#1b068c",
-    "#1d068d",
-    "#1f058e",
-    "#21058f",
-    "#230590",
-    "#250591",
-    "#270592",
-    "#290593",
-    "#2b0594",
-    "#2d0494",
-    "#2f0495",
-    "#310496",
-    "#330497",
-    "#340498",
-    "#360498",
-    "#380499",
-    "#3a049a",
-    "#3b039a",
-    "#3d039b",
-    "#3f039c",
-    "#40039c",
-    "#42039d",
-    "#44039e",
-    "#45039e",
-    "#47029f",
-    "#49029f",
-    "#4a02a0",
-    "#4c02a1",
-    "#4e02a1",
-    "#4f02a2",
-    "#5101a2",
-    "#5201a3",
-    "#5401a3",
-    "#5601a3",
-    "#5701a4",
-    "#5901a4",
-    "#5a00a5",
-    "#5c00a5",
-    "#5e00a5",
-    "#5f00a6",
-    "#6100a6",
-    "#6200a6",
-    "#6400a7",
-    "#6500a7",
-    "#6700a7",
-    "#6800a7",
-    "#6a00a7",
-    "#6c00a8",
-    "#6d00a8",
-    "#6f00a8",
-    "#7000a8",
-    "#7200a8",
-    "#7300a8",
-    "#7500a8",
-    "#7601a8",
-    "#7801a8",
-    "#7901a8",
-    "#7b02a8",
-    "#7c02a7",
-    "#7e03a7",
-    "#7f03a7",
-    "#8104a7",
-    "#8204a7",
-    "#8405a6",
-    "#8506a6",
-    "#8607a6",
-    "#8807a5",
-    "#8908a5",
-    "#8b09a4",
-    "#8c0aa4",
-    "#8e0ca4",
-    "#8f0da3",
-    "#900ea3",
-    "#920fa2",
-    "#9310a1",
-    "#9511a1",
-    "#9612a0",
-    "#9713a0",
-    "#99149f",
-    "#9a159e",
-    "#9b179e",
-    "#9d189d",
-    "#9e199c",
-    "#9f1a9b",
-    "#a01b9b",
-    "#a21c9a",
-    "#a31d99",
-    "#a41e98",
-    "#a51f97",
-    "#a72197",
-    "#a82296",
-    "#a92395",
-    "#aa2494",
-    "#ac2593",
-    "#ad2692",
-    "#ae2791",
-    "#af2890",
-    "#b02a8f",
-    "#b12b8f",
-    "#b22c8e",
-    "#b42d8d",
-    "#b52e8c",
-    "#b62f8b",
-    "#b7308a",
-    "#b83289",
-    "#b93388",
-    "#ba3487",
-    "#bb3586",
-    "#bc3685",
-    "#bd3784",
-    "#be3883",
-    "#bf3982",
-    "#c03b81",
-    "#c13c80",
-    "#c23d80",
-    "#c33e7f",
-    "#c43f7e",
-    "#c5407d",
-    "#c6417c",
-    "#c7427b",
-    "#c8447a",
-    "#c94579",
-    "#ca4678",
-    "#cb4777",
-    "#cc4876",
-    "#cd4975",
-    "#ce4a75",
-    "#cf4b74",
-    "#d04d73",
-    "#d14e72",
-    "#d14f71",
-    "#d25070",
-    "#d3516f",
-    "#d4526e",
-    "#d5536d",
-    "#d6556d",
-    "#d7566c",
-    "#d7576b",
-    "#d8586a",
-    "#d95969",
-    "#da5a68",
-    "#db5b67",
-    "#dc5d66",
-    "#dc5e66",
-    "#dd5f65",
-    "#de6064",
-    "#df6163",
-    "#df6262",
-    "#e06461",
-    "#e16560",
-    "#e26660",
-    "#e3675f",
-    "#e3685e",
-    "#e46a5d",
-    "#e56b5c",
-    "#e56c5b",
-    "#e66d5a",
-    "#e76e5a",
-    "#e87059",
-    "#e87158",
-    "#e97257",
-    "#ea7356",
-    "#ea7455",
-    "#eb7654",
-    "#ec7754",
-    "#ec7853",
-    "#ed7952",
-    "#ed7b51",
-    "#ee7c50",
-    "#ef7d4f",
-    "#ef7e4e",
-    "#f0804d",
-    "#f0814d",
-    "#f1824c",
-    "#f2844b",
-    "#f2854a",
-    "#f38649",
-    "#f38748",
-    "#f48947",
-    "#f48a47",
-    "#f58b46",
-    "#f58d45",
-    "#f68e44",
-    "#f68f43",
-    "#f69142",
-    "#f79241",
-    "#f79341",
-    "#f89540",
-    "#f8963f",
-    "#f8983e",
-    "#f9993d",
-    "#f99a3c",
-    "#fa9c3b",
-    "#fa9d3a",
-    "#fa9f3a",
-    "#faa039",
-    "#fba238",
-    "#fba337",
-    "#fba436",
-    "#fca635",
-    "#fca735",
-    "#fca934",
-    "#fcaa33",
-    "#fcac32",
-    "#fcad31",
-    "#fdaf31",
-    "#fdb030",
-    "#fdb22f",
-    "#fdb32e",
-    "#fdb52d",
-    "#fdb62d",
-    "#fdb82c",
-    "#fdb92b",
-    "#fdbb2b",
-    "#fdbc2a",
-    "#fdbe29",
-    "#fdc029",
-    "#fdc128",
-    "#fdc328",
-    "#fdc427",
-    "#fdc626",
-    "#fcc726",
-    "#fcc926",
-    "#fccb25",
-    "#fccc25",
-    "#fcce25",
-    "#fbd024",
-    "#fbd124",
-    "#fbd324",
-    "#fad524",
-    "#fad624",
-    "#fad824",
-    "#f9d924",
-    "#f9db24",
-    "#f8dd24",
-    "#f8df24",
-    "#f7e024",
-    "#f7e225",
-    "#f6e425",
-    "#f6e525",
-    "#f5e726",
-    "#f5e926",
-    "#f4ea26",
-    "#f3ec26",
-    "#f3ee26",
-    "#f2f026",
-    "#f2f126",
-    "#f1f326",
-    "#f0f525",
-    "#f0f623",
-    "#eff821"
-  ],
-  "prism": [
-    "#ff0000",
-    "#ff0000",
-    "#ff2100",
-    "#ff5100",
-    "#ff8200",
-    "#ffb000",
-    "#ffd700",
-    "#fff600",
-    "#e2ff00",
-    "#b2ff00",
-    "#81ff00",
-    "#53fe00",
-    "#2ae200",
-    "#0abc39",
-    "#00907d",
-    "#0060b9",
-    "#002fe8",
-    "#0000ff",
-    "#1900ff",
-    "#3d00ff",
-    "#6900fe",
-    "#9900d7",
-    "#ca00a2",
-    "#f90063",
-    "#ff001c",
-    "#ff0000",
-    "#ff0e00",
-    "#ff3d00",
-    "#ff6f00",
-    "#ff9e00",
-    "#ffc800",
-    "#ffeb00",
-    "#f5ff00",
-    "#c5ff00",
-    "#94ff00",
-    "#65ff00",
-    "#3aee00",
-    "#16cc1c",
-    "#00a362",
-    "#0074a2",
-    "#0043d7",
-    "#0013fd",
-    "#0d00ff",
-    "#2e00ff",
-    "#5700ff",
-    "#8500e8",
-    "#b600b9",
-    "#e7007d",
-    "#ff0039",
-    "#ff0000",
-    "#ff0000",
-    "#ff2a00",
-    "#ff5b00",
-    "#ff8b00",
-    "#ffb800",
-    "#ffde00",
-    "#fffb00",
-    "#d9ff00",
-    "#a8ff00",
-    "#77ff00",
-    "#4af900",
-    "#23db00",
-    "#05b447",
-    "#008789",
-    "#0056c3",
-    "#0026f0",
-    "#0300ff",
-    "#2000ff",
-    "#4600ff",
-    "#7200f7",
-    "#a300ce",
-    "#d40096",
-    "#ff0055",
-    "#ff000e",
-    "#ff0000",
-    "#ff1700",
-    "#ff4700",
-    "#ff7800",
-    "#ffa700",
-    "#ffd000",
-    "#fff100",
-    "#ecff00",
-    "#bcff00",
-    "#8bff00",
-    "#5cff00",
-    "#32e800",
-    "#10c52a",
-    "#009a6f",
-    "#006aad",
-    "#0039e0",
-    "#000aff",
-    "#1300ff",
-    "#3500ff",
-    "#6000ff",
-    "#8f00e0",
-    "#c000ae",
-    "#f00070",
-    "#ff002b",
-    "#ff0000",
-    "#ff0400",
-    "#ff3300",
-    "#ff6400",
-    "#ff9400",
-    "#ffc000",
-    "#ffe500",
-    "#feff00",
-    "#cfff00",
-    "#9eff00",
-    "#6eff00",
-    "#42f400",
-    "#1dd40d",
-    "#01ac54",
-    "#007e96",
-    "#004dcd",
-    "#001cf7",
-    "#0700ff",
-    "#2600ff",
-    "#4e00ff",
-    "#7c00f0",
-    "#ac00c4",
-    "#dd008a",
-    "#ff0048",
-    "#ff0000",
-    "#ff0000",
-    "#ff2000",
-    "#ff5100",
-    "#ff8100",
-    "#ffaf00",
-    "#ffd700",
-    "#fff600",
-    "#e3ff00",
-    "#b2ff00",
-    "#81ff00",
-    "#53fe00",
-    "#2be200",
-    "#0bbd38",
-    "#00917c",
-    "#0060b8",
-    "#002fe8",
-    "#0001ff",
-    "#1900ff",
-    "#3d00ff",
-    "#6900fe",
-    "#9900d7",
-    "#ca00a3",
-    "#f90063",
-    "#ff001d",
-    "#ff0000",
-    "#ff0d00",
-    "#ff3d00",
-    "#ff6e00",
-    "#ff9d00",
-    "#ffc800",
-    "#ffeb00",
-    "#f5ff00",
-    "#c6ff00",
-    "#95ff00",
-    "#65ff00",
-    "#3aee00",
-    "#16cd1b",
-    "#00a362",
-    "#0074a1",
-    "#0043d6",
-    "#0013fd",
-    "#0d00ff",
-    "#2d00ff",
-    "#5600ff",
-    "#8500e9",
-    "#b600b9",
-    "#e6007e",
-    "#ff003a",
-    "#ff0000",
-    "#ff0000",
-    "#ff2900",
-    "#ff5a00",
-    "#ff8b00",
-    "#ffb800",
-    "#ffde00",
-    "#fffb00",
-    "#d9ff00",
-    "#a9ff00",
-    "#78ff00",
-    "#4bf900",
-    "#24db00",
-    "#05b546",
-    "#008789",
-    "#0057c3",
-    "#0026ef",
-    "#0200ff",
-    "#1f00ff",
-    "#4500ff",
-    "#7200f8",
-    "#a200ce",
-    "#d30097",
-    "#ff0056",
-    "#ff000f",
-    "#ff0000",
-    "#ff1600",
-    "#ff4700",
-    "#ff7800",
-    "#ffa600",
-    "#ffcf00",
-    "#fff000",
-    "#ecff00",
-    "#bcff00",
-    "#8bff00",
-    "#5cff00",
-    "#32e900",
-    "#10c52a",
-    "#009a6f",
-    "#006bad",
-    "#0039df",
-    "#000aff",
-    "#1200ff",
-    "#3500ff",
-    "#5f00ff",
-    "#8f00e1",
-    "#c000af",
-    "#ef0071",
-    "#ff002c",
-    "#ff0000",
-    "#ff0400",
-    "#ff3300",
-    "#ff6400",
-    "#ff9400",
-    "#ffc000",
-    "#ffe400",
-    "#feff00",
-    "#d0ff00",
-    "#9fff00",
-    "#6fff00",
-    "#42f400",
-    "#1dd40d",
-    "#01ac54",
-    "#007e95",
-    "#004dcc",
-    "#001df6",
-    "#0700ff",
-    "#2600ff",
-    "#4d00ff",
-    "#7b00f1",
-    "#ac00c4",
-    "#dd008b",
-    "#ff0048",
-    "#ff0001",
-    "#ff0000",
-    "#ff2000",
-    "#ff5000",
-    "#ff8100",
-    "#ffaf00",
-    "#ffd700",
-    "#fff600",
-    "#e3ff00",
-    "#b3ff00",
-    "#82ff00",
-    "#54fe00"
-  ],
-  "rainbow": [
-    "#7f00ff",
-    "#7d03fe",
-    "#7b06fe",
-    "#7909fe",
-    "#770cfe",
-    "#750ffe",
-    "#7312fe",
-    "#7115fe",
-    "#6f19fe",
-    "#6d1cfe",
-    "#6b1ffe",
-    "#6922fe",
-    "#6725fe",
-    "#6528fe",
-    "#632bfe",
-    "#612efd",
-    "#5f31fd",
-    "#5d35fd",
-    "#5b38fd",
-    "#593bfd",
-    "#573efd",
-    "#5541fc",
-    "#5344fc",
-    "#5147fc",
-    "#4f4afc",
-    "#4d4dfb",
-    "#4b50fb",
-    "#4953fb",
-    "#4756fb",
-    "#4559fa",
-    "#435cfa",
-    "#415ffa",
-    "#3f61fa",
-    "#3d64f9",
-    "#3b67f9",
-    "#396af9",
-    "#376df8",
-    "#3570f8",
-    "#3373f8",
-    "#3175f7",
-    "#2f78f7",
-    "#2d7bf6",
-    "#2b7ef6",
-    "#2980f6",
-    "#2783f5",
-    "#2586f5",
-    "#2388f4",
-    "#218bf4",
-    "#1f8ef3",
-    "#1d90f3",
-    "#1b93f3",
-    "#1995f2",
-    "#1798f2",
-    "#159af1",
-    "#139df1",
-    "#119ff0",
-    "#0fa2ef",
-    "#0da4ef",
-    "#0ba7ee",
-    "#09a9ee",
-    "#07abed",
-    "#05aeed",
-    "#03b0ec",
-    "#01b2ec",
-    "#00b4eb",
-    "#02b7ea",
-    "#04b9ea",
-    "#06bbe9",
-    "#08bde8",
-    "#0abfe8",
-    "#0cc1e7",
-    "#0ec3e6",
-    "#10c5e6",
-    "#12c7e5",
-    "#14c9e4",
-    "#16cbe4",
-    "#18cde3",
-    "#1acfe2",
-    "#1cd1e2",
-    "#1ed2e1",
-    "#20d4e0",
-    "#22d6df",
-    "#24d7df",
-    "#26d9de",
-    "#28dbdd",
-    "#2adcdc",
-    "#2cdedc",
-    "#2edfdb",
-    "#30e1da",
-    "#32e2d9",
-    "#34e4d8",
-    "#36e5d7",
-    "#38e6d7",
-    "#3ae8d6",
-    "#3ce9d5",
-    "#3eead4",
-    "#40ecd3",
-    "#42edd2",
-    "#44eed1",
-    "#46efd1",
-    "#48f0d0",
-    "#4af1cf",
-    "#4cf2ce",
-    "#4ef3cd",
-    "#50f4cc",
-    "#52f5cb",
-    "#54f6ca",
-    "#56f6c9",
-    "#58f7c8",
-    "#5af8c7",
-    "#5cf9c6",
-    "#5ef9c5",
-    "#60fac4",
-    "#62fac3",
-    "#64fbc2",
-    "#66fbc1",
-    "#68fcc0",
-    "#6afcbf",
-    "#6cfdbe",
-    "#6efdbd",
-    "#70fdbc",
-    "#72febb",
-    "#74feba",
-    "#76feb9",
-    "#78feb8",
-    "#7afeb7",
-    "#7cfeb5",
-    "#7efeb4",
-    "#80feb3",
-    "#82feb2",
-    "#84feb1",
-    "#86feb0",
-    "#88feaf",
-    "#8afeae",
-    "#8cfeac",
-    "#8efdab",
-    "#90fdaa",
-    "#92fda9",
-    "#94fca8",
-    "#96fca7",
-    "#98fba5",
-    "#9afba4",
-    "#9cfaa3",
-    "#9efaa2",
-    "#a0f9a1",
-    "#a2f99f",
-    "#a4f89e",
-    "#a6f79d",
-    "#a8f69c",
-    "#aaf69a",
-    "#acf599",
-    "#aef498",
-    "#b0f397",
-    "#b2f295",
-    "#b4f194",
-    "#b6f093",
-    "#b8ef92",
-    "#baee90",
-    "#bced8f",
-    "#beec8e",
-    "#c0ea8c",
-    "#c2e98b",
-    "#c4e88a",
-    "#c6e688",
-    "#c8e587",
-    "#cae486",
-    "#cce284",
-    "#cee183",
-    "#d0df82",
-    "#d2de80",
-    "#d4dc7f",
-    "#d6db7e",
-    "#d8d97c",
-    "#dad77b",
-    "#dcd67a",
-    "#ded478",
-    "#e0d277",
-    "#e2d175",
-    "#e4cf74",
-    "#e6cd73",
-    "#e8cb71",
-    "#eac970",
-    "#ecc76e",
-    "#eec56d",
-    "#f0c36c",
-    "#f2c16a",
-    "#f4bf69",
-    "#f6bd67",
-    "#f8bb66",
-    "#fab964",
-    "#fcb763",
-    "#feb461",
-    "#ffb260",
-    "#ffb05f",
-    "#ffae5d",
-    "#ffab5c",
-    "#ffa95a",
-    "#ffa759",
-    "#ffa457",
-    "#ffa256",
-    "#ff9f54",
-    "#ff9d53",
-    "#ff9a51",
-    "#ff9850",
-    "#ff954e",
-    "#ff934d",
-    "#ff904b",
-    "#ff8e4a",
-    "#ff8b48",
-    "#ff8847",
-    "#ff8645",
-    "#ff8344",
-    "#ff8042",
-    "#ff7e41",
-    "#ff7b3f",
-    "#ff783e",
-    "#ff753c",
-    "#ff733b",
-    "#ff7039",
-    "#ff6d38",
-    "#ff6a36",
-    "#ff6735",
-    "#ff6433",
-    "#ff6131",
-    "#ff5f30",
-    "#ff5c2e",
-    "#ff592d",
-    "#ff562b",
-    "#ff532a",
-    "#ff5028",
-    "#ff4d27",
-    "#ff4a25",
-    "#ff4724",
-    "#ff4422",
-    "#ff4120",
-    "#ff3e1f",
-    "#ff3b1d",
-    "#ff381c",
-    "#ff351a",
-    "#ff3119",
-    "#ff2e17",
-    "#ff2b15",
-    "#ff2814",
-    "#ff2512",
-    "#ff2211",
-    "#ff1f0f",
-    "#ff1c0e",
-    "#ff190c",
-    "#ff150a",
-    "#ff1209",
-    "#ff0f07",
-    "#ff0c06",
-    "#ff0904",
-    "#ff0603",
-    "#ff0301",
-    "#ff0000"
-  ],
-  "seismic": [
-    "#00004c",
-    "#00004f",
-    "#000052",
-    "#000054",
-    "#000057",
-    "#00005a",
-    "#00005d",
-    "#000060",
-    "#000062",
-    "#000065",
-    "#000068",
-    "#00006b",
-    "#00006e",
-    "#000070",
-    "#000073",
-    "#000076",
-    "#000079",
-    "#00007c",
-    "#00007e",
-    "#000081",
-    "#000084",
-    "#000087",
-    "#00008a",
-    "#00008c",
-    "#00008f",
-    "#000092",
-    "#000095",
-    "#000098",
-    "#00009a",
-    "#00009d",
-    "#0000a0",
-    "#0000a3",
-    "#0000a6",
-    "#0000a8",
-    "#0000ab",
-    "#0000ae",
-    "#0000b1",
-    "#0000b4",
-    "#0000b6",
-    "#0000b9",
-    "#0000bc",
-    "#0000bf",
-    "#0000c2",
-    "#0000c4",
-    "#0000c7",
-    "#0000ca",
-    "#0000cd",
-    "#0000d0",
-    "#0000d2",
-    "#0000d5",
-    "#0000d8",
-    "#0000db",
-    "#0000de",
-    "#0000e0",
-    "#0000e3",
-    "#0000e6",
-    "#0000e9",
-    "#0000ec",
-    "#0000ee",
-    "#0000f1",
-    "#0000f4",
-    "#0000f7",
-    "#0000fa",
-    "#0000fc",
-    "#0101ff",
-    "#0505ff",
-    "#0808ff",
-    "#0d0dff",
-    "#1111ff",
-    "#1515ff",
-    "#1919ff",
-    "#1d1dff",
-    "#2121ff",
-    "#2525ff",
-    "#2828ff",
-    "#2d2dff",
-    "#3131ff",
-    "#3535ff",
-    "#3939ff",
-    "#3d3dff",
-    "#4141ff",
-    "#4545ff",
-    "#4848ff",
-    "#4d4dff",
-    "#5151ff",
-    "#5555ff",
-    "#5959ff",
-    "#5d5dff",
-    "#6161ff",
-    "#6565ff",
-    "#6868ff",
-    "#6d6dff",
-    "#7171ff",
-    "#7575ff",
-    "#7979ff",
-    "#7d7dff",
-    "#8181ff",
-    "#8585ff",
-    "#8888ff",
-    "#8d8dff",
-    "#9191ff",
-    "#9595ff",
-    "#9999ff",
-    "#9d9dff",
-    "#a1a1ff",
-    "#a5a5ff",
-    "#a8a8ff",
-    "#adadff",
-    "#b1b1ff",
-    "#b5b5ff",
-    "#b9b9ff",
-    "#bdbdff",
-    "#c1c1ff",
-    "#c5c5ff",
-    "#c8c8ff",
-    "#cdcdff",
-    "#d1d1ff",
-    "#d5d5ff",
-    "#d9d9ff",
-    "#ddddff",
-    "#e1e1ff",
-    "#e5e5ff",
-    "#e8e8ff",
-    "#ededff",
-    "#f1f1ff",
-    "#f5f5ff",
-    "#f9f9ff",
-    "#fdfdff",
-    "#fffdfd",
-    "#fff9f9",
-    "#fff5f5",
-    "#fff1f1",
-    "#ffeded",
-    "#ffe9e9",
-    "#ffe5e5",
-    "#ffe1e1",
-    "#ffdddd",
-    "#ffd9d9",
-    "#ffd5d5",
-    "#ffd1d1",
-    "#ffcdcd",
-    "#ffc9c9",
-    "#ffc5c5",
-    "#ffc1c1",
-    "#ffbdbd",
-    "#ffb9b9",
-    "#ffb4b4",
-    "#ffb1b1",
-    "#ffadad",
-    "#ffa9a9",
-    "#ffa4a4",
-    "#ffa1a1",
-    "#ff9d9d",
-    "#ff9999",
-    "#ff9494",
-    "#ff9191",
-    "#ff8d8d",
-    "#ff8989",
-    "#ff8484",
-    "#ff8181",
-    "#ff7d7d",
-    "#ff7979",
-    "#ff7575",
-    "#ff7171",
-    "#ff6d6d",
-    "#ff6969",
-    "#ff6565",
-    "#ff6161",
-    "#ff5d5d",
-    "#ff5959",
-    "#ff5555",
-    "#ff5151",
-    "#ff4d4d",
-    "#ff4949",
-    "#ff4545",
-    "#ff4141",
-    "#ff3d3d",
-    "#ff3838",
-    "#ff3535",
-    "#ff3030",
-    "#ff2d2d",
-    "#ff2828",
-    "#ff2525",
-    "#ff2020",
-    "#ff1d1d",
-    "#ff1818",
-    "#ff1515",
-    "#ff1010",
-    "#ff0d0d",
-    "#ff0808",
-    "#ff0505",
-    "#ff0000",
-    "#fd0000",
-    "#fb0000",
-    "#f90000",
-    "#f70000",
-    "#f50000",
-    "#f30000",
-    "#f10000",
-    "#ef0000",
-    "#ed0000",
-    "#eb0000",
-    "#e90000",
-    "#e70000",
-    "#e50000",
-    "#e30000",
-    "#e10000",
-    "#df0000",
-    "#dd0000",
-    "#db0000",
-    "#d90000",
-    "#d70000",
-    "#d50000",
-    "#d30000",
-    "#d10000",
-    "#cf0000",
-    "#cd0000",
-    "#cb0000",
-    "#c90000",
-    "#c70000",
-    "#c50000",
-    "#c30000",
-    "#c10000",
-    "#bf0000",
-    "#bd0000",
-    "#bb0000",
-    "#b90000",
-    "#b70000",
-    "#b50000",
-    "#b30000",
-    "#b10000",
-    "#af0000",
-    "#ad0000",
-    "#ab0000",
-    "#a90000",
-    "#a70000",
-    "#a50000",
-    "#a30000",
-    "#a10000",
-    "#9f0000",
-    "#9d0000",
-    "#9b0000",
-    "#990000",
-    "#970000",
-    "#950000",
-    "#930000",
-    "#910000",
-    "#8f0000",
-    "#8d0000",
-    "#8b0000",
-    "#890000",
-    "#870000",
-    "#850000",
-    "#830000",
-    "#810000",
-    "#7f0000"
-  ],
-  "spring": [
-    "#ff00ff",
-    "#ff01fe",
-    "#ff02fd",
-    "#ff03fc",
-    "#ff04fb",
-    "#ff05fa",
-    "#ff06f9",
-    "#ff07f8",
-    "#ff08f7",
-    "#ff09f6",
-    "#ff0af5",
-    "#ff0bf4",
-    "#ff0cf3",
-    "#ff0df2",
-    "#ff0ef1",
-    "#ff0ff0",
-    "#ff10ef",
-    "#ff11ee",
-    "#ff12ed",
-    "#ff13ec",
-    "#ff14eb",
-    "#ff15ea",
-    "#ff16e9",
-    "#ff17e8",
-    "#ff18e7",
-    "#ff19e6",
-    "#ff1ae5",
-    "#ff1be4",
-    "#ff1ce3",
-    "#ff1de2",
-    "#ff1ee1",
-    "#ff1fe0",
-    "#ff20df",
-    "#ff20de",
-    "#ff22dd",
-    "#ff23dc",
-    "#ff24db",
-    "#ff24da",
-    "#ff26d9",
-    "#ff27d8",
-    "#ff28d7",
-    "#ff28d6",
-    "#ff2ad5",
-    "#ff2bd3",
-    "#ff2cd3",
-    "#ff2cd2",
-    "#ff2ed1",
-    "#ff2fd0",
-    "#ff30cf",
-    "#ff30ce",
-    "#ff32cd",
-    "#ff33cc",
-    "#ff34cb",
-    "#ff34ca",
-    "#ff36c9",
-    "#ff37c8",
-    "#ff38c7",
-    "#ff38c6",
-    "#ff3ac5",
-    "#ff3bc3",
-    "#ff3cc3",
-    "#ff3cc2",
-    "#ff3ec1",
-    "#ff3fc0",
-    "#ff40bf",
-    "#ff41be",
-    "#ff41bd",
-    "#ff43bc",
-    "#ff44bb",
-    "#ff45ba",
-    "#ff46b9",
-    "#ff47b8",
-    "#ff48b7",
-    "#ff49b6",
-    "#ff49b5",
-    "#ff4bb3",
-    "#ff4cb3",
-    "#ff4db2",
-    "#ff4eb1",
-    "#ff4fb0",
-    "#ff50af",
-    "#ff51ae",
-    "#ff51ad",
-    "#ff53ac",
-    "#ff54ab",
-    "#ff55aa",
-    "#ff56a9",
-    "#ff57a8",
-    "#ff58a7",
-    "#ff59a6",
-    "#ff59a5",
-    "#ff5ba3",
-    "#ff5ca3",
-    "#ff5da2",
-    "#ff5ea1",
-    "#ff5fa0",
-    "#ff609f",
-    "#ff619e",
-    "#ff619d",
-    "#ff639c",
-    "#ff649b",
-    "#ff659a",
-    "#ff6699",
-    "#ff6798",
-    "#ff6897",
-    "#ff6996",
-    "#ff6995",
-    "#ff6b93",
-    "#ff6c93",
-    "#ff6d92",
-    "#ff6e91",
-    "#ff6f90",
-    "#ff708f",
-    "#ff718e",
-    "#ff718d",
-    "#ff738c",
-    "#ff748b",
-    "#ff758a",
-    "#ff7689",
-    "#ff7788",
-    "#ff7887",
-    "#ff7986",
-    "#ff7985",
-    "#ff7b83",
-    "#ff7c83",
-    "#ff7d82",
-    "#ff7e81",
-    "#ff7f80",
-    "#ff807f",
-    "#ff817e",
-    "#ff827d",
-    "#ff837c",
-    "#ff837b",
-    "#ff8579",
-    "#ff8679",
-    "#ff8778",
-    "#ff8877",
-    "#ff8976",
-    "#ff8a75",
-    "#ff8b74",
-    "#ff8c72",
-    "#ff8d71",
-    "#ff8e71",
-    "#ff8f70",
-    "#ff906f",
-    "#ff916e",
-    "#ff926d",
-    "#ff936c",
-    "#ff936b",
-    "#ff9569",
-    "#ff9669",
-    "#ff9768",
-    "#ff9867",
-    "#ff9966",
-    "#ff9a65",
-    "#ff9b64",
-    "#ff9c62",
-    "#ff9d61",
-    "#ff9e61",
-    "#ff9f60",
-    "#ffa05f",
-    "#ffa15e",
-    "#ffa25d",
-    "#ffa35c",
-    "#ffa35b",
-    "#ffa559",
-    "#ffa659",
-    "#ffa758",
-    "#ffa857",
-    "#ffa956",
-    "#ffaa55",
-    "#ffab54",
-    "#ffac52",
-    "#ffad51",
-    "#ffae51",
-    "#ffaf50",
-    "#ffb04f",
-    "#ffb14e",
-    "#ffb24d",
-    "#ffb34c",
-    "#ffb34b",
-    "#ffb549",
-    "#ffb649",
-    "#ffb748",
-    "#ffb847",
-    "#ffb946",
-    "#ffba45",
-    "#ffbb44",
-    "#ffbc42",
-    "#ffbd41",
-    "#ffbe41",
-    "#ffbf40",
-    "#ffc03f",
-    "#ffc13e",
-    "#ffc23d",
-    "#ffc33c",
-    "#ffc33b",
-    "#ffc539",
-    "#ffc638",
-    "#ffc738",
-    "#ffc837",
-    "#ffc936",
-    "#ffca35",
-    "#ffcb34",
-    "#ffcc32",
-    "#ffcd31",
-    "#ffce30",
-    "#ffcf30",
-    "#ffd02f",
-    "#ffd12e",
-    "#ffd22d",
-    "#ffd32c",
-    "#ffd32b",
-    "#ffd529",
-    "#ffd628",
-    "#ffd728",
-    "#ffd827",
-    "#ffd926",
-    "#ffda25",
-    "#ffdb24",
-    "#ffdc22",
-    "#ffdd21",
-    "#ffde20",
-    "#ffdf20",
-    "#ffe01f",
-    "#ffe11e",
-    "#ffe21d",
-    "#ffe31c",
-    "#ffe31b",
-    "#ffe519",
-    "#ffe618",
-    "#ffe718",
-    "#ffe817",
-    "#ffe916",
-    "#ffea15",
-    "#ffeb14",
-    "#ffec12",
-    "#ffed11",
-    "#ffee10",
-    "#ffef10",
-    "#fff00f",
-    "#fff10e",
-    "#fff20d",
-    "#fff30c",
-    "#fff30b",
-    "#fff509",
-    "#fff608",
-    "#fff708",
-    "#fff807",
-    "#fff906",
-    "#fffa05",
-    "#fffb04",
-    "#fffc02",
-    "#fffd01",
-    "#fffe00",
-    "#ffff00"
-  ],
-  "summer": [
-    "#007f66",
-    "#018066",
-    "#028066",
-    "#038166",
-    "#048166",
-    "#058266",
-    "#068266",
-    "#078366",
-    "#088366",
-    "#098466",
-    "#0a8466",
-    "#0b8566",
-    "#0c8566",
-    "#0d8666",
-    "#0e8666",
-    "#0f8766",
-    "#108766",
-    "#118866",
-    "#128866",
-    "#138966",
-    "#148966",
-    "#158a66",
-    "#168a66",
-    "#178b66",
-    "#188b66",
-    "#198c66",
-    "#1a8c66",
-    "#1b8d66",
-    "#1c8d66",
-    "#1d8e66",
-    "#1e8e66",
-    "#1f8f66",
-    "#208f66",
-    "#209066",
-    "#229066",
-    "#239166",
-    "#249166",
-    "#249266",
-    "#269266",
-    "#279366",
-    "#289366",
-    "#289366",
-    "#2a9466",
-    "#2b9566",
-    "#2c9566",
-    "#2c9666",
-    "#2e9666",
-    "#2f9766",
-    "#309766",
-    "#309866",
-    "#329866",
-    "#339966",
-    "#349966",
-    "#349a66",
-    "#369a66",
-    "#379b66",
-    "#389b66",
-    "#389c66",
-    "#3a9c66",
-    "#3b9d66",
-    "#3c9d66",
-    "#3c9e66",
-    "#3e9e66",
-    "#3f9f66",
-    "#409f66",
-    "#41a066",
-    "#41a066",
-    "#43a166",
-    "#44a166",
-    "#45a266",
-    "#46a266",
-    "#47a366",
-    "#48a366",
-    "#49a366",
-    "#49a466",
-    "#4ba566",
-    "#4ca566",
-    "#4da666",
-    "#4ea666",
-    "#4fa766",
-    "#50a766",
-    "#51a866",
-    "#51a866",
-    "#53a966",
-    "#54a966",
-    "#55aa66",
-    "#56aa66",
-    "#57ab66",
-    "#58ab66",
-    "#59ac66",
-    "#59ac66",
-    "#5bad66",
-    "#5cad66",
-    "#5dae66",
-    "#5eae66",
-    "#5faf66",
-    "#60af66",
-    "#61b066",
-    "#61b066",
-    "#63b166",
-    "#64b166",
-    "#65b266",
-    "#66b266",
-    "#67b366",
-    "#68b366",
-    "#69b366",
-    "#69b466",
-    "#6bb566",
-    "#6cb566",
-    "#6db666",
-    "#6eb666",
-    "#6fb766",
-    "#70b766",
-    "#71b866",
-    "#71b866",
-    "#73b966",
-    "#74b966",
-    "#75ba66",
-    "#76ba66",
-    "#77bb66",
-    "#78bb66",
-    "#79bc66",
-    "#79bc66",
-    "#7bbd66",
-    "#7cbd66",
-    "#7dbe66",
-    "#7ebe66",
-    "#7fbf66",
-    "#80bf66",
-    "#81c066",
-    "#82c066",
-    "#83c166",
-    "#83c166",
-    "#85c266",
-    "#86c266",
-    "#87c366",
-    "#88c366",
-    "#89c366",
-    "#8ac466",
-    "#8bc466",
-    "#8cc566",
-    "#8dc666",
-    "#8ec666",
-    "#8fc766",
-    "#90c766",
-    "#91c866",
-    "#92c866",
-    "#93c966",
-    "#93c966",
-    "#95ca66",
-    "#96ca66",
-    "#97cb66",
-    "#98cb66",
-    "#99cc66",
-    "#9acc66",
-    "#9bcd66",
-    "#9ccd66",
-    "#9dce66",
-    "#9ece66",
-    "#9fcf66",
-    "#a0cf66",
-    "#a1d066",
-    "#a2d066",
-    "#a3d166",
-    "#a3d166",
-    "#a5d266",
-    "#a6d266",
-    "#a7d366",
-    "#a8d366",
-    "#a9d366",
-    "#aad466",
-    "#abd466",
-    "#acd566",
-    "#add666",
-    "#aed666",
-    "#afd766",
-    "#b0d766",
-    "#b1d866",
-    "#b2d866",
-    "#b3d966",
-    "#b3d966",
-    "#b5da66",
-    "#b6da66",
-    "#b7db66",
-    "#b8db66",
-    "#b9dc66",
-    "#badc66",
-    "#bbdd66",
-    "#bcdd66",
-    "#bdde66",
-    "#bede66",
-    "#bfdf66",
-    "#c0df66",
-    "#c1e066",
-    "#c2e066",
-    "#c3e166",
-    "#c3e166",
-    "#c5e266",
-    "#c6e266",
-    "#c7e366",
-    "#c8e366",
-    "#c9e366",
-    "#cae466",
-    "#cbe466",
-    "#cce566",
-    "#cde666",
-    "#cee666",
-    "#cfe766",
-    "#d0e766",
-    "#d1e866",
-    "#d2e866",
-    "#d3e966",
-    "#d3e966",
-    "#d5ea66",
-    "#d6ea66",
-    "#d7eb66",
-    "#d8eb66",
-    "#d9ec66",
-    "#daec66",
-    "#dbed66",
-    "#dced66",
-    "#ddee66",
-    "#deee66",
-    "#dfef66",
-    "#e0ef66",
-    "#e1f066",
-    "#e2f066",
-    "#e3f166",
-    "#e3f166",
-    "#e5f266",
-    "#e6f266",
-    "#e7f366",
-    "#e8f366",
-    "#e9f366",
-    "#eaf466",
-    "#ebf466",
-    "#ecf566",
-    "#edf666",
-    "#eef666",
-    "#eff766",
-    "#f0f766",
-    "#f1f866",
-    "#f2f866",
-    "#f3f966",
-    "#f3f966",
-    "#f5fa66",
-    "#f6fa66",
-    "#f7fb66",
-    "#f8fb66",
-    "#f9fc66",
-    "#fafc66",
-    "#fbfd66",
-    "#fcfd66",
-    "#fdfe66",
-    "#fefe66",
-    "#ffff66"
-  ],
-  "tab10": [
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf"
-  ],
-  "tab20": [
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#1f77b4",
-    "#aec7e8",
-    "#aec7e8",
-    "#aec7e8",
-    "#aec7e8",
-    "#aec7e8",
-    "#aec7e8",
-    "#aec7e8",
-    "#aec7e8",
-    "#aec7e8",
-    "#aec7e8",
-    "#aec7e8",
-    "#aec7e8",
-    "#aec7e8",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ff7f0e",
-    "#ffbb78",
-    "#ffbb78",
-    "#ffbb78",
-    "#ffbb78",
-    "#ffbb78",
-    "#ffbb78",
-    "#ffbb78",
-    "#ffbb78",
-    "#ffbb78",
-    "#ffbb78",
-    "#ffbb78",
-    "#ffbb78",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#2ca02c",
-    "#98df8a",
-    "#98df8a",
-    "#98df8a",
-    "#98df8a",
-    "#98df8a",
-    "#98df8a",
-    "#98df8a",
-    "#98df8a",
-    "#98df8a",
-    "#98df8a",
-    "#98df8a",
-    "#98df8a",
-    "#98df8a",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#d62728",
-    "#ff9896",
-    "#ff9896",
-    "#ff9896",
-    "#ff9896",
-    "#ff9896",
-    "#ff9896",
-    "#ff9896",
-    "#ff9896",
-    "#ff9896",
-    "#ff9896",
-    "#ff9896",
-    "#ff9896",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#9467bd",
-    "#c5b0d5",
-    "#c5b0d5",
-    "#c5b0d5",
-    "#c5b0d5",
-    "#c5b0d5",
-    "#c5b0d5",
-    "#c5b0d5",
-    "#c5b0d5",
-    "#c5b0d5",
-    "#c5b0d5",
-    "#c5b0d5",
-    "#c5b0d5",
-    "#c5b0d5",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#8c564b",
-    "#c49c94",
-    "#c49c94",
-    "#c49c94",
-    "#c49c94",
-    "#c49c94",
-    "#c49c94",
-    "#c49c94",
-    "#c49c94",
-    "#c49c94",
-    "#c49c94",
-    "#c49c94",
-    "#c49c94",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#e377c2",
-    "#f7b6d2",
-    "#f7b6d2",
-    "#f7b6d2",
-    "#f7b6d2",
-    "#f7b6d2",
-    "#f7b6d2",
-    "#f7b6d2",
-    "#f7b6d2",
-    "#f7b6d2",
-    "#f7b6d2",
-    "#f7b6d2",
-    "#f7b6d2",
-    "#f7b6d2",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#7f7f7f",
-    "#c7c7c7",
-    "#c7c7c7",
-    "#c7c7c7",
-    "#c7c7c7",
-    "#c7c7c7",
-    "#c7c7c7",
-    "#c7c7c7",
-    "#c7c7c7",
-    "#c7c7c7",
-    "#c7c7c7",
-    "#c7c7c7",
-    "#c7c7c7",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#bcbd22",
-    "#dbdb8d",
-    "#dbdb8d",
-    "#dbdb8d",
-    "#dbdb8d",
-    "#dbdb8d",
-    "#dbdb8d",
-    "#dbdb8d",
-    "#dbdb8d",
-    "#dbdb8d",
-    "#dbdb8d",
-    "#dbdb8d",
-    "#dbdb8d",
-    "#dbdb8d",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#17becf",
-    "#9edae5",
-    "#9edae5",
-    "#9edae5",
-    "#9edae5",
-    "#9edae5",
-    "#9edae5",
-    "#9edae5",
-    "#9edae5",
-    "#9edae5",
-    "#9edae5",
-    "#9edae5",
-    "#9edae5",
-    "#9edae5"
-  ],
-  "tab20b": [
-    "#393b79",
-    "#393b79",
-    "#393b79",
-    "#393b79",
-    "#393b79",
-    "#393b79",
-    "#393b79",
-    "#393b79",
-    "#393b79",
-    "#393b79",
-    "#393b79",
-    "#393b79",
-    "#393b79",
-    "#5254a3",
-    "#5254a3",
-    "#5254a3",
-    "#5254a3",
-    "#5254a3",
-    "#5254a3",
-    "#5254a3",
-    "#5254a3",
-    "#5254a3",
-    "#5254a3",
-    "#5254a3",
-    "#5254a3",
-    "#5254a3",
-    "#6b6ecf",
-    "#6b6ecf",
-    "#6b6ecf",
-    "#6b6ecf",
-    "#6b6ecf",
-    "#6b6ecf",
-    "#6b6ecf",
-    "#6b6ecf",
-    "#6b6ecf",
-    "#6b6ecf",
-    "#6b6ecf",
-    "#6b6ecf",
-    "#6b6ecf",
-    "#9c9ede",
-    "#9c9ede",
-    "#9c9ede",
-    "#9c9ede",
-    "#9c9ede",
-    "#9c9ede",
-    "#9c9ede",
-    "#9c9ede",
-    "#9c9ede",
-    "#9c9ede",
-    "#9c9ede",
-    "#9c9ede",
-    "#637939",
-    "#637939",
-    "#637939",
-    "#637939",
-    "#637939",
-    "#637939",
-    "#637939",
-    "#637939",
-    "#637939",
-    "#637939",
-    "#637939",
-    "#637939",
-    "#637939",
-    "#8ca252",
-    "#8ca252",
-    "#8ca252",
-    "#8ca252",
-    "#8ca252",
-    "#8ca252",
-    "#8ca252",
-    "#8ca252",
-    "#8ca252",
-    "#8ca252",
-    "#8ca252",
-    "#8ca252",
-    "#8ca252",
-    "#b5cf6b",
-    "#b5cf6b",
-    "#b5cf6b",
-    "#b5cf6b",
-    "#b5cf6b",
-    "#b5cf6b",
-    "#b5cf6b",
-    "#b5cf6b",
-    "#b5cf6b",
-    "#b5cf6b",
-    "#b5cf6b",
-    "#b5cf6b",
-    "#b5cf6b",
-    "#cedb9c",
-    "#cedb9c",
-    "#cedb9c",
-    "#cedb9c",
-    "#cedb9c",
-    "#cedb9c",
-    "#cedb9c",
-    "#cedb9c",
-    "#cedb9c",
-    "#cedb9c",
-    "#cedb9c",
-    "#cedb9c",
-    "#8c6d31",
-    "#8c6d31",
-    "#8c6d31",
-    "#8c6d31",
-    "#8c6d31",
-    "#8c6d31",
-    "#8c6d31",
-    "#8c6d31",
-    "#8c6d31",
-    "#8c6d31",
-    "#8c6d31",
-    "#8c6d31",
-    "#8c6d31",
-    "#bd9e39",
-    "#bd9e39",
-    "#bd9e39",
-    "#bd9e39",
-    "#bd9e39",
-    "#bd9e39",
-    "#bd9e39",
-    "#bd9e39",
-    "#bd9e39",
-    "#bd9e39",
-    "#bd9e39",
-    "#bd9e39",
-    "#bd9e39",
-    "#e7ba52",
-    "#e7ba52",
-    "#e7ba52",
-    "#e7ba52",
-    "#e7ba52",
-    "#e7ba52",
-    "#e7ba52",
-    "#e7ba52",
-    "#e7ba52",
-    "#e7ba52",
-    "#e7ba52",
-    "#e7ba52",
-    "#e7ba52",
-    "#e7cb94",
-    "#e7cb94",
-    "#e7cb94",
-    "#e7cb94",
-    "#e7cb94",
-    "#e7cb94",
-    "#e7cb94",
-    "#e7cb94",
-    "#e7cb94",
-    "#e7cb94",
-    "#e7cb94",
-    "#e7cb94",
-    "#843c39",
-    "#843c39",
-    "#843c39",
-    "#843c39",
-    "#843c39",
-    "#843c39",
-    "#843c39",
-    "#843c39",
-    "#843c39",
-    "#843c39",
-    "#843c39",
-    "#843c39",
-    "#843c39",
-    "#ad494a",
-    "#ad494a",
-    "#ad494a",
-    "#ad494a",
-    "#ad494a",
-    "#ad494a",
-    "#ad494a",
-    "#ad494a",
-    "#ad494a",
-    "#ad494a",
-    "#ad494a",
-    "#ad494a",
-    "#ad494a",
-    "#d6616b",
-    "#d6616b",
-    "#d6616b",
-    "#d6616b",
-    "#d6616b",
-    "#d6616b",
-    "#d6616b",
-    "#d6616b",
-    "#d6616b",
-    "#d6616b",
-    "#d6616b",
-    "#d6616b",
-    "#d6616b",
-    "#e7969c",
-    "#e7969c",
-    "#e7969c",
-    "#e7969c",
-    "#e7969c",
-    "#e7969c",
-    "#e7969c",
-    "#e7969c",
-    "#e7969c",
-    "#e7969c",
-    "#e7969c",
-    "#e7969c",
-    "#7b4173",
-    "#7b4173",
-    "#7b4173",
-    "#7b4173",
-    "#7b4173",
-    "#7b4173",
-    "#7b4173",
-    "#7b4173",
-    "#7b4173",
-    "#7b4173",
-    "#7b4173",
-    "#7b4173",
-    "#7b4173",
-    "#a55194",
-    "#a55194",
-    "#a55194",
-    "#a55194",
-    "#a55194",
-    "#a55194",
-    "#a55194",
-    "#a55194",
-    "#a55194",
-    "#a55194",
-    "#a55194",
-    "#a55194",
-    "#a55194",
-    "#ce6dbd",
-    "#ce6dbd",
-    "#ce6dbd",
-    "#ce6dbd",
-    "#ce6dbd",
-    "#ce6dbd",
-    "#ce6dbd",
-    "#ce6dbd",
-    "#ce6dbd",
-    "#ce6dbd",
-    "#ce6dbd",
-    "#ce6dbd",
-    "#ce6dbd",
-    "#de9ed6",
-    "#de9ed6",
-    "#de9ed6",
-    "#de9ed6",
-    "#de9ed6",
-    "#de9ed6",
-    "#de9ed6",
-    "#de9ed6",
-    "#de9ed6",
-    "#de9ed6",
-    "#de9ed6",
-    "#de9ed6",
-    "#de9ed6"
-  ],
-  "tab20c": [
-    "#3182bd",
-    "#3182bd",
-    "#3182bd",
-    "#3182bd",
-    "#3182bd",
-    "#3182bd",
-    "#3182bd",
-    "#3182bd",
-    "#3182bd",
-    "#3182bd",
-    "#3182bd",
-    "#3182bd",
-    "#3182bd",
-    "#6baed6",
-    "#6baed6",
-    "#6baed6",
-    "#6baed6",
-    "#6baed6",
-    "#6baed6",
-    "#6baed6",
-    "#6baed6",
-    "#6baed6",
-    "#6baed6",
-    "#6baed6",
-    "#6baed6",
-    "#6baed6",
-    "#9ecae1",
-    "#9ecae1",
-    "#9ecae1",
-    "#9ecae1",
-    "#9ecae1",
-    "#9ecae1",
-    "#9ecae1",
-    "#9ecae1",
-    "#9ecae1",
-    "#9ecae1",
-    "#9ecae1",
-    "#9ecae1",
-    "#9ecae1",
-    "#c6dbef",
-    "#c6dbef",
-    "#c6dbef",
-    "#c6dbef",
-    "#c6dbef",
-    "#c6dbef",
-    "#c6dbef",
-    "#c6dbef",
-    "#c6dbef",
-    "#c6dbef",
-    "#c6dbef",
-    "#c6dbef",
-    "#e6550d",
-    "#e6550d",
-    "#e6550d",
-    "#e6550d",
-    "#e6550d",
-    "#e6550d",
-    "#e6550d",
-    "#e6550d",
-    "#e6550d",
-    "#e6550d",
-    "#e6550d",
-    "#e6550d",
-    "#e6550d",
-    "#fd8d3c",
-    "#fd8d3c",
-    "#fd8d3c",
-    "#fd8d3c",
-    "#fd8d3c",
-    "#fd8d3c",
-    "#fd8d3c",
-    "#fd8d3c",
-    "#fd8d3c",
-    "#fd8d3c",
-    "#fd8d3c",
-    "#fd8d3c",
-    "#fd8d3c",
-    "#fdae6b",
-    "#fdae6b",
-    "#fdae6b",
-    "#fdae6b",
-    "#fdae6b",
-    "#fdae6b",
-    "#fdae6b",
-    "#fdae6b",
-    "#fdae6b",
-    "#fdae6b",
-    "#fdae6b",
-    "#fdae6b",
-    "#fdae6b",
-    "#fdd0a2",
-    "#fdd0a2",
-    "#fdd0a2",
-    "#fdd0a2",
-    "#fdd0a2",
-    "#fdd0a2",
-    "#fdd0a2",
-    "#fdd0a2",
-    "#fdd0a2",
-    "#fdd0a2",
-    "#fdd0a2",
-    "#fdd0a2",
-    "#31a354",
-    "#31a354",
-    "#31a354",
-    "#31a354",
-    "#31a354",
-    "#31a354",
-    "#31a354",
-    "#31a354",
-    "#31a354",
-    "#31a354",
-    "#31a354",
-    "#31a354",
-    "#31a354",
-    "#74c476",
-    "#74c476",
-    "#74c476",
-    "#74c476",
-    "#74c476",
-    "#74c476",
-    "#74c476",
-    "#74c476",
-    "#74c476",
-    "#74c476",
-    "#74c476",
-    "#74c476",
-    "#74c476",
-    "#a1d99b",
-    "#a1d99b",
-    "#a1d99b",
-    "#a1d99b",
-    "#a1d99b",
-    "#a1d99b",
-    "#a1d99b",
-    "#a1d99b",
-    "#a1d99b",
-    "#a1d99b",
-    "#a1d99b",
-    "#a1d99b",
-    "#a1d99b",
-    "#c7e9c0",
-    "#c7e9c0",
-    "#c7e9c0",
-    "#c7e9c0",
-    "#c7e9c0",
-    "#c7e9c0",
-    "#c7e9c0",
-    "#c7e9c0",
-    "#c7e9c0",
-    "#c7e9c0",
-    "#c7e9c0",
-    "#c7e9c0",
-    "#756bb1",
-    "#756bb1",
-    "#756bb1",
-    "#756bb1",
-    "#756bb1",
-    "#756bb1",
-    "#756bb1",
-    "#756bb1",
-    "#756bb1",
-    "#756bb1",
-    "#756bb1",
-    "#756bb1",
-    "#756bb1",
-    "#9e9ac8",
-    "#9e9ac8",
-    "#9e9ac8",
-    "#9e9ac8",
-    "#9e9ac8",
-    "#9e9ac8",
-    "#9e9ac8",
-    "#9e9ac8",
-    "#9e9ac8",
-    "#9e9ac8",
-    "#9e9ac8",
-    "#9e9ac8",
-    "#9e9ac8",
-    "#bcbddc",
-    "#bcbddc",
-    "#bcbddc",
-    "#bcbddc",
-    "#bcbddc",
-    "#bcbddc",
-    "#bcbddc",
-    "#bcbddc",
-    "#bcbddc",
-    "#bcbddc",
-    "#bcbddc",
-    "#bcbddc",
-    "#bcbddc",
-    "#dadaeb",
-    "#dadaeb",
-    "#dadaeb",
-    "#dadaeb",
-    "#dadaeb",
-    "#dadaeb",
-    "#dadaeb",
-    "#dadaeb",
-    "#dadaeb",
-    "#dadaeb",
-    "#dadaeb",
-    "#dadaeb",
-    "#636363",
-    "#636363",
-    "#636363",
-    "#636363",
-    "#636363",
-    "#636363",
-    "#636363",
-    "#636363",
-    "#636363",
-    "#636363",
-    "#636363",
-    "#636363",
-    "#636363",
-    "#969696",
-    "#969696",
-    "#969696",
-    "#969696",
-    "#969696",
-    "#969696",
-    "#969696",
-    "#969696",
-    "#969696",
-    "#969696",
-    "#969696",
-    "#969696",
-    "#969696",
-    "#bdbdbd",
-    "#bdbdbd",
-    "#bdbdbd",
-    "#bdbdbd",
-    "#bdbdbd",
-    "#bdbdbd",
-    "#bdbdbd",
-    "#bdbdbd",
-    "#bdbdbd",
-    "#bdbdbd",
-    "#bdbdbd",
-    "#bdbdbd",
-    "#bdbdbd",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9",
-    "#d9d9d9"
-  ],
-  "terrain": [
-    "#333399",
-    "#31359b",
-    "#30389e",
-    "#2f3ba1",
-    "#2d3da3",
-    "#2c40a6",
-    "#2b43a9",
-    "#2945ab",
-    "#2848ae",
-    "#274bb1",
-    "#254db3",
-    "#2450b6",
-    "#2353b9",
-    "#2155bb",
-    "#2058be",
-    "#1f5bc1",
-    "#1d5dc3",
-    "#1c60c6",
-    "#1b62c9",
-    "#1965cb",
-    "#1868ce",
-    "#176bd1",
-    "#156dd3",
-    "#1470d6",
-    "#1373d9",
-    "#1175db",
-    "#1078de",
-    "#0e7be1",
-    "#0d7de3",
-    "#0c80e6",
-    "#0b83e9",
-    "#0985eb",
-    "#0888ee",
-    "#078af1",
-    "#058df3",
-    "#0490f6",
-    "#0393f9",
-    "#0195fb",
-    "#0098fe",
-    "#009afa",
-    "#009cf4",
-    "#009eee",
-    "#00a0e8",
-    "#00a2e2",
-    "#00a4dc",
-    "#00a6d6",
-    "#00a8d0",
-    "#00aaca",
-    "#00acc4",
-    "#00aebe",
-    "#00b0b8",
-    "#00b2b2",
-    "#00b4ac",
-    "#00b6a6",
-    "#00b8a0",
-    "#00ba9a",
-    "#00bc94",
-    "#00be8e",
-    "#00c088",
-    "#00c282",
-    "#00c47c",
-    "#00c676",
-    "#00c870",
-    "#00ca6a",
-    "#01cc66",
-    "#05cd67",
-    "#08cd67",
-    "#0dce68",
-    "#11cf69",
-    "#15d06a",
-    "#19d16b",
-    "#1dd16b",
-    "#21d26c",
-    "#25d36d",
-    "#28d46e",
-    "#2dd56f",
-    "#31d56f",
-    "#35d670",
-    "#39d771",
-    "#3dd872",
-    "#41d973",
-    "#45d973",
-    "#48da74",
-    "#4ddb75",
-    "#51dc76",
-    "#55dd77",
-    "#59dd77",
-    "#5dde78",
-    "#61df79",
-    "#65e07a",
-    "#68e17a",
-    "#6de17b",
-    "#71e27c",
-    "#75e37d",
-    "#79e47e",
-    "#7de57f",
-    "#81e57f",
-    "#85e680",
-    "#88e781",
-    "#8de882",
-    "#91e983",
-    "#95e983",
-    "#99ea84",
-    "#9deb85",
-    "#a1ec86",
-    "#a5ed87",
-    "#a8ed87",
-    "#adee88",
-    "#b1ef89",
-    "#b5f08a",
-    "#b9f18b",
-    "#bdf18b",
-    "#c1f28c",
-    "#c5f38d",
-    "#c8f48e",
-    "#cdf58f",
-    "#d1f58f",
-    "#d5f690",
-    "#d9f791",
-    "#ddf892",
-    "#e1f993",
-    "#e5f993",
-    "#e8fa94",
-    "#edfb95",
-    "#f1fc96",
-    "#f5fd97",
-    "#f9fd97",
-    "#fdfe98",
-    "#fefd98",
-    "#fcfb97",
-    "#faf896",
-    "#f8f695",
-    "#f6f394",
-    "#f4f093",
-    "#f2ee91",
-    "#f0eb90",
-    "#eee98f",
-    "#ece68e",
-    "#eae48d",
-    "#e8e18c",
-    "#e6df8b",
-    "#e4dc8a",
-    "#e2d989",
-    "#e0d788",
-    "#ded487",
-    "#dcd286",
-    "#dacf85",
-    "#d8cd83",
-    "#d6ca82",
-    "#d3c781",
-    "#d2c580",
-    "#d0c27f",
-    "#cec07e",
-    "#ccbd7d",
-    "#cabb7c",
-    "#c8b87b",
-    "#c6b67a",
-    "#c3b379",
-    "#c2b078",
-    "#c0ae76",
-    "#beab75",
-    "#bca974",
-    "#baa673",
-    "#b8a472",
-    "#b6a171",
-    "#b39f70",
-    "#b29c6f",
-    "#b0996e",
-    "#ae976d",
-    "#ac946c",
-    "#aa926b",
-    "#a88f6a",
-    "#a68d68",
-    "#a38a67",
-    "#a28766",
-    "#a08565",
-    "#9e8264",
-    "#9c8063",
-    "#9a7d62",
-    "#987b61",
-    "#967860",
-    "#93765f",
-    "#92735e",
-    "#90705d",
-    "#8e6e5b",
-    "#8c6b5a",
-    "#8a6959",
-    "#886658",
-    "#866457",
-    "#836156",
-    "#825f55",
-    "#805c54",
-    "#815d56",
-    "#836058",
-    "#85625b",
-    "#87655e",
-    "#886760",
-    "#8b6a63",
-    "#8d6d66",
-    "#8f6f68",
-    "#91726b",
-    "#93746e",
-    "#957770",
-    "#977973",
-    "#997c76",
-    "#9b7f79",
-    "#9d817b",
-    "#9f847e",
-    "#a18681",
-    "#a38983",
-    "#a58b86",
-    "#a78e89",
-    "#a8908b",
-    "#ab938e",
-    "#ad9691",
-    "#af9893",
-    "#b19b96",
-    "#b39d99",
-    "#b5a09b",
-    "#b7a29e",
-    "#b9a5a1",
-    "#bba7a3",
-    "#bdaaa6",
-    "#bfada9",
-    "#c1afab",
-    "#c3b2ae",
-    "#c4b4b1",
-    "#c7b7b3",
-    "#c8b9b6",
-    "#cbbcb9",
-    "#cdbfbb",
-    "#cfc1be",
-    "#d1c4c1",
-    "#d3c6c4",
-    "#d4c9c6",
-    "#d7cbc9",
-    "#d9cecc",
-    "#dbd0ce",
-    "#ddd3d1",
-    "#dfd6d4",
-    "#e1d8d6",
-    "#e3dbd9",
-    "#e4dddc",
-    "#e7e0de",
-    "#e8e2e1",
-    "#ebe5e4",
-    "#ede7e6",
-    "#efeae9",
-    "#f1edec",
-    "#f3efee",
-    "#f4f2f1",
-    "#f7f4f4",
-    "#f9f7f6",
-    "#fbf9f9",
-    "#fdfcfc",
-    "#ffffff"
-  ],
-  "twilight": [
-    "#e1d8e2",
-    "#e0d9e2",
-    "#dfd9e1",
-    "#ded9e0",
-    "#ddd9e0",
-    "#dbd8df",
-    "#d9d8de",
-    "#d8d7dd",
-    "#d6d6dc",
-    "#d4d6db",
-    "#d2d5da",
-    "#cfd4d9",
-    "#cdd2d8",
-    "#cad1d7",
-    "#c7d0d6",
-    "#c5cfd4",
-    "#c2cdd3",
-    "#bfccd2",
-    "#bccad1",
-    "#b9c9d0",
-    "#b6c7cf",
-    "#b3c6ce",
-    "#b0c4cd",
-    "#adc3cc",
-    "#aac1cb",
-    "#a7c0ca",
-    "#a4beca",
-    "#a1bcc9",
-    "#9ebbc8",
-    "#9bb9c8",
-    "#98b7c7",
-    "#96b5c6",
-    "#93b4c6",
-    "#90b2c5",
-    "#8eb0c5",
-    "#8baec5",
-    "#89acc4",
-    "#86abc4",
-    "#84a9c3",
-    "#82a7c3",
-    "#80a5c3",
-    "#7ea3c2",
-    "#7ca1c2",
-    "#7a9fc2",
-    "#789dc1",
-    "#769bc1",
-    "#749ac1",
-    "#7398c0",
-    "#7196c0",
-    "#6f94c0",
-    "#6e92bf",
-    "#6d90bf",
-    "#6b8ebf",
-    "#6a8bbe",
-    "#6989be",
-    "#6887be",
-    "#6785bd",
-    "#6683bd",
-    "#6581bd",
-    "#647fbc",
-    "#647dbc",
-    "#637bbb",
-    "#6278bb",
-    "#6276ba",
-    "#6174ba",
-    "#6172b9",
-    "#6070b8",
-    "#606db8",
-    "#606bb7",
-    "#5f69b6",
-    "#5f67b6",
-    "#5f64b5",
-    "#5f62b4",
-    "#5f60b3",
-    "#5e5db2",
-    "#5e5bb1",
-    "#5e59b0",
-    "#5e56af",
-    "#5e54ae",
-    "#5e51ad",
-    "#5e4fac",
-    "#5e4daa",
-    "#5e4aa9",
-    "#5d48a7",
-    "#5d45a6",
-    "#5d43a4",
-    "#5d40a3",
-    "#5d3ea1",
-    "#5c3c9f",
-    "#5c399d",
-    "#5c379b",
-    "#5b3499",
-    "#5b3297",
-    "#5a3095",
-    "#5a2d92",
-    "#592b90",
-    "#59298d",
-    "#58278b",
-    "#572488",
-    "#562285",
-    "#552182",
-    "#541f7f",
-    "#531d7c",
-    "#521b78",
-    "#501a75",
-    "#4f1972",
-    "#4d176e",
-    "#4c166b",
-    "#4a1567",
-    "#491564",
-    "#471460",
-    "#45135d",
-    "#44125a",
-    "#421257",
-    "#401154",
-    "#3e1151",
-    "#3d114e",
-    "#3b114b",
-    "#3a1048",
-    "#381046",
-    "#371043",
-    "#361041",
-    "#34103f",
-    "#33113d",
-    "#32113b",
-    "#32113a",
-    "#301238",
-    "#2f1337",
-    "#2f1336",
-    "#311236",
-    "#321237",
-    "#331137",
-    "#351138",
-    "#361138",
-    "#371139",
-    "#391139",
-    "#3b113a",
-    "#3d113b",
-    "#3f113c",
-    "#41113d",
-    "#43123e",
-    "#45123f",
-    "#471240",
-    "#4a1341",
-    "#4c1342",
-    "#4f1443",
-    "#511444",
-    "#541545",
-    "#561546",
-    "#591647",
-    "#5c1648",
-    "#5e1749",
-    "#61184a",
-    "#63184b",
-    "#66194c",
-    "#691a4c",
-    "#6b1a4d",
-    "#6e1b4e",
-    "#711c4e",
-    "#731d4e",
-    "#761e4f",
-    "#781f4f",
-    "#7b204f",
-    "#7d2150",
-    "#802350",
-    "#822450",
-    "#842550",
-    "#872750",
-    "#892850",
-    "#8b2a50",
-    "#8d2c50",
-    "#902d50",
-    "#922f4f",
-    "#94314f",
-    "#96324f",
-    "#98344f",
-    "#9a364f",
-    "#9b384f",
-    "#9d3a4f",
-    "#9f3c4f",
-    "#a13e4f",
-    "#a2404f",
-    "#a4424f",
-    "#a6444f",
-    "#a7464f",
-    "#a94950",
-    "#aa4b50",
-    "#ac4d50",
-    "#ad4f50",
-    "#af5151",
-    "#b05451",
-    "#b25652",
-    "#b35852",
-    "#b45a53",
-    "#b55d53",
-    "#b65f54",
-    "#b86155",
-    "#b96456",
-    "#ba6657",
-    "#bb6857",
-    "#bc6b59",
-    "#bd6d5a",
-    "#be705b",
-    "#bf725c",
-    "#c0745d",
-    "#c0775f",
-    "#c17960",
-    "#c27c62",
-    "#c37e64",
-    "#c38166",
-    "#c48368",
-    "#c5866a",
-    "#c5886c",
-    "#c68b6e",
-    "#c78d70",
-    "#c78f72",
-    "#c89275",
-    "#c89478",
-    "#c9977a",
-    "#c9997d",
-    "#ca9c80",
-    "#ca9e83",
-    "#cba185",
-    "#cca389",
-    "#cca58c",
-    "#cda88f",
-    "#cdaa92",
-    "#ceac95",
-    "#cfaf99",
-    "#cfb19c",
-    "#d0b39f",
-    "#d1b6a3",
-    "#d2b8a6",
-    "#d3baa9",
-    "#d3bcad",
-    "#d4beb0",
-    "#d5c0b4",
-    "#d6c2b7",
-    "#d7c4bb",
-    "#d8c6be",
-    "#d9c8c1",
-    "#dacac4",
-    "#dbccc8",
-    "#dbcecb",
-    "#dccfcd",
-    "#ddd1d0",
-    "#ded2d3",
-    "#ded3d5",
-    "#dfd5d7",
-    "#dfd6d9",
-    "#e0d6db",
-    "#e0d7dd",
-    "#e1d8de",
-    "#e1d8df",
-    "#e1d8e1",
-    "#e1d8e1"
-  ],
-  "twilight_shifted": [
-    "#2f1337",
-    "#301238",
-    "#32113a",
-    "#32113b",
-    "#33113d",
-    "#34103f",
-    "#361041",
-    "#371043",
-    "#381046",
-    "#3a1048",
-    "#3b114b",
-    "#3d114e",
-    "#3e1151",
-    "#401154",
-    "#421257",
-    "#44125a",
-    "#45135d",
-    "#471460",
-    "#491564",
-    "#4a1567",
-    "#4c166b",
-    "#4d176e",
-    "#4f1972",
-    "#501a75",
-    "#521b78",
-    "#531d7c",
-    "#541f7f",
-    "#552182",
-    "#562285",
-    "#572488",
-    "#58278b",
-    "#59298d",
-    "#592b90",
-    "#5a2d92",
-    "#5a3095",
-    "#5b3297",
-    "#5b3499",
-    "#5c379b",
-    "#5c399d",
-    "#5c3c9f",
-    "#5d3ea1",
-    "#5d40a3",
-    "#5d43a4",
-    "#5d45a6",
-    "#5d48a7",
-    "#5e4aa9",
-    "#5e4daa",
-    "#5e4fac",
-    "#5e51ad",
-    "#5e54ae",
-    "#5e56af",
-    "#5e59b0",
-    "#5e5bb1",
-    "#5e5db2",
-    "#5f60b3",
-    "#5f62b4",
-    "#5f64b5",
-    "#5f67b6",
-    "#5f69b6",
-    "#606bb7",
-    "#606db8",
-    "#6070b8",
-    "#6172b9",
-    "#6174ba",
-    "#6276ba",
-    "#6278bb",
-    "#637bbb",
-    "#647dbc",
-    "#647fbc",
-    "#6581bd",
-    "#6683bd",
-    "#6785bd",
-    "#6887be",
-    "#6989be",
-    "#6a8bbe",
-    "#6b8ebf",
-    "#6d90bf",
-    "#6e92bf",
-    "#6f94c0",
-    "#7196c0",
-    "#7398c0",
-    "#749ac1",
-    "#769bc1",
-    "#789dc1",
-    "#7a9fc2",
-    "#7ca1c2",
-    "#7ea3c2",
-    "#80a5c3",
-    "#82a7c3",
-    "#84a9c3",
-    "#86abc4",
-    "#89acc4",
-    "#8baec5",
-    "#8eb0c5",
-    "#90b2c5",
-    "#93b4c6",
-    "#96b5c6",
-    "#98b7c7",
-    "#9bb9c8",
-    "#9ebbc8",
-    "#a1bcc9",
-    "#a4beca",
-    "#a7c0ca",
-    "#aac1cb",
-    "#adc3cc",
-    "#b0c4cd",
-    "#b3c6ce",
-    "#b6c7cf",
-    "#b9c9d0",
-    "#bccad1",
-    "#bfccd2",
-    "#c2cdd3",
-    "#c5cfd4",
-    "#c7d0d6",
-    "#cad1d7",
-    "#cdd2d8",
-    "#cfd4d9",
-    "#d2d5da",
-    "#d4d6db",
-    "#d6d6dc",
-    "#d8d7dd",
-    "#d9d8de",
-    "#dbd8df",
-    "#ddd9e0",
-    "#ded9e0",
-    "#dfd9e1",
-    "#e0d9e2",
-    "#e1d8e2",
-    "#e1d8e1",
-    "#e1d8df",
-    "#e1d8de",
-    "#e0d7dd",
-    "#e0d6db",
-    "#dfd6d9",
-    "#dfd5d7",
-    "#ded3d5",
-    "#ded2d3",
-    "#ddd1d0",
-    "#dccfcd",
-    "#dbcecb",
-    "#dbccc8",
-    "#dacac4",
-    "#d9c8c1",
-    "#d8c6be",
-    "#d7c4bb",
-    "#d6c2b7",
-    "#d5c0b4",
-    "#d4beb0",
-    "#d3bcad",
-    "#d3baa9",
-    "#d2b8a6",
-    "#d1b6a3",
-    "#d0b39f",
-    "#cfb19c",
-    "#cfaf99",
-    "#ceac95",
-    "#cdaa92",
-    "#cda88f",
-    "#cca58c",
-    "#cca389",
-    "#cba185",
-    "#ca9e83",
-    "#ca9c80",
-    "#c9997d",
-    "#c9977a",
-    "#c89478",
-    "#c89275",
-    "#c78f72",
-    "#c78d70",
-    "#c68b6e",
-    "#c5886c",
-    "#c5866a",
-    "#c48368",
-    "#c38166",
-    "#c37e64",
-    "#c27c62",
-    "#c17960",
-    "#c0775f",
-    "#c0745d",
-    "#bf725c",
-    "#be705b",
-    "#bd6d5a",
-    "#bc6b59",
-    "#bb6857",
-    "#ba6657",
-    "#b96456",
-    "#b86155",
-    "#b65f54",
-    "#b55d53",
-    "#b45a53",
-    "#b35852",
-    "#b25652",
-    "#b05451",
-    "#af5151",
-    "#ad4f50",
-    "#ac4d50",
-    "#aa4b50",
-    "#a94950",
-    "#a7464f",
-    "#a6444f",
-    "#a4424f",
-    "#a2404f",
-    "#a13e4f",
-    "#9f3c4f",
-    "#9d3a4f",
-    "#9b384f",
-    "#9a364f",
-    "#98344f",
-    "#96324f",
-    "#94314f",
-    "#922f4f",
-    "#902d50",
-    "#8d2c50",
-    "#8b2a50",
-    "#892850",
-    "#872750",
-    "#842550",
-    "#822450",
-    "#802350",
-    "#7d2150",
-    "#7b204f",
-    "#781f4f",
-    "#761e4f",
-    "#731d4e",
-    "#711c4e",
-    "#6e1b4e",
-    "#6b1a4d",
-    "#691a4c",
-    "#66194c",
-    "#63184b",
-    "#61184a",
-    "#5e1749",
-    "#5c1648",
-    "#591647",
-    "#561546",
-    "#541545",
-    "#511444",
-    "#4f1443",
-    "#4c1342",
-    "#4a1341",
-    "#471240",
-    "#45123f",
-    "#43123e",
-    "#41113d",
-    "#3f113c",
-    "#3d113b",
-    "#3b113a",
-    "#391139",
-    "#371139",
-    "#361138",
-    "#351138",
-    "#331137",
-    "#321237",
-    "#311236",
-    "#2f1336",
-    "#2f1436"
-  ],
-  "viridis": [
-    "#440154",
-    "#440255",
-    "#440357",
-    "#450558",
-    "#45065a",
-    "#45085b",
-    "#46095c",
-    "#460b5e",
-    "#460c5f",
-    "#460e61",
-    "#470f62",
-    "#471163",
-    "#471265",
-    "#471466",
-    "#471567",
-    "#471669",
-    "#47186a",
-    "#48196b",
-    "#481a6c",
-    "#481c6e",
-    "#481d6f",
-    "#481e70",
-    "#482071",
-    "#482172",
-    "#482273",
-    "#482374",
-    "#472575",
-    "#472676",
-    "#472777",
-    "#472878",
-    "#472a79",
-    "#472b7a",
-    "#472c7b",
-    "#462d7c",
-    "#462f7c",
-    "#46307d",
-    "#46317e",
-    "#45327f",
-    "#45347f",
-    "#453580",
-    "#453681",
-    "#443781",
-    "#443982",
-    "#433a83",
-    "#433b83",
-    "#433c84",
-    "#423d84",
-    "#423e85",
-    "#424085",
-    "#414186",
-    "#414286",
-    "#404387",
-    "#404487",
-    "#3f4587",
-    "#3f4788",
-    "#3e4888",
-    "#3e4989",
-    "#3d4a89",
-    "#3d4b89",
-    "#3d4c89",
-    "#3c4d8a",
-    "#3c4e8a",
-    "#3b508a",
-    "#3b518a",
-    "#3a528b",
-    "#3a538b",
-    "#39548b",
-    "#39558b",
-    "#38568b",
-    "#38578c",
-    "#37588c",
-    "#37598c",
-    "#365a8c",
-    "#365b8c",
-    "#355c8c",
-    "#355d8c",
-    "#345e8d",
-    "#345f8d",
-    "#33608d",
-    "#33618d",
-    "#32628d",
-    "#32638d",
-    "#31648d",
-    "#31658d",
-    "#31668d",
-    "#30678d",
-    "#30688d",
-    "#2f698d",
-    "#2f6a8d",
-    "#2e6b8e",
-    "#2e6c8e",
-    "#2e6d8e",
-    "#2d6e8e",
-    "#2d6f8e",
-    "#2c708e",
-    "#2c718e",
-    "#2c728e",
-    "#2b738e",
-    "#2b748e",
-    "#2a758e",
-    "#2a768e",
-    "#2a778e",
-    "#29788e",
-    "#29798e",
-    "#287a8e",
-    "#287a8e",
-    "#287b8e",
-    "#277c8e",
-    "#277d8e",
-    "#277e8e",
-    "#267f8e",
-    "#26808e",
-    "#26818e",
-    "#25828e",
-    "#25838d",
-    "#24848d",
-    "#24858d",
-    "#24868d",
-    "#23878d",
-    "#23888d",
-    "#23898d",
-    "#22898d",
-    "#228a8d",
-    "#228b8d",
-    "#218c8d",
-    "#218d8c",
-    "#218e8c",
-    "#208f8c",
-    "#20908c",
-    "#20918c",
-    "#1f928c",
-    "#1f938b",
-    "#1f948b",
-    "#1f958b",
-    "#1f968b",
-    "#1e978a",
-    "#1e988a",
-    "#1e998a",
-    "#1e998a",
-    "#1e9a89",
-    "#1e9b89",
-    "#1e9c89",
-    "#1e9d88",
-    "#1e9e88",
-    "#1e9f88",
-    "#1ea087",
-    "#1fa187",
-    "#1fa286",
-    "#1fa386",
-    "#20a485",
-    "#20a585",
-    "#21a685",
-    "#21a784",
-    "#22a784",
-    "#23a883",
-    "#23a982",
-    "#24aa82",
-    "#25ab81",
-    "#26ac81",
-    "#27ad80",
-    "#28ae7f",
-    "#29af7f",
-    "#2ab07e",
-    "#2bb17d",
-    "#2cb17d",
-    "#2eb27c",
-    "#2fb37b",
-    "#30b47a",
-    "#32b57a",
-    "#33b679",
-    "#35b778",
-    "#36b877",
-    "#38b976",
-    "#39b976",
-    "#3bba75",
-    "#3dbb74",
-    "#3ebc73",
-    "#40bd72",
-    "#42be71",
-    "#44be70",
-    "#45bf6f",
-    "#47c06e",
-    "#49c16d",
-    "#4bc26c",
-    "#4dc26b",
-    "#4fc369",
-    "#51c468",
-    "#53c567",
-    "#55c666",
-    "#57c665",
-    "#59c764",
-    "#5bc862",
-    "#5ec961",
-    "#60c960",
-    "#62ca5f",
-    "#64cb5d",
-    "#67cc5c",
-    "#69cc5b",
-    "#6bcd59",
-    "#6dce58",
-    "#70ce56",
-    "#72cf55",
-    "#74d054",
-    "#77d052",
-    "#79d151",
-    "#7cd24f",
-    "#7ed24e",
-    "#81d34c",
-    "#83d34b",
-    "#86d449",
-    "#88d547",
-    "#8bd546",
-    "#8dd644",
-    "#90d643",
-    "#92d741",
-    "#95d73f",
-    "#97d83e",
-    "#9ad83c",
-    "#9dd93a",
-    "#9fd938",
-    "#a2da37",
-    "#a5da35",
-    "#a7db33",
-    "#aadb32",
-    "#addc30",
-    "#afdc2e",
-    "#b2dd2c",
-    "#b5dd2b",
-    "#b7dd29",
-    "#bade27",
-    "#bdde26",
-    "#bfdf24",
-    "#c2df22",
-    "#c5df21",
-    "#c7e01f",
-    "#cae01e",
-    "#cde01d",
-    "#cfe11c",
-    "#d2e11b",
-    "#d4e11a",
-    "#d7e219",
-    "#dae218",
-    "#dce218",
-    "#dfe318",
-    "#e1e318",
-    "#e4e318",
-    "#e7e419",
-    "#e9e419",
-    "#ece41a",
-    "#eee51b",
-    "#f1e51c",
-    "#f3e51e",
-    "#f6e61f",
-    "#f8e621",
-    "#fae622",
-    "#fde724"
-  ],
-  "winter": [
-    "#0000ff",
-    "#0001fe",
-    "#0002fe",
-    "#0003fd",
-    "#0004fd",
-    "#0005fc",
-    "#0006fc",
-    "#0007fb",
-    "#0008fb",
-    "#0009fa",
-    "#000afa",
-    "#000bf9",
-    "#000cf9",
-    "#000df8",
-    "#000ef8",
-    "#000ff7",
-    "#0010f7",
-    "#0011f6",
-    "#0012f6",
-    "#0013f5",
-    "#0014f5",
-    "#0015f4",
-    "#0016f4",
-    "#0017f3",
-    "#0018f3",
-    "#0019f2",
-    "#001af2",
-    "#001bf1",
-    "#001cf1",
-    "#001df0",
-    "#001ef0",
-    "#001fef",
-    "#0020ef",
-    "#0020ee",
-    "#0022ee",
-    "#0023ed",
-    "#0024ed",
-    "#0024ec",
-    "#0026ec",
-    "#0027eb",
-    "#0028eb",
-    "#0028ea",
-    "#002aea",
-    "#002be9",
-    "#002ce9",
-    "#002ce8",
-    "#002ee8",
-    "#002fe7",
-    "#0030e7",
-    "#0030e6",
-    "#0032e6",
-    "#0033e5",
-    "#0034e5",
-    "#0034e4",
-    "#0036e4",
-    "#0037e3",
-    "#0038e3",
-    "#0038e2",
-    "#003ae2",
-    "#003be1",
-    "#003ce1",
-    "#003ce0",
-    "#003ee0",
-    "#003fdf",
-    "#0040df",
-    "#0041de",
-    "#0041de",
-    "#0043dd",
-    "#0044dd",
-    "#0045dc",
-    "#0046dc",
-    "#0047db",
-    "#0048db",
-    "#0049da",
-    "#0049da",
-    "#004bd9",
-    "#004cd9",
-    "#004dd8",
-    "#004ed8",
-    "#004fd7",
-    "#0050d7",
-    "#0051d6",
-    "#0051d6",
-    "#0053d5",
-    "#0054d5",
-    "#0055d4",
-    "#0056d3",
-    "#0057d3",
-    "#0058d3",
-    "#0059d2",
-    "#0059d2",
-    "#005bd1",
-    "#005cd1",
-    "#005dd0",
-    "#005ed0",
-    "#005fcf",
-    "#0060cf",
-    "#0061ce",
-    "#0061ce",
-    "#0063cd",
-    "#0064cd",
-    "#0065cc",
-    "#0066cc",
-    "#0067cb",
-    "#0068cb",
-    "#0069ca",
-    "#0069ca",
-    "#006bc9",
-    "#006cc9",
-    "#006dc8",
-    "#006ec8",
-    "#006fc7",
-    "#0070c7",
-    "#0071c6",
-    "#0071c6",
-    "#0073c5",
-    "#0074c5",
-    "#0075c4",
-    "#0076c3",
-    "#0077c3",
-    "#0078c3",
-    "#0079c2",
-    "#0079c2",
-    "#007bc1",
-    "#007cc1",
-    "#007dc0",
-    "#007ec0",
-    "#007fbf",
-    "#0080bf",
-    "#0081be",
-    "#0082be",
-    "#0083bd",
-    "#0083bd",
-    "#0085bc",
-    "#0086bc",
-    "#0087bb",
-    "#0088bb",
-    "#0089ba",
-    "#008aba",
-    "#008bb9",
-    "#008cb9",
-    "#008db8",
-    "#008eb8",
-    "#008fb7",
-    "#0090b7",
-    "#0091b6",
-    "#0092b6",
-    "#0093b5",
-    "#0093b5",
-    "#0095b4",
-    "#0096b3",
-    "#0097b3",
-    "#0098b3",
-    "#0099b2",
-    "#009ab2",
-    "#009bb1",
-    "#009cb1",
-    "#009db0",
-    "#009eb0",
-    "#009faf",
-    "#00a0af",
-    "#00a1ae",
-    "#00a2ae",
-    "#00a3ad",
-    "#00a3ad",
-    "#00a5ac",
-    "#00a6ac",
-    "#00a7ab",
-    "#00a8ab",
-    "#00a9aa",
-    "#00aaaa",
-    "#00aba9",
-    "#00aca9",
-    "#00ada8",
-    "#00aea8",
-    "#00afa7",
-    "#00b0a7",
-    "#00b1a6",
-    "#00b2a6",
-    "#00b3a5",
-    "#00b3a5",
-    "#00b5a4",
-    "#00b6a3",
-    "#00b7a3",
-    "#00b8a3",
-    "#00b9a2",
-    "#00baa2",
-    "#00bba1",
-    "#00bca1",
-    "#00bda0",
-    "#00bea0",
-    "#00bf9f",
-    "#00c09f",
-    "#00c19e",
-    "#00c29e",
-    "#00c39d",
-    "#00c39d",
-    "#00c59c",
-    "#00c69c",
-    "#00c79b",
-    "#00c89b",
-    "#00c99a",
-    "#00ca9a",
-    "#00cb99",
-    "#00cc99",
-    "#00cd98",
-    "#00ce98",
-    "#00cf97",
-    "#00d097",
-    "#00d196",
-    "#00d296",
-    "#00d395",
-    "#00d395",
-    "#00d594",
-    "#00d693",
-    "#00d793",
-    "#00d893",
-    "#00d992",
-    "#00da92",
-    "#00db91",
-    "#00dc91",
-    "#00dd90",
-    "#00de90",
-    "#00df8f",
-    "#00e08f",
-    "#00e18e",
-    "#00e28e",
-    "#00e38d",
-    "#00e38d",
-    "#00e58c",
-    "#00e68c",
-    "#00e78b",
-    "#00e88b",
-    "#00e98a",
-    "#00ea8a",
-    "#00eb89",
-    "#00ec89",
-    "#00ed88",
-    "#00ee88",
-    "#00ef87",
-    "#00f087",
-    "#00f186",
-    "#00f286",
-    "#00f385",
-    "#00f385",
-    "#00f584",
-    "#00f683",
-    "#00f783",
-    "#00f883",
-    "#00f982",
-    "#00fa82",
-    "#00fb81",
-    "#00fc81",
-    "#00fd80",
-    "#00fe80",
-    "#00ff7f"
-  ]
-}
+"""
+Color maps used by `colors.color_map()` when matplotlib is not installed.
+
+The tables are stored in `cmaps.npz` as 256 uint8 RGB colors per map
+and are only loaded on first use.
+"""
+import os
+
+import numpy as np
+
+__docformat__ = "google"
+
+_cmaps_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cmaps.npz")
+_table = None
+
+
+def get_table():
+    """Return the names of the color maps and their (ncmaps, 256, 3) uint8 RGB table."""
+    global _table
+    if _table is None:
+        with np.load(_cmaps_file) as data:
+            names = {str(n): i for i, n in enumerate(data["names"])}
+            _table = (names, data["rgb"])
+    return _table
+
+
+def __getattr__(name):
+    # backward compatibility: build the dictionary of hex colors on demand
+    if name == "cmaps":
+        names, rgb = get_table()
+        return {
+            n: ["#%02x%02x%02x" % tuple(c) for c in rgb[i].tolist()] for n, i in names.items()
+        }
+    raise AttributeError(f"module {__name__} has no attribute {name}")
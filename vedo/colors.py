@@ -3,6 +3,8 @@
 import os
 import sys
 import time
+from functools import lru_cache
+from importlib.util import find_spec
 
 import numpy as np
 
@@ -25,6 +27,7 @@ __all__ = [
     "printc",
     "printd",
     "get_color",
+    "get_colors",
     "get_color_name",
     "color_map",
     "build_palette",
@@ -32,14 +35,9 @@ __all__ = [
 ]
 
 
-try:
-    import matplotlib.cm as _cm_mpl
-    _has_matplotlib = True
-    cmaps = {}
-except ModuleNotFoundError:
-    from vedo.cmaps import cmaps
-    _has_matplotlib = False
-    # see below, this is dealt with in color_map()
+# matplotlib is only imported when a color map is first needed
+# (see color_map()), importing it here would slow down import vedo
+_has_matplotlib = find_spec("matplotlib") is not None
 
 #########################################################
 # handy global shortcuts for terminal printing
@@ -685,11 +683,8 @@ emoji = {
 
 # terminal or notebook can do color print
 def _has_colors(stream):
-    try:
-        import IPython
+    if find_spec("IPython") is not None:
         return True
-    except:
-        pass
 
     if not hasattr(stream, "isatty"):
         return False
@@ -765,34 +760,7 @@ def get_color(rgb=None, hsv=None):
         return (c[0] / 255.0, c[1] / 255.0, c[2] / 255.0, c[3])  # RGBA
 
     elif isinstance(c, str):  # is string
-        c = c.replace("grey", "gray").replace(" ", "")
-        if 0 < len(c) < 3:  # single/double letter color
-            if c.lower() in color_nicks:
-                c = color_nicks[c.lower()]
-            else:
-                vedo.logger.warning(
-                    f"Unknown color nickname {c}\nAvailable abbreviations: {color_nicks}"
-                )
-                return (0.5, 0.5, 0.5)
-
-        if c.lower() in colors:  # matplotlib name color
-            c = colors[c.lower()]
-            # from now format is hex!
-
-        if c.startswith("#"):  # hex to rgb
-            h = c.lstrip("#")
-            rgb255 = list(int(h[i : i + 2], 16) for i in (0, 2, 4))
-            rgbh = np.array(rgb255) / 255.0
-            if np.sum(rgbh) > 3:
-                vedo.logger.error(f"in get_color(): Wrong hex color {c}")
-                return (0.5, 0.5, 0.5)
-            return tuple(rgbh)
-
-        else:  # vtk name color
-            namedColors = vtk.vtkNamedColors()
-            rgba = [0, 0, 0, 0]
-            namedColors.GetColor(c, rgba)
-            return (rgba[0] / 255.0, rgba[1] / 255.0, rgba[2] / 255.0)
+        return _str2rgb(c)
 
     elif isinstance(c, (int, float)):  # color number
         return palettes[vedo.settings.palette % len(palettes)][abs(int(c)) % 10]
@@ -800,6 +768,132 @@ def get_color(rgb=None, hsv=None):
     return (0.5, 0.5, 0.5)
 
 
+@lru_cache(maxsize=1024)
+def _str2rgb(c):
+    # parse a color name, nickname or hex string, results are cached
+    c = c.replace("grey", "gray").replace(" ", "")
+    if 0 < len(c) < 3:  # single/double letter color
+        if c.lower() in color_nicks:
+            c = color_nicks[c.lower()]
+        else:
+            vedo.logger.warning(
+                f"Unknown color nickname {c}\nAvailable abbreviations: {color_nicks}"
+            )
+            return (0.5, 0.5, 0.5)
+
+    if c.lower() in colors:  # matplotlib name color
+        c = colors[c.lower()]
+        # from now format is hex!
+
+    if c.startswith("#"):  # hex to rgb
+        h = c.lstrip("#")
+        rgb255 = list(int(h[i : i + 2], 16) for i in (0, 2, 4))
+        rgbh = np.array(rgb255) / 255.0
+        if np.sum(rgbh) > 3:
+            vedo.logger.error(f"in get_color(): Wrong hex color {c}")
+            return (0.5, 0.5, 0.5)
+        return tuple(rgbh)
+
+    # vtk name color
+    rgba = [0, 0, 0, 0]
+    _named_colors().GetColor(c, rgba)
+    return (rgba[0] / 255.0, rgba[1] / 255.0, rgba[2] / 255.0)
+
+
+def _get_rgba(col):
+    # as get_color() but also accepting an (r,g,b,alpha) color
+    if _is_sequence(col) and len(col) == 4:
+        return (*get_color(col[:3]), col[3])
+    return get_color(col)
+
+
+@lru_cache(maxsize=None)
+def _named_colors():
+    return vtk.vtkNamedColors()
+
+
+def get_colors(cols, alpha=None):
+    """
+    Convert a list of colors to a `numpy` array of `uint8` RGB (or RGBA) values.
+
+    Each element can be in any of the formats accepted by `get_color()`.
+    Distinct elements are converted only once, and numeric arrays of shape (N,3) or (N,4)
+    are converted without a python loop.
+    Arrays of type `uint8` are assumed to be already in the range [0,255].
+
+    Arguments:
+        cols : (list, numpy.ndarray)
+            list of N colors
+        alpha : (float, list)
+            opacity in range [0,1], a single value or one per color.
+            If given, the output has 4 components.
+
+    Returns:
+        a (N,3) array, or (N,4) if alpha is given or any input color has an alpha component.
+
+    Example:
+        ```python
+        from vedo import get_colors
+        print(get_colors(["red", "dg", (0, 0, 1), 7], alpha=0.5))
+        ```
+    """
+    arr = None
+    if isinstance(cols, np.ndarray) and cols.dtype.kind in "uif":
+        arr = cols
+    elif _is_sequence(cols):
+        try:
+            arr = np.asarray(cols, dtype=float)
+        except (ValueError, TypeError):  # strings or mixed formats
+            arr = None
+    else:
+        raise ValueError(f"in get_colors() input must be a list of colors, got {type(cols)}")
+
+    if arr is not None and arr.ndim == 2 and arr.shape[1] in (3, 4):
+        if arr.dtype == np.uint8:
+            rgba = arr
+        else:
+            rgba = arr.astype(float)  # a copy
+            # same convention as get_color(): rgb in [0,1] unless any is larger than 1
+            is255 = np.any(rgba[:, :3] > 1, axis=1)
+            rgba[~is255, :3] *= 255
+            if rgba.shape[1] == 4:
+                rgba[:, 3] *= 255
+        has_alpha = rgba.shape[1] == 4
+
+    else:
+        # convert each distinct color once, then index the table
+        cache = {}
+        table = []
+        idx = np.empty(len(cols), dtype=int)
+        for i, col in enumerate(cols):
+            key = tuple(col) if _is_sequence(col) else col
+            try:
+                idx[i] = cache[key]
+            except KeyError:
+                idx[i] = cache[key] = len(table)
+                table.append(_get_rgba(col))
+            except TypeError:  # unhashable
+                idx[i] = len(table)
+                table.append(_get_rgba(col))
+        has_alpha = any(len(rgb) == 4 for rgb in table)
+        table = np.array([(*rgb[:3], rgb[3] if len(rgb) == 4 else 1) for rgb in table])
+        rgba = table.reshape(-1, 4)[idx] * 255
+
+    if alpha is not None:
+        if rgba.shape[1] == 3:
+            rgba = np.c_[rgba, np.zeros(len(rgba))]
+        elif rgba.dtype == np.uint8:
+            rgba = rgba.astype(float)
+        rgba[:, 3] = np.asarray(alpha) * 255
+        has_alpha = True
+
+    if not has_alpha:
+        rgba = rgba[:, :3]
+    if rgba.dtype == np.uint8:
+        return rgba
+    return np.clip(np.rint(rgba), 0, 255).astype(np.uint8)
+
+
 def get_color_name(c):
     """Find the name of the closest color."""
     c = np.array(get_color(c))  # reformat to rgb
@@ -901,6 +995,7 @@ def color_map(value, name="jet", vmin=None, vmax=None):
     if _has_matplotlib:
         # matplotlib is available, use it! ###########################
         if isinstance(name, str):
+            import matplotlib.cm as _cm_mpl
             mp = _cm_mpl.get_cmap(name=name)
         else:
             mp = name  # assume matplotlib.colors.LinearSegmentedColormap
@@ -908,32 +1003,56 @@ def color_map(value, name="jet", vmin=None, vmax=None):
 
     else:
         # matplotlib not available ###################################
+        from vedo.cmaps import get_table
+
+        cmaps, table = get_table()
         invert = False
         if name.endswith("_r"):
             invert = True
-            name = name.replace("_r", "")
+            name = name[:-2]
         try:
-            cmap = cmaps[name]
+            cmap = table[cmaps[name]]
         except KeyError:
             vedo.logger.error(f"in color_map(), no color map with name {name} or {name}_r")
             vedo.logger.error(f"Available color maps are:\n{cmaps.keys()}")
             return np.array([0.5, 0.5, 0.5])
 
-        result = []
         n = len(cmap) - 1
-        for v in values:
-            iv = int(v * n)
-            if invert:
-                iv = n - iv
-            rgb = hex2rgb(cmap[iv])
-            result.append(rgb)
-        result = np.array(result)
+        iv = (np.asarray(values, dtype=float) * n).astype(int)
+        if invert:
+            iv = n - iv
+        result = cmap[iv] / 255.0
 
     if cut:
         return result
     return result[0]
 
 
+def _lut_table(cmap, n_colors, alpha=1.0):
+    # RGBA uint8 table for a vtkLookupTable,
+    # the tables of named color maps are cached (alpha must then be a float or a tuple)
+    if isinstance(cmap, str):
+        return _named_lut_table(cmap, n_colors, alpha)
+    if _is_sequence(cmap):  # a list of colors
+        return get_colors(cmap, alpha=alpha)
+    return _cmap_lut_table(cmap, n_colors, alpha)  # e.g. a matplotlib colormap
+
+
+def _cmap_lut_table(cmap, n_colors, alpha):
+    rgba = np.empty((n_colors, 4))
+    rgba[:, :3] = color_map(range(n_colors), cmap, 0, n_colors)
+    rgba[:, 3] = alpha
+    # same rounding as vtkLookupTable.SetTableValue()
+    return np.floor(rgba * 255 + 0.5).astype(np.uint8)
+
+
+@lru_cache(maxsize=128)
+def _named_lut_table(name, n_colors, alpha):
+    table = _cmap_lut_table(name, n_colors, alpha)
+    table.flags.writeable = False  # shared by all callers
+    return table
+
+
 def build_palette(color1, color2, n, hsv=True):
     """
     Generate N colors starting from `color1` to `color2`
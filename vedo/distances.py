@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import numpy as np
+
+try:
+    import vedo.vtkclasses as vtk
+except ImportError:
+    import vtkmodules.all as vtk
+
+import vedo
+from vedo import utils
+
+__docformat__ = "google"
+
+__doc__ = """
+Distances between point clouds and meshes:
+mean, maximum (Hausdorff), percentile and Chamfer distances.
+
+The search structures are cached on the objects and are reused
+as long as the objects are not modified or moved, so that the same object
+can be compared cheaply to many others with `batch_point_set_distance()`.
+"""
+
+__all__ = ["closest_distances", "point_set_distance", "batch_point_set_distance"]
+
+_metrics = ("mean", "max", "percentile", "chamfer", "hausdorff")
+
+
+def _as_points(obj):
+    if isinstance(obj, vedo.Points):
+        return obj
+    return vedo.Points(utils.make3d(np.asarray(obj, dtype=float)))
+
+
+def _distances_to(pts, target, cells=False):
+    # distance of each point to the closest point (or cell) of target
+    if len(pts) == 0:
+        return np.zeros(0)
+    data = target.inputdata()
+
+    if cells and (data.GetNumberOfPolys() or data.GetNumberOfStrips() or data.GetNumberOfLines()):
+        # one locator query per point, see _upper_bounds() to skip most of them
+        locator = target._get_cell_locator()
+        closest = [0.0, 0.0, 0.0]
+        cid, subid, dist2 = vtk.mutable(0), vtk.mutable(0), vtk.mutable(0.0)
+        dists = np.zeros(len(pts))
+        for i, p in enumerate(pts):
+            locator.FindClosestPoint(p, closest, cid, subid, dist2)
+            dists[i] = dist2
+        return np.sqrt(dists)
+
+    # point clouds (or cells not requested): closest point distance
+    _, dists = target.find_neighbors(pts, n=1)
+    return dists[:, 0]
+
+
+def _upper_bounds(pts, target):
+    # Distance of each point to the closest point of target or, if target
+    # has faces, to the closest point on the triangles around it.
+    # Both are upper bounds of the distance to the closest cell, the second
+    # one is usually exact.
+    ids, bounds = target.find_neighbors(pts, n=1)
+    bounds = bounds[:, 0]
+    tris, incident = target._get_surface_triangles()
+    if tris is None:
+        return bounds
+    rows, _, _, d2 = utils._closest_on_incident(pts, tris, incident, ids[:, 0])
+    bounds[rows] = np.minimum(bounds[rows], np.sqrt(d2))
+    return bounds
+
+
+def closest_distances(source, target, cells=False):
+    """
+    Compute the distance of each point of `source` to the closest point of `target`,
+    or to the closest cell of `target` if `cells=True`.
+
+    The distances to the cells are computed with one query of a cell locator
+    per point, which is slower than the distances to the points.
+    The "max" and "hausdorff" metrics of `point_set_distance()` need
+    only a few of these queries.
+
+    Arguments:
+        source : (Points, list)
+            the points to measure
+        target : (Points, Mesh, list)
+            the object to measure the distance to
+        cells : (bool)
+            measure the distance to the cells (faces or lines) of `target`
+            instead of its points
+
+    Example:
+        ```python
+        from vedo import *
+        from vedo.distances import closest_distances
+        s1 = Sphere()
+        s2 = Sphere(res=6).pos(0.1, 0, 0)
+        d = closest_distances(s1, s2, cells=True)
+        s1.cmap("jet", d).add_scalarbar().show(axes=1).close()
+        ```
+    """
+    source, target = _as_points(source), _as_points(target)
+    return _distances_to(source.points(), target, cells)
+
+
+def _directed(pts, target, metric, q, cells, rng, upper_bound):
+    # reduce the distances from pts to target
+    if metric == "max" and (cells or upper_bound is not None) and len(pts) > 1000:
+        return _directed_max(pts, target, cells, rng, upper_bound)
+
+    dists = _distances_to(pts, target, cells)
+    if metric == "mean":
+        return dists.mean()
+    if metric == "max":
+        return dists.max()
+    return np.percentile(dists, q)
+
+
+def _directed_max(pts, target, cells, rng, upper_bound):
+    # Largest distance from pts to target, computed in chunks of points
+    # to stop as soon as the result is known or exceeds upper_bound.
+    if cells:
+        # visit the points by decreasing upper bound of their distance and stop
+        # when no remaining point can increase the maximum found so far
+        bounds = _upper_bounds(pts, target)
+        order = np.argsort(-bounds, kind="stable")
+    else:
+        bounds = None
+        order = rng.permutation(len(pts))
+
+    dmax, start, size = 0.0, 0, 256
+    while start < len(order):
+        chunk = order[start : start + size]
+        if bounds is not None and bounds[chunk[0]] <= dmax * (1 + 1e-09):
+            break
+        dists = _distances_to(pts[chunk], target, cells)
+        if bounds is not None:
+            dists = np.minimum(dists, bounds[chunk])
+        dmax = max(dmax, dists.max())
+        if upper_bound is not None and dmax > upper_bound:
+            break
+        start += size
+        size *= 2
+    return dmax
+
+
+def point_set_distance(
+    source,
+    target,
+    metric="chamfer",
+    symmetric=False,
+    q=95,
+    cells=False,
+    sample=None,
+    upper_bound=None,
+):
+    """
+    Compute a distance between two point clouds or meshes.
+    Returns a single `float`.
+
+    Available metrics are:
+        - "mean", the average of the distances from the points of `source`
+        to the closest points of `target`
+        - "max", the largest of these distances
+        - "percentile", their `q`-th percentile
+        - "chamfer", the same as "mean" with `symmetric=True`
+        - "hausdorff", the same as "max" with `symmetric=True`
+
+    With `symmetric=True` the distances are also measured from `target` to `source`:
+    the two mean values are then averaged, and the largest of the two maxima
+    or percentiles is returned (e.g. "percentile" with `q=95` is the 95% Hausdorff distance).
+
+    Arguments:
+        source : (Points, Mesh, list)
+            first set of points
+        target : (Points, Mesh, list)
+            second set of points
+        metric : (str)
+            one of "mean", "max", "percentile", "chamfer", "hausdorff"
+        symmetric : (bool)
+            measure the distances in both directions
+        q : (float)
+            percentile in the range [0, 100] used by the "percentile" metric
+        cells : (bool)
+            measure the distances to the closest cells (faces or lines)
+            instead of the closest points
+        sample : (int)
+            use at most this number of points of each set, picked at random.
+            The distances are still measured to the complete other set.
+        upper_bound : (float)
+            for "max" and "hausdorff", stop as soon as a distance larger
+            than this value is found. The returned value is then larger than
+            `upper_bound` but may be smaller than the true distance.
+
+    Example:
+        ```python
+        from vedo import *
+        from vedo.distances import point_set_distance
+        s1 = Sphere()
+        s2 = Sphere().scale(1.1)
+        print(point_set_distance(s1, s2, "chamfer"))
+        print(point_set_distance(s1, s2, "percentile", q=95, symmetric=True))
+        print(point_set_distance(s1, s2, "hausdorff", upper_bound=0.05))
+        ```
+    """
+    metric = metric.lower()
+    if metric not in _metrics:
+        vedo.logger.error(f"in point_set_distance(), unknown metric {metric}, use one of {_metrics}")
+        raise ValueError(metric)
+    if metric == "chamfer":
+        metric, symmetric = "mean", True
+    elif metric == "hausdorff":
+        metric, symmetric = "max", True
+
+    source, target = _as_points(source), _as_points(target)
+    pts1, pts2 = source.points(), target.points()
+    if len(pts1) == 0 or len(pts2) == 0:
+        vedo.logger.error("in point_set_distance(), empty point set")
+        raise ValueError("empty point set")
+
+    rng = np.random.default_rng(0)
+    if sample:
+        if len(pts1) > sample:
+            pts1 = pts1[rng.choice(len(pts1), int(sample), replace=False)]
+        if len(pts2) > sample:
+            pts2 = pts2[rng.choice(len(pts2), int(sample), replace=False)]
+
+    d12 = _directed(pts1, target, metric, q, cells, rng, upper_bound)
+    if not symmetric:
+        return float(d12)
+    if metric == "max" and upper_bound is not None and d12 > upper_bound:
+        return float(d12)
+    d21 = _directed(pts2, source, metric, q, cells, rng, upper_bound)
+    if metric == "mean":
+        return float((d12 + d21) / 2)
+    return float(max(d12, d21))
+
+
+def batch_point_set_distance(pairs, metric="chamfer", **kwargs):
+    """
+    Compute the distance between the objects of many pairs at once.
+    Returns a numpy array with one value per pair.
+
+    Objects which appear in several pairs build their search structure only once.
+    The keyword arguments are the same as in `point_set_distance()`.
+
+    Example:
+        ```python
+        from vedo import *
+        from vedo.distances import batch_point_set_distance
+        ref = Sphere()
+        shapes = [Sphere().scale(1 + i / 10) for i in range(10)]
+        print(batch_point_set_distance([(s, ref) for s in shapes], "hausdorff"))
+        ```
+    """
+    return np.array([point_set_distance(a, b, metric, **kwargs) for a, b in pairs])
@@ -1,4 +1,7 @@
 import glob
+import io
+import itertools
+import json
 import os
 import time
 from tempfile import NamedTemporaryFile, TemporaryDirectory
@@ -29,6 +32,7 @@ and other I/O functionalities.
 
 __all__ = [
     "load",
+    "iload",
     "download",
     "gunzip",
     "loadStructuredPoints",
@@ -42,6 +46,7 @@ __all__ = [
     "import_window",
     "screenshot",
     "ask",
+    "BatchRenderer",
     "Video",
 ]
 
@@ -176,7 +181,7 @@ _x3d_html = """
 """
 
 
-def load(inputobj, unpack=True, force=False):
+def load(inputobj, unpack=True, force=False, parallel=False):
     """
     Load any vedo objects from file or from the web.
 
@@ -191,6 +196,11 @@ def load(inputobj, unpack=True, force=False):
         force : bool
             when downloading a file ignore any previous cached downloads and force a new one.
 
+        parallel : (bool, int)
+            read multiple files concurrently with a pool of threads.
+            If an integer is given it sets the number of worker threads.
+            The output list keeps the same order as the input files.
+
     Example:
         ```python
         from vedo import dataurl, load, show
@@ -201,64 +211,11 @@ def load(inputobj, unpack=True, force=False):
         # (if directory contains DICOM files then a Volume is returned)
         g = load('mydicomdir/')
         show(g)
+        # Read a long time series of files with 8 threads
+        g = load('frames/*.vtp', parallel=8)
         ```
     """
-    acts = []
-    if utils.is_sequence(inputobj):
-        flist = inputobj
-    elif isinstance(inputobj, str) and inputobj.startswith("https://"):
-        flist = [inputobj]
-    else:
-        # flist = sorted(glob.glob(inputobj))
-        flist = utils.humansort(glob.glob(inputobj))
-
-    for fod in flist:
-
-        if fod.startswith("https://"):
-            fod = download(fod, force=force, verbose=False)
-
-        if os.path.isfile(fod):  ### it's a file
-
-            if fod.endswith(".gz"):
-                fod = gunzip(fod)
-
-            a = _load_file(fod, unpack)
-            acts.append(a)
-
-        elif os.path.isdir(fod):  ### it's a directory or DICOM
-            flist = os.listdir(fod)
-            if ".dcm" in flist[0]:  ### it's DICOM
-                reader = vtk.vtkDICOMImageReader()
-                reader.SetDirectoryName(fod)
-                reader.Update()
-                image = reader.GetOutput()
-                actor = Volume(image)
-
-                actor.info["PixelSpacing"] = reader.GetPixelSpacing()
-                actor.info["Width"] = reader.GetWidth()
-                actor.info["Height"] = reader.GetHeight()
-                actor.info["PositionPatient"] = reader.GetImagePositionPatient()
-                actor.info["OrientationPatient"] = reader.GetImageOrientationPatient()
-                actor.info["BitsAllocated"] = reader.GetBitsAllocated()
-                actor.info["PixelRepresentation"] = reader.GetPixelRepresentation()
-                actor.info["NumberOfComponents"] = reader.GetNumberOfComponents()
-                actor.info["TransferSyntaxUID"] = reader.GetTransferSyntaxUID()
-                actor.info["RescaleSlope"] = reader.GetRescaleSlope()
-                actor.info["RescaleOffset"] = reader.GetRescaleOffset()
-                actor.info["PatientName"] = reader.GetPatientName()
-                actor.info["StudyUID"] = reader.GetStudyUID()
-                actor.info["StudyID"] = reader.GetStudyID()
-                actor.info["GantryAngle"] = reader.GetGantryAngle()
-
-                acts.append(actor)
-
-            else:  ### it's a normal directory
-                utils.humansort(flist)
-                for ifile in flist:
-                    a = _load_file(fod + "/" + ifile, unpack)
-                    acts.append(a)
-        else:
-            vedo.logger.error(f"in load(), cannot find {fod}")
+    acts = list(iload(inputobj, unpack, force, parallel))
 
     if len(acts) == 1:
         if "numpy" in str(type(acts[0])):
@@ -275,6 +232,117 @@ def load(inputobj, unpack=True, force=False):
         return acts
 
 
+def iload(inputobj, unpack=True, force=False, parallel=False):
+    """
+    Lazy version of `load()`: return a generator which yields the objects
+    one by one, in the same order as the input files, as soon as they are read.
+
+    With `parallel` the next files are read in background threads
+    while the current object is being used.
+
+    Example:
+        ```python
+        from vedo import iload, Plotter
+        plt = Plotter(interactive=False)
+        for msh in iload("frames/*.vtp", parallel=True):
+            plt.clear().add(msh).render()  # starts before all frames are read
+        ```
+    """
+    if utils.is_sequence(inputobj):
+        flist = inputobj
+    elif isinstance(inputobj, str) and inputobj.startswith("https://"):
+        flist = [inputobj]
+    else:
+        # flist = sorted(glob.glob(inputobj))
+        flist = utils.humansort(glob.glob(inputobj))
+
+    def _tasks():
+        for fod in flist:
+            if fod.startswith("https://") or os.path.isfile(fod):
+                yield fod
+            elif os.path.isdir(fod):
+                if _is_dicom_dir(fod):
+                    yield fod
+                else:  ### it's a normal directory
+                    for ifile in utils.humansort(os.listdir(fod)):
+                        yield fod + "/" + ifile
+            else:
+                vedo.logger.error(f"in load(), cannot find {fod}")
+
+    if parallel is True:
+        parallel = os.cpu_count() or 1
+
+    if not parallel or parallel < 2:
+        for fod in _tasks():
+            yield _load_one(fod, unpack, force)
+        return
+
+    import collections
+    from concurrent.futures import ThreadPoolExecutor
+
+    # keep a bounded window of pending reads so that memory stays under control
+    # and the objects are returned in order as soon as they are ready
+    pool = ThreadPoolExecutor(max_workers=int(parallel))
+    pending = collections.deque()
+    try:
+        for fod in _tasks():
+            pending.append(pool.submit(_load_one, fod, unpack, force))
+            if len(pending) >= 2 * parallel:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # the generator may be abandoned before the end
+        for fut in pending:
+            fut.cancel()
+        pool.shutdown(wait=False)
+
+
+def _is_dicom_dir(dirname):
+    flist = os.listdir(dirname)
+    return len(flist) > 0 and ".dcm" in flist[0]
+
+
+def _load_one(fod, unpack, force):
+    # load a single file, url or DICOM directory
+    if fod.startswith("https://"):
+        fod = download(fod, force=force, verbose=False)
+
+    if os.path.isfile(fod):  ### it's a file
+
+        if fod.endswith(".gz"):
+            fod = gunzip(fod)
+
+        return _load_file(fod, unpack)
+
+    elif os.path.isdir(fod):  ### it's DICOM
+        reader = vtk.vtkDICOMImageReader()
+        reader.SetDirectoryName(fod)
+        reader.Update()
+        image = reader.GetOutput()
+        actor = Volume(image)
+
+        actor.info["PixelSpacing"] = reader.GetPixelSpacing()
+        actor.info["Width"] = reader.GetWidth()
+        actor.info["Height"] = reader.GetHeight()
+        actor.info["PositionPatient"] = reader.GetImagePositionPatient()
+        actor.info["OrientationPatient"] = reader.GetImageOrientationPatient()
+        actor.info["BitsAllocated"] = reader.GetBitsAllocated()
+        actor.info["PixelRepresentation"] = reader.GetPixelRepresentation()
+        actor.info["NumberOfComponents"] = reader.GetNumberOfComponents()
+        actor.info["TransferSyntaxUID"] = reader.GetTransferSyntaxUID()
+        actor.info["RescaleSlope"] = reader.GetRescaleSlope()
+        actor.info["RescaleOffset"] = reader.GetRescaleOffset()
+        actor.info["PatientName"] = reader.GetPatientName()
+        actor.info["StudyUID"] = reader.GetStudyUID()
+        actor.info["StudyID"] = reader.GetStudyID()
+        actor.info["GantryAngle"] = reader.GetGantryAngle()
+        return actor
+
+    vedo.logger.error(f"in load(), cannot find {fod}")
+    return None
+
+
 def _load_file(filename, unpack):
     fl = filename.lower()
 
@@ -288,6 +356,8 @@ def _load_file(filename, unpack):
         actor = loadGmesh(filename)
     elif fl.endswith(".pcd"):  # PCL point-cloud format
         actor = loadPCD(filename)
+        if actor is None:
+            return None
         actor.GetProperty().SetPointSize(2)
     elif fl.endswith(".off"):
         actor = loadOFF(filename)
@@ -377,6 +447,11 @@ def _load_file(filename, unpack):
         return mb
 
         ################################################################# numpy:
+    elif fl.endswith(".vedo"):
+        actor = load_native(filename)
+        if actor is None:
+            return None
+
     elif fl.endswith(".npy") or fl.endswith(".npz"):
         acts = loadnumpy(filename)
 
@@ -616,41 +691,57 @@ def load3DS(filename):
     return Assembly(acts)
 
 
-def loadOFF(filename):
-    """Read the OFF file format (polygonal mesh)."""
-    with open(filename, "r", encoding="UTF-8") as f:
-        lines = f.readlines()
+def _loadtxt_chunked(f, nrows, usecols, dtype=float, chunk_size=200000):
+    # Parse the next `nrows` lines of the open text file `f` in chunks
+    # into a preallocated numpy array. Lines which are empty or start with # are skipped.
+    out = np.empty((nrows, len(usecols)), dtype=dtype)
+    i = 0
+    while i < nrows:
+        lines = list(itertools.islice(f, min(chunk_size, nrows - i)))
+        if not lines:
+            break
+        block = np.loadtxt(lines, usecols=usecols, dtype=dtype, ndmin=2)
+        out[i : i + len(block)] = block
+        i += len(block)
+    return out[:i]
 
-    vertices = []
-    faces = []
-    NumberOfVertices = None
-    i = -1
-    for text in lines:
-        if len(text) == 0:
-            continue
-        if text == "\n":
-            continue
-        if "#" in text:
-            continue
-        if "OFF" in text:
-            continue
 
+def _parse_polygons(lines, skip=1):
+    # Parse lines of the form "[skipped fields] n id0 ... idn [extra fields]"
+    # into a list of cells (or a 2D numpy array if all cells have the same size)
+    if not lines:
+        return []
+    try:
+        arr = np.loadtxt(lines, ndmin=2)
+        sizes = arr[:, skip - 1].astype(int)
+        if len(arr) and np.all(sizes == sizes[0]) and arr.shape[1] >= sizes[0] + skip:
+            return arr[:, skip : skip + sizes[0]].astype(np.int64)
+    except ValueError:
+        pass  # not all lines have the same number of fields
+    cells = []
+    for text in lines:
         ts = text.split()
-        n = len(ts)
+        if len(ts) > skip:
+            n = int(ts[skip - 1])
+            cells.append([int(x) for x in ts[skip : skip + n]])
+    return cells
 
-        if not NumberOfVertices and n > 1:
-            NumberOfVertices, NumberOfFaces = int(ts[0]), int(ts[1])
-            continue
-        i += 1
 
-        if i < NumberOfVertices and n == 3:
-            x, y, z = float(ts[0]), float(ts[1]), float(ts[2])
-            vertices.append([x, y, z])
+def loadOFF(filename):
+    """Read the OFF file format (polygonal mesh)."""
+    with open(filename, "r", encoding="UTF-8") as f:
+        NumberOfVertices, NumberOfFaces = 0, 0
+        for text in f:
+            ts = text.split("#")[0].split()
+            if "OFF" in text:
+                ts = ts[1:]  # counts may follow the header keyword
+            if len(ts) > 1:
+                NumberOfVertices, NumberOfFaces = int(ts[0]), int(ts[1])
+                break
 
-        ids = []
-        if NumberOfVertices <= i < (NumberOfVertices + NumberOfFaces + 1) and n > 2:
-            ids += [int(xx) for xx in ts[1:]]
-            faces.append(ids)
+        lines = (l for l in f if l.strip() and not l.lstrip().startswith("#"))
+        vertices = _loadtxt_chunked(lines, NumberOfVertices, usecols=(0, 1, 2))
+        faces = _parse_polygons(list(itertools.islice(lines, NumberOfFaces)))
 
     return Mesh(utils.buildPolyData(vertices, faces))
 
@@ -719,80 +810,172 @@ def loadPVD(filename):
 def loadNeutral(filename):
     """Reads a `Neutral` tetrahedral file format. Return an `Mesh` object."""
     with open(filename, "r", encoding="UTF-8") as f:
-        lines = f.readlines()
-
-    ncoords = int(lines[0])
-    coords = []
-    for i in range(1, ncoords + 1):
-        x, y, z = lines[i].split()
-        coords.append([float(x), float(y), float(z)])
-
-    ntets = int(lines[ncoords + 1])
-    idolf_tets = []
-    for i in range(ncoords + 2, ncoords + ntets + 2):
-        text = lines[i].split()
-        v0, v1, v2, v3 = int(text[1]) - 1, int(text[2]) - 1, int(text[3]) - 1, int(text[4]) - 1
-        idolf_tets.append([v0, v1, v2, v3])
+        ncoords = int(f.readline())
+        coords = _loadtxt_chunked(f, ncoords, usecols=(0, 1, 2))
+        ntets = int(f.readline())
+        idolf_tets = _loadtxt_chunked(f, ntets, usecols=(1, 2, 3, 4), dtype=np.int64) - 1
 
     poly = utils.buildPolyData(coords, idolf_tets)
     return Mesh(poly)
 
 
 def loadGmesh(filename):
-    """Reads a `gmesh` file format. Return an `Mesh` object."""
+    """
+    Reads a `gmesh` file format (ASCII version 2). Return an `Mesh` object.
+    Only triangular and quadrangular elements are considered.
+    """
     with open(filename, "r", encoding="UTF-8") as f:
-        lines = f.readlines()
-
-    nnodes = 0
-    index_nodes = 0
-    for i, line in enumerate(lines):
-        if "$Nodes" in line:
-            index_nodes = i + 1
-            nnodes = int(lines[index_nodes])
-            break
-    node_coords = []
-    for i in range(index_nodes + 1, index_nodes + 1 + nnodes):
-        cn = lines[i].split()
-        node_coords.append([float(cn[1]), float(cn[2]), float(cn[3])])
-
-    nelements = 0
-    index_elements = 0
-    for i, line in enumerate(lines):
-        if "$Elements" in line:
-            index_elements = i + 1
-            nelements = int(lines[index_elements])
-            break
-    elements = []
-    for i in range(index_elements + 1, index_elements + 1 + nelements):
-        ele = lines[i].split()
-        elements.append([int(ele[-3]), int(ele[-2]), int(ele[-1])])
+        for line in f:
+            if "$Nodes" in line:
+                break
+        nnodes = int(f.readline())
+        nodes = _loadtxt_chunked(f, nnodes, usecols=(0, 1, 2, 3))
 
-    poly = utils.buildPolyData(node_coords, elements, indexOffset=1)
+        for line in f:
+            if "$Elements" in line:
+                break
+        nelements = int(f.readline())
+        lines = list(itertools.islice(f, nelements))
+
+    # element lines are: elm-number elm-type number-of-tags <tags> node-number-list
+    try:  # fast path: all elements of the same kind
+        arr = np.loadtxt(lines, dtype=np.int64, ndmin=2)
+        if not (np.all(arr[:, 1:3] == arr[0, 1:3]) and arr[0, 1] in (2, 3)):
+            raise ValueError
+        elements = arr[:, 3 + arr[0, 2] :]
+        conn, sizes = elements.ravel(), [elements.shape[1]] * len(elements)
+    except ValueError:
+        elements = []
+        for text in lines:
+            ele = text.split()
+            if ele[1] in ("2", "3"):  # triangles and quads
+                elements.append([int(x) for x in ele[3 + int(ele[2]) :]])
+        sizes = [len(e) for e in elements]
+        conn = np.array([i for e in elements for i in e], dtype=np.int64)
+
+    # map node numbers to point indices
+    tags = nodes[:, 0].astype(np.int64)
+    order = np.argsort(tags)
+    ids = order[np.searchsorted(tags, conn, sorter=order)]
+    faces = np.split(ids, np.cumsum(sizes)[:-1]) if len(sizes) else []
+
+    poly = utils.buildPolyData(nodes[:, 1:], faces)
     return Mesh(poly)
 
 
+def _lzf_decompress(data, size):
+    # Decompress a LZF compressed buffer as used in binary_compressed PCD files.
+    # Uses the python-lzf module if available.
+    if size == 0:
+        return b""
+    try:
+        import lzf
+    except ImportError:
+        return _lzf_decode(data, size)
+    out = lzf.decompress(data, size)
+    if out is None:
+        raise ValueError("corrupted LZF data")
+    return out
+
+
+def _lzf_decode(data, size):
+    # pure python LZF decoder
+    out = bytearray(size)
+    ip, op, n = 0, 0, len(data)
+    while ip < n:
+        ctrl = data[ip]
+        ip += 1
+        if ctrl < 32:  # literal run
+            ln = ctrl + 1
+            out[op : op + ln] = data[ip : ip + ln]
+            ip += ln
+            op += ln
+        else:  # back reference
+            ln = ctrl >> 5
+            ref = op - ((ctrl & 0x1F) << 8) - 1
+            if ln == 7:
+                ln += data[ip]
+                ip += 1
+            ref -= data[ip]
+            ip += 1
+            ln += 2
+            if ref + ln <= op:
+                out[op : op + ln] = out[ref : ref + ln]
+            else:  # overlapping run
+                for k in range(ln):
+                    out[op + k] = out[ref + k]
+            op += ln
+    return bytes(out)
+
+
 def loadPCD(filename):
     """Return a `Mesh` made of only vertex points
-    from `Point Cloud` file format. Return an `Points` object."""
-    with open(filename, "r", encoding="UTF-8") as f:
-        lines = f.readlines()
-
-    start = False
-    pts = []
-    N, expN = 0, 0
-    for text in lines:
-        if start:
-            if N >= expN:
+    from `Point Cloud` file format. Return an `Points` object.
+    The `ascii`, `binary` and `binary_compressed` data formats are supported."""
+    header = {}
+    with open(filename, "rb") as f:
+        while True:
+            line = f.readline()
+            if not line:
+                break
+            ts = line.decode("ascii", errors="ignore").split()
+            if not ts or ts[0].startswith("#"):
+                continue
+            header[ts[0].upper()] = ts[1:]
+            if ts[0].upper() == "DATA":
                 break
-            l = text.split()
-            pts.append([float(l[0]), float(l[1]), float(l[2])])
-            N += 1
-        if not start and "POINTS" in text:
-            expN = int(text.split()[1])
-        if not start and "DATA ascii" in text:
-            start = True
+        offset = f.tell()
+
+        fields = header.get("FIELDS", ["x", "y", "z"])
+        expN = int(header["POINTS"][0]) if "POINTS" in header else 0
+        if not expN and "WIDTH" in header:
+            expN = int(header["WIDTH"][0]) * int(header.get("HEIGHT", ["1"])[0])
+        ixyz = [fields.index(c) if c in fields else i for i, c in enumerate("xyz")]
+        counts = [int(x) for x in header.get("COUNT", ["1"] * len(fields))]
+        mode = header.get("DATA", ["ascii"])[0].lower()
+
+        if mode == "ascii":
+            # a field with COUNT > 1 spans several columns
+            columns = np.r_[0, np.cumsum(counts)][ixyz]
+            ftext = io.TextIOWrapper(f, encoding="UTF-8")
+            pts = _loadtxt_chunked(ftext, expN, usecols=columns.tolist(), dtype=np.float32)
+            N = len(pts)
+
+        else:
+            # build a numpy structured type describing the binary record of a point
+            sizes = [int(x) for x in header.get("SIZE", ["4"] * len(fields))]
+            types = header.get("TYPE", ["F"] * len(fields))
+            names = [f"{c}_{i}" for i, c in enumerate(fields)]
+            kinds = {"F": "f", "I": "i", "U": "u"}
+            dtypes = [np.dtype(f"<{kinds[t.upper()]}{sz}") for t, sz in zip(types, sizes)]
+
+            if mode == "binary":
+                dt = np.dtype([(nm, d, (c,)) for nm, d, c in zip(names, dtypes, counts)])
+                N = min(expN, (os.path.getsize(filename) - offset) // dt.itemsize)
+                data = np.memmap(filename, dtype=dt, mode="r", offset=offset, shape=(N,))
+                pts = np.empty((N, 3), dtype=np.float32)
+                for k in range(3):
+                    pts[:, k] = data[names[ixyz[k]]][:, 0]
+
+            elif mode == "binary_compressed":
+                csize, usize = np.frombuffer(f.read(8), dtype="<u4")
+                buf = _lzf_decompress(f.read(int(csize)), int(usize))
+                # uncompressed data is organized field by field
+                N = expN
+                pts = np.empty((N, 3), dtype=np.float32)
+                start = 0
+                for i, (d, c) in enumerate(zip(dtypes, counts)):
+                    nbytes = N * d.itemsize * c
+                    if i in ixyz:
+                        arr = np.frombuffer(buf, dtype=d, count=N * c, offset=start)
+                        pts[:, ixyz.index(i)] = arr.reshape(N, c)[:, 0]
+                    start += nbytes
+            else:
+                vedo.logger.error(f"Unknown DATA format {mode} in PCD file {filename}")
+                return None
+
     if expN != N:
-        vedo.logger.warning(f"Mismatch in PCD file {expN} != {len(pts)}")
+        vedo.logger.warning(f"Mismatch in PCD file {expN} != {N}")
     poly = utils.buildPolyData(pts)
     return Points(poly).point_size(4)
 
@@ -1176,6 +1359,198 @@ def loadnumpy(inobj):
     return objs
 
 
+_NATIVE_MAGIC = b"VEDO\x00MM1"
+_NATIVE_ALIGN = 64
+
+
+def write_native(obj, filename):
+    """
+    Write a `Points` or `Mesh` object to the native binary `.vedo` format.
+
+    The file contains a small json header followed by the raw arrays
+    (points, cells, pointdata, celldata) stored contiguously and aligned,
+    so that it can be loaded back with `np.memmap` without any parsing.
+    The object transformation matrix and the `info` dictionary are also saved.
+
+    Example:
+        ```python
+        from vedo import *
+        m = Mesh(dataurl+"bunny.obj").rotate_x(30)
+        m.pointdata["myzcoord"] = m.points()[:,2]
+        write(m, "bunny.vedo")
+        m2 = load("bunny.vedo")  # almost instantaneous, data are paged in on demand
+        ```
+    """
+    if not isinstance(obj, Points):
+        vedo.logger.error(f"write_native(): cannot write object of type {type(obj)}")
+        return None
+
+    poly = obj.polydata(False)
+    arrays = []  # list of (key, numpy array)
+
+    def _add(key, arr):
+        arrays.append((key, np.ascontiguousarray(arr)))
+        return key
+
+    header = {
+        "version": 1,
+        "type": "Mesh" if isinstance(obj, Mesh) else "Points",
+        "name": obj.name,
+        "filename": obj.filename,
+        "time": obj.time,
+        "info": obj.info,
+        "transform": utils.vtk2numpy(obj.GetMatrix()).ravel().tolist(),
+        "points": _add("points", utils.vtk2numpy(poly.GetPoints().GetData()))
+        if poly.GetNumberOfPoints() else None,
+        "cells": {},
+        "pointdata": [],
+        "celldata": [],
+    }
+
+    for ctype in ["verts", "lines", "polys", "strips"]:
+        carr = getattr(poly, "Get" + ctype.capitalize())()
+        if carr.GetNumberOfCells():
+            offsets, conn = utils.cell_connectivity(carr, "csr")
+            header["cells"][ctype] = [
+                _add(f"{ctype}_offsets", offsets),
+                _add(f"{ctype}_connectivity", conn),
+            ]
+
+    for key, vdata in [("pointdata", poly.GetPointData()), ("celldata", poly.GetCellData())]:
+        scals = vdata.GetScalars()
+        vecs = vdata.GetVectors()
+        for i in range(vdata.GetNumberOfArrays()):
+            varr = vdata.GetArray(i)
+            if varr is None:  # e.g. a vtkStringArray
+                continue
+            name = varr.GetName()
+            header[key].append(
+                {
+                    "name": name,
+                    "array": _add(f"{key}_{i}", utils.vtk2numpy(varr)),
+                    "scalars": bool(scals and scals.GetName() == name),
+                    "vectors": bool(vecs and vecs.GetName() == name),
+                }
+            )
+
+    # compute the layout of the binary section
+    layout = {}
+    offset = 0
+    for key, arr in arrays:
+        offset = -(-offset // _NATIVE_ALIGN) * _NATIVE_ALIGN
+        layout[key] = {"offset": offset, "dtype": arr.dtype.str, "shape": list(arr.shape)}
+        offset += arr.nbytes
+    header["arrays"] = layout
+
+    def _jsonable(x):
+        if isinstance(x, np.ndarray):
+            return x.tolist()
+        if isinstance(x, np.generic):
+            return x.item()
+        return str(x)
+
+    txt = json.dumps(header, default=_jsonable).encode("utf-8")
+    start = len(_NATIVE_MAGIC) + 8 + len(txt)
+    start = -(-start // _NATIVE_ALIGN) * _NATIVE_ALIGN
+
+    with open(filename, "wb") as f:
+        f.write(_NATIVE_MAGIC)
+        f.write(np.uint64(start).tobytes())
+        f.write(txt)
+        for key, arr in arrays:
+            f.seek(start + layout[key]["offset"])
+            arr.tofile(f)
+        f.truncate(start + offset)
+    return filename
+
+
+def load_native(filename, mmap=True):
+    """
+    Load a `Points` or `Mesh` object from a file in the native binary `.vedo` format.
+
+    Arguments:
+        mmap : (bool)
+            memory-map the file instead of reading it in memory.
+            The arrays are mapped in copy-on-write mode so the object can be
+            freely modified without altering the file on disk.
+
+    See also `write_native()`.
+    """
+    with open(filename, "rb") as f:
+        magic = f.read(len(_NATIVE_MAGIC))
+        if magic != _NATIVE_MAGIC:
+            vedo.logger.error(f"load_native(): {filename} is not a valid .vedo file")
+            return None
+        start = int(np.frombuffer(f.read(8), dtype=np.uint64)[0])
+        header = json.loads(f.read(start - len(_NATIVE_MAGIC) - 8).rstrip(b"\x00"))
+
+        if not mmap:
+            buffer = np.fromfile(f, dtype=np.uint8)
+
+    def _get(key):
+        desc = header["arrays"][key]
+        dtype = np.dtype(desc["dtype"])
+        shape = tuple(desc["shape"])
+        if not mmap:
+            n = dtype.itemsize * int(np.prod(shape))
+            raw = buffer[desc["offset"] : desc["offset"] + n]
+            return raw.view(dtype).reshape(shape)
+        if 0 in shape:
+            return np.zeros(shape, dtype=dtype)
+        return np.memmap(
+            filename, dtype=dtype, mode="c", offset=start + desc["offset"], shape=shape
+        )
+
+    # vtk arrays are built without copying the data, we keep the buffers
+    # alive by attaching them to the vtk objects (see numpy_to_vtk)
+    poly = vtk.vtkPolyData()
+    if header["points"]:
+        vpts = vtk.vtkPoints()
+        vpts.SetData(utils.numpy2vtk(_get(header["points"]), deep=False))
+        poly.SetPoints(vpts)
+
+    ast = np.int32
+    if vtk.vtkIdTypeArray().GetDataTypeSize() != 4:
+        ast = np.int64
+    for ctype, (koffsets, kconn) in header["cells"].items():
+        offsets, conn = _get(koffsets), _get(kconn)
+        if offsets.dtype == ast and conn.dtype == ast and hasattr(vtk.vtkCellArray, "SetData"):
+            carr = vtk.vtkCellArray()
+            carr.SetData(
+                utils.numpy2vtk(offsets, dtype="id", deep=False),
+                utils.numpy2vtk(conn, dtype="id", deep=False),
+            )
+            # vtkCellArray shares the memory but not the wrapping arrays
+            carr._numpy_reference = (offsets, conn)
+        else:
+            carr = utils._csr_to_cellarray(offsets, conn)
+        getattr(poly, "Set" + ctype.capitalize())(carr)
+
+    for key, vdata in [("pointdata", poly.GetPointData()), ("celldata", poly.GetCellData())]:
+        for desc in header[key]:
+            varr = utils.numpy2vtk(_get(desc["array"]), deep=False, name=desc["name"] or "")
+            vdata.AddArray(varr)
+            if desc["scalars"]:
+                vdata.SetActiveScalars(desc["name"])
+            if desc["vectors"]:
+                vdata.SetActiveVectors(desc["name"])
+
+    if header["type"] == "Mesh":
+        obj = Mesh(poly)
+    else:
+        obj = Points(poly)
+
+    M = np.array(header["transform"]).reshape(4, 4)
+    if not np.allclose(M, np.eye(4)):
+        obj.apply_transform(M)
+
+    obj.name = header["name"]
+    obj.filename = header["filename"]
+    obj.time = header["time"]
+    obj.info = header["info"]
+    return obj
+
+
 def loadImageData(filename):
     """Read and return a `vtkImageData` object from file."""
     if ".tif" in filename.lower():
@@ -1216,6 +1591,7 @@ def write(objct, fileoutput, binary=True):
 
     Possile extensions are:
         - `vtk, vti, npy, npz, ply, obj, stl, byu, vtp, vti, mhd, xyz, tif, png, bmp`
+        - `vedo` is the native binary format which can be memory-mapped, see `write_native()`
     """
     obj = objct
     if isinstance(obj, Points):  # picks transformation
@@ -1226,7 +1602,10 @@ def write(objct, fileoutput, binary=True):
         obj = objct
 
     fr = fileoutput.lower()
-    if fr.endswith(".vtk"):
+    if fr.endswith(".vedo"):
+        write_native(objct, fileoutput)
+        return objct
+    elif fr.endswith(".vtk"):
         writer = vtk.vtkDataSetWriter()
     elif fr.endswith(".ply"):
         writer = vtk.vtkPLYWriter()
@@ -1875,6 +2254,170 @@ def ask(*question, **kwarg):
     return resp
 
 
+##############################################################################################
+class BatchRenderer:
+    """
+    Render many objects from many points of view in a single offscreen window.
+    """
+
+    def __init__(self, size=(200, 200), bg="white", zoom=1.25, axes=False):
+        """
+        Render thumbnails, turntables or multiple views of a list of objects
+        reusing the same offscreen rendering window, and return them as numpy arrays.
+
+        Arguments:
+            size : (list)
+                size of the images in pixels
+            bg : (color)
+                background color
+            zoom : (float)
+                zoom factor applied after the camera is reset on each object
+            axes : (bool)
+                add a set of axes around each object
+
+        Example:
+            ```python
+            from vedo import *
+            meshes = [Sphere(), Cube(), Cone()]
+            br = BatchRenderer(size=(300, 300))
+            imgs = br.render(meshes, views=[(0, 0), (90, 0), (0, 60)])
+            print(imgs.shape)  # (3, 3, 300, 300, 3)
+            br.render(meshes, write="thumb_{obj}_{view}.png")  # async writing
+            br.close()
+            ```
+        """
+        self.size = size
+        self.zoom = zoom
+        self.axes = axes
+
+        self.renderer = vtk.vtkRenderer()
+        self.renderer.SetBackground(colors.get_color(bg))
+        self.window = vtk.vtkRenderWindow()
+        self.window.SetOffScreenRendering(True)
+        self.window.SetSize(size)
+        self.window.AddRenderer(self.renderer)
+
+        self._pixels = vtk.vtkUnsignedCharArray()
+        self._pool = None
+        self._jobs = []
+
+    def _snap(self):
+        self.window.Render()
+        nx, ny = self.window.GetSize()
+        self.window.GetRGBACharPixelData(0, 0, nx - 1, ny - 1, 0, self._pixels)
+        narr = utils.vtk2numpy(self._pixels).reshape([ny, nx, 4])
+        return narr[::-1, :, :3]
+
+    def _set_view(self, home, view):
+        cam = self.renderer.GetActiveCamera()
+        if isinstance(view, dict):
+            utils.camera_from_dict(view, modify_inplace=cam)
+        elif isinstance(view, vtk.vtkCamera):
+            cam.DeepCopy(view)
+        else:  # (azimuth, elevation) relative to the initial view
+            cam.DeepCopy(home)
+            azimuth, elevation = view
+            cam.Elevation(elevation)
+            cam.Azimuth(azimuth)
+            cam.OrthogonalizeViewUp()
+        self.renderer.ResetCameraClippingRange()
+
+    def render(self, objects, views=((0, 0),), write=None):
+        """
+        Render each object from each view.
+
+        Arguments:
+            objects : (list)
+                list of objects, each item can also be a list of objects
+                to be rendered together
+            views : (list)
+                list of camera poses, each can be a pair `(azimuth, elevation)`
+                relative to the initial camera, a dictionary (see `utils.camera_from_dict()`)
+                or a `vtkCamera`
+            write : (str)
+                if set, images are written to files in background threads instead
+                of being returned, e.g. `write="img_{obj}_{view}.png"`.
+                Call `wait()` to make sure all files are written.
+
+        Returns:
+            a numpy `uint8` array of shape `(nobjects, nviews, height, width, 3)`
+        """
+        if not utils.is_sequence(objects):
+            objects = [objects]
+        nx, ny = self.window.GetSize()
+        if write is None:
+            out = np.zeros([len(objects), len(views), ny, nx, 3], dtype=np.uint8)
+
+        ren = self.renderer
+        cam = ren.GetActiveCamera()
+        home = vtk.vtkCamera()
+        for i, obj in enumerate(objects):
+            ren.RemoveAllViewProps()
+            objs = obj if utils.is_sequence(obj) else [obj]
+            for a in objs:
+                ren.AddActor(a)
+                if self.axes:
+                    ren.AddActor(vedo.addons.Axes(a))
+            ren.ResetCamera()
+            cam.Zoom(self.zoom)
+            home.DeepCopy(cam)
+
+            for j, view in enumerate(views):
+                self._set_view(home, view)
+                if write is None:
+                    out[i, j] = self._snap()
+                else:
+                    self._write_async(np.array(self._snap()), write.format(obj=i, view=j))
+
+        ren.RemoveAllViewProps()
+        if write is None:
+            return out
+        return self
+
+    def turntable(self, obj, n=36, elevation=0, write=None):
+        """
+        Render `n` views of an object rotating around it.
+        Returns a numpy array of shape `(n, height, width, 3)`.
+        """
+        views = [(360 * i / n, elevation) for i in range(n)]
+        if write:
+            write = write.replace("{view}", "{view:04d}")
+            return self.render([obj], views, write)
+        return self.render([obj], views)[0]
+
+    def _write_async(self, arr, filename):
+        if self._pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._pool = ThreadPoolExecutor(max_workers=2)
+
+        def _write(arr, filename):
+            ny, nx, _ = arr.shape
+            img = vtk.vtkImageData()
+            img.SetDimensions(nx, ny, 1)
+            img.GetPointData().SetScalars(utils.numpy2vtk(arr[::-1].reshape(-1, 3)))
+            write(img, filename)
+
+        self._jobs.append(self._pool.submit(_write, arr, filename))
+
+    def wait(self):
+        """Wait for all the pending image files to be written."""
+        for job in self._jobs:
+            job.result()
+        self._jobs = []
+        return self
+
+    def close(self):
+        """Write the pending files and release the rendering window."""
+        self.wait()
+        if self._pool:
+            self._pool.shutdown()
+            self._pool = None
+        self.renderer.RemoveAllViewProps()
+        self.window.Finalize()
+        return self
+
+
 ##############################################################################################
 class Video:
     """
@@ -1886,6 +2429,13 @@ class Video:
         Class to generate a video from the specified rendering window.
         Program `ffmpeg` is used to create video from each generated frame.
 
+        The raw RGB buffers of the rendering window are sent to the encoder
+        from a background thread as soon as they are added, no image file is written.
+        If `duration` is set the final frame rate is only known at the end,
+        so frames are spooled uncompressed to a temporary file and encoded on `close()`.
+        If the window is resized during the recording, the frames are cropped
+        or padded to the size of the first one.
+
         Arguments:
             name : (str)
                 name of the output file.
@@ -1908,26 +2458,171 @@ class Video:
         self.command = "ffmpeg -loglevel panic -y -r"
         self.options = "-b:v 8000k"
 
+        # list of frame ids, a repeated frame is stored only once and referenced again
         self.frames = []
         self.tmp_dir = TemporaryDirectory()
         self.get_filename = lambda x: os.path.join(self.tmp_dir.name, x)
+
+        self._w2if = None
+        self._last_frame = None
+        self._nframes = 0  # number of distinct frames
+        self._shape = None  # size of the first frame
+        self._resized = False
+        self._spool = None
+        self._queue = None
+        self._thread = None
+        self._writer = None
+        self._error = None
         colors.printc(":video: Video file", self.name, "is open... ", c="m", end="")
 
+    def _grab(self):
+        # read the RGB buffer of the rendering window into a numpy array
+        win = vedo.plotter_instance.window
+        if self._w2if is None or self._w2if.GetInput() is not win:
+            self._w2if = vtk.vtkWindowToImageFilter()
+            self._w2if.SetInput(win)
+            self._w2if.SetInputBufferTypeToRGB()
+            self._w2if.ReadFrontBufferOff()  # read from the back buffer
+        self._w2if.Modified()
+        self._w2if.Update()
+        img = self._w2if.GetOutput()
+        nx, ny, _ = img.GetDimensions()
+        arr = utils.vtk2numpy(img.GetPointData().GetScalars()).reshape([ny, nx, -1])
+        return np.ascontiguousarray(arr[::-1, :, :3])  # flip and copy
+
+    def _open_writer(self, shape):
+        ny, nx, _ = shape
+        fps = self.fps
+
+        if self.backend == "ffmpeg":
+            import subprocess
+
+            cmd = self.command.split() + [str(fps)]
+            cmd += ["-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{nx}x{ny}", "-i", "-"]
+            cmd += self.options.split() + [self.name]
+            proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+            return proc.stdin.write, proc
+
+        elif "cv" in self.backend:
+            import cv2
+
+            fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+            writer = cv2.VideoWriter(self.name, fourcc, fps, (nx, ny), True)
+            # cv2 needs a contiguous BGR buffer
+            return lambda frame: writer.write(np.ascontiguousarray(frame[:, :, ::-1])), writer
+
+        elif "imageio" in self.backend:
+            try:
+                import imageio
+            except ImportError:
+                raise ImportError("Please install imageio with:\n pip install imageio[ffmpeg]")
+
+            if self.name.endswith(".mp4"):
+                writer = imageio.get_writer(self.name, fps=fps)
+            elif self.name.endswith(".gif"):
+                writer = imageio.get_writer(self.name, mode="I", duration=1 / fps)
+            elif self.name.endswith(".webm"):
+                writer = imageio.get_writer(self.name, format="webm", fps=fps)
+            else:
+                raise ValueError(f"Unknown format of {self.name}.")
+            return writer.append_data, writer
+
+        raise ValueError(f"Unknown video backend {self.backend}")
+
+    def _close_writer(self, writer):
+        if self.backend == "ffmpeg":
+            writer.stdin.close()
+            out = writer.wait()
+            if out:
+                raise RuntimeError(f"ffmpeg returning error: {out}")
+        elif "cv" in self.backend:
+            writer.release()
+        else:
+            writer.close()
+
+    def _encode(self):
+        # runs in a background thread, frames are taken from the queue in order
+        write = None
+        try:
+            while True:
+                frame = self._queue.get()
+                if frame is None:
+                    break
+                if write is None:
+                    write, self._writer = self._open_writer(frame.shape)
+                write(frame)
+        except Exception as e:
+            self._error = e
+            # keep consuming so that add_frame() never blocks
+            while self._queue.get() is not None:
+                pass
+
+    def _push(self, frame, fid):
+        if self.duration:
+            # fps is not known yet, spool the distinct frames uncompressed
+            if fid == self._nframes:
+                if self._spool is None:
+                    self._spool = open(self.get_filename("frames.raw"), "wb")
+                frame.tofile(self._spool)
+            return
+
+        if self._thread is None:
+            import queue
+            import threading
+
+            self._queue = queue.Queue(maxsize=16)
+            self._thread = threading.Thread(target=self._encode, daemon=True)
+            self._thread.start()
+        self._queue.put(frame)
+
+    def _fit(self, frame):
+        # all frames must have the size of the first one, if the window
+        # was resized the frame is cropped or padded with black
+        if self._shape is None:
+            self._shape = frame.shape
+        if frame.shape == self._shape:
+            return frame
+        ny, nx, _ = self._shape
+        if not self._resized:
+            vedo.logger.warning(
+                f"in Video the window size changed, frames are cropped or padded to {nx}x{ny}"
+            )
+            self._resized = True
+        out = np.zeros(self._shape, dtype=np.uint8)
+        my, mx = min(ny, frame.shape[0]), min(nx, frame.shape[1])
+        out[:my, :mx] = frame[:my, :mx]
+        return out
+
+    def _add(self, frame):
+        # add an RGB frame of shape (ny, nx, 3)
+        frame = self._fit(frame)
+        if self._last_frame is not None and np.array_equal(frame, self._last_frame):
+            # identical to the previous one, encode it by reference
+            frame = self._last_frame
+            fid = self.frames[-1]
+        else:
+            fid = self._nframes
+        self._push(frame, fid)
+        if fid == self._nframes:
+            self._nframes += 1
+        self._last_frame = frame
+        self.frames.append(fid)
+        return self
+
     def add_frame(self):
         """Add frame to current video."""
-        fr = self.get_filename(str(len(self.frames)) + ".png")
-        screenshot(fr)
-        self.frames.append(fr)
-        return self
+        if not vedo.plotter_instance or not vedo.plotter_instance.window:
+            return self
+        return self._add(self._grab())
 
     def pause(self, pause=0):
         """Insert a `pause`, in seconds."""
-        fr = self.frames[-1]
+        if not self.frames:
+            return self
         n = int(self.fps * pause)
         for _ in range(n):
-            fr2 = self.get_filename(str(len(self.frames)) + ".png")
-            self.frames.append(fr2)
-            os.system("cp -f %s %s" % (fr, fr2))
+            self._push(self._last_frame, self.frames[-1])
+            self.frames.append(self.frames[-1])
         return self
 
     def action(self, elevation=(0, 80), azimuth=(0, 359), cameras=(), resetcam=False):
@@ -1981,75 +2676,37 @@ class Video:
         else:
             self.fps = int(self.fps)
 
-        ########################################
-        if self.backend == "ffmpeg":
-            out = os.system(
-                self.command
-                + " "
-                + str(self.fps)
-                + " -i "
-                + f"'{self.tmp_dir.name}'"
-                + os.sep
-                + "%01d.png "
-                + self.options
-                + " "
-                + f"'{self.name}'"
-            )
-            if out:
-                vedo.logger.error(f":noentry: backend {self.backend} returning error: {out}")
-            else:
+        try:
+            if self._thread is not None:  # streaming mode
+                self._queue.put(None)
+                self._thread.join()
+                if self._error:
+                    raise self._error
+
+            elif self._spool is not None:  # spooled frames are encoded now
+                self._spool.close()
+                spool = np.memmap(
+                    self.get_filename("frames.raw"),
+                    dtype=np.uint8,
+                    mode="r",
+                    shape=(self._nframes,) + self._shape,
+                )
+                write, self._writer = self._open_writer(self._shape)
+                for fid in self.frames:
+                    write(spool[fid])
+                del spool
+
+            if self._writer is not None:
+                self._close_writer(self._writer)
                 colors.printc(f":save: saved to {self.name}", c="m")
 
-        ########################################
-        elif "cv" in self.backend:
-            try:
-                import cv2
-            except ImportError:
-                vedo.logger.error("opencv is not installed")
-                return
-
-            cap = cv2.VideoCapture(os.path.join(self.tmp_dir.name, "%1d.png"))
-            fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-            w, h = vedo.plotter_instance.window.GetSize()
-            writer = cv2.VideoWriter(self.name, fourcc, self.fps, (w, h), True)
-
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    break
-                writer.write(frame)
-
-            cap.release()
-            writer.release()
-
-        ########################################
-        elif "imageio" in self.backend:
-            try:
-                import imageio
-            except ImportError:
-                vedo.logger.error("Please install imageio with:\n pip install imageio[ffmpeg]")
-                return
-
-            if self.name.endswith(".mp4"):
-                writer = imageio.get_writer(self.name, fps=self.fps)
-            elif self.name.endswith(".gif"):
-                writer = imageio.get_writer(self.name, mode="I", duration=1 / self.fps)
-            elif self.name.endswith(".webm"):
-                writer = imageio.get_writer(self.name, format="webm", fps=self.fps)
-            else:
-                vedo.logger.error(f"Unknown format of {self.name}.")
-                return
-
-            for f in utils.humansort(self.frames):
-                image = imageio.v3.imread(f)
-                writer.append_data(image)
-            try:
-                writer.close()
-                colors.printc(f"... saved as {self.name}", c="m")
-            except:
-                colors.printc(f":noentry: Could not save video {self.name}", c="r")
+        except Exception as e:
+            vedo.logger.error(f":noentry: Could not save video {self.name} ({e})")
 
         # finalize cleanup
+        self._writer = None
+        self._thread = None
+        self._spool = None
         self.tmp_dir.cleanup()
 
     def split_frames(self, output_dir="video_frames", prefix="frame_", format="png"):
@@ -23,7 +23,7 @@ Submodule to work with polygonal meshes
 ![](https://vedo.embl.es/images/advanced/mesh_smoother2.png)
 """
 
-__all__ = ["Mesh"]
+__all__ = ["Mesh", "CollisionWorld"]
 
 
 ####################################################
@@ -56,6 +56,8 @@ class Mesh(Points):
         Points.__init__(self)
 
         self.line_locator = None
+        self._inside_classifier = None  # cached classifier used by contains()
+        self._collision_filter = None  # cached filter used by collide_with()
 
         self._mapper.SetInterpolateScalarsBeforeMapping(
             vedo.settings.interpolate_scalars_before_mapping
@@ -312,39 +314,27 @@ class Mesh(Points):
         ]
         return "\n".join(allt)
 
-    def faces(self):
+    def faces(self, fmt="list"):
         """
         Get cell polygonal connectivity ids as a python `list`.
         The output format is: `[[id0 ... idn], [id0 ... idm],  etc]`.
-        """
-        arr1d = vtk2numpy(self._data.GetPolys().GetData())
-        if arr1d is None:
-            return []
 
-        # Get cell connettivity ids as a 1D array. vtk format is:
-        # [nids1, id0 ... idn, niids2, id0 ... idm,  etc].
-        if len(arr1d) == 0:
-            arr1d = vtk2numpy(self._data.GetStrips().GetData())
-            if arr1d is None:
-                return []
+        Arguments:
+            fmt : (str)
+                use "csr" to get a tuple of numpy arrays `(offsets, connectivity)`,
+                or "dense" to get a (N, k) numpy array when all faces have k vertices.
+                See also `utils.cell_connectivity()`.
+        """
+        carr = self._data.GetPolys()
+        if carr.GetNumberOfCells() == 0 and self._data.GetStrips().GetNumberOfCells():
+            carr = self._data.GetStrips()
+        return vedo.utils.cell_connectivity(carr, fmt)
 
-        i = 0
-        conn = []
-        n = len(arr1d)
-        if n:
-            while True:
-                cell = [arr1d[i + k] for k in range(1, arr1d[i] + 1)]
-                conn.append(cell)
-                i += arr1d[i] + 1
-                if i >= n:
-                    break
-        return conn  # cannot always make a numpy array of it!
-
-    def cells(self):
+    def cells(self, fmt="list"):
         """Alias for `faces()`."""
-        return self.faces()
+        return self.faces(fmt)
 
-    def lines(self, flat=False):
+    def lines(self, flat=False, fmt="list"):
         """
         Get lines connectivity ids as a numpy array.
         Default format is `[[id0,id1], [id3,id4], ...]`
@@ -352,50 +342,30 @@ class Mesh(Points):
         Arguments:
             flat : (bool)
                 return a 1D numpy array as e.g. [2, 10,20, 3, 10,11,12, 2, 70,80, ...]
+            fmt : (str)
+                use "csr" to get a tuple of numpy arrays `(offsets, connectivity)`,
+                or "dense" to get a (N, k) numpy array when all lines have k points.
         """
         # Get cell connettivity ids as a 1D array. The vtk format is:
         #    [nids1, id0 ... idn, niids2, id0 ... idm,  etc].
-        arr1d = vtk2numpy(self.polydata(False).GetLines().GetData())
-
-        if arr1d is None:
-            return []
-
+        carr = self.polydata(False).GetLines()
         if flat:
-            return arr1d
+            return vtk2numpy(carr.GetData())
+        return vedo.utils.cell_connectivity(carr, fmt)
 
-        i = 0
-        conn = []
-        n = len(arr1d)
-        for _ in range(n):
-            cell = [arr1d[i + k + 1] for k in range(arr1d[i])]
-            conn.append(cell)
-            i += arr1d[i] + 1
-            if i >= n:
-                break
-
-        return conn  # cannot always make a numpy array of it!
+    def edges(self, fmt="list"):
+        """
+        Return an array containing the edges connectivity.
 
-    def edges(self):
-        """Return an array containing the edges connectivity."""
+        Use `fmt="dense"` to get a (N, 2) numpy array, or "csr" for a tuple
+        of numpy arrays `(offsets, connectivity)`.
+        """
         extractEdges = vtk.vtkExtractEdges()
         extractEdges.SetInputData(self._data)
         # eed.UseAllPointsOn()
         extractEdges.Update()
         lpoly = extractEdges.GetOutput()
-
-        arr1d = vtk2numpy(lpoly.GetLines().GetData())
-        # [nids1, id0 ... idn, niids2, id0 ... idm,  etc].
-
-        i = 0
-        conn = []
-        n = len(arr1d)
-        for _ in range(n):
-            cell = [arr1d[i + k + 1] for k in range(arr1d[i])]
-            conn.append(cell)
-            i += arr1d[i] + 1
-            if i >= n:
-                break
-        return conn  # cannot always make a numpy array of it!
+        return vedo.utils.cell_connectivity(lpoly.GetLines(), fmt)
 
     def texture(
         self,
@@ -1634,28 +1604,85 @@ class Mesh(Points):
         )
         return out
 
-    def is_inside(self, point, tol=1e-05):
-        """Return True if point is inside a polydata closed surface."""
-        poly = self.polydata()
-        points = vtk.vtkPoints()
-        points.InsertNextPoint(point)
-        pointsPolydata = vtk.vtkPolyData()
-        pointsPolydata.SetPoints(points)
-        sep = vtk.vtkSelectEnclosedPoints()
-        sep.SetTolerance(tol)
-        sep.CheckSurfaceOff()
-        sep.SetInputData(pointsPolydata)
-        sep.SetSurfaceData(poly)
-        sep.Update()
-        return sep.IsInside(0)
-
-    def inside_points(self, pts, invert=False, tol=1e-05, return_ids=False):
+    def _get_inside_classifier(self):
+        # Return the classifier used by contains(). It is rebuilt only if the
+        # polydata, its modification time or the object position have changed.
+        data = self.inputdata()
+        M = self.GetMatrix()
+        key = (data, data.GetMTime(), tuple(M.GetElement(i, j) for i in range(4) for j in range(4)))
+        cached = self._inside_classifier
+        if cached is not None and cached[0][0] is key[0] and cached[0][1:] == key[1:]:
+            return cached[1]
+
+        tf = vtk.vtkTriangleFilter()
+        tf.PassLinesOff()
+        tf.PassVertsOff()
+        tf.SetInputData(self.polydata())
+        tf.Update()
+        tpoly = tf.GetOutput()
+        vertices = vtk2numpy(tpoly.GetPoints().GetData()) if tpoly.GetNumberOfPoints() else np.zeros((0, 3))
+        triangles = vtk2numpy(tpoly.GetPolys().GetData()).reshape(-1, 4)[:, 1:]
+        classifier = _EnclosedPointsClassifier(vertices, triangles)
+        self._inside_classifier = (key, classifier)
+        return classifier
+
+    def contains(self, pts):
+        """
+        Return a boolean array telling which of the input points are inside
+        this closed surface.
+
+        The inside/outside classifier is built once and cached, it is rebuilt
+        only if the mesh changes, so that many small batches of points can be
+        tested efficiently. Points lying exactly on the surface can be
+        classified either way: they may differ from the results of `vtkSelectEnclosedPoints`
+        (e.g. points of a regular grid which lie on the faces of a `Box`).
+
+        Arguments:
+            pts : (list, Points)
+                the (N,3) query points
+
+        Example:
+            ```python
+            import numpy as np
+            from vedo import Sphere
+            s = Sphere()
+            for i in range(10):
+                pts = np.random.randn(100_000, 3)
+                print(s.contains(pts).sum())
+            ```
+        """
+        if isinstance(pts, Points):
+            pts = pts.points()
+        pts = np.asarray(pts, dtype=float)
+        if pts.ndim == 1:
+            pts = pts.reshape(1, -1)
+        if pts.shape[1] == 2:
+            pts = np.c_[pts, np.zeros(len(pts))]
+        return self._get_inside_classifier().contains(pts)
+
+    def is_inside(self, point, tol=None):
+        """
+        Return True if point is inside a polydata closed surface.
+
+        Use `contains()` to test many points at once.
+        Points lying exactly on the surface can be classified either way.
+        The `tol` argument is deprecated and ignored.
+        """
+        if tol is not None:  # deprecation message
+            vedo.logger.warning("in is_inside() the tol argument is deprecated and ignored")
+        return bool(self.contains([point])[0])
+
+    def inside_points(self, pts, invert=False, tol=None, return_ids=False):
         """
         Return the point cloud that is inside mesh surface as a new Points object.
 
         If return_ids is True a list of IDs is returned and in addition input points
         are marked by a pointdata array named "IsInside".
 
+        See also `contains()`. Points lying exactly on the surface can be classified
+        either way, so they may differ from the results of `vtkSelectEnclosedPoints`.
+        The `tol` argument is deprecated and ignored.
+
         Example:
             `print(pts.pointdata["IsInside"])`
 
@@ -1664,30 +1691,20 @@ class Mesh(Points):
 
             ![](https://vedo.embl.es/images/basic/pca.png)
         """
+        if tol is not None:  # deprecation message
+            vedo.logger.warning("in inside_points() the tol argument is deprecated and ignored")
         if isinstance(pts, Points):
-            pointsPolydata = pts.polydata()
             ptsa = pts.points()
         else:
             ptsa = np.asarray(pts)
-            vpoints = vtk.vtkPoints()
-            vpoints.SetData(numpy2vtk(ptsa, dtype=np.float32))
-            pointsPolydata = vtk.vtkPolyData()
-            pointsPolydata.SetPoints(vpoints)
-
-        sep = vtk.vtkSelectEnclosedPoints()
-        # sep = vtk.vtkExtractEnclosedPoints()
-        sep.SetTolerance(tol)
-        sep.SetInputData(pointsPolydata)
-        sep.SetSurfaceData(self.polydata())
-        sep.SetInsideOut(invert)
-        sep.Update()
-
-        varr = sep.GetOutput().GetPointData().GetArray("SelectedPoints")
-        mask = vtk2numpy(varr).astype(bool)
-        ids = np.array(range(len(ptsa)), dtype=int)[mask]
+
+        mask = self.contains(ptsa)
+        if invert:
+            mask = ~mask
+        ids = np.nonzero(mask)[0]
 
         if isinstance(pts, Points):
-            varr.SetName("IsInside")
+            varr = numpy2vtk(mask, dtype=np.uint8, name="IsInside")
             pts.inputdata().GetPointData().AddArray(varr)
 
         if return_ids:
@@ -2466,19 +2483,26 @@ class Mesh(Points):
         """
         Collide this Mesh with the input surface.
         Information is stored in `ContactCells1` and `ContactCells2`.
-        """
-        ipdf = vtk.vtkCollisionDetectionFilter()
-        # ipdf.SetGlobalWarningDisplay(0)
 
-        transform0 = vtk.vtkTransform()
-        transform1 = vtk.vtkTransform()
+        The OBB trees of the two meshes are built in their own local frame and
+        kept from one call to the next, so that repeatedly testing the same
+        two meshes while they move rigidly does not rebuild them.
+        To test many moving meshes at once see `CollisionWorld`.
+        """
+        data1, data2 = self.polydata(False), mesh2.polydata(False)
+        cached = self._collision_filter
+        if cached is not None and cached[0] is data1 and cached[1] is data2:
+            ipdf = cached[2]
+        else:
+            ipdf = vtk.vtkCollisionDetectionFilter()
+            ipdf.SetInputData(0, data1)
+            ipdf.SetInputData(1, data2)
+            self._collision_filter = (data1, data2, ipdf)
 
         # ipdf.SetBoxTolerance(tol)
         ipdf.SetCellTolerance(tol)
-        ipdf.SetInputData(0, self.polydata())
-        ipdf.SetInputData(1, mesh2.polydata())
-        ipdf.SetTransform(0, transform0)
-        ipdf.SetTransform(1, transform1)
+        ipdf.SetMatrix(0, self.GetMatrix())
+        ipdf.SetMatrix(1, mesh2.GetMatrix())
         if return_bool:
             ipdf.SetCollisionModeToFirstContact()
         else:
@@ -2488,13 +2512,11 @@ class Mesh(Points):
         if return_bool:
             return bool(ipdf.GetNumberOfContacts())
 
-        msh = Mesh(ipdf.GetContactsOutput(), "k", 1).lighting("off")
-        msh.metadata["ContactCells1"] = vtk2numpy(
-            ipdf.GetOutput(0).GetFieldData().GetArray("ContactCells")
-        )
-        msh.metadata["ContactCells2"] = vtk2numpy(
-            ipdf.GetOutput(1).GetFieldData().GetArray("ContactCells")
-        )
+        contacts = vtk.vtkPolyData()
+        contacts.DeepCopy(ipdf.GetContactsOutput())
+        msh = Mesh(contacts, "k", 1).lighting("off")
+        msh.metadata["ContactCells1"] = _contact_cells(ipdf, 0)
+        msh.metadata["ContactCells2"] = _contact_cells(ipdf, 1)
         msh.GetProperty().SetLineWidth(3)
         msh.name = "SurfaceCollision"
 
@@ -2845,3 +2867,252 @@ class Follower(vedo.base.BaseActor, vtk.vtkFollower):
         self.PickableOff()
 
         self.pipeline = OperationNode("Follower", parents=[actor], shape="component", c="#d9ed92")
+
+
+####################################################
+class CollisionWorld:
+    """
+    Detect the contacts among many meshes moving rigidly in space.
+    """
+
+    def __init__(self, meshes=(), tol=0.0, first_contact=False):
+        """
+        At each `step()` the bounding boxes of the meshes are sorted along
+        their axis of largest spread and swept to find the pairs which overlap
+        (sweep-and-prune). Only these pairs are tested cell by cell.
+        The OBB trees used in this narrow phase are built once in the local
+        frame of the meshes, and the current transformation matrix of each
+        mesh is used to bring them in place, so moving, rotating or scaling
+        the meshes never triggers a rebuild.
+
+        Arguments:
+            meshes : (list)
+                list of `Mesh` objects
+            tol : (float)
+                cells closer than this distance are considered in contact
+            first_contact : (bool)
+                stop at the first contact found for each pair of meshes
+
+        Example:
+            ```python
+            from vedo import *
+            balls = [Sphere(r=0.5).pos(1.5*i, 0, 0) for i in range(10)]
+            world = CollisionWorld(balls)
+            balls[3].pos(3.8, 0.2, 0)
+            for i, j, cells_i, cells_j in world.step():
+                print(i, j, len(cells_i), len(cells_j))  # 2 3 ...
+            ```
+        """
+        self.meshes = []
+        self.tol = tol
+        self.first_contact = first_contact
+        self.contacts = []  # contacts found at the last step()
+        self._filters = {}  # one collision filter per pair of meshes
+        self.add(*meshes)
+
+    def __len__(self):
+        return len(self.meshes)
+
+    def add(self, *meshes):
+        """Add one or more meshes to the world."""
+        for msh in meshes:
+            if msh not in self.meshes:
+                self.meshes.append(msh)
+        return self
+
+    def remove(self, *meshes):
+        """Remove one or more meshes from the world."""
+        for msh in meshes:
+            self.meshes.remove(msh)
+            for key in [k for k in self._filters if id(msh) in k]:
+                del self._filters[key]
+        return self
+
+    def broad_phase(self):
+        """
+        Return the pairs of indices of the meshes whose bounding boxes overlap,
+        as a sorted array of shape (N, 2) with `i < j` on each row.
+        """
+        if len(self.meshes) < 2:
+            return np.zeros((0, 2), dtype=int)
+        bounds = np.array([msh.GetBounds() for msh in self.meshes])
+        return _sweep_and_prune(bounds, self.tol)
+
+    def step(self):
+        """
+        Find the meshes in contact at their current position.
+
+        Returns a list of tuples `(i, j, cells_i, cells_j)` with the indices of
+        the two meshes in `meshes` and the ids of their cells in contact.
+        """
+        contacts = []
+        for i, j in self.broad_phase():
+            msh1, msh2 = self.meshes[i], self.meshes[j]
+            cdf = self._get_filter(msh1, msh2)
+            cdf.Update()
+            if cdf.GetNumberOfContacts():
+                contacts.append((i, j, _contact_cells(cdf, 0), _contact_cells(cdf, 1)))
+        self.contacts = contacts
+        return contacts
+
+    def _get_filter(self, msh1, msh2):
+        data1, data2 = msh1.polydata(False), msh2.polydata(False)
+        key = (id(msh1), id(msh2))
+        cached = self._filters.get(key)
+        if cached is not None and cached[0] is data1 and cached[1] is data2:
+            cdf = cached[2]
+        else:
+            cdf = vtk.vtkCollisionDetectionFilter()
+            cdf.SetInputData(0, data1)
+            cdf.SetInputData(1, data2)
+            self._filters[key] = (data1, data2, cdf)
+        cdf.SetCellTolerance(self.tol)
+        if self.first_contact:
+            cdf.SetCollisionModeToFirstContact()
+        else:
+            cdf.SetCollisionModeToAllContacts()
+        cdf.SetMatrix(0, msh1.GetMatrix())
+        cdf.SetMatrix(1, msh2.GetMatrix())
+        return cdf
+
+
+def _contact_cells(cdf, i):
+    # ids of the cells of input i of a vtkCollisionDetectionFilter found in contact
+    arr = cdf.GetOutput(i).GetFieldData().GetArray("ContactCells")
+    if arr is None:
+        return np.zeros(0, dtype=int)
+    return np.array(vtk2numpy(arr), dtype=int)
+
+
+def _sweep_and_prune(bounds, tol=0.0):
+    # pairs of overlapping axis-aligned boxes given as rows of
+    # (xmin, xmax, ymin, ymax, zmin, zmax), returned as sorted (N, 2) indices
+    bounds = np.asarray(bounds, dtype=float).reshape(-1, 6)
+    lo = bounds[:, 0::2] - tol / 2
+    hi = bounds[:, 1::2] + tol / 2
+    valid = np.all(lo <= hi, axis=1)  # empty meshes have inverted bounds
+    if valid.sum() < 2:
+        return np.zeros((0, 2), dtype=int)
+
+    # sweep along the axis where the box centers are most spread
+    axis = np.argmax(np.var(lo[valid] + hi[valid], axis=0))
+    ids = np.nonzero(valid)[0]
+    ids = ids[np.argsort(lo[ids, axis], kind="stable")]
+    lo, hi = lo[ids], hi[ids]
+    n = len(ids)
+
+    # each box is paired with the following ones starting before its end
+    stop = np.searchsorted(lo[:, axis], hi[:, axis], side="right")
+    counts = np.maximum(stop - np.arange(n) - 1, 0)
+    i = np.repeat(np.arange(n), counts)
+    j = i + 1 + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    keep = np.all((lo[j] <= hi[i]) & (lo[i] <= hi[j]), axis=1)
+
+    pairs = np.sort(np.c_[ids[i[keep]], ids[j[keep]]], axis=1)
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+
+####################################################
+class _EnclosedPointsClassifier:
+    # Vectorized inside/outside test of points against a closed surface.
+    # A ray is cast from each query point along +z and the crossings with the
+    # surface triangles are counted: the point is inside if the number is odd.
+    # The triangles are bucketed once on a regular grid in the xy plane,
+    # so that each point is only tested against the few triangles above it.
+    # Points exactly on an edge or a vertex in the xy projection are counted
+    # consistently with a "top-left" rule, so that they are never counted twice.
+
+    def __init__(self, vertices, triangles, max_pairs=4_000_000):
+        self.max_pairs = max_pairs
+        tri = np.asarray(vertices, dtype=float)[np.asarray(triangles, dtype=int)]
+
+        # make all triangles counter-clockwise in the xy plane, drop the vertical ones
+        e1 = tri[:, 1, :2] - tri[:, 0, :2]
+        e2 = tri[:, 2, :2] - tri[:, 0, :2]
+        area = e1[:, 0] * e2[:, 1] - e1[:, 1] * e2[:, 0]
+        tri = tri[area != 0]
+        cw = area[area != 0] < 0
+        tri[cw] = tri[cw][:, [0, 2, 1]]
+        self.tri = tri
+
+        if len(tri) == 0:
+            self.origin = np.zeros(2)
+            self.cell = np.ones(2)
+            self.shape = (1, 1)
+            self.start = np.zeros(2, dtype=int)
+            self.ids = np.zeros(0, dtype=int)
+            return
+
+        # bucket the triangles on the grid
+        txy = tri[:, :, :2]
+        lo, hi = txy.min(axis=(0, 1)), txy.max(axis=(0, 1))
+        size = np.maximum(hi - lo, 1e-12)
+        ng = np.sqrt(len(tri)) / np.sqrt(size[0] * size[1]) * size
+        shape = np.clip(np.ceil(ng), 1, 1024).astype(int)
+        self.origin, self.cell, self.shape = lo, size / shape, tuple(shape)
+
+        i0 = np.clip(((txy.min(axis=1) - lo) / self.cell).astype(int), 0, shape - 1)
+        i1 = np.clip(((txy.max(axis=1) - lo) / self.cell).astype(int), 0, shape - 1)
+        nx = i1[:, 0] - i0[:, 0] + 1
+        ny = i1[:, 1] - i0[:, 1] + 1
+        counts = nx * ny
+        tids = np.repeat(np.arange(len(tri)), counts)
+        k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        cx = i0[tids, 0] + k % nx[tids]
+        cy = i0[tids, 1] + k // nx[tids]
+        cids = cx * shape[1] + cy
+        order = np.argsort(cids, kind="stable")
+        self.ids = tids[order]
+        ncells = shape[0] * shape[1]
+        self.start = np.r_[0, np.cumsum(np.bincount(cids, minlength=ncells))]
+
+    @staticmethod
+    def _edge(a, b, p):
+        # edge function of p with respect to the oriented edge a->b, positive on the left.
+        # It is computed from the lexicographically ordered endpoints so that
+        # the two triangles sharing an edge get exactly opposite values.
+        swap = (a[:, 0] > b[:, 0]) | ((a[:, 0] == b[:, 0]) & (a[:, 1] > b[:, 1]))
+        u = np.where(swap[:, None], b, a)
+        v = np.where(swap[:, None], a, b)
+        e = (v[:, 0] - u[:, 0]) * (p[:, 1] - u[:, 1]) - (v[:, 1] - u[:, 1]) * (p[:, 0] - u[:, 0])
+        e = np.where(swap, -e, e)
+        # top-left rule: points on the edge belong to the triangle only for
+        # left edges (going down) or top edges (horizontal, going left)
+        d = b - a
+        topleft = (d[:, 1] < 0) | ((d[:, 1] == 0) & (d[:, 0] < 0))
+        return e, (e > 0) | ((e == 0) & topleft)
+
+    def contains(self, pts):
+        pts = np.asarray(pts, dtype=float)
+        inside = np.zeros(len(pts), dtype=bool)
+        if len(self.tri) == 0 or len(pts) == 0:
+            return inside
+
+        cxy = np.floor((pts[:, :2] - self.origin) / self.cell).astype(int)
+        ok = np.all((cxy >= 0) & (cxy < self.shape), axis=1)
+        qids = np.nonzero(ok)[0]
+        cids = cxy[qids, 0] * self.shape[1] + cxy[qids, 1]
+        counts = self.start[cids + 1] - self.start[cids]
+
+        # process the (point, triangle) pairs in chunks of bounded size
+        csum = np.cumsum(counts)
+        bounds = np.searchsorted(csum, np.arange(0, csum[-1] if len(csum) else 0, self.max_pairs), side="right")
+        bounds = np.unique(np.r_[0, bounds, len(qids)])
+        crossings = np.zeros(len(pts), dtype=int)
+        for b0, b1 in zip(bounds[:-1], bounds[1:]):
+            n = counts[b0:b1]
+            q = np.repeat(qids[b0:b1], n)
+            first = np.repeat(self.start[cids[b0:b1]], n)
+            k = np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n)
+            tri = self.tri[self.ids[first + k]]
+            p = pts[q]
+            a, b, c = tri[:, 0], tri[:, 1], tri[:, 2]
+            w0, in0 = self._edge(b[:, :2], c[:, :2], p[:, :2])
+            w1, in1 = self._edge(c[:, :2], a[:, :2], p[:, :2])
+            w2, in2 = self._edge(a[:, :2], b[:, :2], p[:, :2])
+            hit = in0 & in1 & in2
+            z = (w0 * a[:, 2] + w1 * b[:, 2] + w2 * c[:, 2]) / (w0 + w1 + w2)
+            hit &= z > p[:, 2]
+            crossings += np.bincount(q[hit], minlength=len(pts))
+        inside[:] = crossings % 2 == 1
+        return inside
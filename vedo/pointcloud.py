@@ -758,6 +758,10 @@ class Points(BaseActor, vtk.vtkActor):
         BaseActor.__init__(self)
 
         self._data = None
+        self._neighbor_tree = None  # cached search tree used by find_neighbors()
+        self._surface_triangles = None  # cached triangles and vertex-to-triangle table
+        self._transformed_cache = None  # cached output of polydata(transformed=True)
+        self._transformed_cache_stats = {"hits": 0, "misses": 0}
 
         if blur:
             self._mapper = vtk.vtkPointGaussianMapper()
@@ -872,9 +876,6 @@ class Points(BaseActor, vtk.vtkActor):
 
                 pd.GetPoints().SetData(utils.numpy2vtk(plist, dtype=np.float32))
 
-                ucols = vtk.vtkUnsignedCharArray()
-                ucols.SetNumberOfComponents(4)
-                ucols.SetName("Points_RGBA")
                 if utils.is_sequence(alpha):
                     if len(alpha) != n:
                         vedo.logger.error(f"mismatch in Points() alpha array lengths {n} and {len(cols)}")
@@ -882,20 +883,18 @@ class Points(BaseActor, vtk.vtkActor):
                     alphas = alpha
                     alpha = 1
                 else:
-                    alphas = (alpha,) * n
+                    alphas = alpha
 
                 if utils.is_sequence(cols):
                     c = None
-                    if len(cols[0]) == 4:
-                        for i in range(n):  # FAST
-                            rc, gc, bc, ac = cols[i]
-                            ucols.InsertNextTuple4(rc, gc, bc, ac)
+                    if utils.is_sequence(cols[0]) and len(cols[0]) == 4:
+                        rgba = cols  # already RGBA in range [0,255]
                     else:
-                        for i in range(n):  # SLOW
-                            rc, gc, bc = colors.get_color(cols[i])
-                            ucols.InsertNextTuple4(rc * 255, gc * 255, bc * 255, alphas[i] * 255)
+                        rgba = colors.get_colors(cols, alpha=alphas)
                 else:
                     c = cols
+                    rgba = colors.get_colors([cols] * n, alpha=alphas)
+                ucols = utils.numpy2vtk(rgba, dtype=np.uint8, name="Points_RGBA")
 
                 pd.GetPointData().AddArray(ucols)
                 pd.GetPointData().SetActiveScalars("Points_RGBA")
@@ -1034,6 +1033,8 @@ class Points(BaseActor, vtk.vtkActor):
     def _update(self, polydata):
         # Overwrite the polygonal mesh with a new vtkPolyData
         self._data = polydata
+        self.point_locator = None
+        self.cell_locator = None
         self.mapper().SetInputData(polydata)
         self.mapper().Modified()
         return self
@@ -1060,6 +1061,8 @@ class Points(BaseActor, vtk.vtkActor):
         .. note::
             If `transformed=True` return a copy of polydata that corresponds
             to the current mesh position in space.
+            The transformed copy is cached and only recomputed when either
+            the data or the position of the object change (see `polydata_cache_info()`).
         """
         if not self._data:
             self._data = self.mapper().GetInput()
@@ -1074,16 +1077,44 @@ class Points(BaseActor, vtk.vtkActor):
             # otherwise make a copy that corresponds to
             # the actual position in space of the mesh
             M = self.GetMatrix()
-            transform = vtk.vtkTransform()
-            transform.SetMatrix(M)
-            tp = vtk.vtkTransformPolyDataFilter()
-            tp.SetTransform(transform)
-            tp.SetInputData(self._data)
-            tp.Update()
-            return tp.GetOutput()
+            key = (
+                self._data.GetMTime(),
+                tuple(M.GetElement(i, j) for i in range(4) for j in range(4)),
+            )
+            cached = self._transformed_cache
+            if (
+                cached is not None
+                and cached[0] is self._data
+                and cached[1] == key
+                and cached[2].GetMTime() == cached[3]  # the copy was not modified
+            ):
+                self._transformed_cache_stats["hits"] += 1
+                tpoly = cached[2]
+            else:
+                self._transformed_cache_stats["misses"] += 1
+                transform = vtk.vtkTransform()
+                transform.SetMatrix(M)
+                tp = vtk.vtkTransformPolyDataFilter()
+                tp.SetTransform(transform)
+                tp.SetInputData(self._data)
+                tp.Update()
+                tpoly = tp.GetOutput()
+                self._transformed_cache = (self._data, key, tpoly, tpoly.GetMTime())
+
+            # shallow copy so that the caller can freely add or replace arrays
+            poly = vtk.vtkPolyData()
+            poly.ShallowCopy(tpoly)
+            return poly
 
         return self._data
 
+    def polydata_cache_info(self):
+        """
+        Return a dictionary with the number of `hits` and `misses` of the cache
+        which stores the transformed polydata returned by `polydata(transformed=True)`.
+        """
+        return dict(self._transformed_cache_stats)
+
 
     def clone(self, deep=True, transformed=False):
         """
@@ -1488,33 +1519,117 @@ class Points(BaseActor, vtk.vtkActor):
             ```
             ![](https://vedo.embl.es/images/feats/acoplanarity.jpg)
         """
-        acoplanarities = []
-        if "point" in on:
-            pts = self.points()
-        elif "cell" in on:
-            pts = self.cell_centers()
-        else:
-            raise ValueError(f"In compute_acoplanarity() set on to either 'cells' or 'points', not {on}")
+        if n:
+            radius = None
+        return self.compute_local_pca_features(n, radius, features=["acoplanarity"], on=on)
 
-        for p in utils.progressbar(pts, delay=5, width=15, title=f"{on} acoplanarity"):
-            if n:
-                data = self.closest_point(p, n=n)
-                npts = n
-            elif radius:
-                data = self.closest_point(p, radius=radius)
-                npts = len(data)
+    def compute_local_pca_features(
+        self,
+        n=25,
+        radius=None,
+        features=("acoplanarity", "linearity", "planarity", "sphericity", "eigenvalues", "normals"),
+        on="points",
+        orientation_point=None,
+    ):
+        """
+        Compute in a single pass a set of geometric features which describe
+        the shape of the local neighborhood of each point (or cell center),
+        as obtained from the principal component analysis of the neighbor coordinates.
+        The neighborhood search is performed only once for all the requested features.
 
-            try:
-                center = data.mean(axis=0)
-                res = np.linalg.svd(data - center)
-                acoplanarities.append(res[1][2] / npts)
-            except:
-                acoplanarities.append(-1.0)
+        With the eigenvalues `l1 >= l2 >= l3` of the local covariance matrix,
+        the available features are stored in `pointdata` (or `celldata`) arrays named:
+
+        - "Acoplanarity": smallest singular value divided by the number of neighbors
+        (same as `compute_acoplanarity()`)
+        - "Linearity": `(l1-l2)/l1`
+        - "Planarity": `(l2-l3)/l1`
+        - "Sphericity": `l3/l1`
+        - "Eigenvalues": the three eigenvalues in descending order
+        - "Normals": the direction of least variance
+
+        Neighborhoods with less than 3 points get a value of -1 in the scalar features.
+
+        Arguments:
+            n : (int)
+                number of neighbor points
+            radius : (float)
+                radius of the local search. If given then `n` is ignored.
+            features : (list)
+                list of feature names to compute
+            on : (str)
+                either "points" or "cells"
+            orientation_point : (list)
+                orient the normals to point towards this point.
+                If None, the sign of the normals is arbitrary.
+
+        Example:
+            ```python
+            from vedo import *
+            msh = Mesh(dataurl+"bunny.obj").subdivide()
+            msh.compute_local_pca_features(n=20, features=["planarity", "normals"])
+            msh.cmap("viridis", "Planarity").add_scalarbar()
+            msh.show(axes=1).close()
+            ```
+        """
+        features = [f.lower() for f in features]
+        for f in features:
+            if f not in (
+                "acoplanarity", "linearity", "planarity", "sphericity", "eigenvalues", "normals"
+            ):
+                raise ValueError(f"In compute_local_pca_features() unknown feature {f}")
 
         if "point" in on:
-            self.pointdata["Acoplanarity"] = np.array(acoplanarities, dtype=float)
+            pts = self.points()
+            data = self.inputdata().GetPointData()
+            helper = self.pointdata
+        elif "cell" in on:
+            pts = self.cell_centers()
+            data = self.inputdata().GetCellData()
+            helper = self.celldata
         else:
-            self.celldata["Acoplanarity"] = np.array(acoplanarities, dtype=float)
+            raise ValueError(
+                f"In compute_local_pca_features() set on to either 'cells' or 'points', not {on}"
+            )
+        if radius:
+            n = None
+
+        npq = len(pts)
+        counts = np.zeros(npq, dtype=int)
+        evals = np.zeros((npq, 3))
+        normals = np.zeros((npq, 3))
+        for sl, cnts, _, ev, evec in self._local_pca(pts, n=n, radius=radius):
+            counts[sl] = cnts
+            evals[sl] = ev[:, ::-1]  # descending order
+            normals[sl] = evec[:, :, 0]
+
+        valid = counts >= 3
+        with np.errstate(invalid="ignore", divide="ignore"):
+            covs = evals / counts[:, None]
+            l1 = np.where(covs[:, 0] > 0, covs[:, 0], 1.0)
+
+        for f in features:
+            if f == "acoplanarity":
+                npts = np.full(npq, n) if n else counts
+                arr = np.where(valid, np.sqrt(evals[:, 2]) / np.maximum(npts, 1), -1.0)
+                helper["Acoplanarity"] = arr
+            elif f == "linearity":
+                helper["Linearity"] = np.where(valid, (covs[:, 0] - covs[:, 1]) / l1, -1.0)
+            elif f == "planarity":
+                helper["Planarity"] = np.where(valid, (covs[:, 1] - covs[:, 2]) / l1, -1.0)
+            elif f == "sphericity":
+                helper["Sphericity"] = np.where(valid, covs[:, 2] / l1, -1.0)
+            elif f == "eigenvalues":
+                varr = utils.numpy2vtk(np.where(valid[:, None], covs, 0.0), name="Eigenvalues")
+                data.AddArray(varr)
+            elif f == "normals":
+                if orientation_point is not None:
+                    towards = np.asarray(orientation_point, dtype=float) - pts
+                    flip = np.einsum("ij,ij->i", normals, towards) < 0
+                    normals[flip] *= -1
+                normals[~valid] = 0.0
+                helper["Normals"] = normals
+        data.Modified()
         return self
 
     def distance_to(self, pcloud, signed=False, invert=False, name="Distance"):
@@ -1847,7 +1962,8 @@ class Points(BaseActor, vtk.vtkActor):
     ):
         """
         Generate value or ID labels for mesh cells or points.
-        For large nr. of labels use `font="VTK"` which is much faster.
+        All the labels are placed at once and merged into a single mesh,
+        use `font="VTK"` to get a lighter mesh with fewer points.
 
         See also:
             `labels2d()`, `flagpole()`, `caption()` and `legend()`.
@@ -1941,79 +2057,87 @@ class Points(BaseActor, vtk.vtkActor):
             vedo.logger.error("in labels(), array not found for points or cells")
             return None
 
-        tapp = vtk.vtkAppendPolyData()
-        ninputs = 0
-
-        for i, e in enumerate(elems):
-            if i % ratio:
-                continue
-
-            if mode == 1:
-                txt_lab = str(i)
-            else:
-                if precision:
-                    txt_lab = utils.precision(arr[i], precision)
-                else:
-                    txt_lab = str(arr[i])
-
-            if not txt_lab:
-                continue
+        idx = np.arange(0, len(elems), ratio)
+        if mode == 1:
+            txts = [str(i) for i in idx]
+        elif precision:
+            txts = [utils.precision(arr[i], precision) for i in idx]
+        else:
+            txts = [str(arr[i]) for i in idx]
 
-            if font == "VTK":
+        # generate the geometry of all the labels at once,
+        # the points of label k are pts[offsets[k]:offsets[k+1]]
+        if font == "VTK":
+            pts_list, faces_list, npts = [], [], 0
+            for txt_lab in txts:
                 tx = vtk.vtkVectorText()
                 tx.SetText(txt_lab)
                 tx.Update()
                 tx_poly = tx.GetOutput()
-            else:
-                tx_poly = vedo.shapes.Text3D(txt_lab, font=font, justify=justify)
-                tx_poly = tx_poly.inputdata()
-
-            if tx_poly.GetNumberOfPoints() == 0:
-                continue  #######################
-            ninputs += 1
-
+                if not txt_lab or tx_poly.GetNumberOfPoints() == 0:
+                    pts_list.append(np.zeros([0, 3]))
+                    continue
+                pts_list.append(utils.vtk2numpy(tx_poly.GetPoints().GetData()))
+                faces_list.append(utils.cell_connectivity(tx_poly.GetPolys(), "dense") + npts)
+                npts += tx_poly.GetNumberOfPoints()
+            offsets = np.r_[0, np.cumsum([len(p) for p in pts_list])]
+            pts = np.concatenate(pts_list).astype(float)
+            faces = np.concatenate(faces_list) if faces_list else np.zeros([0, 3], dtype=int)
+        else:
+            pts, faces, offsets = vedo.shapes._text3d_arrays(txts, font=font, justify=justify)
+
+        counts = np.diff(offsets)
+        lab = np.repeat(np.arange(len(txts)), counts)  # label index of each point
+        elems = np.asarray(elems)[idx]
+
+        half = None
+        if hasnorms and cells and len(pts):  # center-justify
+            nonempty = counts > 0
+            bmin = np.minimum.reduceat(pts, offsets[:-1][nonempty])
+            bmax = np.maximum.reduceat(pts, offsets[:-1][nonempty])
+            half = np.zeros([len(txts), 3])
+            half[nonempty, :2] = (bmax - bmin)[:, :2] / 2
+
+        if italic:
+            pts[:, 0] += 0.2 * pts[:, 1]
+        if half is not None:
+            pts -= half[lab]
+
+        if xrot or yrot or zrot:
             T = vtk.vtkTransform()
             T.PostMultiply()
-            if italic:
-                T.Concatenate([1,0.2,0,0,
-                               0,1,0,0,
-                               0,0,1,0,
-                               0,0,0,1])
-            if hasnorms:
-                ni = norms[i]
-                if cells:  # center-justify
-                    bb = tx_poly.GetBounds()
-                    dx, dy = (bb[1] - bb[0]) / 2, (bb[3] - bb[2]) / 2
-                    T.Translate(-dx, -dy, 0)
-                if xrot:
-                    T.RotateX(xrot)
-                if yrot:
-                    T.RotateY(yrot)
-                if zrot:
-                    T.RotateZ(zrot)
-                crossvec = np.cross([0, 0, 1], ni)
-                angle = np.arccos(np.dot([0, 0, 1], ni)) * 57.3
-                T.RotateWXYZ(angle, crossvec)
-                if cells:  # small offset along normal only for cells
-                    T.Translate(ni * scale / 2)
-            else:
-                if xrot:
-                    T.RotateX(xrot)
-                if yrot:
-                    T.RotateY(yrot)
-                if zrot:
-                    T.RotateZ(zrot)
-            T.Scale(scale, scale, scale)
-            T.Translate(e)
-            tf = vtk.vtkTransformPolyDataFilter()
-            tf.SetInputData(tx_poly)
-            tf.SetTransform(T)
-            tf.Update()
-            tapp.AddInputData(tf.GetOutput())
+            T.RotateX(xrot)
+            T.RotateY(yrot)
+            T.RotateZ(zrot)
+            pts = pts @ utils.vtk2numpy(T.GetMatrix())[:3, :3].T
+
+        if hasnorms:
+            # rotate each label from the z axis to the normal direction
+            ns = np.asarray(norms, dtype=float)[idx]
+            axes = np.cross([0, 0, 1], ns)
+            angles = np.deg2rad(np.arccos(np.clip(ns[:, 2], -1, 1)) * 57.3)
+            amag = np.linalg.norm(axes, axis=1)
+            valid = amag > 0
+            axes[valid] /= amag[valid, None]
+            angles[~valid] = 0
+            ca, sa = np.cos(angles), np.sin(angles)
+            kx, ky, kz = axes.T
+            K = np.zeros([len(ns), 3, 3])
+            K[:, 0, 1], K[:, 0, 2], K[:, 1, 2] = -kz, ky, -kx
+            K[:, 1, 0], K[:, 2, 0], K[:, 2, 1] = kz, -ky, kx
+            R = (
+                ca[:, None, None] * np.eye(3)
+                + sa[:, None, None] * K
+                + (1 - ca)[:, None, None] * np.einsum("ni,nj->nij", axes, axes)
+            )
+            pts = np.einsum("nij,nj->ni", R[lab], pts)
+            if cells:  # small offset along normal only for cells
+                pts += ns[lab] * scale / 2
 
-        if ninputs:
-            tapp.Update()
-            lpoly = tapp.GetOutput()
+        pts = pts * scale + elems[lab]
+
+        if len(pts):
+            lpoly = utils.buildPolyData(pts, faces)
         else:  # return an empty obj
             lpoly = vtk.vtkPolyData()
 
@@ -2499,6 +2623,7 @@ class Points(BaseActor, vtk.vtkActor):
         The core of the algorithm is to match each vertex in one surface with
         the closest surface point on the other, then apply the transformation
         that modify one surface to best match the other (in the least-square sense).
+        See `vedo.registration` to align many objects to the same target at once.
 
         Arguments:
             rigid : (bool)
@@ -2899,7 +3024,12 @@ class Points(BaseActor, vtk.vtkActor):
             if npts != n:
                 vedo.logger.error(f"in cmap(), nr. of input {on} scalars {npts} != {n} ...skip coloring.")
                 return self
-            arr = utils.numpy2vtk(input_array, name=name, dtype=float)
+            input_array = np.asarray(input_array)
+            if input_array.dtype.kind not in "iu" and input_array.dtype not in (np.float32, np.float64):
+                input_array = input_array.astype(float)  # e.g. bool or float16
+            # keep the native type, the data are copied so that the mesh
+            # does not depend on the lifetime and later edits of input_array
+            arr = utils.numpy2vtk(input_array, name=name)
             data.AddArray(arr)
             data.Modified()
 
@@ -2928,42 +3058,33 @@ class Points(BaseActor, vtk.vtkActor):
             if vmax is None:
                 vmax = vn.max()
 
-        # interpolate alphas if they are not constant
-        if not utils.is_sequence(alpha):
-            alpha = [alpha] * n_colors
-        else:
-            v = np.linspace(0, 1, n_colors, endpoint=True)
-            xp = np.linspace(0, 1, len(alpha), endpoint=True)
-            alpha = np.interp(v, xp, alpha)
-
         ########################### build the look-up table
         if isinstance(input_cmap, vtk.vtkLookupTable):  # vtkLookupTable
             lut = input_cmap
 
-        elif utils.is_sequence(input_cmap):  # manual sequence of colors
-            lut = vtk.vtkLookupTable()
-            if logscale:
-                lut.SetScaleToLog10()
-            lut.SetRange(vmin, vmax)
-            ncols = len(input_cmap)
-            lut.SetNumberOfTableValues(ncols)
+        else:
+            # manual sequence of colors OR string cmap name
+            # OR matplotlib.colors.LinearSegmentedColormap
+            if utils.is_sequence(input_cmap):
+                ncols = len(input_cmap)
+            else:
+                ncols = n_colors
 
-            for i, c in enumerate(input_cmap):
-                r, g, b = colors.get_color(c)
-                lut.SetTableValue(i, r, g, b, alpha[i])
-            lut.Build()
+            # interpolate alphas if they are not constant
+            if utils.is_sequence(alpha):
+                v = np.linspace(0, 1, ncols, endpoint=True)
+                xp = np.linspace(0, 1, len(alpha), endpoint=True)
+                alpha = tuple(np.interp(v, xp, alpha))
+
+            table = colors._lut_table(input_cmap, ncols, alpha)
 
-        else:  # assume string cmap name OR matplotlib.colors.LinearSegmentedColormap
             lut = vtk.vtkLookupTable()
             if logscale:
                 lut.SetScaleToLog10()
-            lut.SetVectorModeToMagnitude()
+            if not utils.is_sequence(input_cmap):
+                lut.SetVectorModeToMagnitude()
             lut.SetRange(vmin, vmax)
-            lut.SetNumberOfTableValues(n_colors)
-            mycols = colors.color_map(range(n_colors), input_cmap, 0, n_colors)
-            for i, c in enumerate(mycols):
-                r, g, b = c
-                lut.SetTableValue(i, r, g, b, alpha[i])
+            lut.SetTable(utils.numpy2vtk(table, dtype=np.uint8))
             lut.Build()
 
         arr.SetLookupTable(lut)
@@ -3002,6 +3123,7 @@ class Points(BaseActor, vtk.vtkActor):
         Colorize each cell (face) of a mesh by passing
         a 1-to-1 list of colors in format [R,G,B] or [R,G,B,A].
         Colors levels and opacities must be in the range [0,255].
+        A list of color names (or of any format accepted by `get_color()`) is also accepted.
 
         A single constant color can also be passed as string or RGBA.
 
@@ -3038,9 +3160,15 @@ class Points(BaseActor, vtk.vtkActor):
             value = np.array([*c, 1]) * 255
             value = np.round(value)
 
-        value = np.asarray(value)
+        try:
+            value = np.asarray(value)
+        except ValueError:  # e.g. a mix of color names and tuples
+            value = np.asarray(value, dtype=object)
         n = self.ncells
 
+        if value.dtype.kind in "USO":  # e.g. a list of color names
+            value = colors.get_colors(value, alpha=1)
+
         if value.ndim == 1:
             value = np.repeat([value], n, axis=0)
 
@@ -3060,6 +3188,7 @@ class Points(BaseActor, vtk.vtkActor):
         Colorize each point (or vertex of a mesh) by passing
         a 1-to-1 list of colors in format [R,G,B] or [R,G,B,A].
         Colors levels and opacities must be in the range [0,255].
+        A list of color names (or of any format accepted by `get_color()`) is also accepted.
 
         A single constant color can also be passed as string or RGBA.
 
@@ -3090,9 +3219,15 @@ class Points(BaseActor, vtk.vtkActor):
             value = np.array([*c, 1]) * 255
             value = np.round(value)
 
-        value = np.asarray(value)
+        try:
+            value = np.asarray(value)
+        except ValueError:  # e.g. a mix of color names and tuples
+            value = np.asarray(value, dtype=object)
         n = self.npoints
 
+        if value.dtype.kind in "USO":  # e.g. a list of color names
+            value = colors.get_colors(value, alpha=1)
+
         if value.ndim == 1:
             value = np.repeat([value], n, axis=0)
 
@@ -3305,48 +3440,238 @@ class Points(BaseActor, vtk.vtkActor):
 
             if not poly:
                 poly = self.polydata()
-            trgp = []
-            for i in range(vtklist.GetNumberOfIds()):
-                trgp_ = [0, 0, 0]
-                vi = vtklist.GetId(i)
-                poly.GetPoints().GetPoint(vi, trgp_)
-                trgp.append(trgp_)
+            ids = utils.vtk2numpy(vtklist).astype(int)
             ########
-            return np.array(trgp)
+            return utils.vtk2numpy(poly.GetPoints().GetData())[ids].astype(float)
             ########
 
         else:
 
-            if not self.cell_locator:
-                poly = self.polydata()
-
-                # As per Miquel example with limbs the vtkStaticCellLocator doesnt work !!
-                # https://discourse.vtk.org/t/vtkstaticcelllocator-problem-vtk9-0-3/7854/4
-                if vedo.vtk_version[0] >= 9 and vedo.vtk_version[0] > 0:
-                    self.cell_locator = vtk.vtkStaticCellLocator()
-                else:
-                    self.cell_locator = vtk.vtkCellLocator()
-
-                self.cell_locator.SetDataSet(poly)
-                self.cell_locator.BuildLocator()
-
             trgp = [0, 0, 0]
             cid = vtk.mutable(0)
             dist2 = vtk.mutable(0)
             subid = vtk.mutable(0)
-            self.cell_locator.FindClosestPoint(pt, trgp, cid, subid, dist2)
+            self._get_cell_locator().FindClosestPoint(pt, trgp, cid, subid, dist2)
 
             if return_cell_id:
                 return int(cid)
 
             return np.array(trgp)
 
+    def _get_neighbor_tree(self):
+        # Return the search tree used by find_neighbors() together with the
+        # point coordinates it was built on. The tree is rebuilt only if the
+        # polydata, its modification time or the object position have changed.
+        # A scipy.spatial.cKDTree is used when available, otherwise
+        # the vtkStaticPointLocator of closest_point() is reused.
+        data = self.inputdata()
+        M = self.GetMatrix()
+        key = (data, data.GetMTime(), tuple(M.GetElement(i, j) for i in range(4) for j in range(4)))
+        cached = self._neighbor_tree
+        if cached is not None and cached[0][0] is key[0] and cached[0][1:] == key[1:]:
+            return cached[1], cached[2]
+
+        poly = self.polydata()
+        coords = utils.vtk2numpy(poly.GetPoints().GetData()).astype(float)
+        try:
+            from scipy.spatial import cKDTree
+            tree = cKDTree(coords)
+        except ImportError:
+            if not self.point_locator:
+                self.point_locator = vtk.vtkStaticPointLocator()
+                self.point_locator.SetDataSet(poly)
+                self.point_locator.BuildLocator()
+            tree = self.point_locator
+        self._neighbor_tree = (key, tree, coords)
+        return tree, coords
+
+    def _get_cell_locator(self):
+        # Return the cell locator used by closest_point() and by the point-to-cell
+        # distances, built on the cells in world coordinates. It is reset to None
+        # together with point_locator when the object is moved or its data change.
+        if not self.cell_locator:
+            # As per Miquel example with limbs the vtkStaticCellLocator doesnt work !!
+            # https://discourse.vtk.org/t/vtkstaticcelllocator-problem-vtk9-0-3/7854/4
+            if vedo.vtk_version[0] >= 9 and vedo.vtk_version[0] > 0:
+                self.cell_locator = vtk.vtkStaticCellLocator()
+            else:
+                self.cell_locator = vtk.vtkCellLocator()
+            self.cell_locator.SetDataSet(self.polydata())
+            self.cell_locator.BuildLocator()
+        return self.cell_locator
+
+    def _get_surface_triangles(self):
+        # Return the triangles of this object in world coordinates as an array (M, 3, 3)
+        # and the ids of the triangles around each vertex as a tuple (offsets, ids):
+        # the triangles around vertex i are ids[offsets[i]:offsets[i+1]].
+        # Return (None, None) if it has no faces. Cached as in _get_neighbor_tree().
+        data = self.inputdata()
+        M = self.GetMatrix()
+        key = (data, data.GetMTime(), tuple(M.GetElement(i, j) for i in range(4) for j in range(4)))
+        cached = self._surface_triangles
+        if cached is not None and cached[0][0] is key[0] and cached[0][1:] == key[1:]:
+            return cached[1]
+
+        poly = self.polydata()
+        if not poly.GetNumberOfPolys() and not poly.GetNumberOfStrips():
+            self._surface_triangles = (key, (None, None))
+            return None, None
+        tf = vtk.vtkTriangleFilter()
+        tf.SetInputData(poly)
+        tf.PassLinesOff()
+        tf.PassVertsOff()
+        tf.Update()
+        tpoly = tf.GetOutput()
+        faces = utils.vtk2numpy(tpoly.GetPolys().GetConnectivityArray()).reshape(-1, 3)
+        faces = faces.astype(int)
+        tris = utils.vtk2numpy(tpoly.GetPoints().GetData())[faces]
+
+        vids = faces.ravel()
+        order = np.argsort(vids, kind="stable")
+        vids, fids = vids[order], order // 3
+        counts = np.bincount(vids, minlength=poly.GetNumberOfPoints())
+        incident = (np.r_[0, np.cumsum(counts)], fids)
+        self._surface_triangles = (key, (tris, incident))
+        return tris, incident
+
+    def find_neighbors(self, pts, n=1, radius=None):
+        """
+        Find the closest points of this object to a whole set of query points at once.
+        The search tree is built only once and cached for the following calls.
+
+        With `n` neighbors the output is a tuple of two arrays of shape `(N, n)`:
+        the point ids ordered by distance, and the corresponding distances.
+        If the object has fewer than `n` points, ids are padded with -1 and distances with `inf`.
+
+        With a `radius` the output is given in compressed sparse row format as
+        a tuple `(offsets, ids, dists)`, where the neighbors of the i-th query point
+        are `ids[offsets[i]:offsets[i+1]]` (ordered by distance).
+
+        Arguments:
+            pts : (list, np.ndarray)
+                query points of shape (N, 3) or (N, 2)
+            n : (int)
+                number of closest points to search for each query point
+            radius : (float)
+                if given, get all points within that radius. Then n is ignored.
+
+        Example:
+            ```python
+            from vedo import *
+            s = Sphere()
+            ids, dists = s.find_neighbors(s.points(), n=5)
+            offsets, ids, dists = s.find_neighbors([[0,0,1], [1,0,0]], radius=0.2)
+            print(ids[offsets[0]:offsets[1]])
+            ```
+
+        .. note::
+            Uses `scipy.spatial.cKDTree` if `scipy` is installed,
+            otherwise it falls back to a (slower) loop over `vtkStaticPointLocator` queries.
+        """
+        pts = utils.make3d(np.asarray(pts, dtype=float))
+        if pts.ndim == 1:
+            pts = pts.reshape(1, 3)
+        npq = len(pts)
+        tree, coords = self._get_neighbor_tree()
+        npts = len(coords)
+
+        if radius:
+            if isinstance(tree, vtk.vtkAbstractPointLocator):
+                vtklist = vtk.vtkIdList()
+                lists = []
+                for p in pts:
+                    tree.FindPointsWithinRadius(radius, p, vtklist)
+                    lists.append(utils.vtk2numpy(vtklist).astype(int))
+            else:
+                lists = tree.query_ball_point(pts, radius, workers=-1)
+            lengths = np.array([len(l) for l in lists], dtype=int)
+            offsets = np.zeros(npq + 1, dtype=int)
+            np.cumsum(lengths, out=offsets[1:])
+            if offsets[-1]:
+                ids = np.concatenate([np.asarray(l, dtype=int) for l in lists])
+            else:
+                ids = np.array([], dtype=int)
+            rows = np.repeat(np.arange(npq), lengths)
+            dists = np.linalg.norm(coords[ids] - pts[rows], axis=1)
+            order = np.lexsort((dists, rows))  # sort by distance within each row
+            return offsets, ids[order], dists[order]
+
+        n = int(n)
+        if isinstance(tree, vtk.vtkAbstractPointLocator):
+            ids = np.full((npq, n), -1, dtype=int)
+            vtklist = vtk.vtkIdList()
+            for i, p in enumerate(pts):
+                tree.FindClosestNPoints(n, p, vtklist)
+                found = utils.vtk2numpy(vtklist).astype(int)
+                ids[i, : len(found)] = found
+            valid = ids >= 0
+            dists = np.full((npq, n), np.inf)
+            dists[valid] = np.linalg.norm(
+                coords[ids[valid]] - np.repeat(pts, valid.sum(axis=1), axis=0), axis=1
+            )
+        else:
+            dists, ids = tree.query(pts, k=n, workers=-1)
+            dists = dists.reshape(npq, n)
+            ids = ids.reshape(npq, n).astype(int)
+            ids[ids >= npts] = -1
+        return ids, dists
+
+    def _local_pca(self, pts, n=None, radius=None, chunk_size=None):
+        # Generator over chunks of the query points `pts` yielding the tuple
+        # (slice, counts, centers, eigenvalues, eigenvectors) for the neighborhood
+        # of each query point (either its `n` closest points or the points within `radius`).
+        # Eigenvalues of the scatter matrix are in ascending order and
+        # eigenvectors are stored as columns, as returned by np.linalg.eigh().
+        pts = np.asarray(pts, dtype=float)
+        npq = len(pts)
+        _, coords = self._get_neighbor_tree()
+        if not chunk_size:
+            # keep the gathered neighborhoods within a few million points per chunk
+            chunk_size = 50000 if radius else max(1, int(4e6 // max(int(n), 1)))
+
+        for start in range(0, npq, chunk_size):
+            sl = slice(start, min(start + chunk_size, npq))
+            nq = sl.stop - sl.start
+            if radius:
+                offsets, ids, _ = self.find_neighbors(pts[sl], radius=radius)
+                rows = np.repeat(np.arange(nq), np.diff(offsets))
+            else:
+                ids, _ = self.find_neighbors(pts[sl], n=n)
+                rows = np.repeat(np.arange(nq), ids.shape[1])
+                ids = ids.ravel()
+                rows = rows[ids >= 0]
+                ids = ids[ids >= 0]
+
+            counts = np.bincount(rows, minlength=nq)
+            nbrs = coords[ids]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                centers = np.c_[
+                    np.bincount(rows, weights=nbrs[:, 0], minlength=nq),
+                    np.bincount(rows, weights=nbrs[:, 1], minlength=nq),
+                    np.bincount(rows, weights=nbrs[:, 2], minlength=nq),
+                ] / counts[:, None]
+            centers[counts == 0] = 0
+            d = nbrs - centers[rows]
+
+            scatter = np.empty((nq, 3, 3))
+            for a in range(3):
+                for b in range(a, 3):
+                    s = np.bincount(rows, weights=d[:, a] * d[:, b], minlength=nq)
+                    scatter[:, a, b] = s
+                    scatter[:, b, a] = s
+            evals, evecs = np.linalg.eigh(scatter)
+            evals = np.clip(evals, 0, None)
+            yield sl, counts, centers, evals, evecs
+
 
     def hausdorff_distance(self, points):
         """
         Compute the Hausdorff distance to the input point set.
         Returns a single `float`.
 
+        The distances are measured from the points of each object to the
+        cells of the other one. See `vedo.distances` for other metrics.
+
         Example:
             ```python
             from vedo import *
@@ -3366,44 +3691,17 @@ class Points(BaseActor, vtk.vtkActor):
             ```
             ![](https://vedo.embl.es/images/feats/heart.png)
         """
-        hp = vtk.vtkHausdorffDistancePointSetFilter()
-        hp.SetInputData(0, self.polydata())
-        hp.SetInputData(1, points.polydata())
-        hp.SetTargetDistanceMethodToPointToCell()
-        hp.Update()
-        return hp.GetHausdorffDistance()
+        return vedo.distances.point_set_distance(self, points, metric="hausdorff", cells=True)
 
     def chamfer_distance(self, pcloud):
         """
         Compute the Chamfer distance to the input point set.
         Returns a single `float`.
-        """
-        if not pcloud.point_locator:
-            pcloud.point_locator = vtk.vtkPointLocator()
-            pcloud.point_locator.SetDataSet(pcloud.polydata())
-            pcloud.point_locator.BuildLocator()
-        if not self.point_locator:
-            self.point_locator = vtk.vtkPointLocator()
-            self.point_locator.SetDataSet(self.polydata())
-            self.point_locator.BuildLocator()
-
-        ps1 = self.points()
-        ps2 = pcloud.points()
 
-        ids12 = []
-        for p in ps1:
-            pid12 = pcloud.point_locator.FindClosestPoint(p)
-            ids12.append(pid12)
-        deltav = ps2[ids12] - ps1
-        da = np.mean(np.linalg.norm(deltav, axis=1))
-
-        ids21 = []
-        for p in ps2:
-            pid21 = self.point_locator.FindClosestPoint(p)
-            ids21.append(pid21)
-        deltav = ps1[ids21] - ps2
-        db = np.mean(np.linalg.norm(deltav, axis=1))
-        return (da + db) / 2
+        This is the average of the mean distances from each point of one set
+        to the closest point of the other. See `vedo.distances` for other metrics.
+        """
+        return vedo.distances.point_set_distance(self, pcloud, metric="chamfer")
 
     def remove_outliers(self, radius, neighbors=5):
         """
@@ -3468,24 +3766,23 @@ class Points(BaseActor, vtk.vtkActor):
                 vedo.logger.warning(f"Please choose a fraction higher than {f}")
                 Ncp = 5
 
-        variances, newline = [], []
-        for p in coords:
-            points = self.closest_point(p, n=Ncp, radius=radius)
-            if len(points) < 4:
-                continue
-
-            points = np.array(points)
-            pointsmean = points.mean(axis=0)  # plane center
-            _, dd, vv = np.linalg.svd(points - pointsmean)
-            newp = np.dot(p - pointsmean, vv[0]) * vv[0] + pointsmean
-            variances.append(dd[1] + dd[2])
-            newline.append(newp)
-
-        vdata = utils.numpy2vtk(np.array(variances))
+        variances = np.zeros(ncoords)
+        newline = np.zeros((ncoords, 3))
+        valid = np.zeros(ncoords, dtype=bool)
+        for sl, counts, centers, evals, evecs in self._local_pca(coords, n=Ncp, radius=radius):
+            # project each point onto the local principal direction
+            v = evecs[:, :, 2]
+            proj = np.einsum("ij,ij->i", coords[sl] - centers, v)
+            newline[sl] = proj[:, None] * v + centers
+            sv = np.sqrt(evals)  # singular values of the centered neighborhood
+            variances[sl] = sv[:, 1] + sv[:, 0]
+            valid[sl] = counts >= 4
+
+        vdata = utils.numpy2vtk(variances[valid])
         vdata.SetName("Variances")
         self.inputdata().GetPointData().AddArray(vdata)
         self.inputdata().GetPointData().Modified()
-        self.points(newline)
+        self.points(newline[valid])
         self.pipeline = utils.OperationNode("smooth_mls_1d", parents=[self])
         return self
 
@@ -3519,32 +3816,20 @@ class Points(BaseActor, vtk.vtkActor):
                 vedo.logger.error(f"MLS2D: Please choose a fraction higher than {f}")
                 Ncp = 4
 
-        variances, newpts, valid = [], [], []
-        pb = None
-        if ncoords > 10000:
-            pb = utils.ProgressBar(0, ncoords)
-        for p in coords:
-            if pb:
-                pb.print("smoothMLS2D working ...")
-            pts = self.closest_point(p, n=Ncp, radius=radius)
-            if len(pts) > 3:
-                ptsmean = pts.mean(axis=0)  # plane center
-                _, dd, vv = np.linalg.svd(pts - ptsmean)
-                cv = np.cross(vv[0], vv[1])
-                t = (np.dot(cv, ptsmean) - np.dot(cv, p)) / np.dot(cv, cv)
-                newp = p + cv * t
-                newpts.append(newp)
-                variances.append(dd[2])
-                if radius:
-                    valid.append(True)
-            else:
-                newpts.append(p)
-                variances.append(0)
-                if radius:
-                    valid.append(False)
-
-        self.info["variances"] = np.array(variances)
-        self.info["is_valid"] = np.array(valid)
+        variances = np.zeros(ncoords)
+        newpts = np.array(coords, dtype=float)
+        valid = np.zeros(ncoords, dtype=bool)
+        for sl, counts, centers, evals, evecs in self._local_pca(coords, n=Ncp, radius=radius):
+            # project each point onto the local best fitting plane
+            ok = counts > 3
+            cv = evecs[:, :, 0]
+            t = np.einsum("ij,ij->i", centers - coords[sl], cv)
+            newpts[sl][ok] += cv[ok] * t[ok, None]
+            variances[sl] = np.where(ok, np.sqrt(evals[:, 0]), 0)
+            valid[sl] = ok
+
+        self.info["variances"] = variances
+        self.info["is_valid"] = valid if radius else np.array([])
         self.points(newpts)
 
         self.pipeline = utils.OperationNode("smooth_mls_2d", parents=[self])
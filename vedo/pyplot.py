@@ -3061,21 +3061,20 @@ def _histogram_quad_bin(x, y, **kwargs):
     newpts = np.vstack([pts1, pts2])
     newzvals = np.hstack([zvals, zvals]) / s
 
+    # bottom, top and the 4 side faces of each bar
     n = pts1.shape[0]
-    newfaces = []
-    for f in faces:
-        f0, f1, f2, f3 = f
-        f0n, f1n, f2n, f3n = f + n
-        newfaces.extend(
-            [
-                [f0, f1, f2, f3],
-                [f0n, f1n, f2n, f3n],
-                [f0, f1, f1n, f0n],
-                [f1, f2, f2n, f1n],
-                [f2, f3, f3n, f2n],
-                [f3, f0, f0n, f3n],
-            ]
-        )
+    f0, f1, f2, f3 = faces.T
+    f0n, f1n, f2n, f3n = faces.T + n
+    newfaces = np.array(
+        [
+            [f0, f1, f2, f3],
+            [f0n, f1n, f2n, f3n],
+            [f0, f1, f1n, f0n],
+            [f1, f2, f2n, f1n],
+            [f2, f3, f3n, f2n],
+            [f3, f0, f0n, f3n],
+        ]
+    ).transpose(2, 0, 1).reshape(-1, 4)
 
     msh = Mesh([newpts, newfaces]).pickable(False)
     msh.cmap(cmap, newzvals, name="Frequency")
@@ -3090,6 +3089,8 @@ def _histogram_quad_bin(x, y, **kwargs):
 def _histogram_hex_bin(
     xvalues, yvalues, bins=12, norm=1, fill=True, c=None, cmap="terrain_r", alpha=1
 ):
+    xvalues = np.asarray(xvalues)
+    yvalues = np.asarray(yvalues)
     xmin, xmax = np.min(xvalues), np.max(xvalues)
     ymin, ymax = np.min(yvalues), np.max(yvalues)
     dx, dy = xmax - xmin, ymax - ymin
@@ -3104,67 +3105,81 @@ def _histogram_hex_bin(
             m = bins
             n = np.rint(dx / dy * m * 1.2 + 0.5).astype(int)
 
-    src = vtk.vtkPointSource()
-    src.SetNumberOfPoints(len(xvalues))
-    src.Update()
-    poly = src.GetOutput()
-
-    values = np.stack((xvalues, yvalues), axis=1)
-    zs = [[0.0]] * len(values)
-    values = np.append(values, zs, axis=1)
-
-    poly.GetPoints().SetData(utils.numpy2vtk(values, dtype=np.float32))
-    cloud = Mesh(poly)
-
-    col = None
-    if c is not None:
-        col = colors.get_color(c)
-
-    hexs, binmax = [], 0
+    ############################################# count the entries
+    # hexagon (i,j) is centered at (i/ki, j/kj) in grid units (odd columns are
+    # shifted by 0.45) and counts the entries within a radius r of its center.
     ki, kj = 1.33, 1.12
     r = 0.47 / n * 1.2 * dx
-    for i in range(n + 3):
-        for j in range(m + 2):
-            cyl = vtk.vtkCylinderSource()
-            cyl.SetResolution(6)
-            cyl.CappingOn()
-            cyl.SetRadius(0.5)
-            cyl.SetHeight(0.1)
-            cyl.Update()
-            t = vtk.vtkTransform()
-            if not i % 2:
-                p = (i / ki, j / kj, 0)
-            else:
-                p = (i / ki, j / kj + 0.45, 0)
-            q = (p[0] / n * 1.2 * dx + xmin, p[1] / m * dy + ymin, 0)
-            ids = cloud.closest_point(q, radius=r, return_cell_id=True)
-            ne = len(ids)
-            if fill:
-                t.Translate(p[0], p[1], ne / 2)
-                t.Scale(1, 1, ne * 10)
-            else:
-                t.Translate(p[0], p[1], ne)
-            t.RotateX(90)  # put it along Z
-            tf = vtk.vtkTransformPolyDataFilter()
-            tf.SetInputData(cyl.GetOutput())
-            tf.SetTransform(t)
-            tf.Update()
-            if c is None:
-                col = i
-            h = Mesh(tf.GetOutput(), c=col, alpha=alpha).flat()
-            h.lighting("plastic")
-            h.PickableOff()
-            hexs.append(h)
-            if ne > binmax:
-                binmax = ne
-
+    ni, nj = n + 3, m + 2
+    nhex = ni * nj
+    sx = 1 / ki / n * 1.2 * dx  # spacing of the centers in data units
+    sy = 1 / kj / m * dy
+    # same precision as the point cloud used for the search
+    xv = xvalues.astype(np.float32).astype(float)
+    yv = yvalues.astype(np.float32).astype(float)
+
+    counts = np.zeros(nhex, dtype=int)
+    ilow = np.floor((xv - xmin - r) / sx).astype(int)
+    for di in range(int(np.ceil(2 * r / sx)) + 1):
+        i = ilow + di
+        inside_i = (i >= 0) & (i < ni)
+        shift = np.where(i % 2, 0.45, 0)
+        qx = i / ki / n * 1.2 * dx + xmin
+        jlow = np.floor((yv - ymin - r) / sy - shift * kj).astype(int)
+        for dj in range(int(np.ceil(2 * r / sy)) + 2):
+            j = jlow + dj
+            qy = (j / kj + shift) / m * dy + ymin
+            ok = inside_i & (j >= 0) & (j < nj)
+            ok &= (xv - qx) ** 2 + (yv - qy) ** 2 <= r * r
+            counts += np.bincount(i[ok] * nj + j[ok], minlength=nhex)
+    binmax = counts.max()
+
+    ############################################# build all the bars
+    cyl = vtk.vtkCylinderSource()
+    cyl.SetResolution(6)
+    cyl.CappingOn()
+    cyl.SetRadius(0.5)
+    cyl.SetHeight(0.1)
+    cyl.Update()
+    hexagon = Mesh(cyl.GetOutput()).rotate_x(90)  # put it along Z
+    hpts = hexagon.points()
+    hoffsets, hconn = utils._sequences_to_csr(hexagon.faces())
+    npts, ncells = len(hpts), len(hoffsets) - 1
+
+    ii, jj = np.divmod(np.arange(nhex), nj)
+    centers = np.c_[ii / ki, jj / kj + np.where(ii % 2, 0.45, 0), np.zeros(nhex)]
+    zscale = np.ones(nhex)
+    if fill:
+        centers[:, 2] = counts / 2
+        zscale = counts * 10
+    else:
+        centers[:, 2] = counts
+    allpts = hpts[None, :, :] * np.c_[np.ones((nhex, 2)), zscale][:, None, :]
+    allpts = (allpts + centers[:, None, :]).reshape(-1, 3)
+    offsets = np.r_[(hoffsets[:-1] + hoffsets[-1] * np.arange(nhex)[:, None]).ravel(), hoffsets[-1] * nhex]
+    conn = (hconn + npts * np.arange(nhex)[:, None]).ravel()
+    poly = vtk.vtkPolyData()
+    poly.SetPoints(vtk.vtkPoints())
+    poly.GetPoints().SetData(utils.numpy2vtk(allpts, dtype=np.float32))
+    poly.SetPolys(utils._csr_to_cellarray(offsets, conn))
+
+    # the color of each bar is set by its top z or by its column
     if cmap is not None:
-        for h in hexs:
-            z = h.GetBounds()[5]
-            col = colors.color_map(z, cmap, 0, binmax)
-            h.color(col)
+        zmax = hpts[:, 2].max() * zscale + centers[:, 2]
+        cols = colors.color_map(zmax, cmap, 0, binmax)
+    elif c is not None:
+        cols = [colors.get_color(c)] * nhex
+    else:
+        cols = colors.get_colors(ii)
+
+    hexs = Mesh(poly, alpha=alpha).flat()
+    hexs.celldata["Frequency"] = np.repeat(counts, ncells)
+    # set the colors last so that they stay the active cell scalars
+    hexs.cellcolors = np.repeat(colors.get_colors(cols)[:, :3], ncells, axis=0)
+    hexs.lighting("plastic")
+    hexs.PickableOff()
 
-    asse = Assembly(hexs)
+    asse = Assembly([hexs])
     asse.SetScale(1.2 / n * dx, 1 / m * dy, norm / binmax * (dx + dy) / 4)
     asse.SetPosition(xmin, ymin, 0)
     asse.base = np.array([0, 0, 0], dtype=float)
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import numpy as np
+
+import vedo
+from vedo import utils
+
+__docformat__ = "google"
+
+__doc__ = """
+Register many point clouds or meshes at once with the
+`Iterative Closest Point` and the `Procrustes` algorithms.
+
+The search tree of the target is built once and cached on the object,
+and all the sources are processed together in vectorized steps,
+so that thousands of scans can be aligned to the same template.
+"""
+
+__all__ = ["icp", "batch_icp", "procrustes"]
+
+_modes = ("rigid", "similarity", "affine")
+
+
+def _as_points(obj):
+    if isinstance(obj, vedo.Points):
+        return obj
+    return vedo.Points(utils.make3d(np.asarray(obj, dtype=float)))
+
+
+def _match(pts, target, tris, incident):
+    # closest point of target to each point, or closest point on the
+    # triangles around the closest vertex if target is a mesh
+    ids = target.find_neighbors(pts, n=1)[0][:, 0]
+    matched = target.points()[ids]
+    if tris is None:
+        return matched, None
+    found, cands, fids, _ = utils._closest_on_incident(pts, tris, incident, ids)
+    matched[found] = cands
+    normals = np.zeros_like(matched)
+    tri = tris[fids]
+    nml = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    lengths = np.linalg.norm(nml, axis=1)
+    normals[found] = np.divide(nml, lengths[:, None], out=nml, where=lengths[:, None] > 0)
+    return matched, normals
+
+
+def _fit_transforms(src, dst, mode):
+    # Least-squares transformations mapping the stacked point sets
+    # src onto dst, both of shape (N, n, 3), as (N, 4, 4) matrices.
+    csrc = src.mean(axis=1)
+    cdst = dst.mean(axis=1)
+    a = src - csrc[:, None]
+    b = dst - cdst[:, None]
+
+    if mode == "affine":
+        lin = np.linalg.pinv(a) @ b  # a @ lin ~ b
+        lin = lin.transpose(0, 2, 1)
+    else:
+        # Kabsch / Umeyama: rotation (and scale) from the SVD of the covariance
+        u, s, vt = np.linalg.svd(a.transpose(0, 2, 1) @ b)
+        d = np.sign(np.linalg.det(u @ vt))
+        d[d == 0] = 1
+        s[:, 2] *= d
+        u[:, :, 2] *= d[:, None]
+        lin = (u @ vt).transpose(0, 2, 1)
+        if mode == "similarity":
+            var = np.einsum("nij,nij->n", a, a)
+            scale = np.divide(s.sum(axis=1), var, out=np.ones(len(var)), where=var > 0)
+            lin = lin * scale[:, None, None]
+
+    mats = np.tile(np.eye(4), (len(src), 1, 1))
+    mats[:, :3, :3] = lin
+    mats[:, :3, 3] = cdst - np.einsum("nij,nj->ni", lin, csrc)
+    return mats
+
+
+def _fit_point_to_plane(pts, dst, normals):
+    # Rigid incremental transformations (N, 4, 4) moving the stacked points pts
+    # towards the planes through dst, linearized around the identity.
+    cen = pts.mean(axis=1)
+    x = pts - cen[:, None]
+    res = np.sum((dst - pts) * normals, axis=2)
+    rows = np.concatenate([np.cross(x, normals), normals], axis=2)
+    ata = rows.transpose(0, 2, 1) @ rows
+    atb = np.einsum("nki,nk->ni", rows, res)
+    # a small damping avoids large steps along the directions in which the surface can slide
+    damp = 1e-06 * np.trace(ata, axis1=1, axis2=2) + 1e-300
+    sol = np.linalg.solve(ata + damp[:, None, None] * np.eye(6), atb[..., None])[..., 0]
+
+    # exact rotation from the rotation vector (Rodrigues formula)
+    rvec, shift = sol[:, :3], sol[:, 3:]
+    angle = np.linalg.norm(rvec, axis=1)
+    axis = np.divide(rvec, angle[:, None], out=np.zeros_like(rvec), where=angle[:, None] > 0)
+    k = np.zeros((len(sol), 3, 3))
+    k[:, 0, 1], k[:, 0, 2], k[:, 1, 2] = -axis[:, 2], axis[:, 1], -axis[:, 0]
+    k = k - k.transpose(0, 2, 1)
+    sin, cos = np.sin(angle)[:, None, None], np.cos(angle)[:, None, None]
+    rot = np.eye(3) + sin * k + (1 - cos) * (k @ k)
+
+    mats = np.tile(np.eye(4), (len(pts), 1, 1))
+    mats[:, :3, :3] = rot
+    mats[:, :3, 3] = cen + shift - np.einsum("nij,nj->ni", rot, cen)
+    return mats
+
+
+def _transform(mats, pts):
+    # apply the (N, 4, 4) matrices to the stacked points (N, n, 3)
+    return pts @ mats[:, :3, :3].transpose(0, 2, 1) + mats[:, None, :3, 3]
+
+
+def batch_icp(
+    sources,
+    target,
+    mode="similarity",
+    iters=100,
+    tol=1e-06,
+    landmarks=200,
+    use_centroids=False,
+):
+    """
+    Align many sources to the same target with the `Iterative Closest Point` algorithm.
+
+    At each iteration every source point is matched to the closest point
+    of the target, then the transformation that best maps the source onto
+    the matched points (in the least-square sense) is computed.
+    If the target is a mesh the points are matched to the closest point of its surface
+    and, except in "affine" mode, the rotation and translation minimize the distances
+    to the tangent planes of the surface (point-to-plane ICP), which needs much fewer iterations.
+
+    All the sources are processed together: the search tree of the target is
+    built only once (and cached for the following calls), the closest points
+    of all the sources are searched in a single multithreaded query,
+    and the transformations are solved for in a single vectorized step.
+
+    Returns a tuple `(matrices, stats)` where `matrices` is an array of shape (N, 4, 4)
+    with the transformation of each source (in world coordinates), and `stats` is a
+    dictionary of arrays with the number of `iterations`, the root mean square
+    distance of the landmarks to the target (`rms`) and whether the
+    algorithm `converged` before reaching `iters`.
+
+    Arguments:
+        sources : (list)
+            list of `Points`, `Mesh` or arrays of points
+        target : (Points, Mesh)
+            the object to align the sources to
+        mode : (str)
+            "rigid", "similarity" (rigid with isotropic scaling) or "affine"
+        iters : (int)
+            maximum number of iterations
+        tol : (float)
+            stop when the `rms` distance changes less than this fraction
+            of the size of the target
+        landmarks : (int)
+            number of points of each source used to compute the alignment,
+            they are picked at regular intervals (as in `vtkIterativeClosestPointTransform`)
+        use_centroids : (bool)
+            start by matching the centroids of the sources to the centroid of the target
+
+    Example:
+        ```python
+        from vedo import *
+        from vedo.registration import batch_icp
+        target = Mesh(dataurl+"bunny.obj")
+        scans = [target.clone().rotate_z(10*i).shift(0.01*i, 0, 0) for i in range(5)]
+        mats, stats = batch_icp(scans, target, mode="rigid")
+        print(stats["rms"])
+        for scan, M in zip(scans, mats):
+            scan.apply_transform(M, concatenate=True)
+        show(target, scans, axes=1).close()
+        ```
+    """
+    if mode not in _modes:
+        vedo.logger.error(f"in batch_icp(), unknown mode {mode}, use one of {_modes}")
+        raise ValueError(mode)
+    target = _as_points(target)
+    tris, incident = target._get_surface_triangles()
+    size = target.diagonal_size()
+    nsrc = len(sources)
+
+    # sample the same number of landmarks from every source
+    src = []
+    for source in sources:
+        pts = _as_points(source).points()
+        idx = np.linspace(0, len(pts) - 1, landmarks).round().astype(int)
+        src.append(pts[idx])
+    src = np.array(src, dtype=float).reshape(nsrc, landmarks, 3)
+
+    mats = np.tile(np.eye(4), (nsrc, 1, 1))
+    if use_centroids:
+        mats[:, :3, 3] = target.points().mean(axis=0) - src.mean(axis=1)
+
+    iterations = np.zeros(nsrc, dtype=int)
+    converged = np.zeros(nsrc, dtype=bool)
+    rms = np.full(nsrc, np.inf)
+    last_matched = np.zeros_like(src)
+    for _ in range(iters):
+        active = np.flatnonzero(~converged)
+        if len(active) == 0:
+            break
+        moved = _transform(mats[active], src[active])
+        matched, normals = _match(moved.reshape(-1, 3), target, tris, incident)
+        matched = matched.reshape(moved.shape)
+        err = np.sqrt(np.mean(np.sum((matched - moved) ** 2, axis=2), axis=1))
+
+        # a step which increased the distance is replaced by a point-to-point
+        # step from the previous matches, which never increases it
+        worse = err > rms[active] + tol * size
+        back = active[worse]
+        if len(back):
+            mats[back] = _fit_transforms(src[back], last_matched[back], mode)
+
+        sel = ~worse
+        sel[sel] = np.abs(rms[active[sel]] - err[sel]) > tol * size
+        converged[active[~worse & ~sel]] = True
+        rms[active[~worse]] = err[~worse]
+        ids = active[sel]
+        moved, matched = moved[sel], matched[sel]
+        last_matched[ids] = matched
+        if normals is None or mode == "affine":
+            mats[ids] = _fit_transforms(src[ids], matched, mode)
+        else:
+            normals = normals.reshape(-1, landmarks, 3)[sel]
+            step = _fit_point_to_plane(moved, matched, normals)
+            if mode == "similarity":
+                # scale fitted on the same matches, applied about the moved centroids
+                lin = _fit_transforms(moved, matched, mode)[:, :3, :3]
+                scale = np.cbrt(np.linalg.det(lin))
+                cen = _transform(step, moved).mean(axis=1)
+                step[:, :3] *= scale[:, None, None]
+                step[:, :3, 3] += (1 - scale)[:, None] * cen
+            mats[ids] = step @ mats[ids]
+        iterations[active[worse | sel]] += 1
+
+    # final distances of the landmarks
+    moved = _transform(mats, src)
+    matched = _match(moved.reshape(-1, 3), target, tris, incident)[0].reshape(moved.shape)
+    rms = np.sqrt(np.mean(np.sum((matched - moved) ** 2, axis=2), axis=1))
+    stats = {"iterations": iterations, "rms": rms, "converged": converged}
+    return mats, stats
+
+
+def icp(
+    source,
+    target,
+    mode="similarity",
+    iters=100,
+    tol=1e-06,
+    landmarks=200,
+    use_centroids=False,
+):
+    """
+    Align `source` to `target` with the `Iterative Closest Point` algorithm.
+
+    Returns a tuple `(matrix, stats)` with the 4x4 transformation matrix
+    and a dictionary with the number of `iterations`, the final `rms` distance
+    and whether the algorithm `converged`.
+    See `batch_icp()` for the meaning of the arguments.
+
+    Example:
+        ```python
+        from vedo import *
+        from vedo.registration import icp
+        s1 = Mesh(dataurl+"bunny.obj")
+        s2 = s1.clone().rotate_z(15).scale(1.1)
+        M, stats = icp(s2, s1)
+        print(stats)
+        s2.apply_transform(M, concatenate=True)
+        ```
+    """
+    mats, stats = batch_icp([source], target, mode, iters, tol, landmarks, use_centroids)
+    return mats[0], {k: v[0].item() for k, v in stats.items()}
+
+
+def procrustes(sources, mode="similarity", iters=100, tol=1e-07):
+    """
+    Align a set of shapes with the same number of points to their mutual mean
+    with the generalized `Procrustes` algorithm.
+
+    The mean is initialized with the first shape and recomputed after
+    each alignment until it does not change anymore. It keeps the position
+    and the size of the first shape.
+    Differently from `procrustes_alignment()` the input objects are not modified
+    and all the shapes are aligned together in vectorized steps.
+
+    Returns a tuple `(matrices, mean, stats)` with the (N, 4, 4) transformation
+    matrices of the sources, the mean shape as a numpy array, and a dictionary
+    with the number of `iterations`, the `rms` distance of each aligned shape
+    to the mean and whether the algorithm `converged`.
+
+    Arguments:
+        sources : (list)
+            list of `Points`, `Mesh` or arrays of points with the same number of points
+        mode : (str)
+            "rigid", "similarity" (rigid with isotropic scaling) or "affine"
+        iters : (int)
+            maximum number of iterations
+        tol : (float)
+            stop when the mean shape moves less than this fraction of its size
+
+    Example:
+        ```python
+        from vedo import *
+        from vedo.registration import procrustes
+        shapes = [Sphere(res=10).scale([1, 1+i/10, 1]).rotate_x(5*i) for i in range(6)]
+        mats, mean, stats = procrustes(shapes, mode="rigid")
+        show(Points(mean), axes=1).close()
+        ```
+    """
+    if mode not in _modes:
+        vedo.logger.error(f"in procrustes(), unknown mode {mode}, use one of {_modes}")
+        raise ValueError(mode)
+    pts = [_as_points(s).points() for s in sources]
+    if len({len(p) for p in pts}) > 1:
+        vedo.logger.error("in procrustes(), sources have different nr of points")
+        raise RuntimeError()
+    src = np.array(pts, dtype=float)
+    nsrc = len(src)
+
+    mean = src[0]
+    size = np.sqrt(np.mean(np.sum((mean - mean.mean(axis=0)) ** 2, axis=1)))
+    mats = np.tile(np.eye(4), (nsrc, 1, 1))
+    converged = False
+    it = 0
+    for it in range(1, iters + 1):
+        mats = _fit_transforms(src, np.broadcast_to(mean, src.shape), mode)
+        new_mean = _transform(mats, src).mean(axis=0)
+        if mode != "rigid":
+            # keep the mean from shrinking: bring it back to the size of the first shape
+            cen = new_mean.mean(axis=0)
+            new_size = np.sqrt(np.mean(np.sum((new_mean - cen) ** 2, axis=1)))
+            new_mean = (new_mean - cen) * (size / new_size) + cen
+        change = np.sqrt(np.mean(np.sum((new_mean - mean) ** 2, axis=1)))
+        mean = new_mean
+        if change <= tol * size:
+            converged = True
+            break
+
+    mats = _fit_transforms(src, np.broadcast_to(mean, src.shape), mode)
+    rms = np.sqrt(np.mean(np.sum((_transform(mats, src) - mean) ** 2, axis=2), axis=1))
+    stats = {"iterations": it, "rms": rms, "converged": converged}
+    return mats, mean, stats
@@ -12,7 +12,7 @@ except ImportError:
 
 import vedo
 from vedo import settings
-from vedo.colors import cmaps_names, color_map, get_color, printc
+from vedo.colors import cmaps_names, color_map, get_color, get_colors, printc
 from vedo import utils
 from vedo.pointcloud import Points, merge
 from vedo.mesh import Mesh
@@ -61,6 +61,7 @@ __all__ = [
     "IcoSphere",
     "Sphere",
     "Spheres",
+    "InstancedGlyph",
     "Earth",
     "Ellipsoid",
     "Grid",
@@ -78,6 +79,7 @@ __all__ = [
     "TextBase",
     "Text3D",
     "Text2D",
+    "preload_fonts",
     "CornerAnnotation",
     "Latex",
     "Glyph",
@@ -159,6 +161,8 @@ class Glyph(Mesh):
     The input can also be a simple list of 2D or 3D coordinates.
     Color can be specified as a colormap which maps the size of the orientation
     vectors in `orientation_array`.
+
+    For very large sets of glyphs see also `InstancedGlyph`.
     """
 
     def __init__(
@@ -226,12 +230,8 @@ class Glyph(Mesh):
             cmap = c
             c = None
         elif utils.is_sequence(c):  # user passing an array of point colors
-            ucols = vtk.vtkUnsignedCharArray()
-            ucols.SetNumberOfComponents(3)
-            ucols.SetName("glyph_RGB")
-            for col in c:
-                cl = get_color(col)
-                ucols.InsertNextTuple3(cl[0] * 255, cl[1] * 255, cl[2] * 255)
+            rgb = get_colors(c)[:, :3]
+            ucols = utils.numpy2vtk(rgb, dtype=np.uint8, name="glyph_RGB")
             poly.GetPointData().AddArray(ucols)
             poly.GetPointData().SetActiveScalars("glyph_RGB")
             c = None
@@ -1705,13 +1705,8 @@ class Tube(Mesh):
         usingColScals = False
         if utils.is_sequence(c):
             usingColScals = True
-            cc = vtk.vtkUnsignedCharArray()
-            cc.SetName("TubeColors")
-            cc.SetNumberOfComponents(3)
-            cc.SetNumberOfTuples(len(c))
-            for i, ic in enumerate(c):
-                r, g, b = get_color(ic)
-                cc.InsertTuple3(i, int(255 * r), int(255 * g), int(255 * b))
+            rgb = get_colors(c)[:, :3]
+            cc = utils.numpy2vtk(rgb, dtype=np.uint8, name="TubeColors")
             polyln.GetPointData().AddArray(cc)
             c = None
         tuf.Update()
@@ -2709,7 +2704,10 @@ class Spheres(Mesh):
         """
         Build a (possibly large) set of spheres at `centers` of radius `r`.
 
-        Either `c` or `r` can be a list of RGB colors or radii.
+        Both `c` and `r` can be a list of colors and radii, one per sphere.
+
+        For very large sets, or sets that change at every frame, consider using
+        `InstancedGlyph` which draws the spheres on the GPU.
 
         Examples:
             - [manyspheres.py](https://github.com/marcomusy/vedo/tree/master/examples/basic/manyspheres.py)
@@ -2739,10 +2737,6 @@ class Spheres(Mesh):
             if len(centers) != len(r):
                 vedo.logger.error(f"mismatch #centers {len(centers)} != {len(r)} #radii")
                 raise RuntimeError()
-        if cisseq and risseq:
-            vedo.logger.error("Limitation: c and r cannot be both sequences.")
-            raise RuntimeError()
-
         src = vtk.vtkSphereSource()
         if not risseq:
             src.SetRadius(r)
@@ -2766,21 +2760,20 @@ class Spheres(Mesh):
 
         if cisseq:
             glyph.SetColorModeToColorByScalar()
-            ucols = vtk.vtkUnsignedCharArray()
-            ucols.SetNumberOfComponents(3)
-            ucols.SetName("Colors")
-            for acol in c:
-                cx, cy, cz = get_color(acol)
-                ucols.InsertNextTuple3(cx * 255, cy * 255, cz * 255)
+            rgb = get_colors(c)[:, :3]
+            ucols = utils.numpy2vtk(rgb, dtype=np.uint8, name="Colors")
             pd.GetPointData().AddArray(ucols)
             pd.GetPointData().SetActiveScalars("Colors")
             glyph.ScalingOff()
-        elif risseq:
+        if risseq:
             glyph.SetScaleModeToScaleByScalar()
+            glyph.ScalingOn()
             urads = utils.numpy2vtk(2 * np.ascontiguousarray(r), dtype=np.float32)
             urads.SetName("Radii")
             pd.GetPointData().AddArray(urads)
             pd.GetPointData().SetActiveScalars("Radii")
+            if cisseq:  # colors are taken from a different array than the radii
+                glyph.SetInputArrayToProcess(3, 0, 0, 0, "Colors")
 
         vpts.SetData(utils.numpy2vtk(centers - base, dtype=np.float32))
 
@@ -2800,6 +2793,234 @@ class Spheres(Mesh):
         self.name = "Spheres"
 
 
+class InstancedGlyph(Points):
+    """
+    Draw a copy of a glyph mesh at each point, instancing it on the GPU.
+    """
+
+    def __init__(
+        self,
+        pos,
+        glyph=None,
+        r=1.0,
+        c="r5",
+        orientation=None,
+        alpha=1.0,
+        res=8,
+        mode="mesh",
+    ):
+        """
+        Draw a copy of a glyph mesh (by default a sphere) at each point.
+
+        Unlike `Spheres` and `Glyph`, the glyph geometry is never replicated in memory:
+        the instances are drawn by the graphics card with a `vtkGlyph3DMapper`,
+        so that millions of instances can be shown and updated at every frame.
+
+        Colors, sizes and orientations can be given together, one per instance.
+        Use `update_instances()` to change them in place.
+        The vertices of this object are the instance positions.
+
+        Arguments:
+            pos : (list, Points)
+                positions of the instances
+            glyph : (Mesh, vtkPolyData)
+                the mesh to be instanced, if None a sphere of radius 1 is used
+            r : (float, list)
+                scaling factor of the glyph (the sphere radius).
+                Can be a list of N values or of N (sx,sy,sz) values.
+            c : (color, list)
+                a single color or a list of N colors, possibly with an alpha component
+            orientation : (list)
+                a list of N directions along which the x-axis of the glyph is aligned,
+                or of N quaternions (w,x,y,z)
+            alpha : (float)
+                overall opacity
+            res : (int)
+                resolution of the default sphere glyph
+            mode : (str)
+                use "splat" to draw spheres as shaded points with a `vtkPointGaussianMapper`.
+                This is the fastest option but glyph and orientation are ignored.
+
+        Example:
+            ```python
+            import numpy as np
+            from vedo import InstancedGlyph, Plotter
+
+            pts = np.random.randn(100_000, 3)
+            particles = InstancedGlyph(pts, r=np.random.rand(100_000)/50, c=np.abs(pts)/3)
+
+            plt = Plotter(interactive=False)
+            plt.show(particles)
+            for i in range(100):
+                pts += np.random.randn(*pts.shape) / 100
+                particles.update_instances(pos=pts)
+                plt.render()
+            plt.interactive().close()
+            ```
+        """
+        if isinstance(pos, Points):
+            pos = pos.points()
+        pos = np.asarray(pos, dtype=float)
+
+        Points.__init__(self, pos, alpha=alpha)
+        self._mode = mode
+
+        if mode == "splat":
+            self._mapper = vtk.vtkPointGaussianMapper()
+            self._mapper.SetEmissive(False)
+            self._mapper.SetScaleFactor(1.0)
+            # https://kitware.github.io/vtk-examples/site/Cxx/Visualization/PointGaussianMapper/
+            self._mapper.SetSplatShaderCode(
+                "//VTK::Color::Impl\n"
+                "float dist = dot(offsetVCVSOutput.xy,offsetVCVSOutput.xy);\n"
+                "if (dist > 1.0) {\n"
+                "   discard;\n"
+                "} else {\n"
+                "   float scale = (1.0 - dist);\n"
+                "   ambientColor *= scale;\n"
+                "   diffuseColor *= scale;\n"
+                "}\n"
+            )
+        elif mode == "mesh":
+            if glyph is None:
+                src = vtk.vtkSphereSource()
+                src.SetRadius(1)
+                src.SetThetaResolution(2 * res)
+                src.SetPhiResolution(res)
+                src.Update()
+                glyph = src.GetOutput()
+            elif isinstance(glyph, Points):
+                glyph = glyph.polydata()
+            self._mapper = vtk.vtkGlyph3DMapper()
+            self._mapper.SetSourceData(glyph)
+            self._mapper.SetScaleFactor(1.0)
+        else:
+            vedo.logger.error(f"in InstancedGlyph() unknown mode {mode}, use 'mesh' or 'splat'")
+            raise ValueError(mode)
+
+        self._mapper.SetInputData(self._data)
+        self.SetMapper(self._mapper)
+        self.property.SetRepresentationToSurface()
+        self.property.RenderPointsAsSpheresOff()
+        self.property.LightingOn()
+        self.property.SetInterpolationToPhong()
+        self.update_instances(r=r, c=c, orientation=orientation)
+        self.name = "InstancedGlyph"
+
+    def _set_instance_array(self, name, values, dtype):
+        # write values into the named point array, in place if the shape allows it
+        values = np.asarray(values, dtype=dtype)
+        pdata = self._data.GetPointData()
+        varr = pdata.GetArray(name)
+        if varr is not None:
+            current = utils.vtk2numpy(varr)
+            if current.shape == values.shape:
+                current[:] = values
+                varr.Modified()
+                return varr
+        varr = utils.numpy2vtk(values, dtype=dtype, name=name)
+        pdata.AddArray(varr)
+        return varr
+
+    def update_instances(self, pos=None, r=None, c=None, orientation=None):
+        """
+        Update the positions, sizes, colors and orientations of the instances.
+
+        Only the given arguments are changed. Arrays are overwritten in place
+        when the number of instances does not change, so this is cheap enough
+        to be called at every frame.
+        If the number of instances changes, the per-instance sizes, colors and
+        orientations which were set must be given again.
+        See `InstancedGlyph` for the meaning of the arguments.
+        """
+        mapper = self._mapper
+        if pos is not None:
+            pos = utils.make3d(np.asarray(pos, dtype=float))
+            vpts = self._data.GetPoints()
+            if len(pos) == vpts.GetNumberOfPoints():
+                utils.vtk2numpy(vpts.GetData())[:] = pos
+                vpts.Modified()
+            else:
+                # arrays of the old size would be out of sync
+                pdata = self._data.GetPointData()
+                for name, value in (
+                    ("InstanceScales", r),
+                    ("InstanceColors", c),
+                    ("InstanceOrientations", orientation),
+                ):
+                    if pdata.GetArray(name) is not None and value is None:
+                        vedo.logger.error(
+                            f"in update_instances() #instances changed, {name} must be given again"
+                        )
+                        raise ValueError(name)
+                vpts.SetData(utils.numpy2vtk(pos, dtype=np.float32))
+                verts = utils.buildPolyData(pos).GetVerts()
+                self._data.SetVerts(verts)
+            self._data.Modified()
+        n = self._data.GetNumberOfPoints()
+
+        if r is not None:
+            if utils.is_sequence(r):
+                r = np.asarray(r, dtype=np.float32)
+                if len(r) != n:
+                    vedo.logger.error(f"in update_instances() mismatch #instances {n} != {len(r)} #sizes")
+                    raise ValueError()
+                self._set_instance_array("InstanceScales", r, np.float32)
+                mapper.SetScaleArray("InstanceScales")
+                mapper.SetScaleFactor(1.0)
+                if isinstance(mapper, vtk.vtkGlyph3DMapper):
+                    mapper.SetScaling(True)
+                    if r.ndim == 2:
+                        mapper.SetScaleModeToScaleByVectorComponents()
+                    else:
+                        mapper.SetScaleModeToScaleByMagnitude()
+                else:
+                    mapper.SetScaleArray("InstanceScales")
+            else:
+                self._data.GetPointData().RemoveArray("InstanceScales")
+                mapper.SetScaleFactor(r)
+                if isinstance(mapper, vtk.vtkGlyph3DMapper):
+                    mapper.SetScaling(False)
+                else:
+                    mapper.SetScaleArray(None)
+
+        if c is not None:
+            percolor = utils.is_sequence(c) and len(c) == n and (
+                utils.is_sequence(c[0]) or isinstance(c[0], str) or n not in (3, 4)
+            )
+            if percolor:
+                rgba = get_colors(c)
+                if rgba.shape[1] == 3:
+                    rgba = np.c_[rgba, np.full(n, 255, dtype=np.uint8)]
+                self._set_instance_array("InstanceColors", rgba, np.uint8)
+                mapper.SetScalarModeToUsePointFieldData()
+                mapper.SelectColorArray("InstanceColors")
+                mapper.SetColorModeToDirectScalars()
+                mapper.ScalarVisibilityOn()
+            else:
+                self._data.GetPointData().RemoveArray("InstanceColors")
+                mapper.ScalarVisibilityOff()
+                self.property.SetColor(get_color(c))
+
+        if orientation is not None and isinstance(mapper, vtk.vtkGlyph3DMapper):
+            orientation = np.asarray(orientation, dtype=np.float32)
+            if len(orientation) != n:
+                vedo.logger.error(
+                    f"in update_instances() mismatch #instances {n} != {len(orientation)} #orientations"
+                )
+                raise ValueError()
+            self._set_instance_array("InstanceOrientations", orientation, np.float32)
+            mapper.SetOrientationArray("InstanceOrientations")
+            if orientation.shape[1] == 4:
+                mapper.SetOrientationModeToQuaternion()
+            else:
+                mapper.SetOrientationModeToDirection()
+            mapper.OrientOn()
+
+        mapper.Modified()
+        return self
+
+
 class Earth(Mesh):
     """
     Build a textured mesh representing the Earth.
@@ -3981,10 +4202,8 @@ class ParametricShape(Mesh):
         self.name = name
 
 
-@lru_cache(None)
-def _load_font(font):
-    # print('_load_font()', font)
-
+def _resolve_font(font):
+    # return the font name and the path to its .npz file
     if utils.is_number(font):
         font = list(settings.font_parameters.keys())[int(font)]
 
@@ -4024,25 +4243,329 @@ def _load_font(font):
                 vedo.logger.warning(f"font {font} not found")
                 font = settings.default_font
                 fontfile = os.path.join(vedo.fonts_path, font + ".npz")
+    return font, fontfile
+
 
-    #####
+@lru_cache(None)
+def _load_font_file(fontfile):
+    # Decode all the letters of a font file into a single glyph table:
+    # "points" (N,3) and "faces" (M,3) are the concatenated glyph meshes
+    # (the faces of each letter index its own points starting from 0),
+    # "index" maps a letter to its (point_start, point_end, face_start, face_end)
+    # and "xrange" to the (xmin, xmax) extent of the glyph.
     try:
         font_meshes = np.load(fontfile, allow_pickle=True)["font"][0]
     except:
-        vedo.logger.warning(f"font name {font} not found.")
+        vedo.logger.warning(f"font file {fontfile} not found.")
         raise RuntimeError
-    return font_meshes
+
+    letters = list(font_meshes.keys())
+    pts = [np.asarray(font_meshes[k][0], dtype=float) for k in letters]
+    faces = [np.asarray(font_meshes[k][1], dtype=np.int64).reshape(-1, 3) for k in letters]
+    npts = np.cumsum([0] + [len(p) for p in pts])
+    nfaces = np.cumsum([0] + [len(f) for f in faces])
+
+    points = np.zeros([npts[-1], 3])
+    if npts[-1]:
+        points[:, :2] = np.concatenate(pts)[:, :2]
+
+    glyphs = {"font_meshes": font_meshes, "points": points, "index": {}, "xrange": {}}
+    glyphs["faces"] = np.concatenate(faces) if faces else np.zeros([0, 3], dtype=np.int64)
+    for i, k in enumerate(letters):
+        glyphs["index"][k] = (npts[i], npts[i + 1], nfaces[i], nfaces[i + 1])
+        if npts[i + 1] > npts[i]:
+            x = points[npts[i] : npts[i + 1], 0]
+            glyphs["xrange"][k] = (x.min(), x.max())
+        else:
+            glyphs["xrange"][k] = (0.0, 0.0)
+    return glyphs
+
+
+@lru_cache(None)
+def _load_font_glyphs(font):
+    return _load_font_file(_resolve_font(font)[1])
+
+
+def _load_font(font):
+    # print('_load_font()', font)
+    return _load_font_glyphs(font)["font_meshes"]
 
 
 @lru_cache(None)
 def _get_font_letter(font, letter):
     # print("_get_font_letter", font, letter)
-    font_meshes = _load_font(font)
+    glyphs = _load_font_glyphs(font)
     try:
-        pts, faces = font_meshes[letter]
-        return utils.buildPolyData(pts, faces)
+        p0, p1, f0, f1 = glyphs["index"][letter]
     except KeyError:
         return None
+    return utils.buildPolyData(glyphs["points"][p0:p1], glyphs["faces"][f0:f1])
+
+
+def preload_fonts(*fonts):
+    """
+    Load and decode the glyphs of the specified fonts
+    (or the default font if none is given), so that the first `Text3D`
+    objects are generated without delay. Fonts are loaded only once anyway.
+
+    Example:
+        ```python
+        from vedo import preload_fonts, Text3D
+        preload_fonts("Normografo", "Calco")
+        t = Text3D("Hello", font="Calco")
+        ```
+    """
+    if not fonts:
+        fonts = [settings.default_font]
+    for font in fonts:
+        _load_font_glyphs(font)
+
+
+def _text3d_layout(txt, font, hspacing=1.15, vspacing=2.15, italic=False, literal=False):
+    # Place the letters of a string, return the points and triangles
+    # of the resulting text and the set of characters not found in the font.
+    if italic is True:
+        italic = 1
+
+    if isinstance(font, int):
+        lfonts = list(settings.font_parameters.keys())
+        font = font % len(lfonts)
+        font = lfonts[font]
+
+    if font not in settings.font_parameters.keys():
+        fpars = settings.font_parameters["Normografo"]
+    else:
+        fpars = settings.font_parameters[font]
+
+    # ad hoc adjustments
+    mono = fpars["mono"]
+    lspacing = fpars["lspacing"]
+    hspacing *= fpars["hspacing"]
+    fscale = fpars["fscale"]
+    dotsep = fpars["dotsep"]
+
+    # replacements
+    if ":" in txt:
+        for r in _reps:
+            txt = txt.replace(r[0], r[1])
+
+    if not literal:
+        reps2 = [
+            ("\_", "┭"),  # trick to protect ~ _ and ^ chars
+            ("\^", "┮"),  #
+            ("\~", "┯"),  #
+            ("**", "^"),  # order matters
+            ("e+0", dotsep + "10^"),
+            ("e-0", dotsep + "10^-"),
+            ("E+0", dotsep + "10^"),
+            ("E-0", dotsep + "10^-"),
+            ("e+", dotsep + "10^"),
+            ("e-", dotsep + "10^-"),
+            ("E+", dotsep + "10^"),
+            ("E-", dotsep + "10^-"),
+        ]
+        for r in reps2:
+            txt = txt.replace(r[0], r[1])
+
+    xmax, ymax, yshift, scale = 0, 0, 0, 1
+    save_xmax = 0
+
+    glyphs = _load_font_glyphs(font)
+    gindex = glyphs["index"]
+    gpoints = glyphs["points"]
+    gfaces = glyphs["faces"]
+
+    notfounds = set()
+    polyletters = []  # list of (points, faces) of the placed letters
+    npts = 0
+    ntxt = len(txt)
+    for i, t in enumerate(txt):
+        ##########
+        if t == "┭":
+            t = "_"
+        elif t == "┮":
+            t = "^"
+        elif t == "┯":
+            t = "~"
+        elif t == "^" and not literal:
+            if yshift < 0:
+                xmax = save_xmax
+            yshift = 0.9 * fscale
+            scale = 0.5
+            continue
+        elif t == "_" and not literal:
+            if yshift > 0:
+                xmax = save_xmax
+            yshift = -0.3 * fscale
+            scale = 0.5
+            continue
+        elif (t in (" ", "\\n")) and yshift:
+            yshift = 0
+            scale = 1
+            save_xmax = xmax
+            if t == " ":
+                continue
+        elif t == "~":
+            if i < ntxt - 1 and txt[i + 1] == "_":
+                continue
+            xmax += hspacing * scale * fscale / 4
+            continue
+
+        ############
+        if t == " ":
+            xmax += hspacing * scale * fscale
+
+        elif t == "\n":
+            xmax = 0
+            save_xmax = 0
+            ymax -= vspacing
+
+        else:
+            if t not in gindex:
+                notfounds.add(t)
+                xmax += hspacing * scale * fscale
+                continue
+
+            # place the letter: shear for italic, scale, then translate
+            p0, p1, f0, f1 = gindex[t]
+            pscale = scale * fscale / 1000
+            pts = gpoints[p0:p1] * pscale
+            if italic:
+                pts[:, 0] += italic * 0.15 * pts[:, 1]
+            pts[:, 0] += xmax
+            pts[:, 1] += ymax + yshift
+            polyletters.append((pts, gfaces[f0:f1] + npts))
+            npts += p1 - p0
+
+            if mono:
+                xmax += hspacing * scale * fscale
+            else:
+                xmax += pts[:, 0].max() - pts[:, 0].min() + hspacing * scale * fscale * lspacing
+            if yshift == 0:
+                save_xmax = xmax
+
+    if polyletters:
+        pts = np.concatenate([pl[0] for pl in polyletters])
+        faces = np.concatenate([pl[1] for pl in polyletters])
+    else:
+        pts = np.zeros([0, 3])
+        faces = np.zeros([0, 3], dtype=np.int64)
+    return pts, faces, notfounds
+
+
+def _text3d_arrays(txts, font="", justify="bottom-left", hspacing=1.15):
+    # Generate the geometry of many Text3D labels at once, equivalent to
+    # Text3D(txt, font=font, justify=justify) for each txt in txts.
+    # Returns the concatenated points and triangles and the point offsets
+    # such that the points of label i are pts[offsets[i]:offsets[i+1]].
+    if not font:
+        font = settings.default_font
+    if isinstance(font, int):
+        lfonts = list(settings.font_parameters.keys())
+        font = lfonts[font % len(lfonts)]
+    fpars = settings.font_parameters.get(font, settings.font_parameters["Normografo"])
+    mono = fpars["mono"]
+    lspacing = fpars["lspacing"]
+    fscale = fpars["fscale"]
+    hs = hspacing * fpars["hspacing"] * fscale  # advance of an empty space
+
+    glyphs = _load_font_glyphs(font)
+    gindex = glyphs["index"]
+    gpoints = glyphs["points"]
+    gfaces = glyphs["faces"]
+    gxrange = glyphs["xrange"]
+
+    txts = [str(t) for t in txts]
+    ntxts = len(txts)
+    special = set(":\\^_~*\n")
+
+    ############################################## plain strings, placed in bulk
+    plain = np.array(
+        [not special.intersection(t) and "e+" not in t and "e-" not in t
+         and "E+" not in t and "E-" not in t for t in txts],
+        dtype=bool,
+    )
+    chars = "".join(t for t, p in zip(txts, plain) if p)
+    clabel = np.repeat(np.arange(ntxts)[plain], [len(t) for t, p in zip(txts, plain) if p])
+
+    notfounds = set(chars) - set(gindex) - {" "}
+    cinfo = np.array([gindex.get(c, (0, 0, 0, 0)) for c in chars], dtype=np.int64).reshape(-1, 4)
+    cwidth = np.array([gxrange[c][1] - gxrange[c][0] if c in gindex else 0.0 for c in chars])
+    found = np.array([c in gindex for c in chars], dtype=bool)
+
+    # horizontal advance of each character and its starting position
+    adv = np.full(len(chars), hs)
+    if not mono:
+        adv[found] = cwidth[found] * fscale / 1000 + hs * lspacing
+    cs = np.cumsum(adv)
+    first = np.r_[True, clabel[1:] != clabel[:-1]] if len(chars) else np.zeros(0, dtype=bool)
+    start = np.maximum.accumulate(np.where(first, np.arange(len(chars)), 0))
+    xstart = cs - adv - (cs - adv)[start]
+
+    # gather the glyph points and faces of all the found characters
+    cinfo = cinfo[found]
+    xstart = xstart[found]
+    clabel = clabel[found]
+    npc = cinfo[:, 1] - cinfo[:, 0]
+    nfc = cinfo[:, 3] - cinfo[:, 2]
+    pstart = np.cumsum(npc) - npc
+    fstart = np.cumsum(nfc) - nfc
+    pidx = np.arange(npc.sum()) - np.repeat(pstart - cinfo[:, 0], npc)
+    fidx = np.arange(nfc.sum()) - np.repeat(fstart - cinfo[:, 2], nfc)
+    ppts = gpoints[pidx] * (fscale / 1000)
+    ppts[:, 0] += np.repeat(xstart, npc)
+    pfaces = gfaces[fidx] + np.repeat(pstart, nfc)[:, None]
+    plabel = np.repeat(clabel, npc)
+    pflabel = np.repeat(clabel, nfc)
+
+    ############################################## other strings, one by one
+    pts_list, faces_list, label_list, flabel_list = [ppts], [pfaces], [plabel], [pflabel]
+    npts = len(ppts)
+    for i in np.nonzero(~plain)[0]:
+        pts, faces, nf = _text3d_layout(txts[i], font, hspacing)
+        notfounds |= nf
+        pts_list.append(pts)
+        faces_list.append(faces + npts)
+        label_list.append(np.full(len(pts), i))
+        flabel_list.append(np.full(len(faces), i))
+        npts += len(pts)
+
+    pts = np.concatenate(pts_list)
+    faces = np.concatenate(faces_list)
+    plabel = np.concatenate(label_list)
+    flabel = np.concatenate(flabel_list)
+
+    if not plain.all():
+        # sort by label, keeping the order of the points inside each label
+        order = np.argsort(plabel, kind="stable")
+        inverse = np.empty_like(order)
+        inverse[order] = np.arange(len(order))
+        pts = pts[order]
+        plabel = plabel[order]
+        faces = inverse[faces[np.argsort(flabel, kind="stable")]]
+    counts = np.bincount(plabel, minlength=ntxts)
+    offsets = np.r_[0, np.cumsum(counts)]
+
+    if notfounds:
+        wmsg = f"These characters are not available in font name {font}: {notfounds}. "
+        wmsg += 'Type "vedo -r fonts" for a demo.'
+        vedo.logger.warning(wmsg)
+
+    ############################################## justify each label as Text3D does
+    if len(pts):
+        nonempty = counts > 0
+        bmin = np.minimum.reduceat(pts, offsets[:-1][nonempty])
+        bmax = np.maximum.reduceat(pts, offsets[:-1][nonempty])
+        shift = -(bmin + bmax) / 2
+        dx = (bmax[:, 0] - bmin[:, 0]) / 2
+        dy = (bmax[:, 1] - bmin[:, 1]) / 2
+        if "bottom" in justify: shift[:, 1] += dy
+        if "top"    in justify: shift[:, 1] -= dy
+        if "left"   in justify: shift[:, 0] += dx
+        if "right"  in justify: shift[:, 0] -= dx
+        pts += np.repeat(shift, counts[nonempty], axis=0)
+
+    return pts, faces, offsets
 
 
 class Text3D(Mesh):
@@ -4202,132 +4725,13 @@ class Text3D(Mesh):
             if not txt or (len(stxt) == 1 and " " in stxt):
                 return vtk.vtkPolyData()
 
-            if italic is True:
-                italic = 1
-
-            if isinstance(font, int):
-                lfonts = list(settings.font_parameters.keys())
-                font = font % len(lfonts)
-                font = lfonts[font]
-
-            if font not in settings.font_parameters.keys():
-                fpars = settings.font_parameters["Normografo"]
-            else:
-                fpars = settings.font_parameters[font]
-
-            # ad hoc adjustments
-            mono = fpars["mono"]
-            lspacing = fpars["lspacing"]
-            hspacing *= fpars["hspacing"]
-            fscale = fpars["fscale"]
-            dotsep = fpars["dotsep"]
-
-            # replacements
-            if ":" in txt:
-                for r in _reps:
-                    txt = txt.replace(r[0], r[1])
-
-            if not literal:
-                reps2 = [
-                    ("\_", "┭"),  # trick to protect ~ _ and ^ chars
-                    ("\^", "┮"),  #
-                    ("\~", "┯"),  #
-                    ("**", "^"),  # order matters
-                    ("e+0", dotsep + "10^"),
-                    ("e-0", dotsep + "10^-"),
-                    ("E+0", dotsep + "10^"),
-                    ("E-0", dotsep + "10^-"),
-                    ("e+", dotsep + "10^"),
-                    ("e-", dotsep + "10^-"),
-                    ("E+", dotsep + "10^"),
-                    ("E-", dotsep + "10^-"),
-                ]
-                for r in reps2:
-                    txt = txt.replace(r[0], r[1])
-
-            xmax, ymax, yshift, scale = 0, 0, 0, 1
-            save_xmax = 0
-
-            notfounds = set()
-            polyletters = []
-            ntxt = len(txt)
-            for i, t in enumerate(txt):
-                ##########
-                if t == "┭":
-                    t = "_"
-                elif t == "┮":
-                    t = "^"
-                elif t == "┯":
-                    t = "~"
-                elif t == "^" and not literal:
-                    if yshift < 0:
-                        xmax = save_xmax
-                    yshift = 0.9 * fscale
-                    scale = 0.5
-                    continue
-                elif t == "_" and not literal:
-                    if yshift > 0:
-                        xmax = save_xmax
-                    yshift = -0.3 * fscale
-                    scale = 0.5
-                    continue
-                elif (t in (" ", "\\n")) and yshift:
-                    yshift = 0
-                    scale = 1
-                    save_xmax = xmax
-                    if t == " ":
-                        continue
-                elif t == "~":
-                    if i < ntxt - 1 and txt[i + 1] == "_":
-                        continue
-                    xmax += hspacing * scale * fscale / 4
-                    continue
-
-                ############
-                if t == " ":
-                    xmax += hspacing * scale * fscale
-
-                elif t == "\n":
-                    xmax = 0
-                    save_xmax = 0
-                    ymax -= vspacing
-
-                else:
-                    poly = _get_font_letter(font, t)
-                    if not poly:
-                        notfounds.add(t)
-                        xmax += hspacing * scale * fscale
-                        continue
-
-                    tr = vtk.vtkTransform()
-                    tr.Translate(xmax, ymax + yshift, 0)
-                    pscale = scale * fscale / 1000
-                    tr.Scale(pscale, pscale, pscale)
-                    if italic:
-                        tr.Concatenate([1, italic * 0.15, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1])
-                    tf = vtk.vtkTransformPolyDataFilter()
-                    tf.SetInputData(poly)
-                    tf.SetTransform(tr)
-                    tf.Update()
-                    poly = tf.GetOutput()
-                    polyletters.append(poly)
-
-                    bx = poly.GetBounds()
-                    if mono:
-                        xmax += hspacing * scale * fscale
-                    else:
-                        xmax += bx[1] - bx[0] + hspacing * scale * fscale * lspacing
-                    if yshift == 0:
-                        save_xmax = xmax
-
-            if len(polyletters) == 1:
-                tpoly = polyletters[0]
+            pts, faces, notfounds = _text3d_layout(
+                txt, font, hspacing, vspacing, italic, literal
+            )
+            if len(pts):
+                tpoly = utils.buildPolyData(pts, faces)
             else:
-                polyapp = vtk.vtkAppendPolyData()
-                for polyd in polyletters:
-                    polyapp.AddInputData(polyd)
-                polyapp.Update()
-                tpoly = polyapp.GetOutput()
+                tpoly = vtk.vtkPolyData()
 
             if notfounds:
                 wmsg = f"These characters are not available in font name {font}: {notfounds}. "
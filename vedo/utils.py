@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import itertools
 import math
 import os
 import time
@@ -442,9 +443,9 @@ def numpy2vtk(arr, dtype=None, deep=True, name=""):
     arr = np.ascontiguousarray(arr)
 
     if dtype == "id":
-        varr = numpy_to_vtkIdTypeArray(arr.astype(np.int64), deep=deep)
+        varr = numpy_to_vtkIdTypeArray(arr.astype(np.int64, copy=False), deep=deep)
     elif dtype:
-        varr = numpy_to_vtk(arr.astype(dtype), deep=deep)
+        varr = numpy_to_vtk(arr.astype(dtype, copy=False), deep=deep)
     else:
         # let numpy_to_vtk() decide what is best type based on arr type
         varr = numpy_to_vtk(arr, deep=deep)
@@ -455,14 +456,14 @@ def numpy2vtk(arr, dtype=None, deep=True, name=""):
 
 
 def vtk2numpy(varr):
-    """Convert a `vtkDataArray`, `vtkIdList` or `vtTransform` into a numpy array."""
+    """Convert a `vtkDataArray`, `vtkIdList`, `vtkMatrix4x4` or `vtTransform` into a numpy array."""
     if isinstance(varr, vtk.vtkIdList):
         return np.array([varr.GetId(i) for i in range(varr.GetNumberOfIds())])
     elif isinstance(varr, vtk.vtkBitArray):
         carr = vtk.vtkCharArray()
         carr.DeepCopy(varr)
         varr = carr
-    elif isinstance(varr, vtk.vtkHomogeneousTransform):
+    elif isinstance(varr, (vtk.vtkHomogeneousTransform, vtk.vtkMatrix4x4)):
         try:
             varr = varr.GetMatrix()
         except AttributeError:
@@ -474,6 +475,62 @@ def vtk2numpy(varr):
     return vtk_to_numpy(varr)
 
 
+def cell_connectivity(carr, fmt="list"):
+    """
+    Extract the point ids of the cells stored in a `vtkCellArray`.
+
+    Arguments:
+        fmt : (str)
+            output format, can be:
+            - "list": a python list of lists `[[id0 ... idn], [id0 ... idm], ...]`
+            - "csr": a tuple of numpy arrays `(offsets, connectivity)` such that the ids
+                of the i-th cell are `connectivity[offsets[i]:offsets[i+1]]`.
+                The arrays share memory with the input `vtkCellArray`.
+            - "dense": a numpy array of shape (ncells, k), only possible
+                if all the cells have the same number of points `k`.
+    """
+    if hasattr(carr, "GetOffsetsArray"):
+        offsets = vtk2numpy(carr.GetOffsetsArray())
+        conn = vtk2numpy(carr.GetConnectivityArray())
+    else:
+        # legacy vtk format: [nids1, id0 ... idn, niids2, id0 ... idm,  etc].
+        arr1d = vtk2numpy(carr.GetData())
+        starts = []
+        i, n = 0, len(arr1d)
+        while i < n:
+            starts.append(i)
+            i += arr1d[i] + 1
+        mask = np.ones(n, dtype=bool)
+        mask[starts] = False
+        conn = arr1d[mask]
+        offsets = np.r_[0, np.cumsum(arr1d[starts])].astype(arr1d.dtype)
+
+    if fmt == "csr":
+        return offsets, conn
+
+    ncells = len(offsets) - 1
+    sizes = np.diff(offsets)
+    uniform = ncells > 0 and np.all(sizes == sizes[0])
+
+    if fmt == "dense":
+        if ncells <= 0:
+            return np.zeros((0, 0), dtype=conn.dtype)
+        if not uniform:
+            raise ValueError("cell_connectivity(): cells have different sizes, cannot use fmt='dense'")
+        return conn.reshape(ncells, sizes[0])
+
+    if fmt == "list":
+        if ncells <= 0:
+            return []
+        if uniform:
+            return conn.reshape(ncells, sizes[0]).tolist()
+        ids = conn.tolist()
+        offs = offsets.tolist()
+        return [ids[a:b] for a, b in zip(offs[:-1], offs[1:])]
+
+    raise ValueError(f"cell_connectivity(): unknown format {fmt}, use 'list', 'csr' or 'dense'")
+
+
 def make3d(pts, transpose=False):
     """
     Make an array which might be 2D to 3D.
@@ -588,116 +645,92 @@ def buildPolyData(vertices, faces=None, lines=None, index_offset=0, tetras=False
 
     if lines is not None:
         # Create a cell array to store the lines in and add the lines to it
-        linesarr = vtk.vtkCellArray()
-        if is_sequence(lines[0]):  # assume format [(id0,id1),..]
-            for iline in lines:
-                for i in range(0, len(iline) - 1):
-                    i1, i2 = iline[i], iline[i + 1]
-                    if i1 != i2:
-                        vline = vtk.vtkLine()
-                        vline.GetPointIds().SetId(0, i1)
-                        vline.GetPointIds().SetId(1, i2)
-                        linesarr.InsertNextCell(vline)
+        if len(lines) and is_sequence(lines[0]):  # assume format [(id0,id1),..]
+            # split each polyline into its segments, skipping degenerate ones
+            offsets, conn = _sequences_to_csr(lines)
+            segments = np.zeros(0, dtype=np.int64)
+            if len(conn):
+                mask = np.ones(len(conn), dtype=bool)
+                mask[offsets[1:] - 1] = False  # last id of each polyline starts no segment
+                i1 = conn[:-1][mask[:-1]]
+                i2 = conn[1:][mask[:-1]]
+                keep = i1 != i2
+                segments = np.c_[i1[keep], i2[keep]].ravel()
         else:  # assume format [id0,id1,...]
-            for i in range(0, len(lines) - 1):
-                vline = vtk.vtkLine()
-                vline.GetPointIds().SetId(0, lines[i])
-                vline.GetPointIds().SetId(1, lines[i + 1])
-                linesarr.InsertNextCell(vline)
-            # print('Wrong format for lines in utils.buildPolydata(), skip.')
-        poly.SetLines(linesarr)
+            ids = np.asarray(lines, dtype=np.int64)
+            segments = np.c_[ids[:-1], ids[1:]].ravel()
+        poly.SetLines(_csr_to_cellarray(np.arange(0, len(segments) + 1, 2), segments))
 
     if faces is None:
-        source_vertices = vtk.vtkCellArray()
-        for i in range(len(vertices)):
-            source_vertices.InsertNextCell(1)
-            source_vertices.InsertCellPoint(i)
-        poly.SetVerts(source_vertices)
+        nv = len(vertices)
+        poly.SetVerts(_csr_to_cellarray(np.arange(nv + 1), np.arange(nv)))
         return poly  ###################
 
     # faces exist
-    source_polygons = vtk.vtkCellArray()
+    if len(faces) == 0:
+        poly.SetPolys(vtk.vtkCellArray())
+        return poly
 
-    if isinstance(faces, np.ndarray) or not is_ragged(faces):
-        ##### all faces are composed of equal nr of vtxs, FAST
-        faces = np.asarray(faces)
-        ast = np.int32
-        if vtk.vtkIdTypeArray().GetDataTypeSize() != 4:
-            ast = np.int64
+    offsets, conn = _sequences_to_csr(faces)
+    if index_offset:
+        conn = conn - index_offset
+
+    if tetras:
+        # split each 4-point cell into its 4 triangular faces.
+        # Do not use vtkTetra() because it fails with dolfin faces orientation
+        sizes = np.diff(offsets)
+        istet = sizes == 4
+        if istet.any():
+            pattern = np.array([0, 1, 2, 0, 1, 3, 1, 2, 3, 2, 3, 0])
+            outlen = np.where(istet, 12, sizes)
+            outstart = np.repeat(np.cumsum(outlen) - outlen, outlen)
+            local = np.arange(outlen.sum()) - outstart
+            cell = np.repeat(np.arange(len(sizes)), outlen)
+            local[istet[cell]] = pattern[local[istet[cell]]]
+            conn = conn[offsets[:-1][cell] + local]
+            newsizes = np.repeat(np.where(istet, 3, sizes), np.where(istet, 4, 1))
+            offsets = np.r_[0, np.cumsum(newsizes)]
+
+    poly.SetPolys(_csr_to_cellarray(offsets, conn))
+    return poly
 
-        if faces.ndim > 1:
-            nf, nc = faces.shape
-            hs = np.hstack((np.zeros(nf)[:, None] + nc, faces)).astype(ast).ravel()
-            arr = numpy_to_vtkIdTypeArray(hs, deep=True)
-            source_polygons.SetCells(nf, arr)
 
+def _sequences_to_csr(seqs):
+    # Convert a list of sequences of ids (possibly of different lengths)
+    # or a 2D numpy array into the arrays (offsets, connectivity)
+    if isinstance(seqs, np.ndarray) and seqs.dtype == object:
+        seqs = seqs.tolist()
+    if isinstance(seqs, np.ndarray) or not is_ragged(seqs):
+        arr = np.asarray(seqs, dtype=np.int64)
+        if arr.ndim != 2:  # not a list of cells
+            return np.zeros(1, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        n, k = arr.shape
+        return np.arange(0, n * k + 1, k), arr.ravel()
+    lengths = np.fromiter((len(s) for s in seqs), dtype=np.int64, count=len(seqs))
+    offsets = np.r_[0, np.cumsum(lengths)]
+    conn = np.fromiter(itertools.chain.from_iterable(seqs), dtype=np.int64, count=offsets[-1])
+    return offsets, conn
+
+
+def _csr_to_cellarray(offsets, conn):
+    # Build a vtkCellArray in one shot from numpy offsets and connectivity arrays
+    ast = np.int32
+    if vtk.vtkIdTypeArray().GetDataTypeSize() != 4:
+        ast = np.int64
+    carr = vtk.vtkCellArray()
+    offsets = np.asarray(offsets).astype(ast)
+    conn = np.asarray(conn).astype(ast)
+    if hasattr(carr, "GetOffsetsArray"):
+        carr.SetData(
+            numpy_to_vtkIdTypeArray(offsets, deep=True),
+            numpy_to_vtkIdTypeArray(conn, deep=True),
+        )
     else:
-        ############################# manually add faces, SLOW
-
-        showbar = False
-        if len(faces) > 25000:
-            showbar = True
-            pb = ProgressBar(0, len(faces), eta=False)
-
-        for f in faces:
-            n = len(f)
-
-            if n == 3:
-                ele = vtk.vtkTriangle()
-                pids = ele.GetPointIds()
-                for i in range(3):
-                    pids.SetId(i, f[i] - index_offset)
-                source_polygons.InsertNextCell(ele)
-
-            elif n == 4 and tetras:
-                # do not use vtkTetra() because it fails
-                # with dolfin faces orientation
-                ele0 = vtk.vtkTriangle()
-                ele1 = vtk.vtkTriangle()
-                ele2 = vtk.vtkTriangle()
-                ele3 = vtk.vtkTriangle()
-                if index_offset:
-                    for i in [0, 1, 2, 3]:
-                        f[i] -= index_offset
-                f0, f1, f2, f3 = f
-                pid0 = ele0.GetPointIds()
-                pid1 = ele1.GetPointIds()
-                pid2 = ele2.GetPointIds()
-                pid3 = ele3.GetPointIds()
-
-                pid0.SetId(0, f0)
-                pid0.SetId(1, f1)
-                pid0.SetId(2, f2)
-
-                pid1.SetId(0, f0)
-                pid1.SetId(1, f1)
-                pid1.SetId(2, f3)
-
-                pid2.SetId(0, f1)
-                pid2.SetId(1, f2)
-                pid2.SetId(2, f3)
-
-                pid3.SetId(0, f2)
-                pid3.SetId(1, f3)
-                pid3.SetId(2, f0)
-
-                source_polygons.InsertNextCell(ele0)
-                source_polygons.InsertNextCell(ele1)
-                source_polygons.InsertNextCell(ele2)
-                source_polygons.InsertNextCell(ele3)
-
-            else:
-                ele = vtk.vtkPolygon()
-                pids = ele.GetPointIds()
-                pids.SetNumberOfIds(n)
-                for i in range(n):
-                    pids.SetId(i, f[i] - index_offset)
-                source_polygons.InsertNextCell(ele)
-            if showbar:
-                pb.print("converting mesh...    ")
-
-    poly.SetPolys(source_polygons)
-    return poly
+        # legacy vtk format: [nids1, id0 ... idn, niids2, id0 ... idm,  etc].
+        sizes = np.diff(offsets)
+        legacy = np.insert(conn, offsets[:-1], sizes).astype(ast)
+        carr.SetCells(len(sizes), numpy_to_vtkIdTypeArray(legacy, deep=True))
+    return carr
 
 
 ##############################################################################
@@ -892,6 +925,68 @@ def intersection_ray_triangle(P0, P1, V0, V1, V2):
     return I  # I is in T
 
 
+def _closest_on_triangles(p, tris):
+    # closest points to p (K, 3) on the triangles (K, 3, 3), from
+    # "Real-Time Collision Detection", C. Ericson, section 5.1.5
+    a, b, c = tris[:, 0], tris[:, 1], tris[:, 2]
+    ab, ac, ap = b - a, c - a, p - a
+    d1 = np.sum(ab * ap, axis=1)
+    d2 = np.sum(ac * ap, axis=1)
+    bp = p - b
+    d3 = np.sum(ab * bp, axis=1)
+    d4 = np.sum(ac * bp, axis=1)
+    cp = p - c
+    d5 = np.sum(ab * cp, axis=1)
+    d6 = np.sum(ac * cp, axis=1)
+    va = d3 * d6 - d5 * d4
+    vb = d5 * d2 - d1 * d6
+    vc = d1 * d4 - d3 * d2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # inside the face
+        denom = va + vb + vc
+        v = vb / denom
+        w = vc / denom
+        res = a + ab * v[:, None] + ac * w[:, None]
+        # edges
+        sel = (va <= 0) & (d4 - d3 >= 0) & (d5 - d6 >= 0)
+        t = (d4 - d3) / ((d4 - d3) + (d5 - d6))
+        res[sel] = (b + (c - b) * t[:, None])[sel]
+        sel = (vb <= 0) & (d2 >= 0) & (d6 <= 0)
+        t = d2 / (d2 - d6)
+        res[sel] = (a + ac * t[:, None])[sel]
+        sel = (vc <= 0) & (d1 >= 0) & (d3 <= 0)
+        t = d1 / (d1 - d3)
+        res[sel] = (a + ab * t[:, None])[sel]
+    # vertices
+    sel = (d6 >= 0) & (d5 <= d6)
+    res[sel] = c[sel]
+    sel = (d3 >= 0) & (d4 <= d3)
+    res[sel] = b[sel]
+    sel = (d1 <= 0) & (d2 <= 0)
+    res[sel] = a[sel]
+    # degenerate triangles
+    sel = ~np.isfinite(res).all(axis=1)
+    res[sel] = a[sel]
+    return res
+
+
+def _closest_on_incident(pts, tris, incident, ids):
+    # closest point to each point on the triangles around the vertex ids,
+    # returns the rows of pts which have triangles and, for each of them,
+    # the closest point, the triangle id and the squared distance
+    offsets, tids = incident
+    counts = offsets[ids + 1] - offsets[ids]
+    rows = np.repeat(np.arange(len(ids)), counts)
+    pos = np.arange(len(rows)) + np.repeat(offsets[ids] - (np.cumsum(counts) - counts), counts)
+    fids = tids[pos]
+    cands = _closest_on_triangles(pts[rows], tris[fids])
+    d2 = np.sum((cands - pts[rows]) ** 2, axis=1)
+    order = np.lexsort((d2, rows))  # rows are sorted, closest first within each row
+    first = order[np.r_[True, rows[order[1:]] != rows[order[:-1]]]] if len(rows) else order
+    return rows[first], cands[first], fids[first], d2[first]
+
+
 def triangle_solver(**input_dict):
     """
     Solve a triangle from any 3 known elements.
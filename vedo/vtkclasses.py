@@ -1,13 +1,17 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-Subset of vtk classes to be imported directly
+Subset of vtk classes to be imported directly.
+
+Only the core modules (data model, rendering and the OpenGL factory overrides)
+are imported eagerly. All other classes are resolved on first access
+through the module ``__getattr__`` (PEP 562) and then cached in the module namespace,
+so that ``import vedo`` does not pay for the whole of VTK up front.
 """
+import importlib
 
 import vtkmodules.vtkCommonComputationalGeometry
 
-from vtkmodules.vtkCommonColor import vtkNamedColors
-
 from vtkmodules.vtkCommonCore import (
     mutable,
     VTK_UNSIGNED_CHAR,
@@ -15,7 +19,6 @@ from vtkmodules.vtkCommonCore import (
     VTK_UNSIGNED_INT,
     VTK_UNSIGNED_LONG,
     VTK_UNSIGNED_LONG_LONG,
-    VTK_UNSIGNED_CHAR,
     VTK_CHAR,
     VTK_SHORT,
     VTK_INT,
@@ -53,6 +56,7 @@ from vtkmodules.vtkCommonDataModel import (
     VTK_PYRAMID,
     VTK_HEXAGONAL_PRISM,
     VTK_PENTAGONAL_PRISM,
+    vtkAbstractPointLocator,
     vtkCellArray,
     vtkBox,
     vtkCellLocator,
@@ -61,6 +65,7 @@ from vtkmodules.vtkCommonDataModel import (
     vtkDataObject,
     vtkDataSet,
     vtkFieldData,
+    vtkGenericCell,
     vtkHexagonalPrism,
     vtkHexahedron,
     vtkImageData,
@@ -95,393 +100,23 @@ from vtkmodules.vtkCommonDataModel import (
     vtkWedge,
 )
 
-from vtkmodules.vtkCommonExecutionModel import vtkAlgorithm
-
-from vtkmodules.vtkCommonMath import vtkMatrix4x4, vtkQuaternion
-
-from vtkmodules.vtkCommonTransforms import (
-    vtkHomogeneousTransform,
-    vtkLandmarkTransform,
-    vtkThinPlateSplineTransform,
-    vtkTransform
-)
-
-from vtkmodules.vtkFiltersCore import (
-    VTK_BEST_FITTING_PLANE,
-    vtk3DLinearGridCrinkleExtractor,
-    vtkAppendPolyData,
-    vtkCellCenters,
-    vtkCellDataToPointData,
-    vtkCenterOfMass,
-    vtkCleanPolyData,
-    vtkClipPolyData,
-    vtkPolyDataConnectivityFilter,
-    vtkPolyDataEdgeConnectivityFilter,
-    vtkContourFilter,
-    vtkContourGrid,
-    vtkCutter,
-    vtkDecimatePro,
-    vtkDelaunay2D,
-    vtkDelaunay3D,
-    vtkElevationFilter,
-    vtkFeatureEdges,
-    vtkFlyingEdges3D,
-    vtkGlyph3D,
-    vtkIdFilter,
-    vtkImageAppend,
-    vtkImplicitPolyDataDistance,
-    vtkMarchingSquares,
-    vtkMaskPoints,
-    vtkMassProperties,
-    vtkPointDataToCellData,
-    vtkPolyDataNormals,
-    vtkProbeFilter,
-    vtkQuadricDecimation,
-    vtkResampleWithDataSet,
-    vtkReverseSense,
-    vtkStripper,
-    vtkTensorGlyph,
-    vtkThreshold,
-    vtkTriangleFilter,
-    vtkTubeFilter,
-    vtkUnstructuredGridQuadricDecimation,
-    vtkVoronoi2D,
-    vtkWindowedSincPolyDataFilter,
-)
-
-try:
-    from vtkmodules.vtkFiltersCore import vtkStaticCleanUnstructuredGrid, vtkPolyDataPlaneCutter
-except ImportError:
-    pass
-
-
-from vtkmodules.vtkFiltersExtraction import (
-    vtkExtractCellsByType,
-    vtkExtractGeometry,
-    vtkExtractPolyDataGeometry,
-    vtkExtractSelection,
-)
-try:
-    from vtkmodules.vtkFiltersExtraction import vtkExtractEdges # vtk9.0
-except ImportError:
-    from vtkmodules.vtkFiltersCore import vtkExtractEdges # vtk9.2
-
-from vtkmodules.vtkFiltersFlowPaths import vtkStreamTracer
-
-
-from vtkmodules.vtkFiltersGeneral import (
-    vtkBooleanOperationPolyDataFilter,
-    vtkBoxClipDataSet,
-    vtkCellValidator,
-    vtkClipDataSet,
-    vtkCountVertices,
-    vtkContourTriangulator,
-    vtkCurvatures,
-    vtkDataSetTriangleFilter,
-    vtkDensifyPolyData,
-    vtkDistancePolyDataFilter,
-    vtkGradientFilter,
-    vtkIntersectionPolyDataFilter,
-    vtkLoopBooleanPolyDataFilter,
-    vtkMultiBlockDataGroupFilter,
-    vtkTransformPolyDataFilter,
-    vtkOBBTree,
-    vtkQuantizePolyDataPoints,
-    vtkRandomAttributeGenerator,
-    vtkShrinkFilter,
-    vtkShrinkPolyData,
-    vtkRectilinearGridToTetrahedra,
-    vtkVertexGlyphFilter,
-)
-
 try:
     from vtkmodules.vtkCommonDataModel import vtkCellTreeLocator
 except ImportError:
-    from vtkmodules.vtkFiltersGeneral import vtkCellTreeLocator
-
-from vtkmodules.vtkFiltersGeometry import (
-    vtkGeometryFilter,
-    vtkDataSetSurfaceFilter,
-    vtkImageDataGeometryFilter,
-)
-try:
-    from vtkmodules.vtkFiltersGeometry import vtkMarkBoundaryFilter
-except ImportError:
-    pass
-
-
-from vtkmodules.vtkFiltersHybrid import (
-    vtkFacetReader,
-    vtkImplicitModeller,
-    vtkPolyDataSilhouette,
-    vtkProcrustesAlignmentFilter,
-    vtkRenderLargeImage,
-)
-
-from vtkmodules.vtkFiltersModeling import (
-    vtkAdaptiveSubdivisionFilter,
-    vtkBandedPolyDataContourFilter,
-    vtkButterflySubdivisionFilter,
-    vtkContourLoopExtraction,
-    vtkCookieCutter,
-    vtkDijkstraGraphGeodesicPath,
-    vtkFillHolesFilter,
-    vtkHausdorffDistancePointSetFilter,
-    vtkLinearExtrusionFilter,
-    vtkLinearSubdivisionFilter,
-    vtkLoopSubdivisionFilter,
-    vtkRibbonFilter,
-    vtkRotationalExtrusionFilter,
-    vtkRuledSurfaceFilter,
-    vtkSectorSource,
-    vtkSelectEnclosedPoints,
-    vtkSelectPolyData,
-    vtkSubdivideTetra,
-)
-
-try:
-    from vtkmodules.vtkFiltersModeling import vtkCollisionDetectionFilter
-except ImportError:
-    pass
-
-try:
-    from vtkmodules.vtkFiltersModeling import vtkImprintFilter
-except ImportError:
-    pass
-
-from vtkmodules.vtkFiltersPoints import (
-    vtkConnectedPointsFilter,
-    vtkDensifyPointCloudFilter,
-    vtkEuclideanClusterExtraction,
-    vtkExtractEnclosedPoints,
-    vtkExtractSurface,
-    vtkGaussianKernel,
-    vtkLinearKernel,
-    vtkPCANormalEstimation,
-    vtkPointDensityFilter,
-    vtkPointInterpolator,
-    vtkRadiusOutlierRemoval,
-    vtkShepardKernel,
-    vtkSignedDistance,
-    vtkVoronoiKernel,
-)
-
-from vtkmodules.vtkFiltersSources import (
-    vtkArcSource,
-    vtkArrowSource,
-    vtkConeSource,
-    vtkCubeSource,
-    vtkCylinderSource,
-    vtkDiskSource,
-    vtkFrustumSource,
-    vtkGlyphSource2D,
-    vtkGraphToPolyData,
-    vtkLineSource,
-    vtkOutlineCornerFilter,
-    vtkParametricFunctionSource,
-    vtkPlaneSource,
-    vtkPointSource,
-    vtkProgrammableSource,
-    vtkSphereSource,
-    vtkTexturedSphereSource,
-    vtkTessellatedBoxSource,
-)
-
-
-from vtkmodules.vtkFiltersTexture import vtkTextureMapToPlane
-
-from vtkmodules.vtkFiltersVerdict import vtkMeshQuality, vtkCellSizeFilter
-
-from vtkmodules.vtkImagingStencil import vtkPolyDataToImageStencil
-
-from vtkmodules.vtkIOExport import vtkX3DExporter
-
-from vtkmodules.vtkIOExportGL2PS import vtkGL2PSExporter
-
-from vtkmodules.vtkIOGeometry import (
-    vtkBYUReader,
-    vtkFacetWriter,
-    vtkOBJReader,
-    vtkOpenFOAMReader,
-    vtkParticleReader,
-    vtkSTLReader,
-    vtkSTLWriter,
-)
-
-from vtkmodules.vtkIOImage import (
-    vtkBMPReader,
-    vtkBMPWriter,
-    vtkDEMReader,
-    vtkDICOMImageReader,
-    vtkHDRReader,
-    vtkJPEGReader,
-    vtkJPEGWriter,
-    vtkMetaImageReader,
-    vtkMetaImageWriter,
-    vtkNIFTIImageReader,
-    vtkNIFTIImageWriter,
-    vtkNrrdReader,
-    vtkPNGReader,
-    vtkPNGWriter,
-    vtkSLCReader,
-    vtkTIFFReader,
-    vtkTIFFWriter,
-)
-
-from vtkmodules.vtkIOImport import (
-    vtk3DSImporter,
-    vtkOBJImporter,
-    vtkVRMLImporter,
-)
+    pass  # vtk<9.2, it is found in vtkFiltersGeneral
 
-from vtkmodules.vtkIOLegacy import (
-    vtkSimplePointsWriter,
-    vtkStructuredGridReader,
-    vtkStructuredPointsReader,
-    vtkDataSetReader,
-    vtkDataSetWriter,
-    vtkPolyDataWriter,
-    vtkRectilinearGridReader,
-    vtkUnstructuredGridReader,
-)
-
-from vtkmodules.vtkIOPLY import vtkPLYReader, vtkPLYWriter
-
-from vtkmodules.vtkIOXML import (
-    vtkXMLGenericDataObjectReader,
-    vtkXMLImageDataReader,
-    vtkXMLImageDataWriter,
-    vtkXMLMultiBlockDataReader,
-    vtkXMLMultiBlockDataWriter,
-    vtkXMLPRectilinearGridReader,
-    vtkXMLPUnstructuredGridReader,
-    vtkXMLPolyDataReader,
-    vtkXMLPolyDataWriter,
-    vtkXMLRectilinearGridReader,
-    vtkXMLStructuredGridReader,
-    vtkXMLUnstructuredGridReader,
-    vtkXMLUnstructuredGridWriter,
-)
-
-from vtkmodules.vtkImagingColor import (
-    vtkImageLuminance,
-    vtkImageMapToWindowLevelColors,
-)
-
-from vtkmodules.vtkImagingCore import (
-    vtkExtractVOI,
-    vtkImageAppendComponents,
-    vtkImageBlend,
-    vtkImageCast,
-    vtkImageConstantPad,
-    vtkImageExtractComponents,
-    vtkImageFlip,
-    vtkImageMapToColors,
-    vtkImageMirrorPad,
-    vtkImagePermute,
-    vtkImageResample,
-    vtkImageResize,
-    vtkImageReslice,
-    vtkImageThreshold,
-    vtkImageTranslateExtent,
-)
-
-from vtkmodules.vtkImagingFourier import (
-    vtkImageButterworthHighPass,
-    vtkImageButterworthLowPass,
-    vtkImageFFT,
-    vtkImageFourierCenter,
-    vtkImageRFFT,
-)
-
-from vtkmodules.vtkImagingGeneral import (
-    vtkImageCorrelation,
-    vtkImageEuclideanDistance,
-    vtkImageGaussianSmooth,
-    vtkImageGradient,
-    vtkImageHybridMedian2D,
-    vtkImageLaplacian,
-    vtkImageMedian3D,
-    vtkImageNormalize,
-)
-
-from vtkmodules.vtkImagingHybrid import vtkImageToPoints, vtkSampleFunction
-from vtkmodules.vtkImagingMath import (
-    vtkImageDivergence,
-    vtkImageDotProduct,
-    vtkImageLogarithmicScale,
-    vtkImageMagnitude,
-    vtkImageMathematics,
-)
-
-from vtkmodules.vtkImagingMorphological import (
-    vtkImageContinuousDilate3D,
-    vtkImageContinuousErode3D,
-)
-
-from vtkmodules.vtkImagingSources import vtkImageCanvasSource2D
-from vtkmodules.vtkImagingStencil import vtkImageStencil
-from vtkmodules.vtkInfovisLayout import (
-    vtkCircularLayoutStrategy,
-    vtkClustering2DLayoutStrategy,
-    vtkConeLayoutStrategy,
-    vtkFast2DLayoutStrategy,
-    vtkForceDirectedLayoutStrategy,
-    vtkGraphLayout,
-    vtkSimple2DLayoutStrategy,
-    vtkSimple3DCirclesStrategy,
-    vtkSpanTreeLayoutStrategy,
-)
-
-from vtkmodules.vtkInteractionStyle import (
-    vtkInteractorStyleFlight,
-    vtkInteractorStyleImage,
-    vtkInteractorStyleJoystickActor,
-    vtkInteractorStyleJoystickCamera,
-    vtkInteractorStyleRubberBand2D,
-    vtkInteractorStyleRubberBand3D,
-    vtkInteractorStyleRubberBandZoom,
-    vtkInteractorStyleTerrain,
-    vtkInteractorStyleTrackballActor,
-    vtkInteractorStyleTrackballCamera,
-    vtkInteractorStyleUnicam,
-    vtkInteractorStyleUser,
-)
+from vtkmodules.vtkCommonExecutionModel import vtkAlgorithm
 
-from vtkmodules.vtkInteractionWidgets import (
-    vtkBalloonRepresentation,
-    vtkBalloonWidget,
-    vtkBoxWidget,
-    vtkContourWidget,
-    vtkPlaneWidget,
-    vtkFocalPlanePointPlacer,
-    vtkImplicitPlaneWidget,
-    vtkOrientationMarkerWidget,
-    vtkOrientedGlyphContourRepresentation,
-    vtkPolygonalSurfacePointPlacer,
-    vtkSliderRepresentation2D,
-    vtkSliderRepresentation3D,
-    vtkSliderWidget,
-    vtkSphereWidget,
+from vtkmodules.vtkCommonMath import (
+    vtkMatrix4x4,
+    vtkQuaternion,
 )
 
-try:
-    from vtkmodules.vtkInteractionWidgets import vtkCameraOrientationWidget
-except ImportError:
-    pass
-
-from vtkmodules.vtkRenderingAnnotation import (
-    vtkAnnotatedCubeActor,
-    vtkAxesActor,
-    vtkAxisActor2D,
-    vtkCaptionActor2D,
-    vtkCornerAnnotation,
-    vtkCubeAxesActor,
-    vtkLegendBoxActor,
-    vtkLegendScaleActor,
-    vtkPolarAxesActor,
-    vtkScalarBarActor,
-    vtkXYPlotActor,
+from vtkmodules.vtkCommonTransforms import (
+    vtkHomogeneousTransform,
+    vtkLandmarkTransform,
+    vtkThinPlateSplineTransform,
+    vtkTransform,
 )
 
 from vtkmodules.vtkRenderingCore import (
@@ -498,6 +133,7 @@ from vtkmodules.vtkRenderingCore import (
     vtkDistanceToCamera,
     vtkFlagpoleLabel,
     vtkFollower,
+    vtkGlyph3DMapper,
     vtkHierarchicalPolyDataMapper,
     vtkImageActor,
     vtkImageMapper,
@@ -534,10 +170,6 @@ from vtkmodules.vtkRenderingCore import (
 
 from vtkmodules.vtkRenderingFreeType import vtkVectorText
 
-from vtkmodules.vtkRenderingImage import vtkImageResliceMapper
-
-from vtkmodules.vtkRenderingLabel import vtkLabeledDataMapper
-
 from vtkmodules.vtkRenderingOpenGL2 import (
     vtkDepthOfFieldPass,
     vtkCameraPass,
@@ -555,17 +187,411 @@ from vtkmodules.vtkRenderingOpenGL2 import (
     vtkVolumetricPass,
 )
 
-from vtkmodules.vtkRenderingVolume import (
-    vtkFixedPointVolumeRayCastMapper,
-    vtkGPUVolumeRayCastMapper,
-    vtkProjectedTetrahedraMapper,
-    vtkUnstructuredGridVolumeRayCastMapper,
-    vtkUnstructuredGridVolumeZSweepMapper,
+from vtkmodules.vtkInteractionStyle import (
+    vtkInteractorStyleFlight,
+    vtkInteractorStyleImage,
+    vtkInteractorStyleJoystickActor,
+    vtkInteractorStyleJoystickCamera,
+    vtkInteractorStyleRubberBand2D,
+    vtkInteractorStyleRubberBand3D,
+    vtkInteractorStyleRubberBandZoom,
+    vtkInteractorStyleTerrain,
+    vtkInteractorStyleTrackballActor,
+    vtkInteractorStyleTrackballCamera,
+    vtkInteractorStyleUnicam,
+    vtkInteractorStyleUser,
 )
 
-from vtkmodules.vtkRenderingVolumeOpenGL2 import (
-    vtkOpenGLGPUVolumeRayCastMapper,
-    vtkSmartVolumeMapper,
-)
 
-# print("successfully finished importing vtkmodules")
+##############################################################################
+# Classes below are imported on demand. Each module name maps to the classes
+# that vedo uses from it; names that are missing in older vtk versions are
+# simply not found, exactly as if the import had failed.
+location = {
+    "vtkCommonColor": (
+        "vtkNamedColors",
+    ),
+    "vtkFiltersCore": (
+        "VTK_BEST_FITTING_PLANE",
+        "vtk3DLinearGridCrinkleExtractor",
+        "vtkAppendPolyData",
+        "vtkCellCenters",
+        "vtkCellDataToPointData",
+        "vtkCenterOfMass",
+        "vtkCleanPolyData",
+        "vtkClipPolyData",
+        "vtkPolyDataConnectivityFilter",
+        "vtkPolyDataEdgeConnectivityFilter",
+        "vtkContourFilter",
+        "vtkContourGrid",
+        "vtkCutter",
+        "vtkDecimatePro",
+        "vtkDelaunay2D",
+        "vtkDelaunay3D",
+        "vtkElevationFilter",
+        "vtkFeatureEdges",
+        "vtkFlyingEdges3D",
+        "vtkGlyph3D",
+        "vtkIdFilter",
+        "vtkImageAppend",
+        "vtkImplicitPolyDataDistance",
+        "vtkMarchingSquares",
+        "vtkMaskPoints",
+        "vtkMassProperties",
+        "vtkPointDataToCellData",
+        "vtkPolyDataNormals",
+        "vtkProbeFilter",
+        "vtkQuadricDecimation",
+        "vtkResampleWithDataSet",
+        "vtkReverseSense",
+        "vtkStripper",
+        "vtkTensorGlyph",
+        "vtkThreshold",
+        "vtkTriangleFilter",
+        "vtkTubeFilter",
+        "vtkUnstructuredGridQuadricDecimation",
+        "vtkVoronoi2D",
+        "vtkWindowedSincPolyDataFilter",
+        "vtkStaticCleanUnstructuredGrid",
+        "vtkPolyDataPlaneCutter",
+    ),
+    "vtkFiltersExtraction": (
+        "vtkExtractCellsByType",
+        "vtkExtractGeometry",
+        "vtkExtractPolyDataGeometry",
+        "vtkExtractSelection",
+        "vtkExtractEdges",
+    ),
+    "vtkFiltersFlowPaths": (
+        "vtkStreamTracer",
+    ),
+    "vtkFiltersGeneral": (
+        "vtkBooleanOperationPolyDataFilter",
+        "vtkBoxClipDataSet",
+        "vtkCellValidator",
+        "vtkClipDataSet",
+        "vtkCountVertices",
+        "vtkContourTriangulator",
+        "vtkCurvatures",
+        "vtkDataSetTriangleFilter",
+        "vtkDensifyPolyData",
+        "vtkDistancePolyDataFilter",
+        "vtkGradientFilter",
+        "vtkIntersectionPolyDataFilter",
+        "vtkLoopBooleanPolyDataFilter",
+        "vtkMultiBlockDataGroupFilter",
+        "vtkTransformPolyDataFilter",
+        "vtkOBBTree",
+        "vtkQuantizePolyDataPoints",
+        "vtkRandomAttributeGenerator",
+        "vtkShrinkFilter",
+        "vtkShrinkPolyData",
+        "vtkRectilinearGridToTetrahedra",
+        "vtkVertexGlyphFilter",
+    ),
+    "vtkFiltersGeometry": (
+        "vtkGeometryFilter",
+        "vtkDataSetSurfaceFilter",
+        "vtkImageDataGeometryFilter",
+        "vtkMarkBoundaryFilter",
+    ),
+    "vtkFiltersHybrid": (
+        "vtkFacetReader",
+        "vtkImplicitModeller",
+        "vtkPolyDataSilhouette",
+        "vtkProcrustesAlignmentFilter",
+        "vtkRenderLargeImage",
+    ),
+    "vtkFiltersModeling": (
+        "vtkAdaptiveSubdivisionFilter",
+        "vtkBandedPolyDataContourFilter",
+        "vtkButterflySubdivisionFilter",
+        "vtkContourLoopExtraction",
+        "vtkCookieCutter",
+        "vtkDijkstraGraphGeodesicPath",
+        "vtkFillHolesFilter",
+        "vtkHausdorffDistancePointSetFilter",
+        "vtkLinearExtrusionFilter",
+        "vtkLinearSubdivisionFilter",
+        "vtkLoopSubdivisionFilter",
+        "vtkRibbonFilter",
+        "vtkRotationalExtrusionFilter",
+        "vtkRuledSurfaceFilter",
+        "vtkSectorSource",
+        "vtkSelectEnclosedPoints",
+        "vtkSelectPolyData",
+        "vtkSubdivideTetra",
+        "vtkCollisionDetectionFilter",
+        "vtkImprintFilter",
+    ),
+    "vtkFiltersPoints": (
+        "vtkConnectedPointsFilter",
+        "vtkDensifyPointCloudFilter",
+        "vtkEuclideanClusterExtraction",
+        "vtkExtractEnclosedPoints",
+        "vtkExtractSurface",
+        "vtkGaussianKernel",
+        "vtkLinearKernel",
+        "vtkPCANormalEstimation",
+        "vtkPointDensityFilter",
+        "vtkPointInterpolator",
+        "vtkRadiusOutlierRemoval",
+        "vtkShepardKernel",
+        "vtkSignedDistance",
+        "vtkVoronoiKernel",
+    ),
+    "vtkFiltersSources": (
+        "vtkArcSource",
+        "vtkArrowSource",
+        "vtkConeSource",
+        "vtkCubeSource",
+        "vtkCylinderSource",
+        "vtkDiskSource",
+        "vtkFrustumSource",
+        "vtkGlyphSource2D",
+        "vtkGraphToPolyData",
+        "vtkLineSource",
+        "vtkOutlineCornerFilter",
+        "vtkParametricFunctionSource",
+        "vtkPlaneSource",
+        "vtkPointSource",
+        "vtkProgrammableSource",
+        "vtkSphereSource",
+        "vtkTexturedSphereSource",
+        "vtkTessellatedBoxSource",
+    ),
+    "vtkFiltersTexture": (
+        "vtkTextureMapToPlane",
+    ),
+    "vtkFiltersVerdict": (
+        "vtkMeshQuality",
+        "vtkCellSizeFilter",
+    ),
+    "vtkImagingStencil": (
+        "vtkPolyDataToImageStencil",
+        "vtkImageStencil",
+    ),
+    "vtkIOExport": (
+        "vtkX3DExporter",
+    ),
+    "vtkIOExportGL2PS": (
+        "vtkGL2PSExporter",
+    ),
+    "vtkIOGeometry": (
+        "vtkBYUReader",
+        "vtkFacetWriter",
+        "vtkOBJReader",
+        "vtkOpenFOAMReader",
+        "vtkParticleReader",
+        "vtkSTLReader",
+        "vtkSTLWriter",
+    ),
+    "vtkIOImage": (
+        "vtkBMPReader",
+        "vtkBMPWriter",
+        "vtkDEMReader",
+        "vtkDICOMImageReader",
+        "vtkHDRReader",
+        "vtkJPEGReader",
+        "vtkJPEGWriter",
+        "vtkMetaImageReader",
+        "vtkMetaImageWriter",
+        "vtkNIFTIImageReader",
+        "vtkNIFTIImageWriter",
+        "vtkNrrdReader",
+        "vtkPNGReader",
+        "vtkPNGWriter",
+        "vtkSLCReader",
+        "vtkTIFFReader",
+        "vtkTIFFWriter",
+    ),
+    "vtkIOImport": (
+        "vtk3DSImporter",
+        "vtkOBJImporter",
+        "vtkVRMLImporter",
+    ),
+    "vtkIOLegacy": (
+        "vtkSimplePointsWriter",
+        "vtkStructuredGridReader",
+        "vtkStructuredPointsReader",
+        "vtkDataSetReader",
+        "vtkDataSetWriter",
+        "vtkPolyDataWriter",
+        "vtkRectilinearGridReader",
+        "vtkUnstructuredGridReader",
+    ),
+    "vtkIOPLY": (
+        "vtkPLYReader",
+        "vtkPLYWriter",
+    ),
+    "vtkIOXML": (
+        "vtkXMLGenericDataObjectReader",
+        "vtkXMLImageDataReader",
+        "vtkXMLImageDataWriter",
+        "vtkXMLMultiBlockDataReader",
+        "vtkXMLMultiBlockDataWriter",
+        "vtkXMLPRectilinearGridReader",
+        "vtkXMLPUnstructuredGridReader",
+        "vtkXMLPolyDataReader",
+        "vtkXMLPolyDataWriter",
+        "vtkXMLRectilinearGridReader",
+        "vtkXMLStructuredGridReader",
+        "vtkXMLUnstructuredGridReader",
+        "vtkXMLUnstructuredGridWriter",
+    ),
+    "vtkImagingColor": (
+        "vtkImageLuminance",
+        "vtkImageMapToWindowLevelColors",
+    ),
+    "vtkImagingCore": (
+        "vtkExtractVOI",
+        "vtkImageAppendComponents",
+        "vtkImageBlend",
+        "vtkImageCast",
+        "vtkImageConstantPad",
+        "vtkImageExtractComponents",
+        "vtkImageFlip",
+        "vtkImageMapToColors",
+        "vtkImageMirrorPad",
+        "vtkImagePermute",
+        "vtkImageResample",
+        "vtkImageResize",
+        "vtkImageReslice",
+        "vtkImageThreshold",
+        "vtkImageTranslateExtent",
+    ),
+    "vtkImagingFourier": (
+        "vtkImageButterworthHighPass",
+        "vtkImageButterworthLowPass",
+        "vtkImageFFT",
+        "vtkImageFourierCenter",
+        "vtkImageRFFT",
+    ),
+    "vtkImagingGeneral": (
+        "vtkImageCorrelation",
+        "vtkImageEuclideanDistance",
+        "vtkImageGaussianSmooth",
+        "vtkImageGradient",
+        "vtkImageHybridMedian2D",
+        "vtkImageLaplacian",
+        "vtkImageMedian3D",
+        "vtkImageNormalize",
+    ),
+    "vtkImagingHybrid": (
+        "vtkImageToPoints",
+        "vtkSampleFunction",
+    ),
+    "vtkImagingMath": (
+        "vtkImageDivergence",
+        "vtkImageDotProduct",
+        "vtkImageLogarithmicScale",
+        "vtkImageMagnitude",
+        "vtkImageMathematics",
+    ),
+    "vtkImagingMorphological": (
+        "vtkImageContinuousDilate3D",
+        "vtkImageContinuousErode3D",
+    ),
+    "vtkImagingSources": (
+        "vtkImageCanvasSource2D",
+    ),
+    "vtkInfovisLayout": (
+        "vtkCircularLayoutStrategy",
+        "vtkClustering2DLayoutStrategy",
+        "vtkConeLayoutStrategy",
+        "vtkFast2DLayoutStrategy",
+        "vtkForceDirectedLayoutStrategy",
+        "vtkGraphLayout",
+        "vtkSimple2DLayoutStrategy",
+        "vtkSimple3DCirclesStrategy",
+        "vtkSpanTreeLayoutStrategy",
+    ),
+    "vtkInteractionWidgets": (
+        "vtkBalloonRepresentation",
+        "vtkBalloonWidget",
+        "vtkBoxWidget",
+        "vtkContourWidget",
+        "vtkPlaneWidget",
+        "vtkFocalPlanePointPlacer",
+        "vtkImplicitPlaneWidget",
+        "vtkOrientationMarkerWidget",
+        "vtkOrientedGlyphContourRepresentation",
+        "vtkPolygonalSurfacePointPlacer",
+        "vtkSliderRepresentation2D",
+        "vtkSliderRepresentation3D",
+        "vtkSliderWidget",
+        "vtkSphereWidget",
+        "vtkCameraOrientationWidget",
+    ),
+    "vtkRenderingAnnotation": (
+        "vtkAnnotatedCubeActor",
+        "vtkAxesActor",
+        "vtkAxisActor2D",
+        "vtkCaptionActor2D",
+        "vtkCornerAnnotation",
+        "vtkCubeAxesActor",
+        "vtkLegendBoxActor",
+        "vtkLegendScaleActor",
+        "vtkPolarAxesActor",
+        "vtkScalarBarActor",
+        "vtkXYPlotActor",
+    ),
+    "vtkRenderingImage": (
+        "vtkImageResliceMapper",
+    ),
+    "vtkRenderingLabel": (
+        "vtkLabeledDataMapper",
+    ),
+    "vtkRenderingVolume": (
+        "vtkFixedPointVolumeRayCastMapper",
+        "vtkGPUVolumeRayCastMapper",
+        "vtkProjectedTetrahedraMapper",
+        "vtkUnstructuredGridVolumeRayCastMapper",
+        "vtkUnstructuredGridVolumeZSweepMapper",
+    ),
+    "vtkRenderingVolumeOpenGL2": (
+        "vtkOpenGLGPUVolumeRayCastMapper",
+        "vtkSmartVolumeMapper",
+    ),
+}
+
+# classes that moved between vtk modules across versions
+_fallback_location = {
+    "vtkExtractEdges": "vtkFiltersCore",
+    "vtkCellTreeLocator": "vtkFiltersGeneral",
+}
+
+# modules providing the OpenGL implementations of abstract classes,
+# they must be loaded before the abstract class is instantiated
+_overrides = {
+    "vtkRenderingVolume": "vtkRenderingVolumeOpenGL2",
+}
+
+_module_of = {name: mod for mod, names in location.items() for name in names}
+
+
+def __getattr__(name):
+    """Import a vtk class the first time it is requested (PEP 562)."""
+    try:
+        module_name = _module_of[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    if module_name in _overrides:
+        importlib.import_module("vtkmodules." + _overrides[module_name])
+
+    module = importlib.import_module("vtkmodules." + module_name)
+    try:
+        obj = getattr(module, name)
+    except AttributeError:
+        if name not in _fallback_location:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+        module = importlib.import_module("vtkmodules." + _fallback_location[name])
+        obj = getattr(module, name)
+
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_module_of))